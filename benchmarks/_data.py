@@ -0,0 +1,12 @@
+"""The fixed data the benchmarks measure, shared by the fixtures in conftest.py and the benchmark modules."""
+from collections import namedtuple
+from datetime import datetime
+from datetime import timezone
+
+# fixed, so that the data (and so the work measured) is the same on every run
+END = datetime(2024, 1, 31, tzinfo=timezone.utc)
+
+PAGE_SIZE = 10_000
+
+# stands in for a `requests.Response` where only its content is read
+Response = namedtuple("Response", "content")
@@ -0,0 +1,109 @@
+"""
+Compares the results of a benchmark run with the stored baseline, and exits with an error if any benchmark's median
+time is slower than the baseline by more than the threshold.
+
+Usage:
+
+    pytest benchmarks --benchmark-json=benchmarks/results.json
+    python benchmarks/compare.py benchmarks/results.json [--threshold 0.25]
+
+To replace the baseline with a run's results, such as after an intended change in performance or on new hardware:
+
+    python benchmarks/compare.py benchmarks/results.json --save
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def load_results(path):
+    """Reads the median time of each benchmark, and the machine it ran on, from a pytest-benchmark JSON report."""
+    report = json.loads(Path(path).read_text())
+    machine = report["machine_info"]
+    return {
+        "machine": {
+            "python": machine["python_version"],
+            "cpu": machine["cpu"].get("brand_raw"),
+            "cpus": machine["cpu"].get("count"),
+        },
+        "benchmarks": {
+            b["fullname"]: {"group": b["group"], "median": b["stats"]["median"]}
+            for b in report["benchmarks"]
+        },
+    }
+
+
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-6:.2f}us"
+
+
+def compare(baseline, results, threshold):
+    """Prints a comparison of each benchmark with the baseline, and returns the names of those that regressed."""
+    regressions = []
+    names = sorted(set(baseline["benchmarks"]) | set(results["benchmarks"]))
+    width = max(len(name) for name in names)
+    print(f"{'benchmark':<{width}}{'baseline':>12}{'current':>12}{'change':>10}")
+    for name in names:
+        before = baseline["benchmarks"].get(name)
+        after = results["benchmarks"].get(name)
+        if before is None or after is None:
+            status = "new" if before is None else "not run"
+            time = format_time((after or before)["median"])
+            columns = f"{'':>12}{time:>12}" if after else f"{time:>12}"
+            print(f"{name:<{width}}{columns}  {status}")
+            continue
+        change = after["median"] / before["median"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSED"
+        print(
+            f"{name:<{width}}{format_time(before['median']):>12}"
+            f"{format_time(after['median']):>12}{change:>+10.0%}{flag}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("results", help="The --benchmark-json report of a run.")
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="The largest allowed slowdown, as a fraction of the baseline's time.",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="Replace the baseline with the results."
+    )
+    args = parser.parse_args()
+
+    results = load_results(args.results)
+    if args.save:
+        Path(args.baseline).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Saved {len(results['benchmarks'])} benchmarks to {args.baseline}")
+        return
+
+    baseline = json.loads(Path(args.baseline).read_text())
+    if baseline["machine"] != results["machine"]:
+        print(
+            f"Warning: the baseline was recorded on a different machine ({baseline['machine']}), so times may not "
+            f"be comparable.\n"
+        )
+    regressions = compare(baseline, results, args.threshold)
+    if regressions:
+        print(
+            f"\n{len(regressions)} benchmark(s) slower than the baseline by more than {args.threshold:.0%}."
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+import json
+
+import pytest
+
+from _incydr_sdk.file_events.models.response import FileEventsPage
+from benchmarks._data import END
+from benchmarks._data import PAGE_SIZE
+from incydr.testing import SyntheticTenant
+
+
+@pytest.fixture(scope="session")
+def tenant():
+    return SyntheticTenant(
+        seed=0, users=500, file_events=PAGE_SIZE, sessions=0, audit_events=0, end=END
+    )
+
+
+@pytest.fixture(scope="session")
+def page_content(tenant):
+    """A raw page of 10,000 file events."""
+    page = {
+        "fileEvents": tenant.file_events,
+        "nextPgToken": None,
+        "totalCount": len(tenant.file_events),
+    }
+    return json.dumps(page).encode()
+
+
+@pytest.fixture(scope="session")
+def file_events(page_content):
+    return FileEventsPage.model_validate_json(page_content).file_events
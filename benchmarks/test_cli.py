@@ -0,0 +1,55 @@
+"""CSV output of flattened file events, reading bulk CSV input and writing checkpoints."""
+import io
+
+from _incydr_cli import render
+from _incydr_cli.cmds.models import UserCSV
+from _incydr_cli.cursor import CursorStore
+from _incydr_sdk.file_events.models.event import FileEventV2
+from _incydr_sdk.utils import iter_model_formatted
+
+
+def test_iter_model_formatted_flat(benchmark, file_events):
+    benchmark.group = "render"
+    events = file_events[:500]
+
+    def flatten():
+        return [dict(iter_model_formatted(e, flat=True, render="csv")) for e in events]
+
+    assert len(benchmark(flatten)) == 500
+
+
+def test_render_csv(benchmark, file_events):
+    benchmark.group = "render"
+    events = file_events[:500]
+
+    def write_csv():
+        output = io.StringIO()
+        render.csv(FileEventV2, events, flat=True, file=output)
+        return output.getvalue()
+
+    assert benchmark(write_csv).count("\n") == 501
+
+
+def test_parse_csv(benchmark):
+    benchmark.group = "bulk csv input"
+    content = "username\n" + "".join(f"user{i}@example.com\n" for i in range(100_000))
+
+    def parse():
+        return sum(1 for _ in UserCSV.parse_csv(io.StringIO(content)))
+
+    assert benchmark(parse) == 100_000
+
+
+def test_checkpoint_writes(benchmark, tmp_path, file_events):
+    benchmark.group = "checkpoints"
+    store = CursorStore(str(tmp_path), "events")
+    ids = [e.event.id for e in file_events[:1000]]
+
+    def write_checkpoints():
+        # a checkpoint and its recently seen event IDs are written after every page
+        for i in range(0, len(ids), 100):
+            store.replace("benchmark", ids[i + 99])
+            store.replace_items("benchmark", ids[: i + 100])
+
+    benchmark(write_checkpoints)
+    assert store.get("benchmark") == ids[-1]
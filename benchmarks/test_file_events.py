@@ -0,0 +1,81 @@
+"""
+Parsing file event pages, in each record format, with each installed JSON codec and in worker processes, and
+paging through search results from the API simulator.
+"""
+from operator import attrgetter
+
+import pytest
+
+from _incydr_sdk.core.codec import get_codec
+from _incydr_sdk.file_events.models.response import FileEventsPage
+from _incydr_sdk.file_events.parsing import parse_page
+from _incydr_sdk.file_events.parsing import parse_pages
+from benchmarks._data import END
+from benchmarks._data import Response
+from incydr import EventQuery
+from incydr.testing import IncydrSimulator
+from incydr.testing import SyntheticTenant
+
+
+@pytest.mark.parametrize("record_format", ["model", "dict", "compact"])
+def test_parse_response(benchmark, page_content, record_format):
+    benchmark.group = "parse 10k event page"
+    response = Response(page_content)
+
+    page = benchmark(
+        FileEventsPage.parse_response,
+        response,
+        record_format=record_format,
+        records="file_events",
+    )
+
+    assert len(page.file_events) == 10_000
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson", "msgspec"])
+def test_codec_decode_and_encode_lines(benchmark, page_content, codec):
+    benchmark.group = "decode page, encode json lines"
+    try:
+        codec = get_codec(codec)
+    except ValueError:
+        pytest.skip(f"{codec} is not installed")
+
+    def decode_and_encode():
+        return [codec.dumps(e) for e in codec.loads(page_content)["fileEvents"]]
+
+    assert len(benchmark(decode_and_encode)) == 10_000
+
+
+@pytest.mark.parametrize(
+    "workers,transform",
+    [(None, None), (2, None), (2, attrgetter("event.id"))],
+    ids=["1 process", "2 workers, models", "2 workers, event IDs"],
+)
+def test_parse_pages(benchmark, page_content, workers, transform):
+    benchmark.group = "parse 2 pages"
+    pages = [page_content] * 2
+
+    def parse():
+        if workers is None:
+            return [parse_page(content) for content in pages]
+        return list(parse_pages(pages, max_workers=workers, transform=transform))
+
+    assert sum(len(p) for p in benchmark.pedantic(parse, rounds=3)) == 20_000
+
+
+@pytest.mark.parametrize("record_format", ["model", "dict"])
+def test_iter_all_from_simulator(benchmark, record_format):
+    benchmark.group = "paginate 50k events over http"
+    tenant = SyntheticTenant(seed=0, users=500, file_events=50_000, end=END)
+    with IncydrSimulator(tenant) as simulator:
+        client = simulator.client()
+        query = EventQuery(start_date="2023-12-01T00:00:00Z")
+        query.page_size = 10_000
+        # generate and encode the tenant's events before timing
+        client.file_events.v2.search(query.model_copy(deep=True))
+
+        def paginate():
+            events = client.file_events.v2.iter_all(query, record_format=record_format)
+            return sum(1 for _ in events)
+
+        assert benchmark.pedantic(paginate, rounds=3) == 50_000
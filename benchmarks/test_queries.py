@@ -0,0 +1,27 @@
+"""Building file event queries and serializing them into request bodies."""
+from incydr import EventQuery
+
+EMAILS = [f"user{i}@example.com" for i in range(100)]
+
+
+def build_query():
+    return (
+        EventQuery(start_date="P30D")
+        .equals("file.category", ["Document", "Spreadsheet", "SourceCode"])
+        .is_any("user.email", EMAILS)
+        .not_equals("destination.category", "Removable Media")
+        .greater_than("risk.score", 9)
+        .exists("destination.name")
+    )
+
+
+def test_build_query(benchmark):
+    benchmark.group = "event query"
+    query = benchmark(build_query)
+    assert len(query.groups) == 6
+
+
+def test_query_dict(benchmark):
+    benchmark.group = "event query"
+    query = build_query()
+    assert len(benchmark(query.dict)["groups"]) == 6
@@ -0,0 +1,55 @@
+"""Holding a large page of actors in each record format."""
+import json
+import tracemalloc
+
+import pytest
+
+from _incydr_sdk.actors.models import ActorsPage
+from benchmarks._data import Response
+
+ACTOR = {
+    "active": True,
+    "actorId": "1234",
+    "alternateNames": ["engineer@example.com"],
+    "country": "United States",
+    "department": "Engineering",
+    "division": "Product",
+    "employeeType": "full-time",
+    "endDate": None,
+    "firstName": "Sam",
+    "inScope": True,
+    "lastName": "Engineer",
+    "locality": "Minneapolis",
+    "managerActorId": "5678",
+    "name": "engineer@example.com",
+    "notes": None,
+    "parentActorId": None,
+    "region": "Minnesota",
+    "startDate": "2020-01-01",
+    "title": "Engineer",
+}
+
+
+@pytest.fixture(scope="module")
+def response():
+    actors = [dict(ACTOR, actorId=str(i)) for i in range(50_000)]
+    return Response(json.dumps({"actors": actors}).encode())
+
+
+@pytest.mark.parametrize("record_format", ["model", "dict", "compact"])
+def test_actors_page(benchmark, response, record_format):
+    benchmark.group = "parse 50k actor page"
+
+    def parse():
+        return ActorsPage.parse_response(
+            response, record_format=record_format, records="actors"
+        )
+
+    assert len(benchmark(parse).actors) == 50_000
+
+    # measured separately, as tracing allocations slows parsing down
+    tracemalloc.start()
+    page = parse()
+    benchmark.extra_info["memory_mb"] = round(tracemalloc.get_traced_memory()[0] / 1e6)
+    tracemalloc.stop()
+    del page
@@ -22,6 +22,7 @@ from _incydr_cli.cmds.options.output_options import TableFormat
 from _incydr_cli.core import incompatible_with
 from _incydr_cli.core import IncydrCommand
 from _incydr_cli.core import IncydrGroup
+from _incydr_cli.file_readers import report_row_error
 from _incydr_sdk.agents.models import Agent
 from _incydr_sdk.core.client import Client
 from _incydr_sdk.utils import model_as_card
@@ -198,9 +199,9 @@ def bulk_activate(file: Path, format_: str):
 
     # parse CSV or JSON input
     if format_ == "csv":
-        models = AgentCSV.parse_csv(file)
+        models = AgentCSV.parse_csv(file, on_error=report_row_error)
     else:
-        models = AgentJSON.parse_json_lines(file)
+        models = AgentJSON.parse_json_lines(file, on_error=report_row_error)
     try:
         agent_ids = [agent.agent_id for agent in models]
     except ValueError as err:
@@ -248,9 +249,9 @@ def bulk_deactivate(file: Path, format_: str):
 
     # parse CSV or JSON input
     if format_ == "csv":
-        models = AgentCSV.parse_csv(file)
+        models = AgentCSV.parse_csv(file, on_error=report_row_error)
     else:
-        models = AgentJSON.parse_json_lines(file)
+        models = AgentJSON.parse_json_lines(file, on_error=report_row_error)
     try:
         agent_ids = [agent.agent_id for agent in models]
     except ValueError as err:
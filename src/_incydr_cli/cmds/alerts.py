@@ -1,5 +1,6 @@
 from contextlib import nullcontext
 from datetime import timezone
+from typing import List
 from typing import Optional
 from typing import Union
 
@@ -32,7 +33,8 @@ from _incydr_cli.core import IncydrCommand
 from _incydr_cli.core import IncydrGroup
 from _incydr_cli.cursor import CursorStore
 from _incydr_cli.file_readers import AutoDecodedFile
-from _incydr_cli.logger import get_server_logger
+from _incydr_cli.file_readers import report_row_error
+from _incydr_cli.sinks import create_output_sink
 from _incydr_sdk.alerts.models.alert import AlertSummary
 from _incydr_sdk.core.client import Client
 from _incydr_sdk.core.models import CSVModel
@@ -62,9 +64,13 @@ def alerts():
 def search(
     format_: TableFormat,
     columns: Optional[str],
-    output: Optional[str],
+    output: Optional[List[str]],
     certs: Optional[str],
     ignore_cert_validation: Optional[bool],
+    output_framing: Optional[str],
+    output_queue_size: Optional[int],
+    output_spill_file: Optional[str],
+    hec_token: Optional[str],
     advanced_query: Optional[Union[str, File]],
     start: Optional[str],
     end: Optional[str],
@@ -133,9 +139,17 @@ def search(
 
     with warn_interrupt() if checkpoint_name else nullcontext():
         if output:
-            logger = get_server_logger(output, certs, ignore_cert_validation)
-            for alert_ in alerts_gen:
-                logger.info(alert_.json())
+            with create_output_sink(
+                output,
+                certs=certs,
+                ignore_cert_validation=ignore_cert_validation,
+                framing=output_framing,
+                queue_size=output_queue_size,
+                spill_file=output_spill_file,
+                hec_token=hec_token,
+            ) as sink:
+                for alert_ in alerts_gen:
+                    sink.send(alert_.json())
             return
 
         if format_ == TableFormat.table:
@@ -283,10 +297,10 @@ def bulk_update_state(
 
     client = Client()
     if format_ == "csv":
-        alerts_ = AlertBulkCSV.parse_csv(file)
+        alerts_ = AlertBulkCSV.parse_csv(file, on_error=report_row_error)
 
     else:
-        alerts_ = AlertBulkJSON.parse_json_lines(file)
+        alerts_ = AlertBulkJSON.parse_json_lines(file, on_error=report_row_error)
 
     # group alerts where state and note are the same, so we can batch API calls
     buckets = bucketize(
@@ -1,9 +1,11 @@
 import json
 import os
 from contextlib import nullcontext
+from datetime import datetime
 from datetime import timezone
 from hashlib import md5
 from itertools import count
+from typing import List
 from typing import Optional
 
 import click
@@ -18,11 +20,16 @@ from _incydr_cli.cmds.options.output_options import columns_option
 from _incydr_cli.cmds.options.output_options import output_options
 from _incydr_cli.cmds.options.output_options import TableFormat
 from _incydr_cli.cmds.options.utils import checkpoint_option
+from _incydr_cli.cmds.options.utils import follow_options
+from _incydr_cli.cmds.utils import AdaptivePollInterval
+from _incydr_cli.cmds.utils import follow as follow_results
 from _incydr_cli.cmds.utils import warn_interrupt
 from _incydr_cli.core import IncydrCommand
 from _incydr_cli.core import IncydrGroup
 from _incydr_cli.cursor import CursorStore
-from _incydr_cli.logger import get_server_logger
+from _incydr_cli.cursor import MemoryCursorStore
+from _incydr_cli.sinks import create_output_sink
+from _incydr_sdk.audit_log.client import iter_events_by_time
 from _incydr_sdk.audit_log.models import DateRange
 from _incydr_sdk.audit_log.models import QueryAuditLogRequest
 from _incydr_sdk.core.client import Client
@@ -39,6 +46,7 @@ def audit_log():
 
 @audit_log.command("search", cls=IncydrCommand)
 @checkpoint_option
+@follow_options
 @click.option(
     "--format",
     "-f",
@@ -52,6 +60,20 @@ def audit_log():
     "CSV output includes limited fields, use audit-log download for a more comprehensive CSV download.",
     default=TableFormat.json_pretty,
 )
+@click.option(
+    "--page-size",
+    type=click.IntRange(min=1, max=10000),
+    default=100,
+    help="The number of events to request per page, up to 10,000. Defaults to 100.",
+)
+@click.option(
+    "--paginate-by-time",
+    is_flag=True,
+    default=False,
+    help="Page through results by narrowing the search's date range to the timestamp of the last event returned, "
+    "rather than by requesting increasing page numbers. Keeps the cost of each request constant when retrieving "
+    "large numbers of events. Recommended with a larger --page-size.",
+)
 @filter_options
 @columns_option
 @output_options
@@ -59,9 +81,13 @@ def audit_log():
 def search(
     format_: TableFormat,
     columns: Optional[str],
-    output: Optional[str],
+    output: Optional[List[str]],
     certs: Optional[str],
     ignore_cert_validation: Optional[bool],
+    output_framing: Optional[str],
+    output_queue_size: Optional[int],
+    output_spill_file: Optional[str],
+    hec_token: Optional[str],
     start: Optional[str],
     end: Optional[str],
     actor_ids: Optional[str],
@@ -71,6 +97,11 @@ def search(
     resource_ids: Optional[str],
     user_types: Optional[str],
     checkpoint_name: Optional[str],
+    follow: bool,
+    poll_interval: float,
+    max_poll_interval: float,
+    page_size: int,
+    paginate_by_time: bool,
 ):
     """
     Search audit log events.  Returns all events that match the search criteria with paging.
@@ -82,6 +113,8 @@ def search(
     Checkpointing is available through the `--checkpoint <checkpoint-name>` option and will only return new results
     on subsequent queries with that same checkpoint. Checkpointing filters by timestamp, additional filter
     options will need to be included in each run.
+
+    Use `--follow` to keep polling for new events after the search completes, until interrupted with CTRL-C.
     """
     client = Client()
     cursor = _get_cursor_store(client.settings.api_client_id)
@@ -89,68 +122,98 @@ def search(
     if output:
         format_ = TableFormat.json_lines
 
+    def get_events(request_):
+        page = client.session.post("/v1/audit/search-audit-log", json=request_.dict())
+        return client.json_codec.loads(page.content).get("events")
+
+    def yield_event_dicts(request_):
+        if paginate_by_time:
+            yield from iter_events_by_time(get_events, request_)
+            return
+        for page_num in count(0):
+            request_.page = page_num
+            events = get_events(request_)
+            yield from events
+            if len(events) < request_.pageSize:
+                break
+
     # skip pydantic modeling when output will just be json
     if format_ in (TableFormat.json_pretty, TableFormat.json_lines):
-
-        def yield_all_events(request_):
-            for page_num in count(0):
-                request_.page = page_num
-                page = client.session.post(
-                    "/v1/audit/search-audit-log", json=request_.dict()
-                )
-                events = page.json().get("events")
-                yield from events
-                if len(events) < request_.pageSize:
-                    break
+        yield_all_events = yield_event_dicts
 
     else:
 
         def yield_all_events(request_):
-            for page_num in count(0):
-                request_.page = page_num
-                page = client.session.post(
-                    "/v1/audit/search-audit-log", json=request_.dict()
-                )
-                events = page.json().get("events")
-                for e in events:
-                    yield DefaultAuditEvent.parse_obj(e)
-                if len(events) < request_.pageSize:
-                    break
-
-    # Use stored checkpoint timestamp for start filter if applicable
-    if checkpoint_name:
-        checkpoint = cursor.get(checkpoint_name)
-        if checkpoint:
-            start = float(checkpoint)
-
-    # Checks if start float timestamp was read from checkpoints
-    start = parse_ts_to_posix_ts(start) if isinstance(start, str) else start
-
-    request = QueryAuditLogRequest(
-        actorIds=actor_ids.split(",") if actor_ids else None,
-        actorIpAddresses=actor_ip_addresses.split(",") if actor_ip_addresses else None,
-        actorNames=actor_names.split(",") if actor_names else None,
-        eventTypes=event_types.split(",") if event_types else None,
-        resourceIds=resource_ids.split(",") if resource_ids else None,
-        userTypes=user_types.split(",") if user_types else None,
-        dateRange=DateRange(
-            startTime=start or None,
-            endTime=parse_ts_to_posix_ts(end) if end else None,
-        ),
-        page=0,
-        pageSize=100,
+            for e in yield_event_dicts(request_):
+                yield DefaultAuditEvent.parse_obj(e)
+
+    if follow:
+        # each poll resumes from the timestamp of the newest event seen so far, held in memory and
+        # written through to the stored checkpoint (if any) so a restarted process can pick up from it
+        cursor = MemoryCursorStore(cursor if checkpoint_name else None)
+        checkpoint_name = checkpoint_name or "follow"
+
+    def yield_new_events():
+        start_ = start
+        # Use stored checkpoint timestamp for start filter if applicable
+        if checkpoint_name:
+            checkpoint = cursor.get(checkpoint_name)
+            if checkpoint:
+                start_ = float(checkpoint)
+
+        # Checks if start float timestamp was read from checkpoints
+        start_ = parse_ts_to_posix_ts(start_) if isinstance(start_, str) else start_
+
+        request = QueryAuditLogRequest(
+            actorIds=actor_ids.split(",") if actor_ids else None,
+            actorIpAddresses=actor_ip_addresses.split(",")
+            if actor_ip_addresses
+            else None,
+            actorNames=actor_names.split(",") if actor_names else None,
+            eventTypes=event_types.split(",") if event_types else None,
+            resourceIds=resource_ids.split(",") if resource_ids else None,
+            userTypes=user_types.split(",") if user_types else None,
+            dateRange=DateRange(
+                startTime=start_ or None,
+                endTime=parse_ts_to_posix_ts(end) if end else None,
+            ),
+            page=0,
+            pageSize=page_size,
+        )
+        events_gen = yield_all_events(request)
+
+        # Checkpointing
+        if checkpoint_name:
+            events_gen = _update_checkpoint(cursor, checkpoint_name, events_gen)
+        return events_gen
+
+    interrupt_context = (
+        warn_interrupt(exit_code=0 if follow else 1)
+        if checkpoint_name
+        else nullcontext()
     )
-    events_gen = yield_all_events(request)
-
-    # Checkpointing
-    if checkpoint_name:
-        events_gen = _update_checkpoint(cursor, checkpoint_name, events_gen)
+    with interrupt_context as interrupt:
+        if follow:
+            events_gen = follow_results(
+                yield_new_events,
+                AdaptivePollInterval(poll_interval, max_poll_interval),
+                should_stop=lambda: interrupt.interrupted,
+            )
+        else:
+            events_gen = yield_new_events()
 
-    with warn_interrupt() if checkpoint_name else nullcontext():
         if output:
-            logger = get_server_logger(output, certs, ignore_cert_validation)
-            for event in events_gen:
-                logger.info(json.dumps(event))
+            with create_output_sink(
+                output,
+                certs=certs,
+                ignore_cert_validation=ignore_cert_validation,
+                framing=output_framing,
+                queue_size=output_queue_size,
+                spill_file=output_spill_file,
+                hec_token=hec_token,
+            ) as sink:
+                for event in events_gen:
+                    sink.send(json.dumps(event))
             return
 
         if format_ == TableFormat.csv:
@@ -228,6 +291,74 @@ def download(
     console.print(f"Audit log events downloaded to '{path}'")
 
 
+@audit_log.command(cls=IncydrCommand)
+@filter_options
+@click.option(
+    "--path",
+    help="The folder where to save the exported files. Defaults to the current directory if not specified.",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True),
+    default=os.getcwd(),
+)
+@click.option(
+    "--format",
+    "-f",
+    "formats",
+    type=click.Choice(["csv", "jsonl", "parquet"]),
+    multiple=True,
+    default=["csv"],
+    help="The file format to write. Can be specified multiple times to write several formats. Defaults to 'csv'. "
+    "'parquet' requires the pyarrow package to be installed.",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=4,
+    help="The maximum number of partitions of the date range to export at once. Defaults to 4.",
+)
+@logging_options
+def export(
+    path: Optional[str],
+    start: Optional[str],
+    end: Optional[str],
+    actor_ids: Optional[str],
+    actor_ip_addresses: Optional[str],
+    actor_names: Optional[str],
+    event_types: Optional[str],
+    resource_ids: Optional[str],
+    user_types: Optional[str],
+    formats: List[str],
+    max_workers: int,
+):
+    """
+    Export all audit log events in a date range to a single file, sorted by timestamp. Requires the `--start` option.
+
+    Unlike `audit-log download`, the export isn't limited to 100,000 events: the date range is split into partitions
+    under that limit, which are exported concurrently and merged.
+    """
+    if not start:
+        raise click.BadOptionUsage("start", "--start option required.")
+    client = Client()
+
+    targets = client.audit_log.v1.export_events(
+        path,
+        start_time=start,
+        end_time=end,
+        actor_ids=actor_ids.split(",") if actor_ids else None,
+        actor_ip_addresses=actor_ip_addresses.split(",")
+        if actor_ip_addresses
+        else None,
+        actor_names=actor_names.split(",") if actor_names else None,
+        event_types=event_types.split(",") if event_types else None,
+        resource_ids=resource_ids.split(",") if resource_ids else None,
+        user_types=user_types.split(",") if user_types else None,
+        formats=formats,
+        max_workers=max_workers,
+    )
+
+    for target in targets:
+        console.print(f"Audit log events exported to '{target}'")
+
+
 def _update_checkpoint(cursor, checkpoint_name, events_gen):
     """
     De-duplicates events across checkpointed runs.
@@ -243,8 +374,13 @@ def _update_checkpoint(cursor, checkpoint_name, events_gen):
     """
 
     checkpoint_events = cursor.get_items(checkpoint_name)
-    new_timestamp = None
-    new_events = []
+    checkpoint = cursor.get(checkpoint_name)
+    # keep the hashes of already processed events that share the checkpoint timestamp, in case
+    # they're returned again alongside new events with that same timestamp
+    new_timestamp = (
+        datetime.fromtimestamp(float(checkpoint), timezone.utc) if checkpoint else None
+    )
+    new_events = list(checkpoint_events)
     for event in events_gen:
         # if event is a model, convert to a dict
         event_as_dict = event.dict() if isinstance(event, Model) else event
@@ -25,6 +25,7 @@ from _incydr_cli.core import incompatible_with
 from _incydr_cli.core import IncydrCommand
 from _incydr_cli.core import IncydrGroup
 from _incydr_cli.file_readers import FileOrString
+from _incydr_cli.file_readers import report_row_error
 from _incydr_sdk.cases.models import Case
 from _incydr_sdk.cases.models import CaseDetail
 from _incydr_sdk.cases.models import FileEvent
@@ -279,9 +280,9 @@ def bulk_update(
             return user
 
     if format_ == "csv":
-        models = UpdateCaseCSV.parse_csv(file)
+        models = UpdateCaseCSV.parse_csv(file, on_error=report_row_error)
     else:
-        models = CaseDetail.parse_json_lines(file)
+        models = CaseDetail.parse_json_lines(file, on_error=report_row_error)
     try:
         for updated in track(models, description="Updating cases...", transient=True):
             fields_set = updated.__fields_set__
@@ -473,15 +474,24 @@ csv_option = click.option(
 @click.option(
     "--format", "-f", "format_", type=click.Choice(["csv", "json-lines"]), default="csv"
 )
+@click.option(
+    "--skip-existing/--no-skip-existing",
+    default=True,
+    help="Look up the events already attached to the case and don't attach them again. Defaults to true.",
+)
 @logging_options
 def add(
     case_number: int,
     event_ids: FileOrString,
     format_: str,
+    skip_existing: bool = True,
 ):
     """
     Attach file events to a case specified by CASE_NUMBER.
 
+    Events are attached in batches of 100, skipping any already attached to the case, and any events that can't be
+    attached are reported individually.
+
     EVENT_IDS can be either a comma-delimited string of event IDs:
 
         add CASE_NUMBER "id-1,id-2,id-3,..."
@@ -501,17 +511,20 @@ def add(
 
     """
     client = Client()
-    if isinstance(event_ids, str):
-        event_ids = [e.strip() for e in event_ids.split(",")]
-    elif format_ == "csv":
-        events = FileEventCSV.parse_csv(event_ids)
-        event_ids = [e.event_id for e in events]
-    else:
-        events = FileEventJSON.parse_json_lines(event_ids)
-        event_ids = [e.event_id for e in events]
-
-    client.cases.v1.add_file_events_to_case(case_number, event_ids)
-    console.print(f"{len(event_ids)} events added to case {case_number}")
+    result = client.cases.v1.attach_file_events(
+        case_number,
+        _iter_event_ids(event_ids, format_),
+        skip_existing=skip_existing,
+    )
+    console.print(f"{len(result.updated)} events added to case {case_number}")
+    if result.skipped:
+        console.print(
+            f"{len(result.skipped)} events were already attached to case {case_number}"
+        )
+    for id_, error in result.failed.items():
+        console.print(
+            f"[red]Error adding event:[/red] {id_} ({error})", highlight=False
+        )
 
 
 @file_events.command(cls=IncydrCommand)
@@ -521,15 +534,25 @@ def add(
 @click.option(
     "--format", "-f", "format_", type=click.Choice(["csv", "json-lines"]), default="csv"
 )
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=8,
+    help="The maximum number of events to remove at once. Defaults to 8.",
+)
 @logging_options
 def remove(
     case_number: int,
     event_ids: str,
     format_: str,
+    max_workers: int = 8,
 ):
     """
     Remove file events from a case specified by CASE_NUMBER.
 
+    Events are removed several at a time (see `--max-workers`), and any events that can't be removed are reported
+    individually.
+
     EVENT_IDS can be either a comma-delimited string of event IDs:
 
         remove CASE_NUMBER "id-1,id-2,id-3,..."
@@ -549,27 +572,33 @@ def remove(
 
     """
     client = Client()
+    result = client.cases.v1.detach_file_events(
+        case_number, _iter_event_ids(event_ids, format_), max_workers=max_workers
+    )
+    console.print(f"{len(result.updated)} events removed from case {case_number}")
+    if result.skipped:
+        console.print(
+            f"{len(result.skipped)} events were not found on case {case_number}"
+        )
+    for id_, error in result.failed.items():
+        console.print(
+            f"[red]Error removing event:[/red] {id_} ({error})", highlight=False
+        )
+
+
+def _iter_event_ids(event_ids, format_):
+    """Yields the event IDs from a comma-delimited string, or from each row of a CSV or JSON Lines file."""
     if isinstance(event_ids, str):
-        event_ids = [e.strip() for e in event_ids.split(",")]
-    elif format_ == "csv":
-        events = FileEventCSV.parse_csv(event_ids)
-        event_ids = [e.event_id for e in events]
-    else:
-        events = FileEventJSON.parse_json_lines(event_ids)
-        event_ids = [e.event_id for e in events]
-
-    for id_ in event_ids:
-        try:
-            client.cases.v1.delete_file_event_from_case(case_number, id_)
-            console.print(f"Event removed: {id_}", highlight=False)
-        except HTTPError as err:
-            if err.response.status_code == 404:
-                console.print(f"Event not found on case: {id_}", highlight=False)
-            else:
-                console.print(
-                    f"[red]Error removing event:[/red] {id_} ({err.response.status_code})",
-                    highlight=False,
-                )
+        return (e.strip() for e in event_ids.split(","))
+    if format_ == "csv":
+        return (
+            e.event_id
+            for e in FileEventCSV.parse_csv(event_ids, on_error=report_row_error)
+        )
+    return (
+        e.event_id
+        for e in FileEventJSON.parse_json_lines(event_ids, on_error=report_row_error)
+    )
 
 
 if __name__ == "__main__":
@@ -1,6 +1,12 @@
 import json
+import os
+from contextlib import closing
+from contextlib import contextmanager
+from contextlib import ExitStack
 from contextlib import nullcontext
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import click
@@ -21,20 +27,32 @@ from _incydr_cli.cmds.options.output_options import single_format_option
 from _incydr_cli.cmds.options.output_options import SingleFormat
 from _incydr_cli.cmds.options.output_options import table_format_option
 from _incydr_cli.cmds.options.output_options import TableFormat
+from _incydr_cli.cmds.options.utils import aggregate_option
 from _incydr_cli.cmds.options.utils import checkpoint_option
+from _incydr_cli.cmds.options.utils import follow_options
+from _incydr_cli.cmds.options.utils import store_option
+from _incydr_cli.cmds.utils import AdaptivePollInterval
+from _incydr_cli.cmds.utils import follow as follow_results
 from _incydr_cli.cmds.utils import warn_interrupt
 from _incydr_cli.core import IncydrCommand
 from _incydr_cli.core import IncydrGroup
 from _incydr_cli.cursor import CursorStore
-from _incydr_cli.logger import get_server_logger
+from _incydr_cli.sinks import create_output_sink
+from _incydr_sdk.aggregations.operators import Aggregation
 from _incydr_sdk.core.client import Client
 from _incydr_sdk.enums.file_events import RiskIndicators
 from _incydr_sdk.enums.file_events import RiskSeverity
+from _incydr_sdk.event_store.reader import filter_raw
+from _incydr_sdk.event_store.reader import SegmentReader
+from _incydr_sdk.event_store.store import EventStore
+from _incydr_sdk.event_store.store import INDEX_FILE
 from _incydr_sdk.file_events.models.event import FileEventV2
 from _incydr_sdk.file_events.models.response import FileEventGroup
 from _incydr_sdk.file_events.models.response import SavedSearch
 from _incydr_sdk.queries.file_events import EventQuery
 from _incydr_sdk.queries.file_events import GroupingEventQuery
+from _incydr_sdk.queries.local import filter_events
+from _incydr_sdk.queries.local import read_events
 from _incydr_sdk.utils import model_as_card
 
 
@@ -45,7 +63,10 @@ def file_events():
 
 
 @file_events.command(cls=IncydrCommand)
+@aggregate_option
 @checkpoint_option
+@store_option
+@follow_options
 @table_format_option
 @columns_option
 @output_options
@@ -56,9 +77,13 @@ def file_events():
 def search(
     format_: TableFormat,
     columns: Optional[str],
-    output: Optional[str],
+    output: Optional[List[str]],
     certs: Optional[str],
     ignore_cert_validation: Optional[bool],
+    output_framing: Optional[str],
+    output_queue_size: Optional[int],
+    output_spill_file: Optional[str],
+    hec_token: Optional[str],
     advanced_query: Optional[Union[str, File]],
     saved_search: Optional[str],
     start: Optional[str],
@@ -76,6 +101,11 @@ def search(
     risk_severity: Optional[RiskSeverity],
     risk_score: Optional[int],
     checkpoint_name: Optional[str],
+    store: Optional[str],
+    follow: bool,
+    poll_interval: float,
+    max_poll_interval: float,
+    aggregate: Optional[Aggregation],
 ):
     """
     Search file events. Various options are provided to filter query results.
@@ -90,9 +120,24 @@ def search(
     Checkpointing is available through the `--checkpoint <checkpoint-name>` option and will only return new results
     on subsequent queries with that same checkpoint.  Checkpointing stores the original query it was run with, so
     additional filters on subsequent runs will be ignored.
+
+    Use `--follow` to keep polling for new events after the search completes, until interrupted with CTRL-C.
+
+    Use `--store <directory>` to also keep the results in a local event store, which `incydr file-events filter` can
+    search without requesting the events again. Combined with `--checkpoint`, each run adds only new events.
+
+    Use `--aggregate` to output counts, top values, distinct counts or time histograms of the results instead of the
+    events themselves.
     """
     if output:
         format_ = TableFormat.json_lines
+    if follow and format_ == TableFormat.table and not aggregate:
+        raise BadOptionUsage(
+            "follow",
+            "--follow can't be used with 'table' format. Use the --format or --output option.",
+        )
+    if follow and aggregate:
+        raise BadOptionUsage("aggregate", "--aggregate can't be used with --follow.")
 
     client = Client()
 
@@ -146,12 +191,12 @@ def search(
         checkpoint_func = None
 
     # skip pydantic modeling when output will just be json
-    if format_ in (TableFormat.json_pretty, TableFormat.json_lines):
+    if format_ in (TableFormat.json_pretty, TableFormat.json_lines) or aggregate:
 
         def yield_all_events(q: EventQuery):
             while q.page_token is not None:
                 response = client.session.post("/v2/file-events", json=q.dict())
-                response_dict = response.json()
+                response_dict = client.json_codec.loads(response.content)
                 q.page_token = response_dict.get("nextPgToken")
                 page = response_dict.get("fileEvents")
                 for event_ in page:
@@ -169,13 +214,61 @@ def search(
                     if checkpoint_func:
                         checkpoint_func(event_.dict())
 
-    events = yield_all_events(query)
+    if follow:
+
+        def poll():
+            # resume after the last event seen, so each poll only returns new events
+            resume_token = query.page_token
+            for event_ in yield_all_events(query):
+                resume_token = (
+                    event_["event"]["id"]
+                    if isinstance(event_, dict)
+                    else event_.event.id
+                )
+                yield event_
+            query.page_token = resume_token
+
+    interrupt_context = (
+        warn_interrupt(exit_code=0 if follow else 1)
+        if checkpoint_name or follow
+        else nullcontext()
+    )
+    with interrupt_context as interrupt, ExitStack() as stack:
+        if follow:
+            events = follow_results(
+                poll,
+                AdaptivePollInterval(poll_interval, max_poll_interval),
+                should_stop=lambda: interrupt.interrupted,
+            )
+        else:
+            events = yield_all_events(query)
+
+        if store:
+            events = stack.enter_context(_stored(events, store))
+
+        if aggregate:
+            # aggregates are output in place of the events
+            events = [aggregate.consume(events).result()]
 
-    with warn_interrupt() if checkpoint_name else nullcontext():
         if output:
-            logger = get_server_logger(output, certs, ignore_cert_validation)
-            for event in events:
-                logger.info(json.dumps(event))
+            with create_output_sink(
+                output,
+                certs=certs,
+                ignore_cert_validation=ignore_cert_validation,
+                framing=output_framing,
+                queue_size=output_queue_size,
+                spill_file=output_spill_file,
+                hec_token=hec_token,
+            ) as sink:
+                for event in events:
+                    sink.send(json.dumps(event))
+            return
+
+        if aggregate:
+            if format_ == TableFormat.json_lines:
+                click.echo(json.dumps(events[0]))
+            else:
+                console.print_json(data=events[0])
             return
 
         if format_ == TableFormat.csv:
@@ -201,6 +294,37 @@ def search(
     help="(required) The term by which approximate counts will be grouped. Example: `user.email`.",
     required=True,
 )
+@click.option(
+    "--windows",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Split the range between `--start` and `--end` into this many time windows, searched separately and merged. "
+    "Use to get past the 10,000 group limit of a single search.",
+)
+@click.option(
+    "--partition-term",
+    default=None,
+    help="A term to partition the search by, such as `file.category`. Requires `--partition-values`.",
+)
+@click.option(
+    "--partition-values",
+    multiple=True,
+    default=None,
+    help="A comma-separated set of values of `--partition-term` to search separately. Can be passed multiple times, "
+    "once for each partition.",
+)
+@click.option(
+    "--top",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Only output the groups with the highest counts.",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=4,
+    help="The maximum number of partitions to search at once. Defaults to 4.",
+)
 @table_format_option
 @columns_option
 @output_options
@@ -211,9 +335,13 @@ def search(
 def search_groups(
     format_: TableFormat,
     columns: Optional[str],
-    output: Optional[str],
+    output: Optional[List[str]],
     certs: Optional[str],
     ignore_cert_validation: Optional[bool],
+    output_framing: Optional[str],
+    output_queue_size: Optional[int],
+    output_spill_file: Optional[str],
+    hec_token: Optional[str],
     advanced_query: Optional[Union[str, File]],
     saved_search: Optional[str],
     start: Optional[str],
@@ -231,6 +359,11 @@ def search_groups(
     risk_severity: Optional[RiskSeverity],
     risk_score: Optional[int],
     group_by: Optional[str],
+    windows: int,
+    partition_term: Optional[str],
+    partition_values: Tuple[str],
+    top: Optional[int],
+    max_workers: int,
 ):
     """
     Retrieve approximate aggregated file event counts. Various options are provided to filter query results.
@@ -240,9 +373,20 @@ def search_groups(
     Results will be output to the console by default, use the `--output` option to send data to a server.
 
     This method returns approximate counts, grouped by the provided term. To obtain full event details, use the `search` method.
+
+    A single search returns at most 10,000 groups. To get all groups of a larger result, use `--windows` and/or
+    `--partition-term` with `--partition-values` to split the search into partitions, which are searched concurrently
+    and merged. Partitions that still return 10,000 groups are split further automatically.
     """
     if output:
         format_ = TableFormat.json_lines
+    if bool(partition_term) != bool(partition_values):
+        raise BadOptionUsage(
+            "partition_term",
+            "--partition-term and --partition-values must be used together.",
+        )
+    if windows > 1 and not start:
+        raise BadOptionUsage("windows", "--windows requires the --start option.")
 
     client = Client()
 
@@ -279,12 +423,32 @@ def search_groups(
 
     query.group_by(group_by).maximum_size(10000)
 
-    groups = client.file_events.v2.search_groups(query).groups or []
+    if windows > 1 or partition_term or top:
+        groups = client.file_events.v2.search_groups_partitioned(
+            query,
+            start_date=start if windows > 1 else None,
+            end_date=end if windows > 1 else None,
+            windows=windows,
+            partition_term=partition_term,
+            partition_values=[v.split(",") for v in partition_values],
+            top_k=top,
+            max_workers=max_workers,
+        ).groups
+    else:
+        groups = client.file_events.v2.search_groups(query).groups or []
 
     if output:
-        logger = get_server_logger(output, certs, ignore_cert_validation)
-        for group in groups:
-            logger.info(json.dumps(group.dict()))
+        with create_output_sink(
+            output,
+            certs=certs,
+            ignore_cert_validation=ignore_cert_validation,
+            framing=output_framing,
+            queue_size=output_queue_size,
+            spill_file=output_spill_file,
+            hec_token=hec_token,
+        ) as sink:
+            for group in groups:
+                sink.send(json.dumps(group.dict()))
         return
 
     if format_ == TableFormat.csv:
@@ -303,6 +467,149 @@ def search_groups(
             console.print("No results found.")
 
 
+@file_events.command("filter", cls=IncydrCommand)
+@click.argument("events-file", type=click.Path(exists=True))
+@table_format_option
+@columns_option
+@output_options
+@advanced_query_option
+@saved_search_option
+@event_filter_options
+@logging_options
+def filter_(
+    events_file: str,
+    format_: TableFormat,
+    columns: Optional[str],
+    output: Optional[List[str]],
+    certs: Optional[str],
+    ignore_cert_validation: Optional[bool],
+    output_framing: Optional[str],
+    output_queue_size: Optional[int],
+    output_spill_file: Optional[str],
+    hec_token: Optional[str],
+    advanced_query: Optional[Union[str, File]],
+    saved_search: Optional[str],
+    start: Optional[str],
+    end: Optional[str],
+    event_action: Optional[str],
+    username: Optional[str],
+    md5: Optional[str],
+    sha256: Optional[str],
+    source_category: Optional[str],
+    destination_category: Optional[str],
+    file_name: Optional[str],
+    file_directory: Optional[str],
+    file_category: Optional[str],
+    risk_indicator: Optional[RiskIndicators],
+    risk_severity: Optional[RiskSeverity],
+    risk_score: Optional[int],
+):
+    """
+    Filter file events that were previously downloaded, without searching them again.
+
+    EVENTS_FILE is a file of events in JSON lines format, such as the output of `incydr file-events search --format
+    json-lines`, a Parquet file (which requires the `pyarrow` package), or the directory of an event store populated
+    with `incydr file-events search --store`, of which only the segments that may contain matching events are read.
+
+    Accepts the same filter options as the `search` command, including `--saved-search` and `--advanced-query`.
+    Filters are evaluated locally, so no events are requested from Forensic Search.
+
+    Use the `--output` option to replay the matching events to a server or files. Events from JSON lines files and
+    event stores are read through a memory map and forwarded (or output with `--format json-lines`) as they're
+    stored, without being encoded again.
+    """
+    if saved_search:
+        saved_search = Client().file_events.v2.get_saved_search(saved_search)
+        query = EventQuery.from_saved_search(saved_search)
+    elif advanced_query:
+        if not isinstance(advanced_query, str):
+            advanced_query = advanced_query.read()
+        query = EventQuery.model_validate_json(advanced_query)
+    else:
+        query = _create_query(
+            cls=EventQuery,
+            start=start,
+            end=end,
+            event_action=event_action,
+            username=username,
+            md5=md5,
+            sha256=sha256,
+            source_category=source_category,
+            destination_category=destination_category,
+            file_name=file_name,
+            file_directory=file_directory,
+            file_category=file_category,
+            risk_indicator=risk_indicator,
+            risk_severity=risk_severity,
+            risk_score=risk_score,
+        )
+
+    store = None
+    if os.path.isdir(events_file):
+        if not os.path.exists(os.path.join(events_file, INDEX_FILE)):
+            raise click.BadParameter(
+                f"'{events_file}' is not an event store.", param_hint="EVENTS_FILE"
+            )
+        store = EventStore(events_file)
+        click.get_current_context().call_on_close(store.close)
+
+    if output or format_ == TableFormat.json_lines:
+        # forward events as the JSON they're stored as
+        if store is not None:
+            lines = store.search_raw(query)
+        elif _is_json_lines(events_file):
+            reader = SegmentReader(events_file)
+            click.get_current_context().call_on_close(reader.close)
+            lines = filter_raw(query, reader.iter_raw(), reader.codec)
+        else:
+            lines = (
+                json.dumps(e).encode("utf-8")
+                for e in filter_events(query, read_events(events_file))
+            )
+        if output:
+            with create_output_sink(
+                output,
+                certs=certs,
+                ignore_cert_validation=ignore_cert_validation,
+                framing=output_framing,
+                queue_size=output_queue_size,
+                spill_file=output_spill_file,
+                hec_token=hec_token,
+            ) as sink:
+                for line in lines:
+                    sink.send_raw(line)
+            return
+        stdout = click.get_binary_stream("stdout")
+        printed = False
+        for line in lines:
+            printed = True
+            stdout.write(line)
+            stdout.write(b"\n")
+        stdout.flush()
+        if not printed:
+            console.print("No results found.")
+        return
+
+    if store is not None:
+        events = store.search(query)
+    else:
+        events = filter_events(query, read_events(events_file))
+
+    if format_ == TableFormat.csv:
+        events = (FileEventV2.parse_obj(e) for e in events)
+        render.csv(FileEventV2, events, columns=columns, flat=True)
+    elif format_ == TableFormat.table:
+        events = (FileEventV2.parse_obj(e) for e in events)
+        render.table(FileEventV2, events, columns=columns, flat=False)
+    else:
+        printed = False
+        for event in events:
+            printed = True
+            console.print_json(data=event)
+        if not printed:
+            console.print("No results found.")
+
+
 @file_events.command()
 @click.argument("checkpoint-name")
 def clear_checkpoint(checkpoint_name: str):
@@ -374,6 +681,21 @@ field_option_map = {
 }
 
 
+@contextmanager
+def _stored(events, path):
+    # tees events into the event store at `path`, writing the last of them before the store is closed
+    with EventStore(path) as store, closing(store.tap(events)) as tapped:
+        yield tapped
+
+
+def _is_json_lines(path):
+    # files which read_events() reads as JSON lines, rather than Parquet or a JSON array
+    if path.lower().endswith(".parquet"):
+        return False
+    with open(path, "rb") as f:
+        return f.read(1024).lstrip()[:1] != b"["
+
+
 def _create_query(cls, **kwargs):
     query = cls(start_date=kwargs["start"], end_date=kwargs["end"])
     for k, v in kwargs.items():
@@ -3,6 +3,7 @@ from enum import Enum
 import click
 
 from _incydr_cli.core import incompatible_with
+from _incydr_cli.logger.enums import SyslogFraming
 
 
 class TableFormat(str, Enum):
@@ -55,23 +56,57 @@ columns_option = click.option(
 output_option = click.option(
     "--output",
     default=None,
-    help="Use to send the raw-json data in to a syslog server.  Pass a string in the format PROTOCOL:HOSTNAME:PORT to output "
-    "to the specified server endpoint, where format is either TCP, TLS-TCP, or UDP (ex: TCP:localhost:5000). "
+    multiple=True,
+    help="Use to send the raw-json data to a syslog server, an HTTP Event Collector, or local files. Can be specified "
+    "multiple times to send the same results to several destinations. Pass a string in the format PROTOCOL:HOSTNAME:PORT "
+    "to output to the specified syslog server endpoint, where format is either TCP, TLS-TCP, or UDP (ex: TCP:localhost:5000). "
     "Also accepts strings of the format HOSTNAME and HOSTNAME:PORT. Defaults to TCP protocol on port 601. "
     "The --certs or --ignore-cert-validation option can be used with TLS-TCP format.  Note that most data will be too large to be sent "
-    "via UDP protocol.",
+    "via UDP protocol. Pass an http:// or https:// URL to send batches of events to a Splunk HTTP Event Collector "
+    "(requires --hec-token). Pass file:PATH to write events to rotating JSON lines files, gzip-compressed if PATH ends in '.gz'.",
     cls=incompatible_with(["format"]),
 )
 ignore_cert_validation_option = click.option(
     "--ignore-cert-validation",
     default=False,
-    help="Set to skip CA certificate validation for the TLS-TCP protocol. Incompatible with the 'certs' option.",
+    help="Set to skip CA certificate validation for the TLS-TCP protocol or HTTPS Event Collector. Incompatible with the 'certs' option.",
     cls=incompatible_with(["certs"]),
 )
 certs_option = click.option(
     "--certs",
     default=None,
-    help="A CA certificates-chain file for the TLS-TCP protocol.",
+    help="A CA certificates-chain file for the TLS-TCP protocol or HTTPS Event Collector.",
+)
+hec_token_option = click.option(
+    "--hec-token",
+    default=None,
+    envvar="INCYDR_HEC_TOKEN",
+    help="The token used to authenticate to an HTTP Event Collector passed to --output. "
+    "Can also be set with the INCYDR_HEC_TOKEN environment variable.",
+)
+output_framing_option = click.option(
+    "--output-framing",
+    type=click.Choice([e.value for e in SyslogFraming], case_sensitive=False),
+    default=SyslogFraming.NEWLINE.value,
+    callback=lambda ctx, param, value: value.upper() if value else value,
+    help="How messages sent with --output are delimited on TCP and TLS-TCP connections. 'NEWLINE' terminates each "
+    "message with a newline, 'OCTET-COUNTING' prefixes each message with its length (RFC 6587). Defaults to 'NEWLINE'.",
+)
+output_queue_size_option = click.option(
+    "--output-queue-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Send --output data from a background thread, buffering up to this many events in memory and coalescing "
+    "them into large writes, so a slow server doesn't stall the search. Dropped connections are retried with backoff. "
+    "A summary of delivered and dropped events is printed to stderr when done.",
+)
+output_spill_file_option = click.option(
+    "--output-spill-file",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="With --output-queue-size, write events to this file instead of waiting when the queue is full. Spilled "
+    "events are forwarded once the queue drains, or by the next run that uses the same file. With several syslog "
+    "outputs, each spills to its own file: this path followed by the server, such as PATH.TCP_host_514.",
 )
 
 
@@ -79,4 +114,8 @@ def output_options(f):
     f = output_option(f)
     f = certs_option(f)
     f = ignore_cert_validation_option(f)
+    f = output_framing_option(f)
+    f = output_queue_size_option(f)
+    f = output_spill_file_option(f)
+    f = hec_token_option(f)
     return f
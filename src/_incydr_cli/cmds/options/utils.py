@@ -1,7 +1,16 @@
+from datetime import timedelta
+
 import click
+from isodate import ISO8601Error
+from isodate import parse_duration
 
 from _incydr_cli.cmds.utils import actor_lookup
 from _incydr_cli.cmds.utils import user_lookup
+from _incydr_sdk.aggregations.operators import Aggregation
+from _incydr_sdk.aggregations.operators import Count
+from _incydr_sdk.aggregations.operators import DistinctCount
+from _incydr_sdk.aggregations.operators import TimeHistogram
+from _incydr_sdk.aggregations.operators import TopK
 from _incydr_sdk.core.client import Client
 
 checkpoint_option = click.option(
@@ -14,6 +23,89 @@ checkpoint_option = click.option(
     "Checkpointing is most accurate with json outputs.  For table and csv formats, checkpointing will track the last returned event in the table.",
 )
 
+store_option = click.option(
+    "--store",
+    default=None,
+    type=click.Path(file_okay=False),
+    help="Also store results in the local event store in this directory, skipping events it already holds. "
+    "Stored events can be searched again with `incydr file-events filter DIRECTORY` without another search.",
+)
+
+follow_option = click.option(
+    "--follow",
+    is_flag=True,
+    default=False,
+    help="Keep running and poll for new results after the search completes, until interrupted with CTRL-C. "
+    "The wait between polls shortens while new results keep arriving and backs off while there are none. "
+    "Combine with --checkpoint to resume from the last result if the process is restarted. "
+    "Not available with 'table' format.",
+)
+poll_interval_option = click.option(
+    "--poll-interval",
+    type=click.FloatRange(min=0),
+    default=5,
+    help="With --follow, the shortest time in seconds to wait between polls. Defaults to 5.",
+)
+max_poll_interval_option = click.option(
+    "--max-poll-interval",
+    type=click.FloatRange(min=0),
+    default=300,
+    help="With --follow, the longest time in seconds to wait between polls when no new results arrive. Defaults to 300.",
+)
+
+
+def follow_options(f):
+    f = follow_option(f)
+    f = poll_interval_option(f)
+    f = max_poll_interval_option(f)
+    return f
+
+
+def _parse_aggregate(spec):
+    kind, *args = spec.split(":")
+    if kind == "count" and not args:
+        return Count()
+    if kind == "top" and len(args) in (1, 2):
+        k = args[1] if len(args) == 2 else "10"
+        if not k.isdigit() or int(k) < 1:
+            raise click.BadParameter(f"'{k}' is not a valid number of top values.")
+        return TopK(args[0], k=int(k))
+    if kind == "distinct" and len(args) == 1:
+        return DistinctCount(args[0])
+    if kind == "histogram" and len(args) <= 2:
+        term = args[0] if args else "@timestamp"
+        try:
+            interval = parse_duration(args[1]) if len(args) == 2 else timedelta(days=1)
+        except ISO8601Error:
+            interval = None
+        if not isinstance(interval, timedelta) or interval <= timedelta(0):
+            raise click.BadParameter(
+                f"'{args[1]}' is not a valid interval. Use an ISO duration in days or less, such as P1D or PT1H."
+            )
+        return TimeHistogram(term, interval=interval)
+    raise click.BadParameter(
+        f"'{spec}' is not a valid aggregation. Expected one of: count, top:TERM[:K], distinct:TERM, "
+        "histogram[:TERM[:INTERVAL]]."
+    )
+
+
+def aggregate_callback(ctx, param, value):
+    if not value:
+        return None
+    return Aggregation(**{spec: _parse_aggregate(spec) for spec in value})
+
+
+aggregate_option = click.option(
+    "--aggregate",
+    multiple=True,
+    callback=aggregate_callback,
+    help="Output aggregates of the results instead of the results themselves, computed as they are retrieved with "
+    "bounded memory. Can be passed multiple times. One of: `count` (the number of results), `top:TERM[:K]` (the K, "
+    "default 10, most frequent values of TERM), `distinct:TERM` (the approximate number of distinct values of TERM), "
+    "`histogram[:TERM[:INTERVAL]]` (counts per time interval of TERM, default `@timestamp` and `P1D`). "
+    "Output as JSON, keyed by each aggregation.",
+)
+
 
 def user_lookup_callback(ctx, param, value):
     if not value:
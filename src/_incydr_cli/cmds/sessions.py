@@ -22,11 +22,16 @@ from _incydr_cli.cmds.options.output_options import SingleFormat
 from _incydr_cli.cmds.options.output_options import table_format_option
 from _incydr_cli.cmds.options.output_options import TableFormat
 from _incydr_cli.cmds.options.utils import checkpoint_option
+from _incydr_cli.cmds.options.utils import follow_options
+from _incydr_cli.cmds.utils import AdaptivePollInterval
+from _incydr_cli.cmds.utils import follow as follow_results
 from _incydr_cli.cmds.utils import warn_interrupt
 from _incydr_cli.core import IncydrCommand
 from _incydr_cli.core import IncydrGroup
 from _incydr_cli.cursor import CursorStore
-from _incydr_cli.logger import get_server_logger
+from _incydr_cli.cursor import MemoryCursorStore
+from _incydr_cli.file_readers import report_row_error
+from _incydr_cli.sinks import create_output_sink
 from _incydr_sdk.core.client import Client
 from _incydr_sdk.core.models import CSVModel
 from _incydr_sdk.core.models import Model
@@ -57,6 +62,7 @@ def sessions():
 
 @sessions.command(cls=IncydrCommand)
 @checkpoint_option
+@follow_options
 @click.option(
     "--actor-id", default=None, help="Limit search to sessions generated by this actor."
 )
@@ -121,8 +127,22 @@ def sessions():
     default=None,
     help="Limit search to sessions with the given content inspection status.",
 )
+@click.option(
+    "--with-events",
+    is_flag=True,
+    default=False,
+    help="Include the file events associated with each session in the results, as records of the form "
+    "`{\"session\": {...}, \"events\": [...]}`. Not available with 'table' or 'csv' formats.",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=8,
+    help="With --with-events, the maximum number of sessions to fetch events for at once. Defaults to 8.",
+)
 @table_format_option
 @columns_option
+@output_options
 @logging_options
 def search(
     actor_id: Optional[str] = None,
@@ -136,10 +156,19 @@ def search(
     rule_id: Optional[List[str]] = None,
     watchlist_id: Optional[List[str]] = None,
     content_inspection_status: Optional[str] = None,
-    output: Optional[str] = None,
+    output: Optional[List[str]] = None,
     certs: Optional[str] = None,
     ignore_cert_validation: Optional[bool] = None,
+    output_framing: Optional[str] = None,
+    output_queue_size: Optional[int] = None,
+    output_spill_file: Optional[str] = None,
+    hec_token: Optional[str] = None,
     checkpoint_name: Optional[str] = None,
+    follow: bool = False,
+    poll_interval: float = 5,
+    max_poll_interval: float = 300,
+    with_events: bool = False,
+    max_workers: int = 8,
     format_: Optional[TableFormat] = None,
     columns: Optional[str] = None,
 ):
@@ -148,44 +177,110 @@ def search(
 
     Defaults to only include sessions that have alerts associated with them.
     Use the --no-alerts option to view sessions without any alerts.
-    """
-    client = Client()
-    cursor = _get_cursor_store(client.settings.api_client_id)
 
+    Use `--follow` to keep polling for new sessions after the search completes, until interrupted with CTRL-C.
+    """
     if output:
         format_ = TableFormat.json_lines
+    if follow and format_ == TableFormat.table:
+        raise click.BadOptionUsage(
+            "follow",
+            "--follow can't be used with 'table' format. Use the --format or --output option.",
+        )
+    if with_events and format_ in (TableFormat.table, TableFormat.csv):
+        raise click.BadOptionUsage(
+            "with-events",
+            "--with-events can only be used with JSON formats. Use the --format or --output option.",
+        )
 
-    # Use stored checkpoint timestamp for start filter if applicable
-    if checkpoint_name:
-        checkpoint = cursor.get(checkpoint_name)
-        if checkpoint:
-            start = int(checkpoint)
+    client = Client()
+    cursor = _get_cursor_store(client.settings.api_client_id)
+    if follow:
+        # each poll resumes from the newest session seen so far, held in memory and written
+        # through to the stored checkpoint (if any) so a restarted process can pick up from it
+        cursor = MemoryCursorStore(cursor if checkpoint_name else None)
+        checkpoint_name = checkpoint_name or "follow"
 
     severity_values = []
     for value in severity:
         severity_values.append(SEVERITY_MAP[value])
 
-    sessions_gen = client.sessions.v1.iter_all(
-        actor_id=actor_id,
-        start_time=start,
-        type=type,
-        end_time=end,
-        has_alerts=not no_alerts,
-        risk_indicators=risk_indicators.split(",") if risk_indicators else None,
-        states=[*state] if state else None,
-        severities=severity_values,
-        rule_ids=[*rule_id] if rule_id else None,
-        watchlist_ids=[*watchlist_id] if watchlist_id else None,
-        content_inspection_status=content_inspection_status,
+    def yield_new_sessions():
+        start_ = start
+        # Use stored checkpoint timestamp for start filter if applicable
+        if checkpoint_name:
+            checkpoint = cursor.get(checkpoint_name)
+            if checkpoint:
+                start_ = int(checkpoint)
+
+        sessions_gen = client.sessions.v1.iter_all(
+            actor_id=actor_id,
+            start_time=start_,
+            type=type,
+            end_time=end,
+            has_alerts=not no_alerts,
+            risk_indicators=risk_indicators.split(",") if risk_indicators else None,
+            states=[*state] if state else None,
+            severities=severity_values,
+            rule_ids=[*rule_id] if rule_id else None,
+            watchlist_ids=[*watchlist_id] if watchlist_id else None,
+            content_inspection_status=content_inspection_status,
+        )
+        if not with_events:
+            if checkpoint_name:
+                sessions_gen = _update_checkpoint(cursor, checkpoint_name, sessions_gen)
+            return sessions_gen
+
+        if checkpoint_name:
+            # don't fetch events for sessions a previous run already output
+            processed = set(cursor.get_items(checkpoint_name))
+            sessions_gen = (s for s in sessions_gen if s.session_id not in processed)
+        # events are fetched ahead of output, so checkpoint each session only once its
+        # events have been yielded, never when it's first read
+        results = client.sessions.v1.iter_with_events(
+            sessions_gen, max_workers=max_workers
+        )
+        if checkpoint_name:
+            results = _update_checkpoint(
+                cursor, checkpoint_name, results, key=lambda result: result[0]
+            )
+        return results
+
+    interrupt_context = (
+        warn_interrupt(exit_code=0 if follow else 1)
+        if checkpoint_name
+        else nullcontext()
     )
-    if checkpoint_name:
-        sessions_gen = _update_checkpoint(cursor, checkpoint_name, sessions_gen)
+    with interrupt_context as interrupt:
+        if follow:
+            sessions_gen = follow_results(
+                yield_new_sessions,
+                AdaptivePollInterval(poll_interval, max_poll_interval),
+                should_stop=lambda: interrupt.interrupted,
+            )
+        else:
+            sessions_gen = yield_new_sessions()
+
+        if with_events:
+            sessions_json = (
+                _session_with_events_json(session, events)
+                for session, events in sessions_gen
+            )
+        else:
+            sessions_json = (session.json() for session in sessions_gen)
 
-    with warn_interrupt() if checkpoint_name else nullcontext():
         if output:
-            logger = get_server_logger(output, certs, ignore_cert_validation)
-            for session in sessions_gen:
-                logger.info(session.json())
+            with create_output_sink(
+                output,
+                certs=certs,
+                ignore_cert_validation=ignore_cert_validation,
+                framing=output_framing,
+                queue_size=output_queue_size,
+                spill_file=output_spill_file,
+                hec_token=hec_token,
+            ) as sink:
+                for session in sessions_json:
+                    sink.send(session)
             return
 
         if format_ == TableFormat.table:
@@ -208,12 +303,12 @@ def search(
             render.csv(Session, sessions_gen, columns=columns, flat=True)
         else:
             printed = False
-            for session in sessions_gen:
+            for session in sessions_json:
                 printed = True
                 if format_ == TableFormat.json_pretty:
-                    console.print_json(session.json())
+                    console.print_json(session)
                 else:
-                    click.echo(session.json())
+                    click.echo(session)
             if not printed:
                 console.print("No results found.")
 
@@ -246,9 +341,13 @@ def show(session_id: str, format_: SingleFormat):
 def show_events(
     session_id: str,
     columns: Optional[str],
-    output: Optional[str],
+    output: Optional[List[str]],
     certs: Optional[str],
     ignore_cert_validation: Optional[bool],
+    output_framing: Optional[str],
+    output_queue_size: Optional[int],
+    output_spill_file: Optional[str],
+    hec_token: Optional[str],
     format_: SingleFormat,
 ):
     """
@@ -263,9 +362,17 @@ def show_events(
     events = event_iterator(page)
 
     if output:
-        logger = get_server_logger(output, certs, ignore_cert_validation)
-        for event_ in events:
-            logger.info(event_.json())
+        with create_output_sink(
+            output,
+            certs=certs,
+            ignore_cert_validation=ignore_cert_validation,
+            framing=output_framing,
+            queue_size=output_queue_size,
+            spill_file=output_spill_file,
+            hec_token=hec_token,
+        ) as sink:
+            for event_ in events:
+                sink.send(event_.json())
         return
 
     if format_ == TableFormat.csv:
@@ -362,9 +469,9 @@ def bulk_update_state(
         note: Optional[str] = None
 
     if format_ == "csv":
-        models = SessionCSV.parse_csv(file)
+        models = SessionCSV.parse_csv(file, on_error=report_row_error)
     else:
-        models = SessionJSON.parse_json_lines(file)
+        models = SessionJSON.parse_json_lines(file, on_error=report_row_error)
 
     # Process input
 
@@ -397,7 +504,12 @@ def _get_cursor_store(api_key):
     return CursorStore(dir_path, "sessions")
 
 
-def _update_checkpoint(cursor, checkpoint_name, sessions_gen):
+def _session_with_events_json(session, events):
+    file_events = ",".join(event.json() for event in events.file_events)
+    return f'{{"session": {session.json()}, "events": [{file_events}]}}'
+
+
+def _update_checkpoint(cursor, checkpoint_name, results, key=None):
     """
     De-duplicates results across checkpointed runs.
 
@@ -409,17 +521,25 @@ def _update_checkpoint(cursor, checkpoint_name, sessions_gen):
     It's also possible that two sessions have the exact same timestamp, so
     `checkpoint_sessions` needs to be a list of session IDs so we can filter out everything that's actually
     been processed.
+
+    `key` gets the session from each result, for results that aren't sessions themselves
+    (such as `(session, events)` pairs). The checkpoint only moves past a result once it's
+    been yielded and the next one is requested.
     """
     checkpoint_sessions = cursor.get_items(checkpoint_name)
-    new_timestamp = None
-    new_sessions = []
-    for session in sessions_gen:
+    checkpoint = cursor.get(checkpoint_name)
+    # keep the IDs of already processed sessions that share the checkpoint timestamp, in case
+    # they're returned again alongside new sessions with that same timestamp
+    new_timestamp = int(checkpoint) if checkpoint else None
+    new_sessions = list(checkpoint_sessions)
+    for result in results:
+        session = key(result) if key else result
         session_id = session.session_id
         if session_id not in checkpoint_sessions:
             if not new_timestamp or session.end_time > new_timestamp:
                 new_timestamp = session.end_time
                 new_sessions.clear()
             new_sessions.append(session_id)
-            yield session
+            yield result
             cursor.replace(checkpoint_name, new_timestamp)
             cursor.replace_items(checkpoint_name, new_sessions)
@@ -0,0 +1,54 @@
+import os
+
+import click
+
+from _incydr_cli import console
+from _incydr_cli import get_user_project_path
+from _incydr_cli import logging_options
+from _incydr_cli.core import IncydrCommand
+from _incydr_sdk.core.client import Client
+from _incydr_sdk.mirror.store import ENTITIES
+from _incydr_sdk.mirror.store import LocalMirror
+
+
+@click.command(cls=IncydrCommand)
+@click.option(
+    "--path",
+    default=None,
+    help="The SQLite database file to store the mirror in. Defaults to a file in the ~/.incydr/mirror directory "
+    "for the configured API client.",
+)
+@click.option(
+    "--entity",
+    "entities",
+    type=click.Choice(ENTITIES),
+    multiple=True,
+    help="The entity type to sync. Can be specified multiple times. Defaults to all entity types.",
+)
+@click.option(
+    "--full",
+    is_flag=True,
+    default=False,
+    help="Fetch every record, instead of only the agents and devices changed since the last sync.",
+)
+@logging_options
+def sync(path, entities, full):
+    """
+    Copy actors, users, agents and devices to a local SQLite database.
+
+    Agents and devices are refreshed incrementally, fetching only the records with recent activity, unless `--full`
+    is passed or the last full sync is more than a day old. Other entity types are always fetched in full.
+
+    The database can be queried directly, or with `incydr.LocalMirror` in the SDK.
+    """
+    client = Client()
+    if path is None:
+        path = os.path.join(
+            get_user_project_path("mirror"),
+            f"{client.settings.api_client_id or 'default'}.db",
+        )
+    with LocalMirror(client, path) as mirror:
+        written = mirror.sync(entities or ENTITIES, full=full)
+    for entity, count in written.items():
+        console.print(f"Synced {count} {entity}.", highlight=False)
+    console.print(f"Mirror saved to {path}", highlight=False)
@@ -26,6 +26,7 @@ from _incydr_cli.cmds.utils import user_lookup
 from _incydr_cli.core import IncydrCommand
 from _incydr_cli.core import IncydrGroup
 from _incydr_cli.file_readers import AutoDecodedFile
+from _incydr_cli.file_readers import report_row_error
 from _incydr_sdk.agents.models import Agent
 from _incydr_sdk.core.client import Client
 from _incydr_sdk.devices.models import Device
@@ -423,9 +424,9 @@ def bulk_update_roles(
         role: str = Field(alias="roleId")
 
     if format_ == "csv":
-        roles_file = RoleUpdateCSV.parse_csv(file)
+        roles_file = RoleUpdateCSV.parse_csv(file, on_error=report_row_error)
     else:
-        roles_file = RoleUpdateJSON.parse_json_lines(file)
+        roles_file = RoleUpdateJSON.parse_json_lines(file, on_error=report_row_error)
 
     if update_method == "add":
         update_func = client.users.v1.add_roles
@@ -480,9 +481,9 @@ def bulk_activate(file: Path, format_: str):
             return user
 
     if format_ == "csv":
-        models = UserCSV.parse_csv(file)
+        models = UserCSV.parse_csv(file, on_error=report_row_error)
     else:
-        models = UserJSON.parse_json_lines(file)
+        models = UserJSON.parse_json_lines(file, on_error=report_row_error)
 
     try:
         for row in track(
@@ -521,9 +522,9 @@ def bulk_deactivate(file: Path, format_: str):
             return user
 
     if format_ == "csv":
-        models = UserCSV.parse_csv(file)
+        models = UserCSV.parse_csv(file, on_error=report_row_error)
     else:
-        models = UserJSON.parse_json_lines(file)
+        models = UserJSON.parse_json_lines(file, on_error=report_row_error)
 
     try:
         for row in track(
@@ -572,9 +573,9 @@ def bulk_move(file: Path, format_: str):
             return user
 
     if format_ == "csv":
-        models = UserMoveCSV.parse_csv(file)
+        models = UserMoveCSV.parse_csv(file, on_error=report_row_error)
     else:
-        models = UserMoveJSON.parse_json_lines(file)
+        models = UserMoveJSON.parse_json_lines(file, on_error=report_row_error)
 
     try:
         for row in track(
@@ -1,4 +1,5 @@
 # CLI - specific utils.py file to avoid circular imports
+import time
 from functools import wraps
 from signal import getsignal
 from signal import SIGINT
@@ -49,8 +50,10 @@ def actor_lookup(client, value):
 
 class warn_interrupt:
     """A context decorator class used to wrap functions where a keyboard interrupt could potentially
-    leave things in a bad state. Warns the user with provided message and exits when wrapped
-    function is complete. Requires user to ctrl-c a second time to force exit.
+    leave things in a bad state. Warns the user with provided message and exits with `exit_code` when
+    wrapped function is complete. Requires user to ctrl-c a second time to force exit.
+
+    Pass `exit_code=0` where an interrupt is the normal way to stop, such as `--follow`.
 
     Usage:
 
@@ -59,8 +62,11 @@ class warn_interrupt:
         pass
     """
 
-    def __init__(self, warning="Cancelling operation cleanly, one moment... "):
+    def __init__(
+        self, warning="Cancelling operation cleanly, one moment... ", exit_code=1
+    ):
         self.warning = warning
+        self.exit_code = exit_code
         self.old_int_handler = None
         self.interrupted = False
         self.exit_instructions = style("Hit CTRL-C again to force quit.", fg="red")
@@ -72,7 +78,7 @@ class warn_interrupt:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.interrupted:
-            exit(1)
+            exit(self.exit_code)
         signal(SIGINT, self.old_int_handler)
 
         return False
@@ -91,3 +97,40 @@ class warn_interrupt:
                 return func(*args, **kwargs)
 
         return inner
+
+
+class AdaptivePollInterval:
+    """Tracks how long `--follow` mode waits between polls.
+
+    The interval halves (down to `minimum` seconds) after a poll that returns results and doubles (up to `maximum`
+    seconds) after one that doesn't, so busy streams are polled often and idle ones back off.
+    """
+
+    def __init__(self, minimum=5, maximum=300):
+        self.minimum = minimum
+        self.maximum = max(minimum, maximum)
+        self.current = minimum
+
+    def update(self, result_count):
+        """Adjusts the interval for the number of results returned by the last poll and returns it."""
+        if result_count:
+            self.current = max(self.minimum, self.current / 2)
+        else:
+            self.current = min(self.maximum, self.current * 2)
+        return self.current
+
+
+def follow(poll, interval, should_stop, sleep=time.sleep):
+    """
+    Yields the results of calling `poll()` over and over, waiting between polls according to the
+    `AdaptivePollInterval` passed as `interval`. Stops before the next poll once `should_stop()` returns True.
+    """
+    while not should_stop():
+        count = 0
+        for result in poll():
+            count += 1
+            yield result
+        deadline = time.monotonic() + interval.update(count)
+        # sleep in short increments so an interrupt doesn't have to wait out a long interval
+        while not should_stop() and time.monotonic() < deadline:
+            sleep(min(1, deadline - time.monotonic()))
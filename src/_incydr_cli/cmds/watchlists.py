@@ -2,8 +2,6 @@ from typing import Optional
 from uuid import UUID
 
 import click
-import requests
-from boltons.iterutils import chunked
 from rich.progress import track
 from rich.table import Table
 
@@ -23,6 +21,7 @@ from _incydr_cli.core import incompatible_with
 from _incydr_cli.core import IncydrCommand
 from _incydr_cli.core import IncydrGroup
 from _incydr_cli.file_readers import FileOrString
+from _incydr_cli.file_readers import report_row_error
 from _incydr_cli.render import measure_renderable
 from _incydr_cli.render import models_as_table
 from _incydr_sdk.core.client import Client
@@ -359,71 +358,29 @@ def add(
     # Add included actors
     if actors:
         actor_ids, errors = _get_actor_ids(client, actors, format_=format_)
-        succeeded = 0
-        for chunk in chunked(actor_ids, size=100):
-            try:
-                client.watchlists.v2.add_included_actors(watchlist, chunk)
-                console.print(
-                    f"Successfully included {len(chunk)} actors on watchlist with ID: '{watchlist}'"
-                )
-                succeeded += len(chunk)
-            except requests.HTTPError as err:
-                if "Actor not found" in err.response.text:
-                    console.print(
-                        "Problem processing batch of actors, will attempt each individually."
-                    )
-                    chunk_succeeded = 0
-                    for actor in chunk:
-                        try:
-                            client.watchlists.v2.add_included_actors(watchlist, actor)
-                            succeeded += 1
-                            chunk_succeeded += 1
-                        except requests.HTTPError as err:
-                            client.settings.logger.error(
-                                f"Problem adding actorId={actor} to watchlist={watchlist}: {err.response.text}"
-                            )
-                            errors.append(actor)
-                    console.print(
-                        f"Successfully included {chunk_succeeded} users on watchlist with ID: '{watchlist}'"
-                    )
-                else:
-                    raise err
+        failed = client.watchlists.v2.update_actors_in_batches(
+            client.watchlists.v2.add_included_actors, watchlist, actor_ids
+        )
+        errors += failed
+        if actor_ids:
+            console.print(
+                f"Successfully included {len(actor_ids) - len(failed)} actors on watchlist with ID: '{watchlist}'"
+            )
         if errors:
             console.print("[red]The following usernames/user IDs were not found:")
             console.print("\t" + "\n\t".join(errors))
 
     # Add excluded actors
     if excluded_actors:
-        succeeded = 0
         actor_ids, errors = _get_actor_ids(client, excluded_actors, format_=format_)
-        for chunk in chunked(actor_ids, size=100):
-            try:
-                client.watchlists.v2.add_excluded_actors(watchlist, chunk)
-                console.print(
-                    f"Successfully excluded {len(chunk)} actors from watchlist with ID: '{watchlist}'"
-                )
-                succeeded += len(chunk)
-            except requests.HTTPError as err:
-                if "Actor not found" in err.response.text:
-                    console.print(
-                        "Problem processing batch of actors, will attempt each individually."
-                    )
-                    chunk_succeeded = 0
-                    for actor in chunk:
-                        try:
-                            client.watchlists.v2.add_excluded_actors(watchlist, actor)
-                            succeeded += 1
-                            chunk_succeeded += 1
-                        except requests.HTTPError as err:
-                            client.settings.logger.error(
-                                f"Problem excluding actorId={actor} from watchlist={watchlist}: {err.response.text}"
-                            )
-                            errors.append(actor)
-                    console.print(
-                        f"Successfully excluded {chunk_succeeded} users from watchlist with ID: '{watchlist}'"
-                    )
-                else:
-                    raise err
+        failed = client.watchlists.v2.update_actors_in_batches(
+            client.watchlists.v2.add_excluded_actors, watchlist, actor_ids
+        )
+        errors += failed
+        if actor_ids:
+            console.print(
+                f"Successfully excluded {len(actor_ids) - len(failed)} actors from watchlist with ID: '{watchlist}'"
+            )
         if errors:
             console.print("[red]The following actornames/actor IDs were not found:")
             console.print("\t" + "\n\t".join(errors))
@@ -543,37 +500,14 @@ def remove(
     # Remove included users
     if actors:
         actor_ids, errors = _get_actor_ids(client, actors, format_=format_)
-        succeeded = 0
-        for chunk in chunked(actor_ids, size=100):
-            try:
-                client.watchlists.v2.remove_included_actors(watchlist, chunk)
-                console.print(
-                    f"Successfully removed {len(chunk)} included actors on watchlist with ID: '{watchlist}'"
-                )
-                succeeded += len(chunk)
-            except requests.HTTPError as err:
-                if "Actor not found" in err.response.text:
-                    console.print(
-                        "Problem processing batch of actors, will attempt each individually."
-                    )
-                    chunk_succeeded = 0
-                    for actor in chunk:
-                        try:
-                            client.watchlists.v2.remove_included_actors(
-                                watchlist, actor
-                            )
-                            succeeded += 1
-                            chunk_succeeded += 1
-                        except requests.HTTPError as err:
-                            client.settings.logger.error(
-                                f"Problem removing actorId={actor} from watchlist={watchlist}: {err.response.text}"
-                            )
-                            errors.append(actor)
-                    console.print(
-                        f"Successfully removed {chunk_succeeded} actors from watchlist with ID: '{watchlist}'"
-                    )
-                else:
-                    raise err
+        failed = client.watchlists.v2.update_actors_in_batches(
+            client.watchlists.v2.remove_included_actors, watchlist, actor_ids
+        )
+        errors += failed
+        if actor_ids:
+            console.print(
+                f"Successfully removed {len(actor_ids) - len(failed)} included actors on watchlist with ID: '{watchlist}'"
+            )
         if errors:
             console.print("[red]The following actornames/actor IDs were not found:")
             console.print("\t" + "\n\t".join(errors))
@@ -581,40 +515,17 @@ def remove(
     # Remove excluded users
     if excluded_actors:
         actor_ids, errors = _get_actor_ids(client, excluded_actors, format_=format_)
-        succeeded = 0
-        for chunk in chunked(actor_ids, size=100):
-            try:
-                client.watchlists.v2.remove_excluded_actors(watchlist, chunk)
-                console.print(
-                    f"Successfully removed {len(chunk)} excluded actors from watchlist with ID: '{watchlist}'"
-                )
-                succeeded += len(chunk)
-            except requests.HTTPError as err:
-                if "User not found" in err.response.text:
-                    console.print(
-                        "Problem processing batch of actors, will attempt each individually."
-                    )
-                    chunk_succeeded = 0
-                    for actor in chunk:
-                        try:
-                            client.watchlists.v2.remove_excluded_actors(
-                                watchlist, actor
-                            )
-                            succeeded += 1
-                            chunk_succeeded += 1
-                        except requests.HTTPError as err:
-                            client.settings.logger.error(
-                                f"Problem removing excluded actorId={actor} from watchlist={watchlist}: {err.response.text}"
-                            )
-                            errors.append(actor)
-                    console.print(
-                        f"Successfully removed {chunk_succeeded} excluded actors from watchlist with ID: '{watchlist}'"
-                    )
-                else:
-                    raise err
-            if errors:
-                console.print("[red]The following actornames/actor IDs were not found:")
-                console.print("\t" + "\n\t".join(errors))
+        failed = client.watchlists.v2.update_actors_in_batches(
+            client.watchlists.v2.remove_excluded_actors, watchlist, actor_ids
+        )
+        errors += failed
+        if actor_ids:
+            console.print(
+                f"Successfully removed {len(actor_ids) - len(failed)} excluded actors from watchlist with ID: '{watchlist}'"
+            )
+        if errors:
+            console.print("[red]The following actornames/actor IDs were not found:")
+            console.print("\t" + "\n\t".join(errors))
 
     # Remove departments
     if departments:
@@ -635,6 +546,116 @@ def remove(
         )
 
 
+@watchlists.command(cls=IncydrCommand)
+@watchlist_arg
+@click.option(
+    "--actors",
+    default=None,
+    type=FileOrString(),
+    help="The complete list of actor IDs or actor names that should be included on the watchlist. "
+    "An additional lookup is performed if an actor name is passed. Argument can be "
+    "passed as a comma-delimited string or from a file if prefixed with '@', e.g. '--actors @actors.csv'. "
+    "File should have a single 'user' column (or 'id', 'userId', 'username'). File format can either be CSV or JSON Lines format, "
+    "as specified with the --format option (Default is CSV).",
+)
+@click.option(
+    "--excluded-actors",
+    default=None,
+    type=FileOrString(),
+    help="The complete list of actor IDs or actor names that should be excluded from the watchlist. "
+    "Accepts the same formats as --actors.",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=4,
+    help="The maximum number of batches of 100 actors to send at once. Defaults to 4.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Print the changes that would be made without applying them.",
+)
+@input_format_option
+@logging_options
+def sync(
+    watchlist: str,
+    actors=None,
+    excluded_actors=None,
+    max_workers: int = 4,
+    dry_run: bool = False,
+    format_=None,
+):
+    """
+    Make the individually included and/or excluded actors of a watchlist match a desired list, such as an export
+    from an HR system.
+
+    The watchlist's current actors are compared with the desired ones and only the difference is applied: actors
+    missing from the watchlist are added, and actors that are no longer in the list are removed. Included or excluded
+    actors are left unchanged when the corresponding option isn't passed.
+
+    WATCHLIST can be specified by watchlist type (ex: `DEPARTING_EMPLOYEE`) or ID.
+    `CUSTOM` watchlists must be specified by title or ID.
+    """
+    if actors is None and excluded_actors is None:
+        raise click.UsageError(
+            "At least one of '--actors' or '--excluded-actors' is required."
+        )
+    client = Client()
+    errors = []
+    actor_ids = excluded_actor_ids = None
+    if actors is not None:
+        actor_ids, lookup_errors = _get_actor_ids(client, actors, format_=format_)
+        errors += lookup_errors
+    if excluded_actors is not None:
+        excluded_actor_ids, lookup_errors = _get_actor_ids(
+            client, excluded_actors, format_=format_
+        )
+        errors += lookup_errors
+    if errors:
+        console.print("[red]The following actor names were not found:")
+        console.print("\t" + "\n\t".join(errors))
+        raise click.ClickException(
+            "Unable to sync watchlist while some desired actors can't be found."
+        )
+
+    result = client.watchlists.v2.sync(
+        watchlist,
+        included_actor_ids=actor_ids,
+        excluded_actor_ids=excluded_actor_ids,
+        max_workers=max_workers,
+        dry_run=dry_run,
+    )
+    failed = set(result.failed)
+    for ids, action, done in [
+        (result.included_added, "include", "included"),
+        (result.included_removed, "remove included", "removed included"),
+        (result.excluded_added, "exclude", "excluded"),
+        (result.excluded_removed, "remove excluded", "removed excluded"),
+    ]:
+        if ids and dry_run:
+            console.print(
+                f"Would {action} {len(ids)} actors for watchlist with ID: '{watchlist}'"
+            )
+        elif ids:
+            console.print(
+                f"Successfully {done} {len(set(ids) - failed)} actors for watchlist with ID: '{watchlist}'"
+            )
+    if not any(
+        [
+            result.included_added,
+            result.included_removed,
+            result.excluded_added,
+            result.excluded_removed,
+        ]
+    ):
+        console.print(f"Watchlist with ID: '{watchlist}' is already in sync.")
+    if result.failed:
+        console.print("[red]The following actor IDs were not found:")
+        console.print("\t" + "\n\t".join(result.failed))
+
+
 @watchlists.command(cls=IncydrCommand)
 @watchlist_arg
 @columns_option
@@ -756,9 +777,9 @@ def _get_actor_ids(client, actors, format_=None):
                 errors.append(actor)
     else:
         if format_ == "csv":
-            actors = UserCSV.parse_csv(actors)
+            actors = UserCSV.parse_csv(actors, on_error=report_row_error)
         else:
-            actors = UserJSON.parse_json_lines(actors)
+            actors = UserJSON.parse_json_lines(actors, on_error=report_row_error)
         for row in track(
             actors,
             description="Reading actors...",
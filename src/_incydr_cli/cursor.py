@@ -93,3 +93,41 @@ class CursorStore:
         location = path.join(self._dir_path, cursor_name) + f"_{self._event_key}"
         with open(location, "w") as checkpoint:
             checkpoint.write(json.dumps(new_events))
+
+
+class MemoryCursorStore:
+    """
+    Keeps checkpoints in memory, for searches that poll repeatedly within one process (`--follow` mode).
+
+    If a `CursorStore` is given, reads fall back to it and writes go through to it, so a restarted process resumes
+    from where the previous one stopped.
+    """
+
+    def __init__(self, store=None):
+        self._store = store
+        self._cursors = {}
+        self._items = {}
+
+    def get(self, cursor_name):
+        if cursor_name not in self._cursors:
+            self._cursors[cursor_name] = (
+                self._store.get(cursor_name) if self._store else None
+            )
+        return self._cursors[cursor_name]
+
+    def replace(self, cursor_name, new_checkpoint):
+        self._cursors[cursor_name] = str(new_checkpoint)
+        if self._store:
+            self._store.replace(cursor_name, new_checkpoint)
+
+    def get_items(self, cursor_name):
+        if cursor_name not in self._items:
+            self._items[cursor_name] = (
+                self._store.get_items(cursor_name) if self._store else []
+            )
+        return self._items[cursor_name]
+
+    def replace_items(self, cursor_name, new_events):
+        self._items[cursor_name] = list(new_events)
+        if self._store:
+            self._store.replace_items(cursor_name, new_events)
@@ -1,5 +1,30 @@
 import chardet
 import click
+from rich.markup import escape
+
+from _incydr_cli import console
+
+# the number of bytes read from the start of a file to detect its encoding
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+
+def detect_encoding(path, sample_size: int = ENCODING_SAMPLE_SIZE):
+    """
+    Detects the encoding of a file from its first `sample_size` bytes, so that large files don't need to be read in
+    full before they're processed.
+    """
+    with open(path, "rb") as file:
+        sample = file.read(sample_size)
+    encoding = chardet.detect(sample)["encoding"]
+    # a sample that's entirely ASCII could be followed by any UTF-8 text
+    if encoding == "ascii":
+        return "utf-8"
+    return encoding
+
+
+def report_row_error(line: int, message: str):
+    """Prints an error for an invalid row of an input file, for use as the `on_error` argument when parsing files."""
+    console.print(f"[red]Error:[/red] {escape(message)}", highlight=False)
 
 
 class AutoDecodedFile(click.File):
@@ -7,8 +32,7 @@ class AutoDecodedFile(click.File):
 
     def convert(self, value, param, ctx):
         try:
-            with open(value, "rb") as file:
-                self.encoding = chardet.detect(file.read())["encoding"]
+            self.encoding = detect_encoding(value)
         except Exception:
             pass  # we'll let click.File do its own exception handling for the filepath
 
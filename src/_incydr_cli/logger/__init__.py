@@ -1,54 +1,67 @@
 import logging
-from threading import Lock
 
 import click
 from click import BadOptionUsage
 
 from _incydr_cli.logger.enums import ServerProtocol
+from _incydr_cli.logger.enums import SyslogFraming
 from _incydr_cli.logger.handlers import NoPrioritySysLogHandler
+from _incydr_cli.logger.handlers import QueuedSysLogHandler
 
 # prevent loggers from printing stacks to stderr if a pipe is broken
 
 
 logging.raiseExceptions = False
 
-logger_deps_lock = Lock()
 
-
-def _init_logger(logger, handler):
-    logger.setLevel(logging.INFO)
-    handler.setFormatter(logging.Formatter(fmt="%(message)s"))
-    logger.addHandler(handler)
-    return logger
-
-
-def get_logger_for_server(protocol, hostname, port, certs):
-    """Gets the logger that sends logs to a server..
+def create_server_handler(
+    protocol,
+    hostname,
+    port,
+    certs,
+    framing=SyslogFraming.NEWLINE,
+    queue_size=None,
+    spill_file=None,
+):
+    """Creates and connects a handler that sends logs to a server.
 
     Args:
         hostname: The hostname of the server. It may include the port.
         port: The port for the server.  Defaults to 601.
         protocol: The transfer protocol for sending logs.
         certs: Use for passing SSL/TLS certificates when connecting to the server.
+        framing: How messages are delimited on TCP/TLS-TCP connections.
+        queue_size: If set, records are sent from a background thread through a queue of this size
+            (see `QueuedSysLogHandler`) instead of on the logging thread.
+        spill_file: File to write records to when the queue is full. Only used with `queue_size`.
     """
-    logger = logging.getLogger("incydr_syslog")
-    if len(logger.handlers):  # if logger has handlers
-        return logger
-
-    with logger_deps_lock:
-        hostname = hostname
-        port = port or 601
-        protocol = protocol.value if isinstance(protocol, ServerProtocol) else protocol
-        if not len(logger.handlers):
-            handler = NoPrioritySysLogHandler(hostname, int(port), protocol, certs)
-            handler.connect_socket()
-            return _init_logger(logger, handler)
-    return logger
+    port = port or 601
+    protocol = protocol.value if isinstance(protocol, ServerProtocol) else protocol
+    framing = framing.value if isinstance(framing, SyslogFraming) else framing
+    if queue_size:
+        handler = QueuedSysLogHandler(
+            hostname,
+            int(port),
+            protocol,
+            certs,
+            framing=framing,
+            queue_size=queue_size,
+            spill_file=spill_file,
+        )
+    else:
+        handler = NoPrioritySysLogHandler(
+            hostname, int(port), protocol, certs, framing=framing
+        )
+    handler.connect_socket()
+    return handler
 
 
-def get_server_logger(output, certs, ignore_cert_validation):
+def parse_server_output(output, certs, ignore_cert_validation):
+    """
+    Parses an `--output` string of the form PROTOCOL:HOSTNAME:PORT, HOSTNAME:PORT or HOSTNAME.
 
-    # parse output
+    Returns a `(protocol, hostname, port, certs)` tuple.
+    """
     output = output.split(":")
 
     protocol = ServerProtocol.TCP
@@ -88,9 +101,4 @@ def get_server_logger(output, certs, ignore_cert_validation):
     if ignore_cert_validation:
         certs = "ignore"
 
-    try:
-        return get_logger_for_server(protocol, hostname, port, certs)
-    except Exception as err:
-        raise ConnectionError(
-            f"Unable to connect to {hostname}. Failed with error: {err}."
-        )
+    return protocol, hostname, port, certs
@@ -8,3 +8,13 @@ class ServerProtocol(str, Enum):
 
     def __iter__(self):
         return iter([self.TCP, self.UDP, self.TLS_TCP])
+
+
+class SyslogFraming(str, Enum):
+    """How messages are delimited on stream (TCP/TLS-TCP) connections, per RFC 6587."""
+
+    NEWLINE = "NEWLINE"
+    OCTET_COUNTING = "OCTET-COUNTING"
+
+    def __iter__(self):
+        return iter([self.NEWLINE, self.OCTET_COUNTING])
@@ -1,10 +1,15 @@
 import logging
+import os
+import queue
 import socket
 import ssl
 import sys
+import threading
+import time
 from logging.handlers import SysLogHandler
 
 from _incydr_cli.logger import ServerProtocol
+from _incydr_cli.logger.enums import SyslogFraming
 
 
 class SyslogServerNetworkConnectionError(Exception):
@@ -33,13 +38,16 @@ class NoPrioritySysLogHandler(SysLogHandler):
         protocol: The protocol over which to submit syslog messages. Accepts TCP, UDP, or TLS.
         certs: Certs to specify when using TLS-TCP for the `protocol` argument. Use "ignore" for
             ssl.CERT_NONE (ignoring certificate validation).
+        framing: How messages are delimited on TCP/TLS-TCP connections. Either newline-terminated (default) or
+            RFC 6587 octet-counting (`<length> <message>`). UDP messages are always newline-terminated.
     """
 
-    def __init__(self, hostname, port, protocol, certs):
+    def __init__(self, hostname, port, protocol, certs, framing=SyslogFraming.NEWLINE):
         self._hostname = hostname
         self._port = port
         self._protocol = protocol
         self._certs = certs
+        self._framing = framing
         self.address = (hostname, port)
         logging.Handler.__init__(self)
         self.socktype = _try_get_socket_type_from_protocol(protocol)
@@ -90,14 +98,20 @@ class NoPrioritySysLogHandler(SysLogHandler):
         super().handleError(record)
 
     def _send_record(self, record):
-        formatted_record = self.format(record)
-        msg = formatted_record + "\n"
-        msg = msg.encode("utf-8")
+        msg = self._frame(self.format(record).encode("utf-8"))
         if self.socktype == socket.SOCK_DGRAM:
             self.socket.sendto(msg, self.address)
         else:
             self.socket.sendall(msg)
 
+    def _frame(self, msg):
+        if (
+            self.socktype == socket.SOCK_STREAM
+            and self._framing == SyslogFraming.OCTET_COUNTING
+        ):
+            return b"%d %b" % (len(msg), msg)
+        return msg + b"\n"
+
     def close(self):
         if self._wrap_socket:
             self.socket.unwrap()
@@ -105,6 +119,270 @@ class NoPrioritySysLogHandler(SysLogHandler):
         logging.Handler.close(self)
 
 
+# sentinels placed on a send queue to control the thread draining it
+FLUSH = object()
+STOP = object()
+
+
+def collect_batch(q, item, max_items, max_bytes):
+    """
+    Builds a batch starting with `item` by taking further items from the queue `q` without waiting, until the batch
+    reaches `max_items` items or roughly `max_bytes` in size, the queue is empty, or a `FLUSH`/`STOP` sentinel is
+    taken.
+
+    Returns a `(batch, sentinel)` tuple, where `sentinel` is `None` if no sentinel was taken.
+    """
+    batch, size = [], 0
+    while item is not FLUSH and item is not STOP:
+        batch.append(item)
+        size += len(item)
+        if len(batch) >= max_items or size >= max_bytes:
+            return batch, None
+        try:
+            item = q.get_nowait()
+        except queue.Empty:
+            return batch, None
+    return batch, item
+
+
+class QueuedSysLogHandler(NoPrioritySysLogHandler):
+    """
+    A `NoPrioritySysLogHandler` that does not send on the logging thread. Formatted records are put on a bounded
+    in-memory queue which a background sender thread drains, coalescing many records into a single socket write.
+
+    When the queue is full, logging blocks until the sender catches up (so a slow server slows down the producer
+    instead of growing memory), unless a `spill_file` is given, in which case overflow records are appended to that
+    file and forwarded once the queue drains. Records left in the spill file by an interrupted run are forwarded by
+    the next handler that uses the same file.
+
+    If sending fails, the connection is re-established with exponential backoff. Once `max_reconnect_attempts` is
+    exhausted the handler stops sending, counts any remaining records as dropped, and the next call to `emit()` raises
+    a `SyslogServerNetworkConnectionError`. A batch that fails part-way through is resent in full after reconnecting,
+    so delivery is at-least-once.
+
+    Call `flush()` to block until everything logged so far has been handed to the server (or dropped), and `stats`
+    for delivered/dropped counters.
+
+    Args:
+        hostname: The hostname of the syslog server to send log messages to.
+        port: The port of the syslog server to send log messages to.
+        protocol: The protocol over which to submit syslog messages. Accepts TCP, UDP, or TLS.
+        certs: Certs to specify when using TLS-TCP for the `protocol` argument.
+        framing: How messages are delimited on TCP/TLS-TCP connections.
+        queue_size: The maximum number of records held in memory waiting to be sent. Defaults to 10,000.
+        batch_size: The maximum number of records coalesced into a single write. Defaults to 500.
+        batch_bytes: The approximate maximum size in bytes of a single write. Defaults to 1MB.
+        spill_file: Optional path of a file to write records to when the queue is full.
+        max_reconnect_attempts: How many times to reconnect after a send failure before giving up. Defaults to 5.
+        reconnect_backoff: The initial number of seconds to wait before reconnecting, doubled for each consecutive
+            failure up to 30 seconds. Defaults to 0.5.
+        flush_interval: How often (in seconds) an idle sender checks the spill file for records to forward.
+    """
+
+    max_reconnect_backoff = 30
+
+    def __init__(
+        self,
+        hostname,
+        port,
+        protocol,
+        certs,
+        framing=SyslogFraming.NEWLINE,
+        queue_size=10000,
+        batch_size=500,
+        batch_bytes=1024 * 1024,
+        spill_file=None,
+        max_reconnect_attempts=5,
+        reconnect_backoff=0.5,
+        flush_interval=1.0,
+    ):
+        super().__init__(hostname, port, protocol, certs, framing=framing)
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._batch_size = batch_size
+        self._batch_bytes = batch_bytes
+        self._spill_file = str(spill_file) if spill_file else None
+        self._spill_stream = None
+        self._spill_lock = threading.Lock()
+        self._spill_pending = bool(self._spill_file) and any(
+            os.path.exists(p) for p in (self._spill_file, self._replay_file)
+        )
+        self._max_reconnect_attempts = max_reconnect_attempts
+        self._reconnect_backoff = reconnect_backoff
+        self._flush_interval = flush_interval
+        self._error = None
+        self._delivered = 0
+        self._dropped = 0
+        self._spilled = 0
+        self._reconnects = 0
+        self._sender = threading.Thread(
+            target=self._run, name="incydr-syslog-sender", daemon=True
+        )
+        self._sender.start()
+
+    @property
+    def stats(self):
+        """A `dict` of counters for records `delivered` to the server, `dropped` after the connection could not be
+        re-established, written to the spill file (`spilled`), `reconnects` made, and currently `queued`."""
+        return {
+            "delivered": self._delivered,
+            "dropped": self._dropped,
+            "spilled": self._spilled,
+            "reconnects": self._reconnects,
+            "queued": self._queue.qsize(),
+        }
+
+    def emit(self, record):
+        try:
+            if self._error is not None:
+                raise ConnectionError(str(self._error))
+            msg = self.format(record).encode("utf-8")
+            if self._spill_file is None:
+                self._queue.put(msg)
+            else:
+                try:
+                    self._queue.put_nowait(msg)
+                except queue.Full:
+                    self._spill(msg)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        """Blocks until every record emitted so far, including spilled records, has been sent or dropped."""
+        if self._sender.is_alive():
+            self._queue.put(FLUSH)
+            self._queue.join()
+
+    def close(self):
+        if self._sender.is_alive():
+            self._queue.put(STOP)
+            self._sender.join()
+        if self.socket is not None:
+            self._close_socket()
+        logging.Handler.close(self)
+
+    def _run(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self._flush_interval)
+            except queue.Empty:
+                self._drain_spill()
+                continue
+            batch, control = collect_batch(
+                self._queue, item, self._batch_size, self._batch_bytes
+            )
+            if batch:
+                self._deliver(batch)
+            if control is not None:
+                self._drain_spill()
+            # only mark items done once sent, so `flush()` returns after delivery rather than after dequeueing
+            for _ in range(len(batch) + (control is not None)):
+                self._queue.task_done()
+            if control is STOP:
+                return
+
+    def _deliver(self, batch):
+        if self._error is not None:
+            self._dropped += len(batch)
+            return
+        framed = [self._frame(msg) for msg in batch]
+        attempt = 0
+        while True:
+            try:
+                self.connect_socket()
+                if self.socktype == socket.SOCK_DGRAM:
+                    for msg in framed:
+                        self.socket.sendto(msg, self.address)
+                else:
+                    self.socket.sendall(b"".join(framed))
+                self._delivered += len(batch)
+                return
+            except OSError as err:
+                self._close_socket()
+                if attempt >= self._max_reconnect_attempts:
+                    self._error = err
+                    self._dropped += len(batch)
+                    return
+                time.sleep(
+                    min(
+                        self._reconnect_backoff * 2**attempt,
+                        self.max_reconnect_backoff,
+                    )
+                )
+                attempt += 1
+                self._reconnects += 1
+
+    def _close_socket(self):
+        sock, self.socket = self.socket, None
+        if sock is None:
+            return
+        try:
+            if self._wrap_socket:
+                sock.unwrap()
+        except (OSError, ValueError):
+            pass
+        finally:
+            sock.close()
+
+    def _spill(self, msg):
+        with self._spill_lock:
+            if self._spill_stream is None:
+                self._spill_stream = open(self._spill_file, "ab")
+            self._spill_stream.write(b"%d %b" % (len(msg), msg))
+            self._spilled += 1
+            self._spill_pending = True
+
+    @property
+    def _replay_file(self):
+        return f"{self._spill_file}.sending"
+
+    def _drain_spill(self):
+        # leave spilled records on disk for a later run if the server is unreachable
+        if not self._spill_pending or self._error is not None:
+            return
+        try:
+            with self._spill_lock:
+                if self._spill_stream is not None:
+                    self._spill_stream.close()
+                    self._spill_stream = None
+                # a leftover replay file is from an interrupted drain, send it before any newer spilled records
+                if not os.path.exists(self._replay_file):
+                    os.replace(self._spill_file, self._replay_file)
+                self._spill_pending = os.path.exists(self._spill_file)
+            with open(self._replay_file, "rb") as f:
+                batch, size = [], 0
+                for msg in _iter_octet_counted(f):
+                    batch.append(msg)
+                    size += len(msg)
+                    if len(batch) >= self._batch_size or size >= self._batch_bytes:
+                        self._deliver(batch)
+                        batch, size = [], 0
+                if batch:
+                    self._deliver(batch)
+            if self._error is None:
+                os.remove(self._replay_file)
+        except OSError as err:
+            self._error = err
+
+
+def _iter_octet_counted(f):
+    """Yields messages from a binary file of `<length> <message>` records, stopping at a truncated final record."""
+    while True:
+        length = b""
+        while True:
+            char = f.read(1)
+            if not char:
+                return
+            if char == b" ":
+                break
+            length += char
+        if not length.isdigit():
+            return
+        msg = f.read(int(length))
+        if len(msg) < int(length):
+            return
+        yield msg
+
+
 def _wrap_socket_for_ssl(sock, certs, hostname):
     do_ignore_certs = certs and certs.lower() == "ignore"
     if do_ignore_certs:
@@ -24,6 +24,7 @@ from _incydr_cli.cmds.orgs import orgs
 from _incydr_cli.cmds.risk_indicator_categories import risk_indicator_categories
 from _incydr_cli.cmds.risk_profiles import risk_profiles
 from _incydr_cli.cmds.sessions import sessions
+from _incydr_cli.cmds.sync import sync
 from _incydr_cli.cmds.trusted_activities import trusted_activities
 from _incydr_cli.cmds.users import users
 from _incydr_cli.cmds.watchlists import watchlists
@@ -90,6 +91,7 @@ incydr.add_command(cases)
 incydr.add_command(risk_profiles)
 incydr.add_command(risk_indicator_categories)
 incydr.add_command(sessions)
+incydr.add_command(sync)
 incydr.add_command(trusted_activities)
 incydr.add_command(users)
 incydr.add_command(orgs)
@@ -1,16 +1,26 @@
+import os
+import shutil
+import subprocess
 import sys
+from contextlib import contextmanager
 from csv import DictWriter
 from datetime import datetime
 from io import TextIOWrapper
 from itertools import chain
+from itertools import islice
 from typing import Iterable
 from typing import List
 from typing import Type
 
 from pydantic import BaseModel
+from rich.box import HEAVY_HEAD
 from rich.console import Console
 from rich.console import ConsoleRenderable
 from rich.console import RichCast
+from rich.measure import Measurement
+from rich.segment import Segment
+from rich.segment import Segments
+from rich.table import Column
 from rich.table import Table
 
 from _incydr_cli import console
@@ -18,6 +28,9 @@ from _incydr_sdk.utils import get_fields
 from _incydr_sdk.utils import iter_model_formatted
 from _incydr_sdk.utils import model_as_card
 
+# the number of rows measured for column widths, and rendered at a time, when rendering large tables
+TABLE_WINDOW_SIZE = 100
+
 
 def date(dt: datetime):
     """render locale appropriate date"""
@@ -45,16 +58,7 @@ def models_as_table(
 ):
     headers = list(get_fields(model, include=columns, flat=flat))
     tbl = Table(*headers, title=title, show_lines=True)
-    for m in models:
-        values = []
-        for _name, value in iter_model_formatted(
-            m, include=headers, flat=flat, render="table"
-        ):
-            if isinstance(value, BaseModel):
-                value = model_as_card(value)
-            elif not isinstance(value, (ConsoleRenderable, RichCast, str)):
-                value = str(value)
-            values.append(value)
+    for values in _table_rows(models, headers, flat):
         tbl.add_row(*values)
     return tbl
 
@@ -66,15 +70,152 @@ def table(
     title=None,
     flat=False,
 ):
-    tbl = models_as_table(model, models, columns, title, flat)
+    """
+    Renders models as a table in the system pager.
+
+    Results that fit in one window of `TABLE_WINDOW_SIZE` rows are measured in full. Larger results are streamed:
+    column widths are measured from the first window, and rows are rendered and written to the pager a window at a
+    time as they're retrieved, folding any later values wider than their column, so the first rows are shown
+    immediately and memory use doesn't grow with the number of results.
+    """
+    headers = list(get_fields(model, include=columns, flat=flat))
+    rows = _table_rows(models, headers, flat)
+    window = list(islice(rows, TABLE_WINDOW_SIZE))
 
-    if not tbl.rows:
+    if not window:
         console.print("No results found.")
         return
-    with console.pager():
-        # expand console and table so no values get truncated due to size of console, since we're using a pager
-        console.width = tbl.width = measure_renderable(tbl)
-        console.print(tbl, crop=False, soft_wrap=False, overflow="fold")
+    if len(window) < TABLE_WINDOW_SIZE:
+        tbl = Table(*headers, title=title, show_lines=True)
+        for values in window:
+            tbl.add_row(*values)
+        with console.pager():
+            # expand console and table so no values get truncated due to size of console, since we're using a pager
+            console.width = tbl.width = measure_renderable(tbl)
+            console.print(tbl, crop=False, soft_wrap=False, overflow="fold")
+        return
+
+    widths = _column_widths(headers, window)
+    # each column is padded by a space on both sides, and separated by a border
+    width = sum(widths) + 3 * len(widths) + 1
+    cell_widths = [w + 2 for w in widths]
+    with _streaming_pager(width) as out:
+        windows = chain([window], _windows(rows))
+        for i, window in enumerate(windows):
+            if not window:
+                # the results ended with the previous window, which was left open
+                out.print(HEAVY_HEAD.get_bottom(cell_widths), crop=False)
+                break
+            last = len(window) < TABLE_WINDOW_SIZE
+            tbl = Table(
+                *[Column(h, width=w, overflow="fold") for h, w in zip(headers, widths)],
+                title=title if i == 0 else None,
+                box=HEAVY_HEAD,
+                show_header=i == 0,
+                show_lines=True,
+            )
+            for values in window:
+                tbl.add_row(*values)
+            lines = out.render_lines(
+                tbl, out.options.update(width=width), pad=False, new_lines=True
+            )
+            if i > 0:
+                # join onto the previous window with a row separator instead of a new top border
+                separator = HEAVY_HEAD.get_row(cell_widths, "row")
+                lines[0] = [Segment(separator), Segment.line()]
+            if not last:
+                # the window's bottom border, which the next window replaces
+                lines.pop()
+            out.print(Segments(chain.from_iterable(lines)), end="", crop=False)
+            if last:
+                break
+
+
+def _table_rows(models, headers, flat):
+    for m in models:
+        values = []
+        for _name, value in iter_model_formatted(
+            m, include=headers, flat=flat, render="table"
+        ):
+            if isinstance(value, BaseModel):
+                value = model_as_card(value)
+            elif not isinstance(value, (ConsoleRenderable, RichCast, str)):
+                value = str(value)
+            values.append(value)
+        yield values
+
+
+def _windows(rows):
+    while True:
+        window = list(islice(rows, TABLE_WINDOW_SIZE))
+        yield window
+        if len(window) < TABLE_WINDOW_SIZE:
+            return
+
+
+def _column_widths(headers, rows):
+    # the widest value of each column, without wrapping
+    measuring_console = Console(width=100_000)
+    options = measuring_console.options
+    return [
+        max(
+            Measurement.get(measuring_console, options, cell).maximum
+            for cell in chain([header], column)
+        )
+        for header, column in zip(headers, zip(*rows))
+    ]
+
+
+def _default_pager():
+    # the pager pydoc (and so `console.pager()`) falls back to when neither variable is set
+    if os.environ.get("TERM") in ("dumb", "emacs"):
+        return None
+    if sys.platform == "win32":
+        return "more"
+    for command in ("less", "more"):
+        if shutil.which(command):
+            return command
+    return None
+
+
+class _PagerConsole(Console):
+    def on_broken_pipe(self):
+        # rich exits on broken pipes, assuming they're stdout, but here it only means the pager was closed
+        raise BrokenPipeError
+
+
+@contextmanager
+def _streaming_pager(width: int):
+    """
+    Yields a console which writes to the system pager (`$MANPAGER` or `$PAGER`, or else `less` or `more` like
+    `pydoc`) as it's printed to, rather than once all output is ready, or to stdout if the output isn't a terminal or
+    there's no pager.
+    """
+    command = os.environ.get("MANPAGER") or os.environ.get("PAGER") or _default_pager()
+    if not console.is_terminal or not command:
+        console.width = width
+        yield console
+        return
+    proc = subprocess.Popen(
+        command, shell=True, stdin=subprocess.PIPE, errors="backslashreplace"
+    )
+    try:
+        yield _PagerConsole(file=proc.stdin, width=width, color_system=None)
+    except BrokenPipeError:
+        # the pager was closed before all rows were written
+        pass
+    finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        while True:
+            try:
+                proc.wait()
+                break
+            except KeyboardInterrupt:
+                # let the pager handle interrupts, like pydoc does
+                pass
 
 
 def csv(
@@ -0,0 +1,421 @@
+"""
+Destinations for data sent with the `--output` option.
+
+A single search can feed several sinks at once (see `create_output_sink()`), each of which batches events and applies
+backpressure on its own: events are put on a bounded per-sink queue that a background thread drains, so a sink only
+slows down the search once its queue is full.
+"""
+import gzip
+import logging
+import queue
+import re
+import threading
+from pathlib import Path
+from urllib.parse import urlparse
+
+import click
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3 import Retry
+
+from _incydr_cli.exceptions import IncydrCLIException
+from _incydr_cli.logger import create_server_handler
+from _incydr_cli.logger import parse_server_output
+from _incydr_cli.logger.enums import SyslogFraming
+from _incydr_cli.logger.handlers import collect_batch
+from _incydr_cli.logger.handlers import FLUSH
+from _incydr_cli.logger.handlers import STOP
+
+
+class OutputSinkError(IncydrCLIException):
+    """Raised when events can no longer be sent to an output sink."""
+
+    def __init__(self, name, err):
+        super().__init__(f"Unable to send events to {name}. Failed with error: {err}")
+
+
+class Sink:
+    """
+    Base class for an `--output` destination. Events are passed to `send()` as JSON strings.
+
+    Sinks are context managers which close the sink, and report its counters to stderr, on exit.
+    """
+
+    name = None
+
+    def send(self, event):
+        raise NotImplementedError
+
+    def send_raw(self, event):
+        """
+        Sends an event that's already JSON encoded, as UTF-8 `bytes` or a `memoryview` of them, such as a line read
+        from a stored export, without decoding and encoding it again where the sink writes bytes.
+        """
+        self.send(str(event, "utf-8"))
+
+    def flush(self):
+        """Blocks until all events passed to `send()` have been written."""
+
+    def close(self):
+        self.flush()
+
+    @property
+    def stats(self):
+        """A `dict` of `delivered` and `dropped` event counts, or `None` if the sink doesn't track them."""
+        return None
+
+    def report(self):
+        stats = self.stats
+        if stats is not None:
+            click.echo(
+                f"Forwarded {stats['delivered']} events to {self.name} ({stats['dropped']} dropped).",
+                err=True,
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        self.report()
+        return False
+
+
+class BatchingSink(Sink):
+    """
+    Base class for sinks that write from a background thread. Events are queued by `send()`, which blocks while the
+    queue is full, and handed to `_write_batch()` in groups of up to `batch_size` events or roughly `batch_bytes`.
+
+    Once a batch fails to write the sink stops writing, counts the remaining events as dropped, and the next call to
+    `send()` raises an `OutputSinkError`.
+    """
+
+    def __init__(self, name, queue_size=10000, batch_size=500, batch_bytes=1024 * 1024):
+        self.name = name
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._batch_size = batch_size
+        self._batch_bytes = batch_bytes
+        self._error = None
+        self._delivered = 0
+        self._dropped = 0
+        self._worker = threading.Thread(
+            target=self._run, name=f"incydr-sink-{name}", daemon=True
+        )
+        self._worker.start()
+
+    @property
+    def stats(self):
+        return {"delivered": self._delivered, "dropped": self._dropped}
+
+    def send(self, event):
+        if self._error is not None:
+            raise OutputSinkError(self.name, self._error)
+        self._queue.put(event.encode("utf-8"))
+
+    def send_raw(self, event):
+        if self._error is not None:
+            raise OutputSinkError(self.name, self._error)
+        # copied, as views of a mapped file may not outlive the reader that returned them
+        self._queue.put(bytes(event))
+
+    def flush(self):
+        if self._worker.is_alive():
+            self._queue.put(FLUSH)
+            self._queue.join()
+
+    def close(self):
+        if self._worker.is_alive():
+            self._queue.put(STOP)
+            self._worker.join()
+        self._close()
+
+    def _run(self):
+        while True:
+            batch, control = collect_batch(
+                self._queue, self._queue.get(), self._batch_size, self._batch_bytes
+            )
+            if batch and self._error is None:
+                try:
+                    self._write_batch(batch)
+                    self._delivered += len(batch)
+                except Exception as err:
+                    self._error = err
+                    self._dropped += len(batch)
+            elif batch:
+                self._dropped += len(batch)
+            if control is not None and self._error is None:
+                try:
+                    self._flush()
+                except Exception as err:
+                    self._error = err
+            for _ in range(len(batch) + (control is not None)):
+                self._queue.task_done()
+            if control is STOP:
+                return
+
+    def _write_batch(self, batch):
+        """Writes a list of utf-8 encoded events."""
+        raise NotImplementedError
+
+    def _flush(self):
+        """Called on the worker thread when `flush()` or `close()` is called."""
+
+    def _close(self):
+        """Called after the worker thread has stopped."""
+
+
+class SyslogSink(Sink):
+    """
+    Sends events to a syslog server through a `NoPrioritySysLogHandler`, or a `QueuedSysLogHandler` when `queue_size`
+    is given. Accepts the `--output` server formats PROTOCOL:HOSTNAME:PORT, HOSTNAME:PORT and HOSTNAME.
+    """
+
+    def __init__(
+        self,
+        output,
+        certs=None,
+        ignore_cert_validation=False,
+        framing=SyslogFraming.NEWLINE,
+        queue_size=None,
+        spill_file=None,
+    ):
+        protocol, hostname, port, certs = parse_server_output(
+            output, certs, ignore_cert_validation
+        )
+        self.name = output
+        try:
+            self._handler = create_server_handler(
+                protocol,
+                hostname,
+                port,
+                certs,
+                framing=framing,
+                queue_size=queue_size,
+                spill_file=spill_file,
+            )
+        except Exception as err:
+            raise ConnectionError(
+                f"Unable to connect to {hostname}. Failed with error: {err}."
+            )
+        self._handler.setFormatter(logging.Formatter(fmt="%(message)s"))
+
+    @property
+    def stats(self):
+        return getattr(self._handler, "stats", None)
+
+    def send(self, event):
+        self._handler.handle(
+            logging.makeLogRecord(
+                {"msg": event, "levelno": logging.INFO, "levelname": "INFO"}
+            )
+        )
+
+    def flush(self):
+        self._handler.flush()
+
+    def close(self):
+        self._handler.flush()
+        self._handler.close()
+
+
+class FileSink(BatchingSink):
+    """
+    Writes events as JSON lines to a series of local files, gzip-compressed when `path` ends with `.gz`.
+
+    Files are numbered after the given path (`events.jsonl.gz` is written as `events-000001.jsonl.gz`,
+    `events-000002.jsonl.gz`, ...), starting after any existing files, and a new file is started once the current
+    one holds `max_bytes` of (uncompressed) data. Defaults to 100MB.
+    """
+
+    def __init__(self, path, max_bytes=100 * 1024 * 1024, **kwargs):
+        path = Path(path)
+        suffix = "".join(path.suffixes)
+        self._dir = path.parent
+        self._stem = path.name[: len(path.name) - len(suffix)] if suffix else path.name
+        self._suffix = suffix
+        self._compress = suffix.endswith(".gz")
+        self._max_bytes = max_bytes
+        # continue numbering after existing files rather than overwriting them
+        existing = (
+            p.name.removeprefix(f"{self._stem}-").removesuffix(suffix)
+            for p in self._dir.glob(f"{self._stem}-*{suffix}")
+        )
+        self._index = max((int(i) for i in existing if i.isdigit()), default=0)
+        self._stream = None
+        self._written = 0
+        super().__init__(str(path), **kwargs)
+
+    @property
+    def current_path(self):
+        """The path of the file currently being written to, if any."""
+        return self._dir / f"{self._stem}-{self._index:06d}{self._suffix}"
+
+    def _write_batch(self, batch):
+        if self._stream is None or self._written >= self._max_bytes:
+            self._rotate()
+        data = b"\n".join(batch) + b"\n"
+        self._stream.write(data)
+        self._written += len(data)
+
+    def _rotate(self):
+        self._close()
+        self._index += 1
+        if self._compress:
+            self._stream = gzip.open(self.current_path, "wb")
+        else:
+            self._stream = open(self.current_path, "wb")
+        self._written = 0
+
+    def _flush(self):
+        if self._stream is not None:
+            self._stream.flush()
+
+    def _close(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
+class HttpEventCollectorSink(BatchingSink):
+    """
+    Sends batches of events to a Splunk HTTP Event Collector (or compatible) endpoint as gzip-compressed requests over
+    a single keep-alive connection. Requests that fail with a 429 or 5xx response are retried with backoff, honoring
+    any `Retry-After` header.
+
+    If `url` has no path, events are sent to `/services/collector/event`.
+    """
+
+    default_path = "/services/collector/event"
+
+    def __init__(self, url, token, verify=True, **kwargs):
+        if urlparse(url).path in ("", "/"):
+            url = url.rstrip("/") + self.default_path
+        self._url = url
+        self._session = Session()
+        self._session.verify = verify
+        self._session.headers.update(
+            {
+                "Authorization": f"Splunk {token}",
+                "Content-Type": "application/json",
+                "Content-Encoding": "gzip",
+            }
+        )
+        retry_strategy = Retry(
+            total=5,
+            backoff_factor=1,
+            allowed_methods=["POST"],
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        self._session.mount(
+            url,
+            HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=retry_strategy),
+        )
+        super().__init__(url, **kwargs)
+
+    def _write_batch(self, batch):
+        payload = b"".join(b'{"event":%b}' % event for event in batch)
+        response = self._session.post(
+            self._url, data=gzip.compress(payload, compresslevel=6), timeout=60
+        )
+        response.raise_for_status()
+
+    def _close(self):
+        self._session.close()
+
+
+class FanOutSink(Sink):
+    """Sends each event to every sink in `sinks`."""
+
+    def __init__(self, sinks):
+        self.sinks = list(sinks)
+        self.name = ", ".join(s.name for s in self.sinks)
+
+    def send(self, event):
+        for sink in self.sinks:
+            sink.send(event)
+
+    def send_raw(self, event):
+        for sink in self.sinks:
+            sink.send_raw(event)
+
+    def flush(self):
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+    def report(self):
+        for sink in self.sinks:
+            sink.report()
+
+
+def create_output_sink(
+    outputs,
+    certs=None,
+    ignore_cert_validation=False,
+    framing=SyslogFraming.NEWLINE,
+    queue_size=None,
+    spill_file=None,
+    hec_token=None,
+):
+    """
+    Creates the sink for one or more `--output` values, fanning out to all of them when there are several.
+
+    Each output is one of:
+
+    * `file:PATH` - rotating local JSON lines files, gzip-compressed if PATH ends in `.gz` (see `FileSink`).
+    * `http://...` or `https://...` - a Splunk HTTP Event Collector, authenticated with `hec_token`.
+    * a syslog server in the format PROTOCOL:HOSTNAME:PORT, HOSTNAME:PORT or HOSTNAME (see `SyslogSink`).
+
+    When there are several syslog servers, each spills to its own file, named after `spill_file` and the server.
+    """
+    if isinstance(outputs, str):
+        outputs = [outputs]
+    servers = [o for o in outputs if not o.startswith(("file:", "http://", "https://"))]
+    if spill_file and not queue_size:
+        raise click.BadOptionUsage(
+            "output-spill-file",
+            "'output-spill-file' can only be used with the 'output-queue-size' option.",
+        )
+    sinks = []
+    try:
+        for output in outputs:
+            if output.startswith("file:"):
+                sinks.append(FileSink(output.removeprefix("file:")))
+            elif output.startswith(("http://", "https://")):
+                if not hec_token:
+                    raise click.BadOptionUsage(
+                        "hec-token",
+                        "'hec-token' is required to send output to an HTTP Event Collector.",
+                    )
+                verify = False if ignore_cert_validation else certs or True
+                sinks.append(HttpEventCollectorSink(output, hec_token, verify=verify))
+            else:
+                sinks.append(
+                    SyslogSink(
+                        output,
+                        certs=certs,
+                        ignore_cert_validation=ignore_cert_validation,
+                        framing=framing,
+                        queue_size=queue_size,
+                        spill_file=(
+                            _spill_file_for(spill_file, output)
+                            if len(servers) > 1
+                            else spill_file
+                        ),
+                    )
+                )
+    except Exception:
+        for sink in sinks:
+            sink.close()
+        raise
+    return sinks[0] if len(sinks) == 1 else FanOutSink(sinks)
+
+
+def _spill_file_for(spill_file, output):
+    if not spill_file:
+        return spill_file
+    suffix = re.sub(r"[^\w.-]", "_", output)
+    return f"{spill_file}.{suffix}"
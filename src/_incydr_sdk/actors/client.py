@@ -35,6 +35,7 @@ class ActorsV1:
         page_num: int = 1,
         page_size: int = 500,
         prefer_parent: bool = False,
+        record_format: str = "model",
     ) -> ActorsPage:
         """
         Get a page of actors.
@@ -49,6 +50,7 @@ class ActorsV1:
         * **page_num**: `int` - Page number for results, starting at 1.
         * **page_size**: `int` - Max number of results to return per page. Must be between 1 and 500. Defaults to 500.
         * **prefer_parent**: `bool` = Returns an actor's parent when applicable. Returns an actor themselves if they have no parent.
+        * **record_format**: `str` - The format to return records in: `"model"` (default) to validate them into models, `"dict"` for the `dict`s returned by the API, or `"compact"` for memory-lean records with the fields of the model, without validation. See [Record Formats][record-formats].
 
         **Returns**: An [`Actor`][actor-model] object representing the actor.
         """
@@ -66,7 +68,9 @@ class ActorsV1:
         )
 
         response = self._parent.session.get(request_path, params=data.dict())
-        return ActorsPage.parse_response(response)
+        return ActorsPage.parse_response(
+            response, record_format=record_format, records="actors"
+        )
 
     def iter_all(
         self,
@@ -75,13 +79,14 @@ class ActorsV1:
         name_ends_with: str = None,
         page_size: int = 500,
         prefer_parent: bool = False,
+        record_format: str = "model",
     ) -> ActorsPage:
         """
         Iterate over all actors.
 
         Accepts the same parameters as `.get_page()` excepting `page_num`.
 
-        **Returns**: A generator yielding individual [`Actor`][actor-model] objects.
+        **Returns**: A generator yielding individual [`Actor`][actor-model] objects, or records in the given `record_format`.
         """
         for page_num in count(1):
             page = self.get_page(
@@ -91,6 +96,7 @@ class ActorsV1:
                 page_size=page_size,
                 page_num=page_num,
                 prefer_parent=prefer_parent,
+                record_format=record_format,
             )
             yield from page.actors
             if len(page.actors) < page_size:
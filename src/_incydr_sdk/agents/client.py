@@ -45,6 +45,7 @@ class AgentsV1:
         not_connected_in_last_days: int = None,
         serial_number: str = None,
         agent_os_types: Union[List[str], str] = None,
+        record_format: str = "model",
     ) -> AgentsPage:
         """
         Get a page of agents.
@@ -67,6 +68,7 @@ class AgentsV1:
         * **not_connected_in_last_days**: `int` - When specified, agents are filtered to include only those that have not connected in the last N days (starting from midnight this morning), where N is the value of the parameter.
         * **serial_number**: `str` - When specified, returns agents that have this serial number.
         * **agent_os_types: `List[str] | str` - When specified, agents are filtered to include only those of the given OS types.
+        * **record_format**: `str` - The format to return records in: `"model"` (default) to validate them into models, `"dict"` for the `dict`s returned by the API, or `"compact"` for memory-lean records with the fields of the model, without validation. See [Record Formats][record-formats].
 
         **Returns**: An [`AgentsPage`][agentspage-model] object.
         """
@@ -91,7 +93,9 @@ class AgentsV1:
             else agent_os_types,
         )
         response = self._parent.session.get("/v1/agents", params=data.dict())
-        return AgentsPage.parse_response(response)
+        return AgentsPage.parse_response(
+            response, record_format=record_format, records="agents"
+        )
 
     def iter_all(
         self,
@@ -108,13 +112,14 @@ class AgentsV1:
         not_connected_in_last_days: int = None,
         serial_number: str = None,
         agent_os_types: Union[List[str], str] = None,
+        record_format: str = "model",
     ) -> Iterator[Agent]:
         """
         Iterate over all agents.
 
         Accepts the same parameters as `.get_page()` excepting `page_num`.
 
-        **Returns**: A generator yielding individual [`Agent`][agent-model] objects.
+        **Returns**: A generator yielding individual [`Agent`][agent-model] objects, or records in the given `record_format`.
         """
         for page_num in count(1):
             page = self.get_page(
@@ -132,6 +137,7 @@ class AgentsV1:
                 not_connected_in_last_days=not_connected_in_last_days,
                 serial_number=serial_number,
                 agent_os_types=agent_os_types,
+                record_format=record_format,
             )
             yield from page.agents
             if len(page.agents) < page_size:
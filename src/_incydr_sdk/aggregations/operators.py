@@ -0,0 +1,387 @@
+"""
+Streaming aggregations over events, with bounded memory, so that counts, top values and distinct counts can be
+computed while events are retrieved instead of after downloading all of them.
+
+Every operator can be merged with another operator of the same configuration, so events can be aggregated in parallel
+partitions (threads, processes or separate runs) and the partial results combined.
+"""
+import heapq
+import math
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from hashlib import blake2b
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Union
+
+from pydantic import BaseModel
+
+from _incydr_sdk.queries.local import as_datetime
+from _incydr_sdk.queries.local import values_getter
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MASK_64 = (1 << 64) - 1
+_ONE_DAY = timedelta(days=1)
+
+
+class Operator:
+    """
+    Base class for aggregation operators.
+
+    `key` selects the values of each event to aggregate: either a file event search term in dot notation, such as
+    `"destination.category"`, or a function which takes an event `dict` and returns a value or a list of values.
+    Events without a value for the key are ignored, and every value of a multi-valued field is aggregated.
+    """
+
+    def __init__(self, key: Union[str, Callable[[dict], object]] = None):
+        self.key = key
+        self._get_values = _values_for_key(key)
+
+    def add(self, event: dict):
+        """Aggregates a single event."""
+        for value in self._get_values(event):
+            self._add_value(value)
+
+    def merge(self, other: "Operator"):
+        """Merges the state of another operator of the same type and configuration into this one."""
+        if type(other) is not type(self) or self._config() != other._config():
+            raise ValueError(
+                f"Can't merge {type(other).__name__} with differently configured {type(self).__name__}."
+            )
+        self._merge(other)
+        return self
+
+    def result(self):
+        """Returns the result of the aggregation so far."""
+        raise NotImplementedError
+
+    def _add_value(self, value):
+        raise NotImplementedError
+
+    def _merge(self, other):
+        raise NotImplementedError
+
+    def _config(self):
+        return ()
+
+    def __getstate__(self):
+        # the value getter is a closure, so it's rebuilt from the key when unpickled
+        state = self.__dict__.copy()
+        del state["_get_values"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._get_values = _values_for_key(self.key)
+
+
+class Count(Operator):
+    """
+    Counts events, or the values of `key` if given.
+
+    **Returns**: `int`
+    """
+
+    def __init__(self, key: Union[str, Callable[[dict], object]] = None):
+        super().__init__(key)
+        self.count = 0
+
+    def _add_value(self, value):
+        self.count += 1
+
+    def _merge(self, other):
+        self.count += other.count
+
+    def result(self) -> int:
+        return self.count
+
+
+class CountMinSketch(Operator):
+    """
+    Estimates how many times each value of `key` occurs, in a fixed `width` x `depth` table of counters.
+
+    Estimates are never lower than the true count, and exceed it by at most `e / width` of the total count with
+    probability `1 - exp(-depth)`. Use `estimate()` to look up a value.
+
+    **Returns**: `int` - The total number of values counted.
+    """
+
+    def __init__(
+        self,
+        key: Union[str, Callable[[dict], object]],
+        width: int = 2048,
+        depth: int = 4,
+    ):
+        super().__init__(key)
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self.table = [[0] * width for _ in range(depth)]
+
+    def _columns(self, value):
+        h = _hash64(value)
+        h1, h2 = h & 0xFFFFFFFF, h >> 32
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def _add_value(self, value):
+        self.total += 1
+        for row, column in zip(self.table, self._columns(value)):
+            row[column] += 1
+
+    def estimate(self, value) -> int:
+        """Returns the estimated number of times `value` was counted."""
+        return min(row[c] for row, c in zip(self.table, self._columns(value)))
+
+    def _merge(self, other):
+        self.total += other.total
+        for row, other_row in zip(self.table, other.table):
+            for i, count in enumerate(other_row):
+                row[i] += count
+
+    def _config(self):
+        return self.width, self.depth
+
+    def result(self) -> int:
+        return self.total
+
+
+class TopK(Operator):
+    """
+    Finds the `k` most frequent values of `key` with the space-saving algorithm, tracking at most `capacity` values
+    (default `10 * k`). Counts of the returned values may be overestimated by up to the reported `error`.
+
+    **Returns**: `List[dict]` - The top values, most frequent first, as `{"value": ..., "count": ..., "error": ...}`.
+    """
+
+    def __init__(
+        self,
+        key: Union[str, Callable[[dict], object]],
+        k: int = 10,
+        capacity: int = None,
+    ):
+        super().__init__(key)
+        self.k = k
+        self.capacity = capacity or 10 * k
+        # value -> [count, error]
+        self.counters = {}
+        # (count, insertion order, value) for each tracked value; counts are only refreshed when an entry reaches
+        # the top of the heap, so finding the least frequent value doesn't require a scan of every counter
+        self._heap = []
+        self._inserted = 0
+
+    def _add_value(self, value):
+        counter = self.counters.get(value)
+        if counter is not None:
+            counter[0] += 1
+            return
+        count = 0
+        if len(self.counters) >= self.capacity:
+            # replace the least frequent value, inheriting its count as the error bound
+            count = self.counters.pop(self._pop_smallest())[0]
+        self.counters[value] = [count + 1, count]
+        self._push(count + 1, value)
+
+    def _push(self, count, value):
+        self._inserted += 1
+        heapq.heappush(self._heap, (count, self._inserted, value))
+
+    def _pop_smallest(self):
+        while True:
+            count, _, value = heapq.heappop(self._heap)
+            current = self.counters[value][0]
+            if current == count:
+                return value
+            self._push(current, value)
+
+    def _merge(self, other):
+        for value, (count, error) in other.counters.items():
+            counter = self.counters.setdefault(value, [0, 0])
+            counter[0] += count
+            counter[1] += error
+        if len(self.counters) > self.capacity:
+            kept = heapq.nlargest(
+                self.capacity, self.counters.items(), key=lambda item: item[1][0]
+            )
+            self.counters = dict(kept)
+        self._heap = []
+        for value, (count, _) in self.counters.items():
+            self._push(count, value)
+
+    def _config(self):
+        return self.k, self.capacity
+
+    def result(self):
+        top = heapq.nlargest(self.k, self.counters.items(), key=lambda i: i[1][0])
+        return [{"value": v, "count": c, "error": e} for v, (c, e) in top]
+
+
+class DistinctCount(Operator):
+    """
+    Estimates the number of distinct values of `key` with HyperLogLog, using `2 ** precision` bytes of memory. The
+    relative error is about `1.04 / sqrt(2 ** precision)`, 0.8% at the default precision of 14.
+
+    **Returns**: `int`
+    """
+
+    def __init__(self, key: Union[str, Callable[[dict], object]], precision: int = 14):
+        super().__init__(key)
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18.")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def _add_value(self, value):
+        h = _hash64(value)
+        index = h >> (64 - self.precision)
+        rest = (h << self.precision) & _MASK_64
+        rank = 64 - self.precision + 1 if rest == 0 else 65 - rest.bit_length()
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def _merge(self, other):
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def _config(self):
+        return (self.precision,)
+
+    def result(self) -> int:
+        m = len(self.registers)
+        estimate = (
+            0.7213 / (1 + 1.079 / m) * m * m / sum(2.0**-r for r in self.registers)
+        )
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # linear counting is more accurate for small cardinalities
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+
+class TimeHistogram(Operator):
+    """
+    Counts events per time bucket of length `interval`, using the timestamps in `key` (default `@timestamp`).
+    Memory grows with the number of buckets spanned by the events, not the number of events.
+
+    **Returns**: `Dict[str, int]` - Counts keyed by the ISO timestamp of the start of each bucket, in time order.
+    """
+
+    def __init__(
+        self,
+        key: Union[str, Callable[[dict], object]] = "@timestamp",
+        interval: timedelta = _ONE_DAY,
+    ):
+        super().__init__(key)
+        if interval <= timedelta(0):
+            raise ValueError("interval must be positive.")
+        self.interval = interval
+        self.buckets = {}
+
+    def _add_value(self, value):
+        ts = as_datetime(value)
+        if ts is None:
+            return
+        bucket = (ts - _EPOCH) // self.interval
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def _merge(self, other):
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+
+    def _config(self):
+        return (self.interval,)
+
+    def result(self) -> Dict[str, int]:
+        return {
+            (_EPOCH + self.interval * b).isoformat().replace("+00:00", "Z"): c
+            for b, c in sorted(self.buckets.items())
+        }
+
+
+class Aggregation:
+    """
+    A named set of aggregation operators, fed from any iterator of events: `dict`s, such as raw file event search
+    results, or SDK models, such as those from `client.sessions.v1.iter_all()`, which are aggregated by their field
+    aliases.
+
+    Usage example:
+
+        >>> from incydr.aggregations import Aggregation, Count, DistinctCount, TopK
+        >>> aggregation = Aggregation(
+        ...     events=Count(),
+        ...     destinations=TopK("destination.category", k=5),
+        ...     files=DistinctCount("file.hash.sha256"),
+        ... )
+        >>> for event in aggregation.tap(events):
+        ...     ...  # events pass through unchanged
+        >>> aggregation.result()
+        {'events': 10000, 'destinations': [...], 'files': 4215}
+
+    Aggregations of separate partitions of events can be combined with `merge()`, and are picklable so that they can
+    be returned from other processes.
+    """
+
+    def __init__(self, **operators: Operator):
+        self.operators = operators
+
+    def add(self, event: Union[dict, BaseModel]):
+        """Aggregates a single event with every operator."""
+        if isinstance(event, BaseModel):
+            event = event.dict(by_alias=True)
+        for operator in self.operators.values():
+            operator.add(event)
+
+    def consume(self, events: Iterable[Union[dict, BaseModel]]) -> "Aggregation":
+        """Aggregates every event of an iterable, and returns the aggregation."""
+        for event in events:
+            self.add(event)
+        return self
+
+    def tap(self, events: Iterable[Union[dict, BaseModel]]) -> Iterator:
+        """Returns a generator yielding each event of `events` unchanged, aggregating them as they pass through."""
+        for event in events:
+            self.add(event)
+            yield event
+
+    def merge(self, other: "Aggregation") -> "Aggregation":
+        """Merges another aggregation with the same operators into this one."""
+        if set(other.operators) != set(self.operators):
+            raise ValueError("Can't merge aggregations with different operators.")
+        for name, operator in self.operators.items():
+            operator.merge(other.operators[name])
+        return self
+
+    def result(self) -> dict:
+        """Returns the result of each operator, by name."""
+        return {name: op.result() for name, op in self.operators.items()}
+
+
+def _values_for_key(key):
+    if key is None:
+        return _no_key
+    if callable(key):
+        return _call_getter(key)
+    return values_getter(key)
+
+
+def _no_key(event):
+    return [None]
+
+
+def _call_getter(key):
+    def get_values(event):
+        value = key(event)
+        if value is None:
+            return []
+        if isinstance(value, list):
+            return [v for v in value if v is not None]
+        return [value]
+
+    return get_values
+
+
+def _hash64(value) -> int:
+    # a stable hash, unlike hash(), so that operators from other processes can be merged
+    digest = blake2b(repr(value).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
@@ -1,4 +1,10 @@
 import itertools
+import time
+from collections import deque
+from concurrent.futures import as_completed
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from itertools import count
 from typing import Iterator
 from typing import List
@@ -32,6 +38,9 @@ class AlertsV1:
         >>> client.alerts.v1.change_state("<alert_id>", AlertState.RESOLVED)
     """
 
+    # seconds to wait before the first retry of a failed `query-details` request, doubling for each further retry
+    retry_backoff = 1
+
     def __init__(self, parent):
         self._parent = parent
 
@@ -86,16 +95,24 @@ class AlertsV1:
             if len(page.alerts) < query.page_size:
                 break
 
-    def get_details(self, alert_ids: Union[str, List[str]]) -> List[AlertDetails]:
+    def get_details(
+        self,
+        alert_ids: Union[str, List[str]],
+        max_workers: int = 1,
+        max_retries: int = 0,
+    ) -> List[AlertDetails]:
         """
         Get full details for a set of alerts.
 
         The `query-details` endpoint accepts a maximum of 100 ids per request, if `alert_ids` is > 100, multiple
-        requests will be made and results will be combined into a single list.
+        requests will be made and results will be combined into a single list, in the order of `alert_ids`.
 
         **Parameters**:
 
         * **alert_ids**: `str | List[str]` (required) - Single alertId or list of alertId strings.
+        * **max_workers**: `int` - The maximum number of requests to make at once. Defaults to 1.
+        * **max_retries**: `int` - The number of times to retry a request that fails with a connection error, a 429
+            or a 5xx response. Defaults to 0.
 
         **Returns**: A list of [`AlertDetails`][alertdetails-model] objects.
         """
@@ -104,22 +121,86 @@ class AlertsV1:
             DeprecationWarning,
             stacklevel=2,
         )
+        return list(
+            self._iter_details(alert_ids, max_workers, max_retries, ordered=True)
+        )
+
+    def iter_details(
+        self,
+        alert_ids: Union[str, List[str]],
+        max_workers: int = 4,
+        max_retries: int = 3,
+    ) -> Iterator[AlertDetails]:
+        """
+        Get full details for a set of alerts, requesting up to `max_workers` chunks of 100 ids at once and yielding
+        the details of each chunk as soon as it arrives.
+
+        Unlike `.get_details()`, results are yielded in the order their requests complete rather than the order of
+        `alert_ids`, and only a few chunks are held in memory at a time, which suits very large sets of alerts.
 
+        **Parameters**:
+
+        * **alert_ids**: `str | Iterable[str]` (required) - Single alertId or iterable of alertId strings.
+        * **max_workers**: `int` - The maximum number of requests to make at once. Defaults to 4.
+        * **max_retries**: `int` - The number of times to retry a request that fails with a connection error, a 429
+            or a 5xx response, waiting longer before each retry. Defaults to 3.
+
+        **Returns**: A generator yielding individual [`AlertDetails`][alertdetails-model] objects.
+        """
+        warn(
+            "Alerts are deprecated. Replaced by Sessions.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        yield from self._iter_details(
+            alert_ids, max_workers, max_retries, ordered=False
+        )
+
+    def _iter_details(self, alert_ids, max_workers, max_retries, ordered):
         if isinstance(alert_ids, str):
             alert_ids = [alert_ids]
-        results = []
         ids = iter(alert_ids)
-        while True:
-            chunk = list(itertools.islice(ids, 100))
-            if not chunk:
-                break
+        chunks = iter(lambda: list(itertools.islice(ids, 100)), [])
+        # bound the number of chunks requested ahead of the consumer
+        max_pending = max_workers * 2
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            if ordered:
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(
+                        executor.submit(self._query_details, chunk, max_retries)
+                    )
+                    if len(pending) >= max_pending:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
             else:
-                data = AlertDetailsRequest(alertIds=chunk)
-            response = self._parent.session.post(
-                "/v1/alerts/query-details", json=data.dict(by_alias=True)
-            )
-            results.extend(parse_obj_as(List[AlertDetails], response.json()["alerts"]))
-        return results
+                pending = set()
+                for chunk in chunks:
+                    pending.add(
+                        executor.submit(self._query_details, chunk, max_retries)
+                    )
+                    if len(pending) >= max_pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield from future.result()
+                for future in as_completed(pending):
+                    yield from future.result()
+
+    def _query_details(self, alert_ids, max_retries):
+        data = AlertDetailsRequest(alertIds=alert_ids)
+        for attempt in count(0):
+            try:
+                response = self._parent.session.post(
+                    "/v1/alerts/query-details", json=data.dict(by_alias=True)
+                )
+                return parse_obj_as(List[AlertDetails], response.json()["alerts"])
+            except (requests.ConnectionError, requests.HTTPError) as err:
+                status = err.response.status_code if err.response is not None else None
+                retryable = status is None or status == 429 or status >= 500
+                if attempt >= max_retries or not retryable:
+                    raise
+                time.sleep(self.retry_backoff * 2**attempt)
 
     def add_note(self, alert_id: str, note: str) -> requests.Response:
         """
@@ -1,15 +1,28 @@
+import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from datetime import timezone
+from hashlib import md5
 from itertools import count
 from pathlib import Path
 from typing import List
 from typing import Union
 
+from _incydr_sdk.audit_log.export import download_csv
+from _incydr_sdk.audit_log.export import EXPORT_EVENT_LIMIT
+from _incydr_sdk.audit_log.export import EXPORT_WRITERS
+from _incydr_sdk.audit_log.export import iter_merged_rows
+from _incydr_sdk.audit_log.export import partition_date_range
+from _incydr_sdk.audit_log.export import sort_csv
 from _incydr_sdk.audit_log.models import AuditEventsPage
 from _incydr_sdk.audit_log.models import DateRange
 from _incydr_sdk.audit_log.models import QueryAuditLogRequest
 from _incydr_sdk.audit_log.models import QueryExportRequest
 from _incydr_sdk.audit_log.models import UserTypes
 from _incydr_sdk.core.utils import get_filename_from_content_disposition
+from _incydr_sdk.exceptions import IncydrException
+from _incydr_sdk.queries.utils import parse_str_to_dt
 from _incydr_sdk.queries.utils import parse_ts_to_posix_ts
 
 
@@ -87,10 +100,12 @@ class AuditLogV1:
             user_types=user_types,
         )
 
+        return self._search(request)
+
+    def _search(self, request: QueryAuditLogRequest) -> AuditEventsPage:
         response = self._parent.session.post(
             "/v1/audit/search-audit-log", json=request.dict()
         )
-
         return AuditEventsPage.parse_response(response)
 
     def iter_all(
@@ -104,15 +119,38 @@ class AuditLogV1:
         event_types: Union[List[str], str] = None,
         resource_ids: Union[List[str], str] = None,
         user_types: Union[List[UserTypes], UserTypes] = None,
+        paginate_by_time: bool = False,
     ):
         """
         Iterate over all audit log events.
 
-        Accepts the same parameters as `.get_page()` except `page_num`.
+        Accepts the same parameters as `.get_page()` except `page_num`, plus:
+
+        * **paginate_by_time**: `bool` - Page through results by narrowing the search's date range to the timestamp of
+            the last event returned, rather than by requesting increasing page numbers. Each request then costs the
+            same no matter how far into the results it is, and events logged during iteration can't shift results
+            between pages. Recommended, with a larger `page_size`, for iterating over large numbers of events.
+            Defaults to `False`.
 
         **Returns**: A generator yielding individual `dict` objects representing audit log events.
         """
         page_size = page_size or self._parent.settings.page_size
+        if paginate_by_time:
+            request = _build_query_request(
+                page_size=page_size,
+                actor_ids=actor_ids,
+                actor_ip_addresses=actor_ip_addresses,
+                actor_names=actor_names,
+                start_time=start_time,
+                end_time=end_time,
+                event_types=event_types,
+                resource_ids=resource_ids,
+                user_types=user_types,
+            )
+            yield from iter_events_by_time(
+                lambda request_: self._search(request_).events, request
+            )
+            return
         for page_num in count(0):
             page = self.get_page(
                 page_num=page_num,
@@ -255,6 +293,186 @@ class AuditLogV1:
 
         return target
 
+    def export_events(
+        self,
+        target_folder: Path,
+        start_time: Union[str, datetime],
+        end_time: Union[str, datetime] = None,
+        actor_ids: Union[List[str], str] = None,
+        actor_ip_addresses: Union[List[str], str] = None,
+        actor_names: Union[List[str], str] = None,
+        event_types: Union[List[str], str] = None,
+        resource_ids: Union[List[str], str] = None,
+        user_types: Union[List[UserTypes], UserTypes] = None,
+        formats: Union[List[str], str] = "csv",
+        max_workers: int = 4,
+        partition_size: int = EXPORT_EVENT_LIMIT,
+    ) -> List[Path]:
+        """
+        Export all search results in a date range to a single file, without the 100,000 event limit of
+        `.download_events()`.
+
+        The date range is split into partitions of up to `partition_size` events using `.get_event_count()`, each
+        partition is exported concurrently and streamed to a temporary CSV file, and the partitions are then merged
+        into one de-duplicated file ordered by event timestamp, oldest first.
+
+        **Parameters:**
+
+        * **target_folder**: `Path, str` (required) - A string or `pathlib.Path` object that represents the folder
+        which the files will be saved to.
+        * **start_time**: `datetime | str` (required) - Start time of the date range to export.
+        * **end_time**: `datetime | str` - End time of the date range to export. Defaults to now.
+        * **actor_ids**: `List[str] | str` - Finds events whose actor_id is one of the given ids.
+        * **actor_ip_addresses**: `List[str] | str` - Finds events whose actor_ip_address is one of the given IP addresses.
+        * **actor_names**: `List[str] | str` - Finds events whose actor_name is one of the given names.
+        * **event_types**: `List[str] | str` - Finds events whose type is one of the given types.
+        * **resource_ids**: `List[str] | str` - Filters searchable events that match resource_id.
+        * **user_types**: `List[UserTypes]` - Filters searchable events that match actor type.
+        * **formats**: `List[str] | str` - The file formats to write, any of `csv`, `jsonl` and `parquet`. Defaults
+            to `csv`. Writing `parquet` files requires the `pyarrow` package.
+        * **max_workers**: `int` - The maximum number of partitions to count or export at once. Defaults to 4.
+        * **partition_size**: `int` - The maximum number of events to export per partition. Defaults to 100,000.
+
+        **Returns**: A list of `pathlib.Path` objects representing the locations of the exported files, in the order
+        of `formats`.
+        """
+        formats = [formats] if isinstance(formats, str) else list(formats)
+        formats = list(dict.fromkeys(formats))
+        unknown = set(formats) - set(EXPORT_WRITERS)
+        if unknown:
+            raise ValueError(f"Unsupported export format(s): {', '.join(unknown)}")
+        if "parquet" in formats:
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                raise IncydrException(
+                    "Exporting audit log events to Parquet requires the `pyarrow` package."
+                )
+
+        folder = Path(target_folder)  # ensure a Path object if we get passed a string
+        if not folder.is_dir():
+            raise ValueError(
+                f"`target_folder` argument must resolve to a folder: {target_folder}"
+            )
+
+        start = _as_utc_datetime(start_time)
+        end = _as_utc_datetime(end_time) if end_time else datetime.now(timezone.utc)
+        filters = dict(
+            actor_ids=actor_ids,
+            actor_ip_addresses=actor_ip_addresses,
+            actor_names=actor_names,
+            event_types=event_types,
+            resource_ids=resource_ids,
+            user_types=user_types,
+        )
+
+        def count_events(start_, end_):
+            return self.get_event_count(start_time=start_, end_time=end_, **filters)
+
+        def export_partition(partition, path):
+            request = _build_query_request(
+                start_time=partition[0], end_time=partition[1], **filters
+            )
+            data = QueryExportRequest(**request.dict(exclude={"page", "pageSize"}))
+            export_response = self._parent.session.post(
+                "/v1/audit/export", json=data.dict()
+            )
+            with self._parent.session.get(
+                f"/v1/audit/redeem-download-token?downloadToken={export_response.json()['downloadToken']}",
+                stream=True,
+            ) as download_response:
+                download_csv(download_response, path)
+            sort_csv(path)
+
+        name = f"AuditLog_Export_{start:%Y%m%dT%H%M%SZ}-{end:%Y%m%dT%H%M%SZ}"
+        targets = [folder / f"{name}.{format_}" for format_ in formats]
+
+        with tempfile.TemporaryDirectory(dir=folder) as temp_dir:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                partitions = partition_date_range(
+                    count_events, start, end, partition_size, executor
+                )
+                paths = [
+                    Path(temp_dir) / f"partition-{i:06d}.csv"
+                    for i in range(len(partitions))
+                ]
+                # consume the results so errors from any partition are raised
+                list(executor.map(export_partition, partitions, paths))
+
+            fieldnames, rows = iter_merged_rows(paths)
+            writers = [
+                EXPORT_WRITERS[format_](target, fieldnames)
+                for format_, target in zip(formats, targets)
+            ]
+            try:
+                for row in rows:
+                    for writer in writers:
+                        writer.write(row)
+            finally:
+                for writer in writers:
+                    writer.close()
+
+        return targets
+
+
+def iter_events_by_time(get_events, request: QueryAuditLogRequest):
+    """
+    Yields the events of every page of an audit log search, paging by time instead of by page number.
+
+    `get_events` is called with the `QueryAuditLogRequest` for each page and returns that page's events. After each
+    full page the request's date range is narrowed to end (or start, if results are in ascending order) at the
+    timestamp of the last event returned. Since that bound is inclusive, events at the boundary timestamp that have
+    already been yielded are skipped. If a full page holds nothing past the current bound (more events share one
+    timestamp than fit on a page) the page number is increased instead until the bound can move again.
+    """
+    request = request.copy(deep=True)
+    request.page = 0
+    if request.dateRange is None:
+        request.dateRange = DateRange()
+    descending = None
+    boundary = None
+    boundary_keys = set()
+    while True:
+        events = get_events(request)
+        timestamps = [_timestamp_ms(event) for event in events]
+        previous_boundary = boundary
+        for event, ts in zip(events, timestamps):
+            key = _event_key(event)
+            if ts == boundary:
+                if key in boundary_keys:
+                    continue
+            else:
+                boundary = ts
+                boundary_keys = set()
+            boundary_keys.add(key)
+            yield event
+
+        if len(events) < request.pageSize:
+            return
+        if timestamps[0] != timestamps[-1]:
+            descending = timestamps[0] > timestamps[-1]
+        if descending is None or boundary == previous_boundary:
+            request.page += 1
+            continue
+        if descending:
+            request.dateRange.endTime = boundary / 1000
+        else:
+            request.dateRange.startTime = boundary / 1000
+        request.page = 0
+
+
+def _timestamp_ms(event):
+    return round(parse_str_to_dt(event["timestamp"]).timestamp() * 1000)
+
+
+def _event_key(event):
+    return md5(json.dumps(event, sort_keys=True).encode()).hexdigest()
+
+
+def _as_utc_datetime(timestamp: Union[str, datetime]):
+    dt = timestamp if isinstance(timestamp, datetime) else parse_str_to_dt(timestamp)
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
 
 def _build_query_request(
     page_num: int = 0,
@@ -0,0 +1,198 @@
+"""
+Helpers for `AuditLogV1.export_events()`, which exports audit log events for date ranges holding more events than a
+single `/v1/audit/export` request returns.
+
+The date range is split into partitions small enough to export in full, each partition's CSV is downloaded to disk
+and sorted by timestamp, and the sorted partitions are then merged into one time-ordered stream of rows with the
+events duplicated at partition boundaries removed.
+"""
+import csv
+import heapq
+import json
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from itertools import groupby
+
+from _incydr_sdk.queries.utils import parse_str_to_dt
+
+EXPORT_EVENT_LIMIT = 100000
+
+
+def partition_date_range(count_events, start, end, max_events, executor):
+    """
+    Splits the date range from `start` to `end` into consecutive ranges that each hold no more than `max_events`
+    events, halving ranges until they fit. `count_events(start, end)` returns the number of events in a range, and is
+    called concurrently on `executor` for all the ranges being split at each step.
+
+    Ranges without any events are dropped. A range that can't be split any further (1 millisecond long) is kept
+    even if it holds more than `max_events` events.
+
+    Returns a list of `(start, end)` tuples in time order.
+    """
+    partitions = []
+    pending = [(start, end)]
+    while pending:
+        counts = executor.map(lambda range_: count_events(*range_), pending)
+        split = []
+        for (range_start, range_end), event_count in zip(pending, counts):
+            unsplittable = range_end - range_start <= timedelta(milliseconds=1)
+            if event_count <= max_events or unsplittable:
+                if event_count:
+                    partitions.append((range_start, range_end))
+            else:
+                middle = range_start + (range_end - range_start) / 2
+                split += [(range_start, middle), (middle, range_end)]
+        pending = split
+    return sorted(partitions)
+
+
+def download_csv(response, path, chunk_size=1024 * 1024):
+    """Writes the body of a streamed `requests.Response` to `path` without loading it into memory."""
+    with open(path, "wb") as f:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            f.write(chunk)
+
+
+def sort_csv(path):
+    """Sorts the rows of a partition's CSV file by timestamp, oldest first, rewriting the file in place."""
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        rows = list(reader)
+    column = _timestamp_column(header)
+    if column is not None:
+        rows.sort(key=lambda row: _timestamp_key(row[column]))
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def iter_merged_rows(paths):
+    """
+    Merges sorted partition CSV files into a single time-ordered stream of rows. Rows that appear in more than one
+    partition (events at the timestamp where two partitions meet) are only yielded once.
+
+    Returns a tuple of the merged field names, in the order they first appear across the files, and a generator
+    yielding each row as a `dict`.
+    """
+    fieldnames = []
+    for path in paths:
+        with open(path, newline="", encoding="utf-8") as f:
+            for name in next(csv.reader(f), []):
+                if name not in fieldnames:
+                    fieldnames.append(name)
+    column = _timestamp_column(fieldnames)
+    timestamp_field = fieldnames[column] if column is not None else None
+
+    def key(row):
+        return _timestamp_key(row.get(timestamp_field)) if timestamp_field else 0
+
+    def rows():
+        files = [open(path, newline="", encoding="utf-8") for path in paths]
+        try:
+            merged = heapq.merge(*(csv.DictReader(f) for f in files), key=key)
+            # duplicates share a timestamp, so only the rows of the current timestamp need remembering
+            for _, group in groupby(merged, key=key):
+                seen = set()
+                for row in group:
+                    row_key = json.dumps(row, sort_keys=True)
+                    if row_key not in seen:
+                        seen.add(row_key)
+                        yield row
+        finally:
+            for f in files:
+                f.close()
+
+    return fieldnames, rows()
+
+
+class CSVWriter:
+    """Writes merged rows to a CSV file."""
+
+    def __init__(self, path, fieldnames):
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames)
+        self._writer.writeheader()
+
+    def write(self, row):
+        self._writer.writerow(row)
+
+    def close(self):
+        self._file.close()
+
+
+class JSONLinesWriter:
+    """Writes merged rows to a JSON lines file, one object per row."""
+
+    def __init__(self, path, fieldnames):
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, row):
+        self._file.write(json.dumps(row) + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetWriter:
+    """Writes merged rows to a Parquet file of string columns, in batches. Requires `pyarrow`."""
+
+    batch_size = 10000
+
+    def __init__(self, path, fieldnames):
+        import pyarrow
+        import pyarrow.parquet
+
+        self._pyarrow = pyarrow
+        self._schema = pyarrow.schema([(name, pyarrow.string()) for name in fieldnames])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+        self._batch = []
+
+    def write(self, row):
+        self._batch.append(row)
+        if len(self._batch) >= self.batch_size:
+            self._write_batch()
+
+    def _write_batch(self):
+        self._writer.write_table(
+            self._pyarrow.Table.from_pylist(self._batch, schema=self._schema)
+        )
+        self._batch = []
+
+    def close(self):
+        if self._batch:
+            self._write_batch()
+        self._writer.close()
+
+
+EXPORT_WRITERS = {
+    "csv": CSVWriter,
+    "jsonl": JSONLinesWriter,
+    "parquet": ParquetWriter,
+}
+
+
+def _timestamp_column(header):
+    names = [name.lower() for name in header]
+    if "timestamp" in names:
+        return names.index("timestamp")
+    for i, name in enumerate(names):
+        if "timestamp" in name:
+            return i
+    return None
+
+
+def _timestamp_key(value):
+    if not value:
+        return 0.0
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        dt = parse_str_to_dt(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
@@ -1,18 +1,25 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from itertools import count
 from pathlib import Path
+from typing import Iterable
 from typing import Iterator
 from typing import List
 from typing import Tuple
 from typing import Union
 
+from boltons.iterutils import chunked_iter
+from requests import HTTPError
 from requests import Response
 
 from _incydr_sdk.cases.models import Case
 from _incydr_sdk.cases.models import CaseDetail
 from _incydr_sdk.cases.models import CaseFileEvents
+from _incydr_sdk.cases.models import CaseFileEventsUpdate
 from _incydr_sdk.cases.models import CasesPage
 from _incydr_sdk.cases.models import CreateCaseRequest
+from _incydr_sdk.cases.models import FileEvent
 from _incydr_sdk.cases.models import QueryCasesRequest
 from _incydr_sdk.cases.models import UpdateCaseRequest
 from _incydr_sdk.core.utils import get_filename_from_content_disposition
@@ -34,6 +41,8 @@ class CasesV1:
         >>> client.cases.v1.get_case(23)
     """
 
+    file_event_batch_size = 100
+
     def __init__(self, parent):
         self._parent = parent
 
@@ -116,6 +125,7 @@ class CasesV1:
         page_size: int = None,
         sort_dir: SortDirection = SortDirection.ASC,
         sort_key: SortKeys = SortKeys.NUMBER,
+        record_format: str = "model",
     ) -> CasesPage:
         """
         Get a page of cases.
@@ -134,6 +144,7 @@ class CasesV1:
         * **page_size**: `int` - Max number of results to return for a page. Defaults to client's `page_size` setting.
         * **sort_dir**: `SortDirection` - The direction on which to sort the response, based on the corresponding key.
         * **sort_key**: [`SortKeys`][cases-sort-keys] - One or more values on which the response will be sorted.
+        * **record_format**: `str` - The format to return records in: `"model"` (default) to validate them into models, `"dict"` for the `dict`s returned by the API, or `"compact"` for memory-lean records with the fields of the model, without validation. See [Record Formats][record-formats].
 
         **Returns**: A [`CasesPage`][casespage-model] object.
         """
@@ -160,7 +171,9 @@ class CasesV1:
             srtKey=sort_key,
         )
         response = self._parent.session.get("/v1/cases", params=data.dict())
-        return CasesPage.parse_response(response)
+        return CasesPage.parse_response(
+            response, record_format=record_format, records="cases"
+        )
 
     def iter_all(
         self,
@@ -173,13 +186,14 @@ class CasesV1:
         page_size: int = None,
         sort_dir: SortDirection = SortDirection.ASC,
         sort_key: SortKeys = SortKeys.NUMBER,
+        record_format: str = "model",
     ) -> Iterator[Case]:
         """
         Iterate over all cases.
 
         Accepts the same parameters as `.get_page()` excepting `page_num`.
 
-        **Returns**: A generator yielding individual [`Case`][case-model] objects.
+        **Returns**: A generator yielding individual [`Case`][case-model] objects, or records in the given `record_format`.
         """
         page_size = page_size or self._parent.settings.page_size
         for page_num in count(1):
@@ -194,6 +208,7 @@ class CasesV1:
                 page_size=page_size,
                 sort_dir=sort_dir,
                 sort_key=sort_key,
+                record_format=record_format,
             )
             yield from page.cases
             if len(page.cases) < page_size:
@@ -396,6 +411,131 @@ class CasesV1:
             f"/v1/cases/{case_number}/fileevent/{event_id}"
         )
 
+    def iter_all_file_events(
+        self, case_number: int, page_size: int = None
+    ) -> Iterator[FileEvent]:
+        """
+        Iterate over all file events attached to a case.
+
+        Accepts the same parameters as `.get_file_events()` excepting `page_num`.
+
+        **Returns**: A generator yielding individual `FileEvent` objects.
+        """
+        page_size = page_size or self._parent.settings.page_size
+        for page_num in count(1):
+            page = self.get_file_events(
+                case_number, page_num=page_num, page_size=page_size
+            )
+            events = page.events or []
+            yield from events
+            if len(events) < page_size:
+                break
+
+    def attach_file_events(
+        self,
+        case_number: int,
+        event_ids: Iterable[str],
+        skip_existing: bool = True,
+        batch_size: int = None,
+    ) -> CaseFileEventsUpdate:
+        """
+        Attach any number of file events to a case, in batches.
+
+        Event IDs are read from `event_ids` as they are needed, so it can be a generator reading from a large file.
+        If a batch is rejected, it is split up until the events that can't be attached are found, and the rest of the
+        batch is still attached.
+
+        **Parameters:**
+
+        * **case_number**: `int` Unique numeric identifier for the case.
+        * **event_ids**: `Iterable[str]` The IDs of the events to attach to the case.
+        * **skip_existing**: `bool` Look up the events already attached to the case and don't attach them again.
+            Defaults to True.
+        * **batch_size**: `int` Max number of events to attach per request. Defaults to 100.
+
+        **Returns**: A [`CaseFileEventsUpdate`][casefileeventsupdate-model] object.
+        """
+        batch_size = batch_size or self.file_event_batch_size
+        result = CaseFileEventsUpdate()
+        seen = set()
+        if skip_existing:
+            seen.update(e.event_id for e in self.iter_all_file_events(case_number))
+
+        def new_event_ids():
+            for event_id in event_ids:
+                if event_id in seen:
+                    result.skipped.append(event_id)
+                    continue
+                seen.add(event_id)
+                yield event_id
+
+        def attach(batch):
+            try:
+                self.add_file_events_to_case(case_number, batch)
+                result.updated += batch
+            except HTTPError as err:
+                if len(batch) > 1 and err.response.status_code == 400:
+                    middle = len(batch) // 2
+                    attach(batch[:middle])
+                    attach(batch[middle:])
+                else:
+                    for event_id in batch:
+                        result.failed[event_id] = _error_message(err)
+
+        for batch in chunked_iter(new_event_ids(), batch_size):
+            attach(batch)
+        return result
+
+    def detach_file_events(
+        self, case_number: int, event_ids: Iterable[str], max_workers: int = 8
+    ) -> CaseFileEventsUpdate:
+        """
+        Remove any number of file events from a case, sending up to `max_workers` requests at once.
+
+        Event IDs are read from `event_ids` as they are needed, so it can be a generator reading from a large file.
+        Events that aren't attached to the case are skipped.
+
+        **Parameters:**
+
+        * **case_number**: `int` Unique numeric identifier for the case.
+        * **event_ids**: `Iterable[str]` The IDs of the events to remove from the case.
+        * **max_workers**: `int` Max number of events to remove at once. Defaults to 8.
+
+        **Returns**: A [`CaseFileEventsUpdate`][casefileeventsupdate-model] object.
+        """
+        result = CaseFileEventsUpdate()
+
+        def detach(event_id):
+            try:
+                self.delete_file_event_from_case(case_number, event_id)
+                return event_id, None
+            except HTTPError as err:
+                return event_id, err
+
+        def record(event_id, err):
+            if err is None:
+                result.updated.append(event_id)
+            elif err.response.status_code == 404:
+                result.skipped.append(event_id)
+            else:
+                result.failed[event_id] = _error_message(err)
+
+        seen = set()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            for event_id in event_ids:
+                if event_id in seen:
+                    result.skipped.append(event_id)
+                    continue
+                seen.add(event_id)
+                pending.append(executor.submit(detach, event_id))
+                # bound the number of queued requests so ids are read as they're needed
+                if len(pending) >= max_workers * 2:
+                    record(*pending.popleft().result())
+            while pending:
+                record(*pending.popleft().result())
+        return result
+
     def get_file_event_detail(self, case_number: int, event_id: str):
         """
         Get the full detail for a given file event attached to a case.
@@ -413,6 +553,10 @@ class CasesV1:
         return FileEventV2.parse_response(response)
 
 
+def _error_message(err):
+    return f"{err.response.status_code}: {err.response.text}"
+
+
 class CasesClient:
     def __init__(self, parent):
         self._parent = parent
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Union
@@ -215,3 +216,19 @@ class CaseFileEvents(ResponseModel):
         description="Total number of events associated with the case.",
         examples=[42],
     )
+
+
+class CaseFileEventsUpdate(Model):
+    """A model representing the outcome of attaching file events to, or detaching them from, a case.
+
+    **Fields**:
+
+    * **updated**: `List[str]` - IDs of the events attached or detached.
+    * **skipped**: `List[str]` - IDs of the events that needed no change: already attached to the case when attaching, or
+        not found on the case when detaching. Repeated IDs are also skipped.
+    * **failed**: `Dict[str, str]` - The error for each event that could not be attached or detached, by event ID.
+    """
+
+    updated: List[str] = Field([])
+    skipped: List[str] = Field([])
+    failed: Dict[str, str] = Field({})
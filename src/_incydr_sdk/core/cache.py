@@ -0,0 +1,113 @@
+"""
+A cache for reference data that rarely changes (watchlists and roles), so that looking items up by name doesn't cost a
+round trip every time.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+class ReferenceDataCache:
+    """
+    Caches the JSON bodies of `GET` requests for reference data, grouped by kind (`"watchlists"`, `"roles"`, ...).
+    Each kind has its own time-to-live in seconds (see `default_ttls`), and a TTL of `0` disables caching for that kind.
+
+    When an expired entry was returned with an `ETag` header, it is revalidated with an `If-None-Match` request and
+    kept, without downloading it again, if the server responds with `304 Not Modified`.
+
+    Entries are held in memory and, when `path` is given, also stored as one JSON file per kind in that directory, so
+    they can be reused across processes.
+
+    Usage:
+
+        >>> client.reference_cache.ttls["watchlists"] = 60
+        >>> client.reference_cache.invalidate("watchlists")
+    """
+
+    default_ttls = {
+        "watchlists": 300,
+        "roles": 3600,
+    }
+
+    def __init__(self, session, ttls=None, path=None, clock=time.time):
+        self._session = session
+        self.ttls = dict(self.default_ttls, **(ttls or {}))
+        self._path = Path(path) if path else None
+        self._clock = clock
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get_json(self, kind, url, params=None):
+        """
+        Returns the JSON body of a `GET` request to `url` with `params`, from the cache if it holds an unexpired entry
+        for the request.
+        """
+        ttl = self.ttls.get(kind)
+        if not ttl:
+            return self._session.get(url, params=params).json()
+
+        key = _entry_key(url, params)
+        with self._lock:
+            entry = self._load(kind).get(key)
+        now = self._clock()
+        if entry is not None and now < entry["expires"]:
+            return entry["data"]
+
+        headers = None
+        if entry is not None and entry.get("etag"):
+            headers = {"If-None-Match": entry["etag"]}
+        response = self._session.get(url, params=params, headers=headers)
+        if entry is not None and response.status_code == 304:
+            entry = dict(entry, expires=now + ttl)
+        else:
+            entry = {
+                "data": response.json(),
+                "etag": response.headers.get("ETag"),
+                "expires": now + ttl,
+            }
+        with self._lock:
+            self._load(kind)[key] = entry
+            self._save(kind)
+        return entry["data"]
+
+    def invalidate(self, kind=None):
+        """Removes all cached entries of `kind`, or of every kind if `kind` is `None`."""
+        with self._lock:
+            kinds = [kind] if kind else set(self.ttls) | set(self._entries)
+            for k in kinds:
+                self._entries.pop(k, None)
+                if self._path is not None:
+                    try:
+                        (self._path / f"{k}.json").unlink()
+                    except FileNotFoundError:
+                        pass
+
+    def _load(self, kind):
+        if kind not in self._entries:
+            entries = {}
+            if self._path is not None:
+                try:
+                    with open(self._path / f"{kind}.json", encoding="utf-8") as f:
+                        entries = json.load(f)
+                except (OSError, ValueError):
+                    # a missing or unreadable store is treated as empty
+                    entries = {}
+            self._entries[kind] = entries
+        return self._entries[kind]
+
+    def _save(self, kind):
+        if self._path is None:
+            return
+        self._path.mkdir(parents=True, exist_ok=True)
+        file = self._path / f"{kind}.json"
+        temp = file.with_name(f"{file.name}.{os.getpid()}.tmp")
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump(self._entries[kind], f)
+        os.replace(temp, file)
+
+
+def _entry_key(url, params):
+    params = sorted((k, str(v)) for k, v in (params or {}).items() if v is not None)
+    return json.dumps([url, params])
@@ -1,4 +1,5 @@
 import base64
+import hashlib
 import json
 import logging
 from collections import deque
@@ -15,6 +16,9 @@ from _incydr_sdk.audit_log.client import AuditLogClient
 from _incydr_sdk.cases.client import CasesClient
 from _incydr_sdk.core.auth import APIClientAuth
 from _incydr_sdk.core.auth import RefreshTokenAuth
+from _incydr_sdk.core.cache import ReferenceDataCache
+from _incydr_sdk.core.codec import get_codec
+from _incydr_sdk.core.history import ResponseRecord
 from _incydr_sdk.core.settings import IncydrSettings
 from _incydr_sdk.customer.client import CustomerClient
 from _incydr_sdk.departments.client import DepartmentsClient
@@ -34,6 +38,25 @@ from _incydr_sdk.watchlists.client import WatchlistsClient
 _base_user_agent = user_agent("incydrSDK", __version__)
 
 
+class _CodecSession(BaseUrlSession):
+    """A `BaseUrlSession` that encodes `json=` request bodies with the client's JSON codec."""
+
+    def __init__(self, base_url, codec):
+        super().__init__(base_url=base_url)
+        self.codec = codec
+
+    def request(self, method, url, *args, **kwargs):
+        body = kwargs.get("json")
+        if body is not None and not args and kwargs.get("data") is None:
+            del kwargs["json"]
+            kwargs["data"] = self.codec.dumps_bytes(body)
+            kwargs["headers"] = {
+                "Content-Type": "application/json",
+                **(kwargs.get("headers") or {}),
+            }
+        return super().request(method, url, *args, **kwargs)
+
+
 class Client:
     """
     An HTTP client for interacting with the Code42 Incydr API.
@@ -68,7 +91,8 @@ class Client:
         )
         self._request_history = deque(maxlen=self._settings.max_response_history)
 
-        self._session = BaseUrlSession(base_url=self._settings.url)
+        self._json_codec = get_codec(self._settings.json_codec)
+        self._session = _CodecSession(self._settings.url, self._json_codec)
         self._session.headers["User-Agent"] = (
             self._settings.user_agent_prefix or ""
         ) + _base_user_agent
@@ -92,11 +116,31 @@ class Client:
             if level == logging.DEBUG:
                 self.settings._log_response_debug(response)
 
-            self._request_history.appendleft(response)
+            if self._settings.response_history_bodies:
+                self._request_history.appendleft(response)
+            else:
+                record = ResponseRecord.from_response(
+                    response, stream=kwargs.get("stream", False)
+                )
+                self._request_history.appendleft(record)
             response.raise_for_status()
 
         self._session.hooks["response"] = [response_hook]
 
+        cache_ttls = None
+        if self._settings.reference_cache_ttl is not None:
+            cache_ttls = dict.fromkeys(
+                ReferenceDataCache.default_ttls, self._settings.reference_cache_ttl
+            )
+        cache_dir = self._settings.reference_cache_dir
+        if cache_dir is not None:
+            # keep each tenant's data apart when several share a cache directory
+            namespace = f"{self._settings.url}|{self._settings.api_client_id}"
+            cache_dir = cache_dir / hashlib.sha256(namespace.encode()).hexdigest()[:16]
+        self._reference_cache = ReferenceDataCache(
+            self._session, ttls=cache_ttls, path=cache_dir
+        )
+
         self._actors = ActorsClient(self)
         self._agents = AgentsClient(self)
         self._alerts = AlertsClient(self)
@@ -134,8 +178,13 @@ class Client:
     @property
     def request_history(self):
         """
-        Property returning a list of the last `n` number of [`requests.Response`](https://requests.readthedocs.io/en/latest/api/#requests.Response)
-        objects received, where `n` equals the `client.settings.max_response_history` value (default=5).
+        Property returning a list of records of the last `n` number of responses received, where `n` equals the
+        `client.settings.max_response_history` value (default=5).
+
+        Each record holds the request's method, URL and endpoint template, and the response's status code, timing,
+        size and the start of its body, so that recent large pages and downloads aren't kept in memory. Set
+        `client.settings.response_history_bodies` to keep whole
+        [`requests.Response`](https://requests.readthedocs.io/en/latest/api/#requests.Response) objects instead.
 
         The most recent request is the first item in the list: `client.request_history[0]`
         """
@@ -166,6 +215,35 @@ class Client:
         """
         return self._session
 
+    @property
+    def json_codec(self):
+        """
+        Property returning the JSON codec selected by the `json_codec` setting, used to encode request bodies. Its
+        `.loads()`, `.dumps()` and `.dumps_bytes()` methods can be used to decode raw responses and encode output with
+        the same library.
+
+        Usage:
+
+            >>> response = client.session.post("/v2/file-events", json=query.dict())
+            >>> client.json_codec.loads(response.content)
+        """
+        return self._json_codec
+
+    @property
+    def reference_cache(self):
+        """
+        Property returning the `ReferenceDataCache` that holds the rarely changing reference data (watchlists and
+        roles) used to resolve names to IDs. Methods which list watchlists or roles always request them.
+
+        Entries expire after a per-type time-to-live and are invalidated when the SDK changes the data they hold.
+        Call `.invalidate()` to clear them after making changes elsewhere.
+
+        Usage:
+
+            >>> client.reference_cache.invalidate("watchlists")
+        """
+        return self._reference_cache
+
     @property
     def actors(self):
         """
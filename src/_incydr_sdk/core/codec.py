@@ -0,0 +1,96 @@
+"""
+JSON encoding and decoding for request bodies, raw response pages and stored events, using the fastest installed
+library.
+"""
+import json
+from typing import Union
+
+CODEC_NAMES = ("auto", "orjson", "msgspec", "json")
+
+
+class JSONCodec:
+    """Encodes and decodes JSON with the standard library `json` module."""
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, memoryview, str]):
+        """Decodes a JSON document from `bytes` (such as `response.content`), a `memoryview` of bytes, or `str`."""
+        if isinstance(data, memoryview):
+            # the standard library can't decode buffers without copying them
+            data = bytes(data)
+        return json.loads(data)
+
+    def dumps(self, obj) -> str:
+        """Encodes an object as a JSON `str`."""
+        return json.dumps(obj)
+
+    def dumps_bytes(self, obj) -> bytes:
+        """Encodes an object as UTF-8 JSON `bytes`, such as for a request body."""
+        return json.dumps(obj).encode("utf-8")
+
+
+class OrjsonCodec(JSONCodec):
+    """Encodes and decodes JSON with `orjson`."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+    def dumps(self, obj):
+        return self._orjson.dumps(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj):
+        return self._orjson.dumps(obj)
+
+
+class MsgspecCodec(JSONCodec):
+    """Encodes and decodes JSON with `msgspec`."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data):
+        return self._decoder.decode(data)
+
+    def dumps(self, obj):
+        return self._encoder.encode(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj):
+        return self._encoder.encode(obj)
+
+
+_CODECS = {"orjson": OrjsonCodec, "msgspec": MsgspecCodec, "json": JSONCodec}
+
+
+def get_codec(name: str = "auto") -> JSONCodec:
+    """
+    Returns the codec named `name`: one of `"orjson"`, `"msgspec"` or `"json"` (the standard library). `"auto"` returns
+    the first of those which is installed.
+
+    Raises `ValueError` if the named codec's library isn't installed.
+    """
+    if name == "auto":
+        for codec in _CODECS.values():
+            try:
+                return codec()
+            except ImportError:
+                continue
+    if name not in _CODECS:
+        raise ValueError(
+            f"Unknown JSON codec '{name}'. Expected one of: {', '.join(CODEC_NAMES)}."
+        )
+    try:
+        return _CODECS[name]()
+    except ImportError:
+        raise ValueError(f"The '{name}' JSON codec requires the `{name}` package.")
@@ -0,0 +1,123 @@
+"""
+Lightweight records of the responses a client has received, kept in `client.request_history` in place of the
+responses themselves so that recent large pages and downloads aren't held in memory.
+"""
+import re
+from datetime import timedelta
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+
+# path segments that identify a resource rather than an endpoint: numbers, UUIDs, email addresses and other long
+# opaque IDs
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}(-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}|.+@.+|(?=.*\d)[\w.-]{16,})$"
+)
+
+# endpoints whose responses hold secrets, which aren't previewed
+_SECRET_TEMPLATES = ("/v1/oauth",)
+
+
+class ResponseRecord:
+    """
+    The metadata of a response: its request's method and URL, the status code, timing and sizes, and a truncated
+    preview of the body.
+
+    **Attributes**:
+
+    * **method**: `str` The request's HTTP method.
+    * **url**: `str` The full URL of the request.
+    * **url_template**: `str` The URL's path with IDs replaced by `{id}`, such as `/v1/cases/{id}/fileevent`, for
+        grouping requests by endpoint.
+    * **status_code**: `int` The response's status code.
+    * **elapsed**: `timedelta` The time between sending the request and receiving the response headers.
+    * **request_size**: `int` The size of the request body in bytes.
+    * **response_size**: `int | None` The size of the response body in bytes. For streamed responses, such as file
+        downloads, this is the `Content-Length` header, if any, as the body isn't read when the response is received.
+    * **preview**: `str` The first `preview_size` bytes of the response body, decoded as UTF-8. Empty for streamed
+        responses and for authentication responses, which hold access tokens.
+    """
+
+    __slots__ = (
+        "method",
+        "url",
+        "url_template",
+        "status_code",
+        "elapsed",
+        "request_size",
+        "response_size",
+        "preview",
+    )
+
+    # the number of bytes of each response body kept as a preview
+    preview_size = 256
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        status_code: int,
+        elapsed: timedelta,
+        request_size: int = 0,
+        response_size: Optional[int] = None,
+        preview: str = "",
+    ):
+        self.method = method
+        self.url = url
+        self.url_template = url_template(url)
+        self.status_code = status_code
+        self.elapsed = elapsed
+        self.request_size = request_size
+        self.response_size = response_size
+        self.preview = preview
+
+    @classmethod
+    def from_response(
+        cls, response: requests.Response, stream: bool = False
+    ) -> "ResponseRecord":
+        """
+        Records a response. Unless `stream` is `True`, the body is read to measure and preview it, which
+        `requests` would otherwise do immediately after receiving the response.
+        """
+        request = response.request
+        body = request.body
+        # bodies can also be generators or files, such as for uploads, which aren't measured
+        request_size = len(body) if isinstance(body, (bytes, str)) else 0
+        if stream:
+            length = response.headers.get("Content-Length")
+            response_size = int(length) if length and length.isdigit() else None
+            preview = ""
+        else:
+            content = response.content or b""
+            response_size = len(content)
+            preview = content[: cls.preview_size].decode("utf-8", errors="replace")
+        if url_template(request.url) in _SECRET_TEMPLATES:
+            preview = ""
+        return cls(
+            method=request.method,
+            url=request.url,
+            status_code=response.status_code,
+            elapsed=response.elapsed,
+            request_size=request_size,
+            response_size=response_size,
+            preview=preview,
+        )
+
+    @property
+    def ok(self) -> bool:
+        """`True` if the status code is less than 400."""
+        return self.status_code < 400
+
+    def __repr__(self):
+        return (
+            f"<ResponseRecord [{self.status_code}] {self.method} {self.url_template}>"
+        )
+
+
+def url_template(url: str) -> str:
+    """Returns the path of `url`, without its query string, with segments that look like IDs replaced by `{id}`."""
+    path = urlsplit(url).path
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
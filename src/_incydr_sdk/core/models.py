@@ -1,19 +1,29 @@
 from __future__ import annotations
 
+import json
+from collections import namedtuple
 from csv import DictReader
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+from functools import lru_cache
+from itertools import islice
 from json import JSONDecodeError
+from typing import Callable
+from typing import get_args
+from typing import List
+from typing import Type
 
 import requests
-from boltons.jsonutils import JSONLIterator
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import model_validator
 from pydantic import PrivateAttr
 from pydantic import SecretStr
+from pydantic import TypeAdapter
 from pydantic import ValidationError
+from pydantic import ValidationInfo
+from pydantic_core import from_json
 
 
 class Model(BaseModel):
@@ -73,25 +83,33 @@ class Model(BaseModel):
         )
 
     @classmethod
-    def parse_json_lines(cls, file):
+    def parse_json_lines(cls, file, on_error: Callable[[int, str], None] = None):
         """
         Accepts an open file-like object in [JSON Lines format](https://jsonlines.org) and returns a generator of
         models parsed from the JSON line by line.
+
+        Lines are read and validated in chunks as the generator is consumed, so files of any size are parsed in
+        constant memory. Invalid lines raise a `ValueError`, unless an `on_error` function is given, in which case it's
+        called with the line number and error message of each invalid line, which is skipped.
         """
-        num = 1
-        try:
-            for line in JSONLIterator(file):
+
+        def rows():
+            for num, line in enumerate(file, start=1):
+                line = line.strip()
+                if not line:
+                    continue
                 try:
-                    yield cls(**line)
-                    num += 1
-                except ValidationError as v_err:
-                    raise ValueError(
-                        f"Error parsing object on line {num}: {str(v_err)}"
-                    )
-        except JSONDecodeError:
-            raise ValueError(
-                f"Unable to parse line {num}. Expecting JSONLines format: https://jsonlines.org"
-            )
+                    yield num, json.loads(line)
+                except JSONDecodeError:
+                    message = f"Unable to parse line {num}. Expecting JSONLines format: https://jsonlines.org"
+                    if on_error is None:
+                        raise ValueError(message)
+                    on_error(num, message)
+
+        def describe(num, err):
+            return f"Error parsing object on line {num}: {str(err)}"
+
+        yield from _validate_rows(cls, rows(), describe, on_error)
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -101,14 +119,74 @@ class Model(BaseModel):
     )
 
 
+# formats that paginated methods can return records in, see `ResponseModel.parse_response()`
+RECORD_FORMATS = ("model", "dict", "compact")
+
+
 class ResponseModel(Model):
     @classmethod
-    def parse_response(cls, response: requests.Response):
-        try:
-            return cls.model_validate_json(response.text)
-        except ValidationError as err:
-            err.response = response
-            raise
+    def parse_response(
+        cls,
+        response: requests.Response,
+        record_format: str = "model",
+        records: str = None,
+    ):
+        """
+        Validates a response into this model.
+
+        With a `record_format` of `"dict"` or `"compact"`, the list field named `records` is instead left unvalidated,
+        as the `dict`s returned by the API or as compact records (see `compact_record_type()`), and the model is
+        constructed without validation.
+        """
+        if record_format == "model":
+            try:
+                # validate the raw bytes, rather than decoding them to text first
+                return cls.model_validate_json(response.content)
+            except ValidationError as err:
+                err.response = response
+                raise
+        if record_format not in RECORD_FORMATS:
+            raise ValueError(
+                f"Unknown record format '{record_format}'. Expected one of: {', '.join(RECORD_FORMATS)}."
+            )
+        data = from_json(response.content)
+        field = cls.model_fields[records]
+        key = field.alias or records
+        items = data.get(key) or []
+        if record_format == "compact":
+            record_type = compact_record_type(_item_model(field.annotation))
+            items = [
+                record_type._make(map(item.get, record_type._keys)) for item in items
+            ]
+        data[key] = items
+        return cls.model_construct(**data)
+
+
+@lru_cache(maxsize=None)
+def compact_record_type(model: Type[BaseModel]) -> type:
+    """
+    Returns a `namedtuple` type with the fields of `model`, for holding records with far less memory than models.
+
+    Records are built from the `dict`s returned by the API without validation, so their values are the raw JSON values
+    (for example timestamps are strings, and nested models are `dict`s). Use `._asdict()` to convert one to a `dict`.
+    """
+    names = tuple(model.model_fields)
+    record_type = namedtuple(
+        f"{model.__name__}Record", names, defaults=(None,) * len(names)
+    )
+    record_type._keys = tuple(f.alias or n for n, f in model.model_fields.items())
+    return record_type
+
+
+def _item_model(annotation):
+    # the model of the items of a list field, such as `Actor` for `Optional[List[Actor]]`
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        model = _item_model(arg)
+        if model is not None:
+            return model
+    return None
 
 
 def datetime_now_utc_callback():
@@ -168,26 +246,36 @@ class CSVModel(BaseModel):
 
     @model_validator(mode="before")
     @classmethod
-    def _alias_validator(cls, values):  # noqa
-        for name, field_info in cls.model_fields.items():
-            if field_info.json_schema_extra:
-                aliases = field_info.json_schema_extra.get("csv_aliases", [])
-            else:
-                aliases = []
+    def _alias_validator(cls, values, info: ValidationInfo):  # noqa
+        # `parse_csv()` passes the aliases already narrowed down to the columns of the file
+        columns = (info.context or {}).get("csv_columns") or (
+            (name, aliases, required, aliases)
+            for name, aliases, required in _csv_alias_map(cls)
+        )
+        for name, aliases, required, all_aliases in columns:
             for alias in aliases:
                 if alias in values and values[alias]:
                     values[name] = values[alias]
                     break
             else:  # no break
-                if field_info.is_required():
+                if required:
                     raise ValueError(
-                        f"'{name}' required. Valid column aliases: {aliases}"
+                        f"'{name}' required. Valid column aliases: {list(all_aliases)}"
                     )
 
         return values
 
     @classmethod
-    def parse_csv(cls, file):
+    def parse_csv(cls, file, on_error: Callable[[int, str], None] = None):
+        """
+        Accepts an open file-like object in CSV format, with a header row, and returns a generator of models parsed
+        from its rows.
+
+        The columns of each field are resolved from the header once, and rows are read and validated in chunks as the
+        generator is consumed, so files of any size are parsed in constant memory. A header missing a required column
+        raises a `ValueError`. Invalid rows also raise a `ValueError`, unless an `on_error` function is given, in which
+        case it's called with the line number and error message of each invalid row, which is skipped.
+        """
         first_line = next(file)
         headers = first_line.strip().split(",")
         try:
@@ -196,12 +284,69 @@ class CSVModel(BaseModel):
             msg = err.errors()[0]["msg"]
             raise ValueError(f"CSV header missing column: {msg}")
 
+        present = set(headers)
+        columns = tuple(
+            (name, tuple(a for a in aliases if a in present), required, aliases)
+            for name, aliases, required in _csv_alias_map(cls)
+        )
         reader = DictReader(file, fieldnames=headers, restkey="extra")
-        for row in reader:
-            try:
+
+        def rows():
+            for row in reader:
                 # coerce empty columns from "" to None
-                row = {k: v or None for k, v in row.items()}
-                yield cls(**row)
+                yield reader.line_num, {k: v or None for k, v in row.items()}
+
+        def describe(num, err):
+            return f"Missing data on CSV row {num}: {err.errors()[0]['msg']}"
+
+        yield from _validate_rows(
+            cls, rows(), describe, on_error, context={"csv_columns": columns}
+        )
+
+
+# the number of rows validated at once when parsing CSV and JSON lines files
+_CHUNK_SIZE = 1000
+
+
+@lru_cache(maxsize=64)
+def _csv_alias_map(model):
+    # (field name, aliases, required) for each field of a `CSVModel`
+    columns = []
+    for name, field_info in model.model_fields.items():
+        extra = field_info.json_schema_extra
+        aliases = tuple(extra.get("csv_aliases", [])) if extra else ()
+        columns.append((name, aliases, field_info.is_required()))
+    return tuple(columns)
+
+
+@lru_cache(maxsize=64)
+def _list_adapter(model):
+    return TypeAdapter(List[model])
+
+
+def _validate_rows(model, rows, describe, on_error, context=None):
+    """
+    Validates `(line number, dict)` pairs into `model`s a chunk at a time, yielding them in order. If a chunk fails
+    validation, its rows are validated one at a time to find the invalid ones, which are passed to `on_error` or
+    raised as a `ValueError`.
+    """
+    adapter = _list_adapter(model)
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, _CHUNK_SIZE))
+        if not chunk:
+            return
+        try:
+            yield from adapter.validate_python(
+                [row for _, row in chunk], context=context
+            )
+            continue
+        except ValidationError:
+            pass
+        for num, row in chunk:
+            try:
+                yield model.model_validate(row, context=context)
             except ValidationError as err:
-                msg = err.errors()[0]["msg"]
-                raise ValueError(f"Missing data on CSV row {reader.line_num}: {msg}")
+                if on_error is None:
+                    raise ValueError(describe(num, err))
+                on_error(num, describe(num, err))
@@ -19,6 +19,7 @@ from rich import pretty
 from rich.console import Console
 from rich.logging import RichHandler
 
+from _incydr_sdk.core.codec import get_codec
 from _incydr_sdk.enums import _Enum
 from _incydr_sdk.exceptions import AuthMissingError
 
@@ -77,6 +78,9 @@ class IncydrSettings(BaseSettings):
     * **page_size**: `int` The default page size for all paginated requests. Defaults to 100. env_var=`INCYDR_PAGE_SIZE`
     * **max_response_history**: `int` The maximum number of responses the `incydr.Client.response_history` list will
         store. Defaults to 5. env_var=`INCYDR_MAX_RESPONSE_HISTORY`
+    * **response_history_bodies**: `bool` Stores whole `requests.Response` objects, including their bodies, in
+        `incydr.Client.request_history` rather than only their metadata. Defaults to False.
+        env_var=`INCYDR_RESPONSE_HISTORY_BODIES`
     * **log_stderr**: `bool` Enables logging to stderr. Defaults to True. env_var=`INCYDR_LOG_STDERR`
     * **log_file**: `str` The file path or file-like object to write log output to. Defaults to None. env_var=`INCYDR_LOG_FILE`
     * **log_level**: `int` The level for logging messages. Defaults to `logging.WARNING`. env_var=`INCYDR_LOG_LEVEL`
@@ -86,6 +90,15 @@ class IncydrSettings(BaseSettings):
     * **user_agent_prefix**: `str` Prefixes all `User-Agent` headers with the supplied string.
     * **use_rich**: `bool` Enables [rich](https://rich.readthedocs.io/en/stable/introduction.html) support in logging
         and the Python repl. Defaults to True. env_var=`INCYDR_USE_RICH`
+    * **reference_cache_ttl**: `int` Overrides how many seconds the watchlists and roles used to resolve names to IDs
+        are cached for by `incydr.Client.reference_cache`. Set to 0 to disable caching. Defaults to None, which uses
+        the cache's per-type defaults. env_var=`INCYDR_REFERENCE_CACHE_TTL`
+    * **reference_cache_dir**: `str` A directory to also store cached reference data in, so it can be reused across
+        processes. Defaults to None (memory only). env_var=`INCYDR_REFERENCE_CACHE_DIR`
+    * **json_codec**: `str` The library used to encode request bodies and to decode raw event pages: one of `orjson`,
+        `msgspec` or `json` (the standard library). Defaults to `auto`, which uses the first of those that is
+        installed. CLI output is always encoded with the standard library, so it doesn't change with the codec.
+        env_var=`INCYDR_JSON_CODEC`
     """
 
     api_client_id: Optional[str] = Field(default=None)
@@ -93,6 +106,7 @@ class IncydrSettings(BaseSettings):
     url: str
     page_size: int = Field(default=100)
     max_response_history: int = Field(default=5)
+    response_history_bodies: bool = Field(default=False)
     use_rich: bool = Field(default=True)
     log_stderr: bool = Field(default=True)
     log_file: Union[str, Path, IOBase] = Field(default=None)
@@ -101,6 +115,9 @@ class IncydrSettings(BaseSettings):
     user_agent_prefix: Union[str] = Field(default="")
     refresh_token: Optional[SecretStr] = Field(default=None)
     refresh_url: Optional[str] = Field(default=None)
+    reference_cache_ttl: Optional[int] = Field(default=None, ge=0)
+    reference_cache_dir: Optional[Path] = Field(default=None)
+    json_codec: str = Field(default="auto")
 
     model_config = SettingsConfigDict(
         env_prefix="incydr_",
@@ -154,6 +171,15 @@ class IncydrSettings(BaseSettings):
             sys.displayhook = _sys_displayhook
         return value
 
+    @field_validator("json_codec", mode="before")
+    @classmethod
+    def _validate_json_codec(cls, value, **kwargs):  # noqa
+        value = str(value).lower()
+        if value != "auto":
+            # raises a ValueError if the codec's library isn't installed
+            get_codec(value)
+        return value
+
     @field_validator("logger", mode="before")
     @classmethod
     def _validate_logger(cls, value, **kwargs):  # noqa
@@ -62,6 +62,7 @@ class DevicesV1:
         page_size: int = None,
         sort_dir: SortDirection = SortDirection.ASC,
         sort_key: SortKeys = SortKeys.NAME,
+        record_format: str = "model",
     ) -> DevicesPage:
         """
         Get a page of devices.
@@ -76,6 +77,7 @@ class DevicesV1:
         * **page_size**: `int` - Max number of results to return per page.
         * **sort_dir**: `SortDirection` - 'asc' or 'desc'. The direction in which to sort the response based on the corresponding key. Defaults to 'asc'.
         * **sort_key**: [`SortKeys`][devices-sort-keys] - One or more values on which the response will be sorted. Defaults to device name.
+        * **record_format**: `str` - The format to return records in: `"model"` (default) to validate them into models, `"dict"` for the `dict`s returned by the API, or `"compact"` for memory-lean records with the fields of the model, without validation. See [Record Formats][record-formats].
 
         **Returns**: A ['DevicesPage'][devicespage-model] object.
         """
@@ -94,7 +96,9 @@ class DevicesV1:
             blocked=blocked,
         )
         response = self._parent.session.get("/v1/devices", params=data.dict())
-        return DevicesPage.parse_response(response)
+        return DevicesPage.parse_response(
+            response, record_format=record_format, records="devices"
+        )
 
     def iter_all(
         self,
@@ -103,13 +107,14 @@ class DevicesV1:
         page_size: int = None,
         sort_dir: SortDirection = SortDirection.ASC,
         sort_key: SortKeys = SortKeys.NAME,
+        record_format: str = "model",
     ) -> Iterator[Device]:
         """
         Iterate over all devices.
 
         Accepts the same parameters as `.get_page()` excepting `page_num`.
 
-        **Returns**: A generator yielding individual [`Device`][device-model] objects.
+        **Returns**: A generator yielding individual [`Device`][device-model] objects, or records in the given `record_format`.
         """
         warn(
             "Devices endpoints are deprecated. Replaced by Agents.",
@@ -125,6 +130,7 @@ class DevicesV1:
                 page_size=page_size,
                 sort_dir=sort_dir,
                 sort_key=sort_key,
+                record_format=record_format,
             )
             yield from page.devices
             if len(page.devices) < page_size:
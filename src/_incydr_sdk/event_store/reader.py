@@ -0,0 +1,179 @@
+"""
+Reads JSON lines files of events, such as event store segments and `--format json-lines` exports, through a memory map,
+handing out each line as a `memoryview` of the mapped file rather than copying it into a new `bytes` or `str`.
+"""
+import gzip
+import mmap
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from _incydr_sdk.core.codec import get_codec
+from _incydr_sdk.core.codec import JSONCodec
+from _incydr_sdk.queries.file_events import BaseEventQuery
+from _incydr_sdk.queries.local import compile_query
+
+_WHITESPACE = b" \t\r"
+
+
+class SegmentReader:
+    """
+    A reader of the lines of a JSON lines file, mapped into memory.
+
+    Lines are returned as `memoryview` slices of the file, without their line endings, which can be passed to the JSON
+    codec (`orjson` and `msgspec` decode them without copying) or written to a socket or file as they are. Slices are
+    only valid while the reader is open; copy them with `bytes()` to keep them longer. Gzip-compressed files (ending
+    in `.gz`) are decompressed into memory once and read the same way.
+
+    Lines can be read from any byte offset, such as the offsets in an event store's index, and `split()` divides the
+    file into disjoint byte ranges that separate readers, in threads or processes, can read in parallel.
+
+    Usage example:
+
+        >>> from _incydr_sdk.event_store.reader import SegmentReader
+        >>> with SegmentReader("events.jsonl") as reader:
+        ...     for line in reader.iter_raw():
+        ...         sink.send_raw(line)
+
+    **Parameters**:
+
+    * **path**: `str | Path` (required) - The file to read.
+    * **codec**: `JSONCodec` - The codec `iter_events()` decodes lines with. Defaults to the fastest installed codec.
+    """
+
+    def __init__(self, path: Union[str, Path], codec: Optional[JSONCodec] = None):
+        self.path = Path(path)
+        self.codec = codec or get_codec()
+        self._mmap = None
+        self._offsets = None
+        with open(self.path, "rb") as f:
+            if self.path.suffix == ".gz":
+                self._buffer = gzip.decompress(f.read())
+            elif self.path.stat().st_size == 0:
+                # empty files can't be mapped
+                self._buffer = b""
+            else:
+                self._mmap = self._buffer = mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
+                )
+        self._view = memoryview(self._buffer)
+
+    @property
+    def size(self) -> int:
+        """The size of the (decompressed) file in bytes."""
+        return len(self._buffer)
+
+    def close(self):
+        """
+        Unmap the file. The mapping is kept until every slice returned by the reader is released, if any are still
+        referenced.
+        """
+        self._view.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # slices are still in use, and the mapping is closed when they're garbage collected
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def line_at(self, offset: int) -> memoryview:
+        """Returns the line starting at byte `offset`."""
+        end = self._buffer.find(b"\n", offset)
+        if end == -1:
+            end = len(self._buffer)
+        return self._view[offset:end]
+
+    def iter_raw(self, start: int = 0, end: int = None) -> Iterator[memoryview]:
+        """
+        Yields each non-blank line starting at or after byte `start` and before byte `end` (default the end of the
+        file). `start` should be the offset of the start of a line, such as a range from `split()`.
+        """
+        buffer, view = self._buffer, self._view
+        end = len(buffer) if end is None else min(end, len(buffer))
+        position = start
+        while position < end:
+            newline = buffer.find(b"\n", position)
+            if newline == -1:
+                newline = len(buffer)
+            # skip blank lines, only copying lines which start with whitespace to check them
+            if newline > position and (
+                buffer[position] not in _WHITESPACE
+                or not buffer[position:newline].isspace()
+            ):
+                yield view[position:newline]
+            position = newline + 1
+
+    def iter_events(self, start: int = 0, end: int = None) -> Iterator[dict]:
+        """Yields the decoded event of each line in the byte range, like `iter_raw()`."""
+        loads = self.codec.loads
+        for line in self.iter_raw(start, end):
+            yield loads(line)
+
+    def split(self, parts: int) -> List[Tuple[int, int]]:
+        """
+        Divides the file into up to `parts` disjoint `(start, end)` byte ranges of about the same size, each starting
+        at the start of a line, to be read with `iter_raw(start, end)` or `iter_events(start, end)`.
+        """
+        size = len(self._buffer)
+        bounds = [0]
+        for i in range(1, parts):
+            newline = self._buffer.find(b"\n", max(size * i // parts, bounds[-1]))
+            if newline == -1:
+                break
+            if newline + 1 > bounds[-1]:
+                bounds.append(newline + 1)
+        bounds.append(size)
+        return [(s, e) for s, e in zip(bounds, bounds[1:]) if s < e]
+
+    @property
+    def offsets(self) -> array:
+        """The byte offset of the start of every line, found on first use."""
+        if self._offsets is None:
+            offsets = array("Q")
+            buffer, size = self._buffer, len(self._buffer)
+            position = 0
+            while position < size:
+                offsets.append(position)
+                newline = buffer.find(b"\n", position)
+                if newline == -1:
+                    break
+                position = newline + 1
+            self._offsets = offsets
+        return self._offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, index: int) -> memoryview:
+        """Returns line number `index` (from 0)."""
+        return self.line_at(self.offsets[index])
+
+
+def filter_raw(
+    query: BaseEventQuery,
+    lines: Iterable[memoryview],
+    codec: JSONCodec,
+    now: datetime = None,
+) -> Iterator[memoryview]:
+    """
+    Yields the lines of JSON encoded events which match a file event query, such as from `SegmentReader.iter_raw()`.
+    Lines are only decoded to test them against the query's filters, so none are decoded if it doesn't have any, and
+    each line is released once the next is requested.
+    """
+    predicate = compile_query(query, now=now) if query.groups else None
+    for line in lines:
+        if predicate is None or predicate(codec.loads(line)):
+            yield line
+        line.release()
@@ -0,0 +1,561 @@
+"""
+A local, append-only store of file events, so that events exported once can be searched again without another
+Forensic Search request, and later exports only need to fetch what's new.
+"""
+import gzip
+import math
+import os
+import sqlite3
+import time
+import uuid
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from pathlib import Path
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Union
+
+from boltons.iterutils import chunked_iter
+from isodate import parse_duration
+from pydantic import BaseModel
+
+from _incydr_sdk.aggregations.operators import _hash64
+from _incydr_sdk.core.codec import get_codec
+from _incydr_sdk.enums.file_events import Operator
+from _incydr_sdk.event_store.reader import filter_raw
+from _incydr_sdk.event_store.reader import SegmentReader
+from _incydr_sdk.queries.file_events import BaseEventQuery
+from _incydr_sdk.queries.file_events import EventQuery
+from _incydr_sdk.queries.file_events import FilterGroupV2
+from _incydr_sdk.queries.local import as_datetime
+from _incydr_sdk.queries.local import compile_query
+from _incydr_sdk.queries.local import match_value
+from _incydr_sdk.queries.local import values_getter
+
+# the database of segment manifests, the event ID index and sync checkpoints, in the store's directory
+INDEX_FILE = "index.db"
+
+PARTITIONS = {"hour": "%Y-%m-%dT%H", "day": "%Y-%m-%d", "month": "%Y-%m"}
+
+# terms with a bloom filter in each segment's manifest, so that segments without a value can be skipped
+BLOOM_TERMS = (
+    "user.email",
+    "file.name",
+    "file.hash.md5",
+    "file.hash.sha256",
+    "event.action",
+    "source.category",
+    "destination.category",
+)
+
+# the partition of events without an @timestamp
+_UNDATED = "undated"
+_ONE_DAY = timedelta(days=1)
+
+
+class BloomFilter:
+    """
+    A set of strings that can be tested for membership with false positives, but no false negatives, in a fixed
+    number of bits.
+    """
+
+    def __init__(self, bits: int, hashes: int, data: bytes = None):
+        self.bits = bits
+        self.hashes = hashes
+        self.data = bytearray(data) if data else bytearray((bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float = 0.01) -> "BloomFilter":
+        """Returns an empty filter sized to hold `capacity` values with a false positive rate of `error_rate`."""
+        capacity = max(capacity, 1)
+        bits = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        hashes = max(1, round(bits / capacity * math.log(2)))
+        return cls(bits, hashes)
+
+    def _positions(self, value):
+        h = _hash64(value)
+        h1, h2 = h & 0xFFFFFFFF, h >> 32
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def add(self, value: str):
+        for position in self._positions(value):
+            self.data[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self.data[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+
+class Segment:
+    """
+    The manifest of a segment: an immutable file of events from one partition of time, written by a single append.
+
+    **Attributes**:
+
+    * **name**: `str` The segment's unique name.
+    * **path**: `Path` The segment file: events in JSON lines format, gzip-compressed if the name ends in `.gz`.
+    * **partition**: `str` The partition of time the segment's events belong to, such as `2024-01-31`, or `undated`
+        for events without an `@timestamp`.
+    * **start**: `datetime | None` The earliest `@timestamp` of the segment's events.
+    * **end**: `datetime | None` The latest `@timestamp` of the segment's events.
+    * **events**: `int` The number of events in the segment.
+    * **blooms**: `Dict[str, BloomFilter]` A bloom filter of the values of each of the store's `bloom_terms` in the
+        segment.
+    """
+
+    __slots__ = ("name", "path", "partition", "start", "end", "events", "blooms")
+
+    def __init__(self, name, path, partition, start, end, events, blooms=None):
+        self.name = name
+        self.path = path
+        self.partition = partition
+        self.start = start
+        self.end = end
+        self.events = events
+        self.blooms = blooms or {}
+
+    @property
+    def compressed(self) -> bool:
+        return self.name.endswith(".gz")
+
+    def __repr__(self):
+        return f"<Segment {self.partition}/{self.name} ({self.events} events)>"
+
+
+class EventStore:
+    """
+    A local, append-only store of file events in the directory at `path`.
+
+    Events are stored in segments: files of JSON lines, gzip-compressed by default, in a directory for each partition
+    of time (a day by default) keyed by `@timestamp`. Segments are never modified once written; each append adds new
+    segments. An index of `event.id`s skips events that are already stored, so the same window can be exported any
+    number of times without storing duplicates, and a manifest of each segment, with its earliest and latest
+    timestamps and bloom filters of the values of common search terms, lets searches skip the segments which can't
+    contain matching events. Segments are read with memory-mapped I/O by a `SegmentReader`.
+
+    Usage example:
+
+        >>> import incydr
+        >>> client = incydr.Client(**kwargs)
+        >>> store = incydr.EventStore("events")
+        >>> store.sync(client, incydr.EventQuery("P30D"), checkpoint="last-30-days")
+        21374
+        >>> query = incydr.EventQuery("P7D").equals("user.email", "foo@bar.com")
+        >>> for event in store.search(query):
+        ...     print(event["event"]["id"])
+
+    **Parameters**:
+
+    * **path**: `str | Path` (required) - The directory to store events in. Created if it doesn't exist.
+    * **partition**: `str` - The length of the partitions new segments are divided into: `"hour"`, `"day"` (default)
+        or `"month"`.
+    * **compression**: `str | None` - `"gzip"` (default) to compress new segments, or `None` to store them
+        uncompressed, which takes more space but is faster to read.
+    * **segment_events**: `int` - The most events written to a single segment. Events are buffered in memory until a
+        partition has this many events, or the append ends. Defaults to 50,000.
+    * **bloom_terms**: `Iterable[str]` - The terms to keep bloom filters of in new segments' manifests. Defaults to
+        `user.email`, `file.name`, `file.hash.md5`, `file.hash.sha256`, `event.action`, `source.category` and
+        `destination.category`.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        partition: str = "day",
+        compression: Optional[str] = "gzip",
+        segment_events: int = 50_000,
+        bloom_terms: Iterable[str] = BLOOM_TERMS,
+    ):
+        if partition not in PARTITIONS:
+            raise ValueError(
+                f"Unknown partition '{partition}'. Expected one of: {', '.join(PARTITIONS)}."
+            )
+        if compression not in ("gzip", None):
+            raise ValueError(
+                f"Unknown compression '{compression}'. Expected 'gzip' or None."
+            )
+        self.path = Path(path)
+        self.partition = partition
+        self.compression = compression
+        self.segment_events = segment_events
+        self.bloom_terms = tuple(bloom_terms)
+        self._codec = get_codec()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path / INDEX_FILE))
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS segments (name TEXT PRIMARY KEY, partition TEXT NOT NULL, "
+                "start_ts REAL, end_ts REAL, events INTEGER NOT NULL, created REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS blooms (segment TEXT NOT NULL, term TEXT NOT NULL, "
+                "bits INTEGER NOT NULL, hashes INTEGER NOT NULL, data BLOB NOT NULL, "
+                "PRIMARY KEY (segment, term))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS events (id TEXT PRIMARY KEY, segment TEXT NOT NULL, "
+                "offset INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints (name TEXT PRIMARY KEY, query TEXT NOT NULL)"
+            )
+
+    def close(self):
+        """Close the connection to the index."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def append(self, events: Iterable[Union[dict, BaseModel]]) -> int:
+        """
+        Store events which aren't already in the store.
+
+        **Parameters**:
+
+        * **events**: `Iterable[dict | FileEventV2]` (required) - The events to store: `dict`s in the shape returned by
+            the file events API, such as from `client.file_events.v2.iter_all(query, record_format="dict")`, or
+            `FileEventV2` models.
+
+        **Returns**: The number of events stored. Events whose `event.id` is already stored aren't counted.
+        """
+        writer = _Writer(self)
+        try:
+            for event in events:
+                writer.add(event)
+        finally:
+            writer.flush()
+        return writer.written
+
+    def tap(self, events: Iterable[Union[dict, BaseModel]]) -> Iterator:
+        """
+        Returns a generator yielding each event of `events` unchanged, storing them as they pass through. Events are
+        written when a segment is full and once the generator is exhausted or closed.
+        """
+        writer = _Writer(self)
+        try:
+            for event in events:
+                writer.add(event)
+                yield event
+        finally:
+            writer.flush()
+
+    def sync(self, client, query: EventQuery, checkpoint: Optional[str] = None) -> int:
+        """
+        Search file events and store the results.
+
+        With a `checkpoint` name, the query and the last event stored are saved, and later syncs with that checkpoint
+        resume the saved query from that event, so only new events are fetched. As with `incydr file-events search
+        --checkpoint`, the saved query replaces the `query` passed to later syncs.
+
+        **Parameters**:
+
+        * **client**: `Client` (required) - The client to search with.
+        * **query**: `EventQuery` (required) - The query of events to store.
+        * **checkpoint**: `str` - The name to save the sync's progress under.
+
+        **Returns**: The number of events stored.
+        """
+        if checkpoint:
+            row = self._conn.execute(
+                "SELECT query FROM checkpoints WHERE name = ?", (checkpoint,)
+            ).fetchone()
+            if row:
+                query = EventQuery.parse_raw(row[0])
+        query = query.model_copy(deep=True)
+        writer = _Writer(self)
+        try:
+            for event in client.file_events.v2.iter_all(query, record_format="dict"):
+                writer.add(event)
+                query.page_token = event["event"]["id"]
+        finally:
+            writer.flush()
+            if checkpoint:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO checkpoints VALUES (?, ?)",
+                        (checkpoint, query.json()),
+                    )
+        return writer.written
+
+    def search(self, query: BaseEventQuery, now: datetime = None) -> Iterator[dict]:
+        """
+        Search the stored events, reading only the segments whose manifests show they may contain matching events.
+
+        **Parameters**:
+
+        * **query**: `EventQuery | GroupingEventQuery` (required) - The query to filter with. See `compile_query()`.
+        * **now**: `datetime` - The time `WITHIN_THE_LAST` filters are relative to. Defaults to the current time.
+
+        **Returns**: A generator yielding each matching event as a `dict`. Segments are read in order of their
+        earliest event, and events in the order they were stored.
+        """
+        now = now or datetime.now(timezone.utc)
+        predicate = compile_query(query, now=now)
+        for segment in self.segments(query, now=now):
+            yield from filter(predicate, self.read_segment(segment))
+
+    def segments(
+        self, query: Optional[BaseEventQuery] = None, now: datetime = None
+    ) -> List[Segment]:
+        """
+        Get the manifests of the stored segments, in order of their earliest event.
+
+        **Parameters**:
+
+        * **query**: `EventQuery | GroupingEventQuery` - Only return the segments which may contain events matching
+            this query.
+        * **now**: `datetime` - The time `WITHIN_THE_LAST` filters are relative to. Defaults to the current time.
+
+        **Returns**: A list of `Segment` manifests.
+        """
+        blooms = {}
+        for name, term, bits, hashes, data in self._conn.execute(
+            "SELECT segment, term, bits, hashes, data FROM blooms"
+        ):
+            blooms.setdefault(name, {})[term] = BloomFilter(bits, hashes, data)
+        segments = [
+            Segment(
+                name=name,
+                path=self.path / partition / name,
+                partition=partition,
+                start=_from_epoch(start),
+                end=_from_epoch(end),
+                events=events,
+                blooms=blooms.get(name),
+            )
+            for name, partition, start, end, events in self._conn.execute(
+                "SELECT name, partition, start_ts, end_ts, events FROM segments "
+                "ORDER BY start_ts IS NULL, start_ts, created"
+            )
+        ]
+        if query is None:
+            return segments
+        may_match = _compile_pruner(query, now or datetime.now(timezone.utc))
+        return [s for s in segments if may_match(s)]
+
+    def search_raw(
+        self, query: BaseEventQuery, now: datetime = None
+    ) -> Iterator[memoryview]:
+        """
+        Search the stored events like `search()`, but yield the stored JSON of each matching event as a `memoryview`,
+        to forward without encoding it again. Each view is only valid until the next one is yielded; copy it with
+        `bytes()` to keep it.
+
+        Events are only decoded to test them against the query's filters, so a query without any filters reads
+        segments without decoding them at all.
+        """
+        now = now or datetime.now(timezone.utc)
+        for segment in self.segments(query, now=now):
+            with SegmentReader(segment.path, codec=self._codec) as reader:
+                yield from filter_raw(query, reader.iter_raw(), self._codec, now=now)
+
+    def read_segment(self, segment: Segment) -> Iterator[dict]:
+        """Read the events of a segment, in the order they were stored."""
+        with SegmentReader(segment.path, codec=self._codec) as reader:
+            yield from reader.iter_events()
+
+    def get(self, event_id: str) -> Optional[dict]:
+        """
+        Get a single stored event by its `event.id`.
+
+        **Returns**: The event as a `dict`, or `None` if it isn't stored.
+        """
+        row = self._conn.execute(
+            "SELECT segments.name, segments.partition, events.offset FROM events "
+            "JOIN segments ON segments.name = events.segment WHERE events.id = ?",
+            (event_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        name, partition, offset = row
+        with SegmentReader(self.path / partition / name) as reader:
+            return self._codec.loads(reader.line_at(offset))
+
+    def __contains__(self, event_id: str) -> bool:
+        return (
+            self._conn.execute(
+                "SELECT 1 FROM events WHERE id = ?", (event_id,)
+            ).fetchone()
+            is not None
+        )
+
+
+class _Writer:
+    """Buffers events by partition, and writes each buffer to a new segment when it's full or flushed."""
+
+    def __init__(self, store: EventStore):
+        self.store = store
+        self.written = 0
+        # partition -> {event ID or a placeholder for events without one: (timestamp, event)}
+        self._buffers: Dict[str, dict] = {}
+
+    def add(self, event):
+        if isinstance(event, BaseModel):
+            event = event.model_dump(mode="json", by_alias=True)
+        timestamp = event.get("@timestamp")
+        timestamp = as_datetime(timestamp) if timestamp else None
+        if timestamp is None:
+            partition = _UNDATED
+        else:
+            partition = timestamp.astimezone(timezone.utc).strftime(
+                PARTITIONS[self.store.partition]
+            )
+        event_id = (event.get("event") or {}).get("id") or object()
+        buffer = self._buffers.setdefault(partition, {})
+        buffer[event_id] = (timestamp, event)
+        if len(buffer) >= self.store.segment_events:
+            self._write(partition, self._buffers.pop(partition))
+
+    def flush(self):
+        for partition in list(self._buffers):
+            self._write(partition, self._buffers.pop(partition))
+
+    def _write(self, partition, buffer):
+        conn = self.store._conn
+        ids = [i for i in buffer if isinstance(i, str)]
+        for chunk in chunked_iter(ids, 500):
+            stored = conn.execute(
+                f"SELECT id FROM events WHERE id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            for (event_id,) in stored:
+                del buffer[event_id]
+        if not buffer:
+            return
+
+        name = f"{time.time_ns()}-{uuid.uuid4().hex[:8]}.jsonl"
+        if self.store.compression == "gzip":
+            name += ".gz"
+        directory = self.store.path / partition
+        directory.mkdir(exist_ok=True)
+        blooms = {
+            term: BloomFilter.for_capacity(len(buffer))
+            for term in self.store.bloom_terms
+        }
+        getters = {term: values_getter(term) for term in self.store.bloom_terms}
+        index = []
+        timestamps = []
+        # write to a temporary file, so that a segment only appears once it's complete
+        tmp = directory / f".{name}.tmp"
+        with (gzip.open if name.endswith(".gz") else open)(tmp, "wb") as f:
+            offset = 0
+            for event_id, (timestamp, event) in buffer.items():
+                line = self.store._codec.dumps_bytes(event) + b"\n"
+                f.write(line)
+                if isinstance(event_id, str):
+                    index.append((event_id, name, offset))
+                offset += len(line)
+                if timestamp is not None:
+                    timestamps.append(timestamp.timestamp())
+                for term, bloom in blooms.items():
+                    for value in getters[term](event):
+                        bloom.add(match_value(value))
+        os.replace(tmp, directory / name)
+
+        with conn:
+            conn.execute(
+                "INSERT INTO segments VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    name,
+                    partition,
+                    min(timestamps, default=None),
+                    max(timestamps, default=None),
+                    len(buffer),
+                    time.time(),
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO blooms VALUES (?, ?, ?, ?, ?)",
+                [
+                    (name, term, b.bits, b.hashes, bytes(b.data))
+                    for term, b in blooms.items()
+                ],
+            )
+            conn.executemany("INSERT INTO events VALUES (?, ?, ?)", index)
+        self.written += len(buffer)
+
+
+def _compile_pruner(query, now):
+    # mirrors compile_query(), over segment manifests instead of events: each filter's test only returns False when
+    # no event in the segment can match the filter, so the combined test only rules out segments without matches
+    return _combine(
+        query.group_clause, [_prune_group(g, now) for g in query.groups or []]
+    )
+
+
+def _combine(clause, tests):
+    if not tests:
+        return lambda segment: True
+    if str(clause).upper() == "OR":
+        return lambda segment: any(t(segment) for t in tests)
+    return lambda segment: all(t(segment) for t in tests)
+
+
+def _prune_group(group, now):
+    if isinstance(group, FilterGroupV2):
+        return _combine(
+            group.subgroupClause, [_prune_group(g, now) for g in group.subgroups]
+        )
+    return _combine(
+        group.filterClause, [_prune_filter(f, now) for f in group.filters or []]
+    )
+
+
+def _prune_filter(filter_, now):
+    operator = Operator(filter_.operator)
+    term = str(filter_.term)
+    value = filter_.value
+
+    if term == "@timestamp":
+        start = end = None
+        if operator == Operator.ON_OR_AFTER:
+            start = as_datetime(value)
+        elif operator == Operator.ON_OR_BEFORE:
+            end = as_datetime(value)
+        elif operator == Operator.ON:
+            day = as_datetime(value)
+            # a day in any time zone is within a day either side of the UTC day
+            if day is not None:
+                start, end = day - _ONE_DAY, day + 2 * _ONE_DAY
+        elif operator == Operator.WITHIN_THE_LAST:
+            start, end = now - parse_duration(value), now
+        else:
+            return lambda segment: True
+        return lambda segment: _overlaps(segment, start, end)
+
+    if operator in (Operator.IS, Operator.IS_ANY):
+        values = value if isinstance(value, list) else [value]
+        expected = [match_value(v) for v in values]
+
+        def may_contain(segment):
+            bloom = segment.blooms.get(term)
+            return bloom is None or any(v in bloom for v in expected)
+
+        return may_contain
+
+    return lambda segment: True
+
+
+def _overlaps(segment, start, end):
+    if segment.start is None:
+        # undated segments can't be ruled out by time
+        return True
+    if start is not None and segment.end < start:
+        return False
+    if end is not None and segment.start > end:
+        return False
+    return True
+
+
+def _from_epoch(ts):
+    return None if ts is None else datetime.fromtimestamp(ts, tz=timezone.utc)
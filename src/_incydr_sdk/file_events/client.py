@@ -1,16 +1,36 @@
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from itertools import product
+from typing import Callable
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
 
+from isodate import parse_duration
 from pydantic import parse_obj_as
 from requests import HTTPError
 from requests.adapters import HTTPAdapter
 from urllib3 import Retry
 
 from ..exceptions import IncydrException
+from .grouping import GroupingPartition
+from .grouping import search_partitioned
+from .grouping import time_partitions
+from .models.event import FileEventV2
 from .models.response import FileEventsPage
 from .models.response import GroupedFileEventResponse
+from .models.response import PartitionedGroupedFileEventResponse
 from .models.response import SavedSearch
+from .parsing import has_file_events
+from .parsing import next_page_token
+from .parsing import parse_pages
 from _incydr_sdk.queries.file_events import EventQuery
 from _incydr_sdk.queries.file_events import GroupingEventQuery
+from _incydr_sdk.queries.multiplex import plan_batches
+from _incydr_sdk.queries.utils import parse_str_to_dt
 
 
 class InvalidQueryException(IncydrException):
@@ -43,6 +63,9 @@ class FileEventsV2:
         >>> client.file_events.v2.search(query)
     """
 
+    # the maximum number of groups the grouping endpoint returns for a single query
+    max_groups = 10000
+
     def __init__(self, parent):
         self._parent = parent
         self._retry_adapter_mounted = False
@@ -64,18 +87,130 @@ class FileEventsV2:
 
         **Returns**: A [`FileEventsPage`][fileeventspage-model] object.
         """
-        self._mount_retry_adapter()
-
-        try:
-            response = self._parent.session.post("/v2/file-events", json=query.dict())
-        except HTTPError as err:
-            if err.response.status_code == 400:
-                raise InvalidQueryException(query=query, exception=err)
-            raise err
+        response = self._post_search(query)
         page = FileEventsPage.parse_response(response)
         query.page_token = page.next_pg_token
         return page
 
+    def iter_all(
+        self,
+        query: EventQuery,
+        parse_workers: int = None,
+        transform: Callable[[FileEventV2], object] = None,
+        record_format: str = "model",
+    ) -> Iterator:
+        """
+        Iterate over every file event matching a query, fetching each page of results in turn.
+
+        Validating large pages into models is CPU-bound. Pass `parse_workers` to validate pages in that many worker
+        processes instead: pages are then fetched ahead of the events being consumed and handed to the workers as raw
+        bytes, and events are still returned in order.
+
+        Sending models back from the workers costs about as much as validating them, so for throughput that scales
+        with the number of workers, also pass a `transform` to reduce each event to just what you need in the workers.
+        It must be picklable, such as a module-level function or an `operator.attrgetter()`.
+
+        Usage example:
+
+            >>> from operator import methodcaller
+            >>> query = EventQuery("P1D")
+            >>> query.page_size = 10000
+            >>> lines = client.file_events.v2.iter_all(query, parse_workers=8, transform=methodcaller("json"))
+            >>> for line in lines:
+            ...     print(line)
+
+        **Parameters**:
+
+        * **query**: `EventQuery` (required) - The query object to filter file events by different fields. Iteration
+            starts from its `page_token`, and the query itself isn't modified.
+        * **parse_workers**: `int` - The number of processes to validate pages in. Defaults to validating pages in
+            the current process.
+        * **transform**: `Callable[[FileEventV2], Any]` - A function to apply to each event, whose results are yielded
+            instead of the events.
+        * **record_format**: `str` - The format to return events in: `"model"` (default) to validate them into models,
+            `"dict"` for the `dict`s returned by the API, or `"compact"` for memory-lean records with the fields of the
+            model, without validation. See [Record Formats][record-formats]. Pages aren't validated in other formats,
+            so `parse_workers` only applies to `"model"`.
+
+        **Returns**: A generator yielding individual [`FileEvent`][fileevent-model] objects, records in the given
+        `record_format`, or the results of `transform`.
+        """
+        query = query.model_copy(deep=True)
+        if not parse_workers or record_format != "model":
+            while query.page_token is not None:
+                page = FileEventsPage.parse_response(
+                    self._post_search(query),
+                    record_format=record_format,
+                    records="file_events",
+                )
+                query.page_token = page.next_pg_token
+                if not page.file_events:
+                    break
+                if transform is None:
+                    yield from page.file_events
+                else:
+                    yield from map(transform, page.file_events)
+            return
+
+        def raw_pages():
+            while query.page_token is not None:
+                content = self._post_search(query).content
+                query.page_token = next_page_token(content, self._parent.json_codec)
+                if not has_file_events(content, self._parent.json_codec):
+                    break
+                yield content
+
+        pages = parse_pages(raw_pages(), max_workers=parse_workers, transform=transform)
+        for events in pages:
+            yield from events
+
+    def search_many(
+        self, queries: Sequence[EventQuery], term: str, batch_size: int = 100
+    ) -> List[List[FileEventV2]]:
+        """
+        Run many queries that differ only in the value(s) they match for one term, using as few searches as possible.
+
+        Queries which are identical apart from a single `.equals(term, ...)` or `.is_any(term, ...)` filter are merged
+        into searches with an `is_any(term, [...])` filter of up to `batch_size` values. The events each search returns
+        are then matched against the values locally, and returned with the queries they belong to. Queries that can't be
+        merged are run on their own.
+
+        Every page of results is fetched for each query, so this is equivalent to calling `.search()` with each query
+        until its results are exhausted, but with far fewer requests.
+
+        Usage example:
+
+            >>> queries = [EventQuery("P1D").equals("user.email", email) for email in emails]
+            >>> for email, events in zip(emails, client.file_events.v2.search_many(queries, "user.email")):
+            ...     print(email, len(events))
+
+        **Parameters**:
+
+        * **queries**: `Sequence[EventQuery]` (required) - The queries to run.
+        * **term**: `str` (required) - The term the queries differ by. Example: `user.email`.
+        * **batch_size**: `int` - The maximum number of values to merge into one search. Defaults to 100.
+
+        **Returns**: A list with a list of [`FileEvent`][fileevent-model] objects for each query, in the order of
+        `queries`.
+        """
+        results = [[] for _ in queries]
+        seen = [set() for _ in queries]
+        for batch in plan_batches(queries, term, batch_size=batch_size):
+            query = batch.query
+            query.page_size = 10000
+            while query.page_token is not None:
+                page = self.search(query)
+                for event in page.file_events:
+                    event_dict = event.dict()
+                    for index in batch.route(event_dict):
+                        # an event can match several values of a multi-valued term
+                        if event.event.id not in seen[index]:
+                            seen[index].add(event.event.id)
+                            results[index].append(event)
+                if not page.file_events:
+                    break
+        return results
+
     def search_groups(self, query: GroupingEventQuery) -> GroupedFileEventResponse:
         """
         Search for file event counts by a grouping term.
@@ -98,6 +233,71 @@ class FileEventsV2:
         response = GroupedFileEventResponse.parse_response(response)
         return response
 
+    def search_groups_partitioned(
+        self,
+        query: GroupingEventQuery,
+        start_date: Union[datetime, timedelta, str, int, float] = None,
+        end_date: Union[datetime, str, int, float] = None,
+        windows: int = 1,
+        partition_term: str = None,
+        partition_values: Sequence[Sequence[str]] = None,
+        top_k: int = None,
+        max_workers: int = 4,
+    ) -> PartitionedGroupedFileEventResponse:
+        """
+        Search for file event counts by a grouping term, without the limit of 10,000 groups of `.search_groups()`.
+
+        The query is split into partitions, by time window and/or by sets of values of another term, which are
+        searched concurrently. Any partition that returns the maximum number of groups is split in half (by time, or by
+        its set of values) and searched again, so that no groups are lost. The counts of each group are then summed
+        across partitions.
+
+        Partitions must not overlap for the merged counts to be accurate, so the sets of `partition_values` should be
+        disjoint, and `partition_term` should have a single value per event.
+
+        **Parameters**:
+
+        * **query**: `GroupingEventQuery` (required) - The query object to group file events by a given field.
+        * **start_date**: `datetime`, `timedelta`, `str`, `int`, `float` - Start of the time range to partition. Accepts
+            the same values as `EventQuery`, including ISO durations such as `P30D`. Required to partition by time.
+        * **end_date**: `datetime`, `str`, `int`, `float` - End of the time range to partition. Defaults to now.
+        * **windows**: `int` - The number of time windows to divide the range from `start_date` to `end_date` into.
+            Defaults to 1.
+        * **partition_term**: `str` - A term to partition the query by, such as `file.category`.
+        * **partition_values**: `Sequence[Sequence[str]]` - The sets of values of `partition_term` to search
+            separately, for example `[["Document", "Spreadsheet"], ["Image"]]`.
+        * **top_k**: `int` - Only return the `top_k` groups with the highest counts. Defaults to returning all groups.
+        * **max_workers**: `int` - The maximum number of partitions to search at once. Defaults to 4.
+
+        **Returns**: A [`PartitionedGroupedFileEventResponse`][partitionedgroupedfileeventresponse-model] object.
+        """
+        if partition_values and not partition_term:
+            raise ValueError("partition_values requires a partition_term.")
+        if start_date is not None:
+            start = _resolve_date(start_date)
+            end = _resolve_date(end_date) if end_date else datetime.now(timezone.utc)
+            time_slices = time_partitions(start, end, windows)
+        elif windows > 1:
+            raise ValueError("Partitioning by time window requires a start_date.")
+        else:
+            time_slices = [GroupingPartition()]
+        value_sets = [list(v) for v in partition_values] if partition_values else [None]
+        partitions = [
+            GroupingPartition(
+                start=t.start, end=t.end, term=partition_term, values=values
+            )
+            for t, values in product(time_slices, value_sets)
+        ]
+        self._mount_retry_adapter()
+        return search_partitioned(
+            self.search_groups,
+            query,
+            partitions,
+            max_groups=self.max_groups,
+            max_workers=max_workers,
+            top_k=top_k,
+        )
+
     def list_saved_searches(self) -> List[SavedSearch]:
         """
         Get all saved searches.
@@ -126,6 +326,15 @@ class FileEventsV2:
         page = parse_obj_as(List[SavedSearch], response.json()["searches"])
         return page[0]
 
+    def _post_search(self, query):
+        self._mount_retry_adapter()
+        try:
+            return self._parent.session.post("/v2/file-events", json=query.dict())
+        except HTTPError as err:
+            if err.response.status_code == 400:
+                raise InvalidQueryException(query=query, exception=err)
+            raise err
+
     def _mount_retry_adapter(self):
         """Sets custom Retry strategy for FFS url requests to gracefully handle being rate-limited on FFS queries."""
         if not self._retry_adapter_mounted:
@@ -149,6 +358,18 @@ class FileEventsV2:
             self._retry_adapter_mounted = True
 
 
+def _resolve_date(value) -> Optional[datetime]:
+    if isinstance(value, timedelta):
+        return datetime.now(timezone.utc) - value
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    if value.startswith("P"):
+        return datetime.now(timezone.utc) - parse_duration(value)
+    return parse_str_to_dt(value)
+
+
 class FileEventsClient:
     def __init__(self, parent):
         self._parent = parent
@@ -0,0 +1,173 @@
+"""
+Runs a grouped file event search as several smaller searches over partitions of the query, so that results aren't
+truncated at the maximum number of groups a single search returns, and merges their counts.
+"""
+import heapq
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import List
+from typing import Optional
+
+from _incydr_sdk.file_events.models.response import FileEventGroup
+from _incydr_sdk.file_events.models.response import FileEventGroupPartition
+from _incydr_sdk.file_events.models.response import (
+    PartitionedGroupedFileEventResponse,
+)
+from _incydr_sdk.queries.file_events import GroupingEventQuery
+
+# windows aren't split any smaller than this when a partition returns too many groups
+MIN_WINDOW = timedelta(minutes=1)
+
+
+class GroupingPartition:
+    """
+    A slice of a grouped search: an optional time window, and an optional set of values of another term. Partitions
+    can be split in two, by halving the window or the set of values, when their search returns too many groups.
+    """
+
+    def __init__(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        term: Optional[str] = None,
+        values: Optional[List[str]] = None,
+        min_window: timedelta = MIN_WINDOW,
+    ):
+        self.start = start
+        self.end = end
+        self.term = term
+        self.values = values
+        self.min_window = min_window
+
+    def apply(self, query: GroupingEventQuery) -> GroupingEventQuery:
+        """Returns a copy of `query` restricted to this partition."""
+        query = query.model_copy(deep=True)
+        if self.start is not None:
+            query.date_range("@timestamp", start_date=self.start, end_date=self.end)
+        if self.values:
+            query.is_any(self.term, self.values)
+        return query
+
+    def split(self) -> Optional[List["GroupingPartition"]]:
+        """Splits the partition in two, or returns `None` if it can't be split any further."""
+        if self.values and len(self.values) > 1:
+            middle = len(self.values) // 2
+            return [
+                self._copy(values=self.values[:middle]),
+                self._copy(values=self.values[middle:]),
+            ]
+        if self.start is not None and self.end - self.start >= 2 * self.min_window:
+            middle = _floor_ms(self.start + (self.end - self.start) / 2)
+            return [
+                self._copy(end=middle - timedelta(milliseconds=1)),
+                self._copy(start=middle),
+            ]
+        return None
+
+    def _copy(self, **kwargs):
+        attrs = dict(
+            start=self.start,
+            end=self.end,
+            term=self.term,
+            values=self.values,
+            min_window=self.min_window,
+        )
+        attrs.update(kwargs)
+        return GroupingPartition(**attrs)
+
+
+def time_partitions(
+    start: datetime,
+    end: datetime,
+    windows: int,
+    min_window: timedelta = MIN_WINDOW,
+) -> List[GroupingPartition]:
+    """
+    Divides the time from `start` to `end` into `windows` consecutive partitions that don't overlap. The date filters
+    are inclusive and have millisecond precision, so each window ends a millisecond before the next one starts.
+    """
+    if windows < 1:
+        raise ValueError("windows must be at least 1.")
+    start, end = _floor_ms(start), _floor_ms(end)
+    step = (end - start) / windows
+    bounds = [start] + [_floor_ms(start + step * i) for i in range(1, windows)]
+    ends = [b - timedelta(milliseconds=1) for b in bounds[1:]] + [end]
+    return [
+        GroupingPartition(start=s, end=e, min_window=min_window)
+        for s, e in zip(bounds, ends)
+    ]
+
+
+def search_partitioned(
+    search_groups,
+    query: GroupingEventQuery,
+    partitions: List[GroupingPartition],
+    max_groups: int,
+    max_workers: int = 4,
+    top_k: Optional[int] = None,
+) -> PartitionedGroupedFileEventResponse:
+    """
+    Runs `search_groups` for each partition of `query` concurrently, splitting any partition whose search returns
+    `max_groups` groups (and so may have been truncated), and merges the group counts of all partitions.
+    """
+    query = query.model_copy(deep=True)
+    query.size = max_groups
+    counts = {}
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def submit(partition):
+            return executor.submit(search_groups, partition.apply(query)), partition
+
+        pending = dict(submit(p) for p in partitions)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                partition = pending.pop(future)
+                groups = future.result().groups or []
+                if len(groups) >= max_groups:
+                    halves = partition.split()
+                    if halves:
+                        pending.update(submit(p) for p in halves)
+                        continue
+                for group in groups:
+                    counts[group.value] = counts.get(group.value, 0) + (
+                        group.doc_count or 0
+                    )
+                results.append(
+                    FileEventGroupPartition(
+                        start_date=partition.start,
+                        end_date=partition.end,
+                        values=partition.values,
+                        group_count=len(groups),
+                        doc_count=sum(g.doc_count or 0 for g in groups),
+                        truncated=len(groups) >= max_groups,
+                    )
+                )
+
+    if top_k is None:
+        merged = sorted(counts.items(), key=_group_order)
+    else:
+        merged = heapq.nsmallest(top_k, counts.items(), key=_group_order)
+    results.sort(
+        key=lambda p: (p.start_date or datetime.min.replace(tzinfo=timezone.utc))
+    )
+    return PartitionedGroupedFileEventResponse(
+        groups=[FileEventGroup(value=v, docCount=c) for v, c in merged],
+        totalGroups=len(counts),
+        partitions=results,
+    )
+
+
+def _group_order(item):
+    # highest counts first, and ties in value order, regardless of which partitions finished first
+    value, count = item
+    return -count, str(value)
+
+
+def _floor_ms(dt):
+    return dt.replace(microsecond=dt.microsecond // 1000 * 1000)
@@ -255,3 +255,41 @@ class GroupedFileEventResponse(ResponseModel):
         None,
         description="List of problems in the request.  A problem with a search request could be an invalid filter value, an operator that can't be used on a term, etc.",
     )
+
+
+class FileEventGroupPartition(ResponseModel):
+    """A model representing one partition of a partitioned grouped search.
+
+    **Fields:**
+
+    * **start_date**: `datetime` - The start of the partition's time window, if partitioned by time.
+    * **end_date**: `datetime` - The end of the partition's time window, if partitioned by time.
+    * **values**: `List[str]` - The values of the partition term matched by the partition, if partitioned by value.
+    * **group_count**: `int` - The number of groups returned for the partition.
+    * **doc_count**: `int` - The total of the counts of the groups returned for the partition.
+    * **truncated**: `bool` - Whether the partition returned the maximum number of groups and couldn't be split any
+        further, meaning some of its groups may be missing.
+    """
+
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+    values: Optional[List[str]] = None
+    group_count: int = Field(0, alias="groupCount")
+    doc_count: int = Field(0, alias="docCount")
+    truncated: bool = False
+
+
+class PartitionedGroupedFileEventResponse(ResponseModel):
+    """A model representing the merged result of a grouped search run in partitions.
+
+    **Fields:**
+
+    * **groups**: `List[FileEventGroup]` - File event counts by grouping term, summed across partitions and sorted by
+        descending count.
+    * **total_groups**: `int` - The number of distinct groups found across all partitions, before any `top_k` limit.
+    * **partitions**: `List[FileEventGroupPartition]` - The partitions that were searched.
+    """
+
+    groups: List[FileEventGroup] = Field(default_factory=list)
+    total_groups: int = Field(0, alias="totalGroups")
+    partitions: List[FileEventGroupPartition] = Field(default_factory=list)
@@ -0,0 +1,85 @@
+"""
+Validates pages of file events in worker processes, so that parsing large pages into models isn't limited to the
+single core the GIL allows, while pages are still fetched one after another and events are returned in order.
+
+Unpickling models costs about as much as validating them, so pages are parsed fastest when a `transform` reduces each
+event to what the caller needs (a row, a JSON line, an ID) in the worker, and only its results are sent back.
+"""
+import json
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+
+from _incydr_sdk.file_events.models.event import FileEventV2
+from _incydr_sdk.file_events.models.response import FileEventsPage
+
+# a "nextPgToken" key which isn't preceded by a backslash can't be inside a JSON string
+_NEXT_PG_TOKEN = re.compile(rb'(?<!\\)"nextPgToken"\s*:\s*(null|"(?:[^"\\]|\\.)*")')
+# the first character in the "fileEvents" list, or null
+_FILE_EVENTS = re.compile(rb'(?<!\\)"fileEvents"\s*:\s*(null|\[\s*.)')
+
+
+def next_page_token(content: bytes, codec) -> Optional[str]:
+    """
+    Returns the `nextPgToken` of a raw file events page without decoding the events, falling back to decoding the
+    whole page with `codec` if the key doesn't appear exactly once.
+    """
+    matches = _NEXT_PG_TOKEN.findall(content)
+    if len(matches) == 1:
+        return json.loads(matches[0])
+    return codec.loads(content).get("nextPgToken")
+
+
+def has_file_events(content: bytes, codec) -> bool:
+    """
+    Returns whether a raw file events page contains any events without decoding them, falling back to decoding the
+    whole page with `codec` if the key doesn't appear exactly once.
+    """
+    matches = _FILE_EVENTS.findall(content)
+    if len(matches) == 1:
+        return matches[0] != b"null" and not matches[0].endswith(b"]")
+    return bool(codec.loads(content).get("fileEvents"))
+
+
+def parse_page(
+    content: bytes, transform: Optional[Callable[[FileEventV2], object]] = None
+) -> list:
+    """Validates a raw file events page and returns its events, or the result of `transform` for each event."""
+    events = FileEventsPage.model_validate_json(content).file_events or []
+    if transform is None:
+        return events
+    return [transform(event) for event in events]
+
+
+def parse_pages(
+    pages: Iterable[bytes],
+    max_workers: int,
+    transform: Optional[Callable[[FileEventV2], object]] = None,
+    max_pending: Optional[int] = None,
+) -> Iterator[list]:
+    """
+    Validates raw file events pages in a pool of `max_workers` processes, and yields the events of each page (or the
+    results of `transform`, which must be picklable) in the order of `pages`.
+
+    `pages` is consumed ahead of the pages yielded, keeping up to `max_pending` pages (default `2 * max_workers`)
+    submitted at once, so that every worker has a page to parse while the next is fetched.
+    """
+    max_pending = max_pending or 2 * max_workers
+    parse = partial(parse_page, transform=transform)
+    pending = deque()
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        for content in pages:
+            pending.append(executor.submit(parse, content))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # don't parse pages which won't be used if the caller stops iterating early
+        executor.shutdown(cancel_futures=True)
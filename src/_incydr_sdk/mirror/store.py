@@ -0,0 +1,297 @@
+"""
+A local copy of directory entities (actors, users, agents and devices) stored in SQLite, so that inventories can be
+queried without paging through the API each time.
+"""
+import math
+import sqlite3
+import time
+import warnings
+from datetime import datetime
+from datetime import timezone
+from itertools import chain
+from itertools import count
+from pathlib import Path
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Union
+
+from boltons.iterutils import chunked_iter
+
+from _incydr_sdk.actors.models import Actor
+from _incydr_sdk.agents.models import Agent
+from _incydr_sdk.devices.models import Device
+from _incydr_sdk.enums import SortDirection
+from _incydr_sdk.enums.devices import SortKeys as DeviceSortKeys
+from _incydr_sdk.users.models import User
+
+ENTITIES = ("actors", "users", "agents", "devices")
+
+_MODELS = {"actors": Actor, "users": User, "agents": Agent, "devices": Device}
+
+
+def _actor_columns(actor):
+    return actor.actor_id, actor.name, _email(actor.name), None
+
+
+def _user_columns(user):
+    return user.user_id, user.username, _email(user.username), user.user_id
+
+
+def _agent_columns(agent):
+    return agent.agent_id, agent.name, None, agent.user_id
+
+
+def _device_columns(device):
+    return device.device_id, device.name, None, device.user_id
+
+
+_COLUMNS = {
+    "actors": _actor_columns,
+    "users": _user_columns,
+    "agents": _agent_columns,
+    "devices": _device_columns,
+}
+
+
+class LocalMirror:
+    """
+    A local SQLite mirror of the tenant's actors, users, agents and devices.
+
+    `sync()` copies entities from the API into the database at `path` (defaults to an in-memory database), and lookups
+    such as `get()` and `find()` are then answered from the local copy. Each entity type is stored in its own table,
+    indexed by ID, name and email.
+
+    Agents and devices are refreshed incrementally where the API allows filtering by recent activity, fetching only the
+    records changed since the last sync. Other entity types, and any type whose last full sync is older than
+    `full_sync_interval` seconds (default 24 hours), are fetched in full, and records no longer returned by the API are
+    removed.
+
+    Usage example:
+
+        >>> import incydr
+        >>> client = incydr.Client(**kwargs)
+        >>> mirror = incydr.LocalMirror(client, "incydr.db")
+        >>> mirror.sync()
+        {'actors': 1520, 'users': 1498, 'agents': 2876, 'devices': 2876}
+        >>> mirror.find("actors", name="foo@bar.com")
+    """
+
+    full_sync_interval = 24 * 60 * 60
+
+    def __init__(self, client, path: Union[str, Path] = ":memory:"):
+        self._client = client
+        self._conn = sqlite3.connect(str(path))
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state "
+                "(entity TEXT PRIMARY KEY, last_full_sync REAL, last_sync REAL)"
+            )
+            for entity in ENTITIES:
+                self._conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {entity} (id TEXT PRIMARY KEY, "
+                    "name TEXT COLLATE NOCASE, email TEXT COLLATE NOCASE, user_id TEXT, "
+                    "data TEXT NOT NULL, synced_at REAL NOT NULL)"
+                )
+                for column in ("name", "email", "user_id"):
+                    self._conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS {entity}_{column} ON {entity} ({column})"
+                    )
+
+    def close(self):
+        """Close the connection to the database."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def sync(
+        self, entities: Iterable[str] = ENTITIES, full: bool = False
+    ) -> Dict[str, int]:
+        """
+        Copy entities from the API into the mirror.
+
+        **Parameters**:
+
+        * **entities**: `Iterable[str]` - The entity types to sync: any of `"actors"`, `"users"`, `"agents"` and
+            `"devices"`. Defaults to all of them.
+        * **full**: `bool` - Fetch every record, even for entity types that could be refreshed incrementally. Defaults
+            to False.
+
+        **Returns**: A `dict` of the number of records written for each entity type.
+        """
+        written = {}
+        for entity in entities:
+            _check_entity(entity)
+            state = self._sync_state(entity)
+            started = time.time()
+            incremental = (
+                not full
+                and entity in ("agents", "devices")
+                and state is not None
+                and started - state[0] < self.full_sync_interval
+            )
+            with warnings.catch_warnings():
+                # the devices endpoints are deprecated, but still part of the inventory
+                warnings.simplefilter("ignore", DeprecationWarning)
+                if incremental:
+                    records = self._iter_changed(entity, since=state[1])
+                else:
+                    records = self._iter_all_from_api(entity)
+                with self._conn:
+                    written[entity] = self._write(entity, records, started)
+                    if incremental:
+                        self._conn.execute(
+                            "UPDATE sync_state SET last_sync = ? WHERE entity = ?",
+                            (started, entity),
+                        )
+                    else:
+                        # anything not returned by a full sync no longer exists
+                        self._conn.execute(
+                            f"DELETE FROM {entity} WHERE synced_at < ?", (started,)
+                        )
+                        self._conn.execute(
+                            "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)",
+                            (entity, started, started),
+                        )
+        return written
+
+    def last_synced(self, entity: str) -> Optional[datetime]:
+        """
+        Get the time an entity type was last synced.
+
+        **Returns**: A `datetime`, or `None` if the entity type has never been synced.
+        """
+        _check_entity(entity)
+        state = self._sync_state(entity)
+        if state is None:
+            return None
+        return datetime.fromtimestamp(state[1], tz=timezone.utc)
+
+    def get(self, entity: str, id_: str) -> Optional[Union[Actor, User, Agent, Device]]:
+        """
+        Get a single entity from the mirror by its ID.
+
+        **Parameters**:
+
+        * **entity**: `str` (required) - The entity type: `"actors"`, `"users"`, `"agents"` or `"devices"`.
+        * **id_**: `str` (required) - The actor, user, agent or device ID.
+
+        **Returns**: An `Actor`, `User`, `Agent` or `Device` object, or `None` if the ID isn't in the mirror.
+        """
+        _check_entity(entity)
+        row = self._conn.execute(
+            f"SELECT data FROM {entity} WHERE id = ?", (id_,)
+        ).fetchone()
+        return _MODELS[entity].parse_raw(row[0]) if row else None
+
+    def find(
+        self,
+        entity: str,
+        name: str = None,
+        email: str = None,
+        user_id: str = None,
+    ) -> List[Union[Actor, User, Agent, Device]]:
+        """
+        Find entities in the mirror. Names and emails are matched case-insensitively.
+
+        **Parameters**:
+
+        * **entity**: `str` (required) - The entity type: `"actors"`, `"users"`, `"agents"` or `"devices"`.
+        * **name**: `str` - Matches the actor name, username, or agent or device name.
+        * **email**: `str` - Matches actor names and usernames that are email addresses.
+        * **user_id**: `str` - Matches the user ID of users, or of the user an agent or device belongs to.
+
+        **Returns**: A list of `Actor`, `User`, `Agent` or `Device` objects.
+        """
+        _check_entity(entity)
+        filters = {"name": name, "email": email, "user_id": user_id}
+        filters = {k: v for k, v in filters.items() if v is not None}
+        where = " AND ".join(f"{column} = ?" for column in filters) or "1"
+        rows = self._conn.execute(
+            f"SELECT data FROM {entity} WHERE {where} ORDER BY name",
+            tuple(filters.values()),
+        )
+        return [_MODELS[entity].parse_raw(row[0]) for row in rows]
+
+    def iter_all(self, entity: str) -> Iterator[Union[Actor, User, Agent, Device]]:
+        """
+        Iterate over all entities of a type in the mirror, ordered by name.
+
+        **Returns**: A generator yielding `Actor`, `User`, `Agent` or `Device` objects.
+        """
+        _check_entity(entity)
+        rows = self._conn.execute(f"SELECT data FROM {entity} ORDER BY name")
+        for row in rows:
+            yield _MODELS[entity].parse_raw(row[0])
+
+    def _sync_state(self, entity):
+        return self._conn.execute(
+            "SELECT last_full_sync, last_sync FROM sync_state WHERE entity = ?",
+            (entity,),
+        ).fetchone()
+
+    def _write(self, entity, records, synced_at):
+        columns = _COLUMNS[entity]
+        written = 0
+        for batch in chunked_iter(records, 1000):
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {entity} VALUES (?, ?, ?, ?, ?, ?)",
+                [(*columns(r), r.json(), synced_at) for r in batch],
+            )
+            written += len(batch)
+        return written
+
+    def _iter_all_from_api(self, entity):
+        if entity == "actors":
+            return self._client.actors.v1.iter_all()
+        if entity == "users":
+            return self._client.users.v1.iter_all()
+        if entity == "agents":
+            return self._client.agents.v1.iter_all()
+        return self._client.devices.v1.iter_all()
+
+    def _iter_changed(self, entity, since):
+        if entity == "agents":
+            days = max(1, math.ceil((time.time() - since) / (24 * 60 * 60)))
+            return chain(
+                self._client.agents.v1.iter_all(connected_in_last_days=days),
+                self._client.agents.v1.iter_all(
+                    agent_health_modified_in_last_days=days
+                ),
+            )
+        return self._iter_devices_connected_since(since)
+
+    def _iter_devices_connected_since(self, since):
+        page_size = self._client.settings.page_size
+        for page_num in count(1):
+            page = self._client.devices.v1.get_page(
+                page_num=page_num,
+                page_size=page_size,
+                sort_key=DeviceSortKeys.LAST_CONNECTED,
+                sort_dir=SortDirection.DESC,
+            )
+            for device in page.devices:
+                if device.last_connected is None:
+                    return
+                if device.last_connected.timestamp() < since:
+                    return
+                yield device
+            if len(page.devices) < page_size:
+                return
+
+
+def _check_entity(entity):
+    if entity not in ENTITIES:
+        raise ValueError(
+            f"Unknown entity type '{entity}'. Expected one of: {', '.join(ENTITIES)}."
+        )
+
+
+def _email(name):
+    return name if name and "@" in name else None
@@ -0,0 +1,276 @@
+"""
+Evaluates file event queries against events stored locally, such as the output of `incydr file-events search
+--format json-lines`, so that a downloaded dataset can be re-filtered without another Forensic Search request.
+"""
+import json
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Union
+
+from dateutil import parser
+from isodate import parse_duration
+
+from _incydr_sdk.enums.file_events import Operator
+from _incydr_sdk.exceptions import IncydrException
+from _incydr_sdk.queries.file_events import BaseEventQuery
+from _incydr_sdk.queries.file_events import FilterGroupV2
+
+
+def compile_query(
+    query: BaseEventQuery, now: datetime = None
+) -> Callable[[dict], bool]:
+    """
+    Compile a query into a predicate which tests whether a single file event matches it.
+
+    Events are `dict`s in the shape returned by the file events API (for example `{"event": {"id": ...}, ...}`), and
+    keys of already flattened events (`{"event.id": ...}`) are also recognized. Terms that address fields in a list,
+    such as `risk.indicators.name`, match when any item in the list matches.
+
+    **Parameters**:
+
+    * **query**: `EventQuery | GroupingEventQuery` (required) - The query to compile. All filter operators and nested
+        subgroups are supported.
+    * **now**: `datetime` - The time `WITHIN_THE_LAST` filters are relative to. Defaults to the current time.
+
+    **Returns**: A function which takes an event `dict` and returns `True` if the event matches the query.
+    """
+    now = now or datetime.now(timezone.utc)
+    return _compile_clause(
+        query.group_clause, [_compile_group(g, now) for g in query.groups or []]
+    )
+
+
+def filter_events(
+    query: BaseEventQuery, events: Iterable[dict], now: datetime = None
+) -> Iterator[dict]:
+    """
+    Filter events stored locally with a file event query.
+
+    Usage example:
+
+        >>> from incydr import EventQuery
+        >>> from _incydr_sdk.queries.local import filter_events, read_events
+        >>> query = EventQuery("P7D").equals("destination.category", "Cloud Storage")
+        >>> for event in filter_events(query, read_events("events.jsonl")):
+        ...     print(event["event"]["id"])
+
+    **Parameters**:
+
+    * **query**: `EventQuery | GroupingEventQuery` (required) - The query to filter with. See `compile_query()`.
+    * **events**: `Iterable[dict]` (required) - The events to filter, for example from `read_events()`.
+    * **now**: `datetime` - The time `WITHIN_THE_LAST` filters are relative to. Defaults to the current time.
+
+    **Returns**: A generator yielding the events which match the query, in their original order.
+    """
+    return filter(compile_query(query, now=now), events)
+
+
+def read_events(path: Union[str, Path], batch_size: int = 10000) -> Iterator[dict]:
+    """
+    Read file events from a local file, one at a time.
+
+    Files ending in `.parquet` are read in batches of `batch_size` rows and require the `pyarrow` package. Any other
+    file is read as JSON lines (one event per line), or as a single JSON array of events if it starts with `[`.
+
+    **Returns**: A generator yielding each event as a `dict`.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".parquet":
+        return _read_parquet(path, batch_size)
+    return _read_json(path)
+
+
+def values_getter(term: str) -> Callable[[dict], list]:
+    """
+    Returns a function which reads the values of a term from a file event, the way filters on that term match them.
+    Terms are looked up as a key of a flattened event first, and then as a path through nested `dict`s, collecting
+    the values of every item of any list on the way. `None` values are left out.
+    """
+    path = term.split(".")
+
+    def get_values(event):
+        if term in event:
+            values = [event[term]]
+        else:
+            values = [event]
+            for key in path:
+                values = [
+                    item.get(key)
+                    for value in values
+                    for item in (value if isinstance(value, list) else [value])
+                    if isinstance(item, dict)
+                ]
+                if not values:
+                    break
+        flat = []
+        for value in values:
+            if isinstance(value, list):
+                flat.extend(v for v in value if v is not None)
+            elif value is not None:
+                flat.append(value)
+        return flat
+
+    return get_values
+
+
+def as_datetime(value) -> Optional[datetime]:
+    """
+    Converts a timestamp value from a file event or filter (a `datetime`, epoch seconds, or a date string) to a
+    timezone-aware `datetime`, treating naive timestamps as UTC. Returns `None` if the value isn't a timestamp.
+    """
+    if isinstance(value, datetime):
+        dt = value
+    elif isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    else:
+        value = str(value)
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            try:
+                dt = parser.parse(value)
+            except (ValueError, OverflowError):
+                return None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def match_value(value) -> str:
+    """
+    Converts a value from a file event or an `IS` filter to the string that `IS`, `IS_NOT`, `IS_ANY` and `IS_NONE`
+    filters compare, so that events match the way Forensic Search matches them: case-insensitively, and with booleans
+    as `"true"` or `"false"`.
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value).casefold()
+
+
+def _read_json(path):
+    with open(path, encoding="utf-8") as f:
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        f.seek(0)
+        if first == "[":
+            yield from json.load(f)
+            return
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _read_parquet(path, batch_size):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise IncydrException("Reading Parquet files requires the `pyarrow` package.")
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+        yield from batch.to_pylist()
+
+
+def _compile_clause(clause, predicates):
+    if not predicates:
+        return lambda event: True
+    if len(predicates) == 1:
+        return predicates[0]
+    if str(clause).upper() == "OR":
+        return lambda event: any(p(event) for p in predicates)
+    return lambda event: all(p(event) for p in predicates)
+
+
+def _compile_group(group, now):
+    if isinstance(group, FilterGroupV2):
+        return _compile_clause(
+            group.subgroupClause, [_compile_group(g, now) for g in group.subgroups]
+        )
+    return _compile_clause(
+        group.filterClause, [_compile_filter(f, now) for f in group.filters or []]
+    )
+
+
+def _compile_filter(filter_, now):
+    operator = Operator(filter_.operator)
+    get_values = values_getter(str(filter_.term))
+    value = filter_.value
+
+    if operator == Operator.EXISTS:
+        return lambda event: bool(get_values(event))
+    if operator == Operator.DOES_NOT_EXIST:
+        return lambda event: not get_values(event)
+
+    if operator in (Operator.IS, Operator.IS_NOT, Operator.IS_ANY, Operator.IS_NONE):
+        expected = value if isinstance(value, list) else [value]
+        expected = frozenset(match_value(v) for v in expected)
+
+        def matches(event):
+            return any(match_value(v) in expected for v in get_values(event))
+
+        if operator in (Operator.IS_NOT, Operator.IS_NONE):
+            return lambda event: not matches(event)
+        return matches
+
+    if operator in (Operator.GREATER_THAN, Operator.LESS_THAN):
+        threshold = float(value)
+        greater = operator == Operator.GREATER_THAN
+
+        def compare(event):
+            for v in get_values(event):
+                number = _as_number(v)
+                if number is None:
+                    continue
+                if number > threshold if greater else number < threshold:
+                    return True
+            return False
+
+        return compare
+
+    if operator == Operator.ON:
+        day = _date_value(filter_).date()
+        return _any_timestamp(get_values, lambda ts: ts.date() == day)
+    if operator == Operator.ON_OR_AFTER:
+        start = _date_value(filter_)
+        return _any_timestamp(get_values, lambda ts: ts >= start)
+    if operator == Operator.ON_OR_BEFORE:
+        end = _date_value(filter_)
+        return _any_timestamp(get_values, lambda ts: ts <= end)
+    # WITHIN_THE_LAST
+    start = now - parse_duration(value)
+    return _any_timestamp(get_values, lambda ts: start <= ts <= now)
+
+
+def _any_timestamp(get_values, test):
+    def predicate(event):
+        for v in get_values(event):
+            ts = as_datetime(v)
+            if ts is not None and test(ts):
+                return True
+        return False
+
+    return predicate
+
+
+def _date_value(filter_):
+    dt = as_datetime(filter_.value)
+    if dt is None:
+        raise ValueError(
+            f"Invalid date value for {filter_.term} {filter_.operator} filter: {filter_.value}"
+        )
+    return dt
+
+
+def _as_number(value):
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
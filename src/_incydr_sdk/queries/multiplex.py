@@ -0,0 +1,136 @@
+"""
+Merges file event queries which differ only in the values of one term into fewer `IS_ANY` queries, and routes the
+events each merged query returns back to the queries it was built from.
+"""
+import json
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from _incydr_sdk.enums.file_events import Operator
+from _incydr_sdk.queries.file_events import EventQuery
+from _incydr_sdk.queries.file_events import Filter
+from _incydr_sdk.queries.file_events import FilterGroup
+from _incydr_sdk.queries.local import match_value
+from _incydr_sdk.queries.local import values_getter
+
+
+class QueryBatch:
+    """
+    A query to send to Forensic Search, and which of the original queries each of its events belongs to.
+
+    `routes` maps each value of `term` in the merged query to the indexes of the original queries filtering on that
+    value. Queries that couldn't be merged are sent as a copy of the original, with `term` set to `None`.
+
+    Values are routed case-insensitively, so that events are still routed if Forensic Search matched them
+    case-insensitively.
+    """
+
+    def __init__(
+        self, query: EventQuery, term: Optional[str], routes: Dict[str, List[int]]
+    ):
+        self.query = query
+        self.term = term
+        self.routes = routes
+        self._get_values = values_getter(term) if term else None
+        self._folded_routes = {}
+        for value, indexes in routes.items():
+            self._folded_routes.setdefault(match_value(value), set()).update(indexes)
+
+    @property
+    def query_indexes(self) -> List[int]:
+        """The indexes of the original queries answered by this batch."""
+        return sorted({i for indexes in self.routes.values() for i in indexes})
+
+    def route(self, event: dict) -> List[int]:
+        """Returns the indexes of the original queries that an event returned by this batch's query matches."""
+        if self._get_values is None:
+            return self.query_indexes
+        indexes = set()
+        for value in self._get_values(event):
+            indexes.update(self._folded_routes.get(match_value(value), ()))
+        return sorted(indexes)
+
+
+def plan_batches(
+    queries: Sequence[EventQuery], term: str, batch_size: int = 100
+) -> List[QueryBatch]:
+    """
+    Group queries that are identical apart from a single filter group matching values of `term` (as created by
+    `.equals(term, ...)` or `.is_any(term, ...)`), and merge each group into queries with an `IS_ANY` filter of up to
+    `batch_size` values. A query is never split across batches, so one matching more than `batch_size` values is
+    planned on its own, as are queries without exactly one such filter group.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+    compatible = {}
+    batches = []
+    for index, query in enumerate(queries):
+        split = _split_query(query, term)
+        if split is None:
+            batches.append(QueryBatch(query.model_copy(deep=True), None, {"": [index]}))
+            continue
+        key, position, values = split
+        compatible.setdefault(key, (query, position, []))[2].append((index, values))
+
+    for query, position, members in compatible.values():
+        routes = {}
+        for index, values in members:
+            new_values = values - set(routes)
+            if routes and len(routes) + len(new_values) > batch_size:
+                batches.append(_merge(query, position, term, routes))
+                routes = {}
+            for value in values:
+                routes.setdefault(value, []).append(index)
+        batches.append(_merge(query, position, term, routes))
+    return batches
+
+
+def _split_query(query, term):
+    """
+    Returns a key identifying everything about `query` except the values it matches for `term`, the position of the
+    filter group matching those values, and the values themselves.
+    """
+    positions = [i for i, g in enumerate(query.groups) if _term_values(g, term)]
+    if len(positions) != 1:
+        return None
+    position = positions[0]
+    data = query.dict()
+    data.pop("pgToken", None)
+    data.pop("pgNum", None)
+    data["groups"][position] = None
+    return (
+        json.dumps(data, sort_keys=True, default=str),
+        position,
+        _term_values(query.groups[position], term),
+    )
+
+
+def _term_values(group, term):
+    """Returns the values of `term` a filter group matches if it only tests `term` for equality, otherwise `None`."""
+    if not isinstance(group, FilterGroup) or not group.filters:
+        return None
+    if len(group.filters) > 1 and group.filterClause.upper() != "OR":
+        return None
+    values = set()
+    for filter_ in group.filters:
+        if filter_.term != term:
+            return None
+        if filter_.operator == Operator.IS_ANY:
+            values.update(str(v) for v in filter_.value)
+        elif filter_.operator == Operator.IS:
+            values.add(str(filter_.value))
+        else:
+            return None
+    return values
+
+
+def _merge(query, position, term, routes):
+    merged = query.model_copy(deep=True)
+    merged.groups[position] = FilterGroup(
+        filters=[Filter(term=term, operator=Operator.IS_ANY, value=sorted(routes))]
+    )
+    merged.page_num = 1
+    merged.page_token = ""
+    return QueryBatch(merged, term, routes)
@@ -74,6 +74,7 @@ class RiskProfilesV1:
         active: bool = None,
         deleted: bool = None,
         support_user: bool = None,
+        record_format: str = "model",
     ) -> RiskProfilesPage:
         """
         Get a page of risk profiles.
@@ -98,6 +99,7 @@ class RiskProfilesV1:
                                        Defaults to returning both.
         * **support_user**: `bool | None` - When true, return only support users. When false, return only non-support users.
                                             Defaults to returning both
+        * **record_format**: `str` - The format to return records in: `"model"` (default) to validate them into models, `"dict"` for the `dict`s returned by the API, or `"compact"` for memory-lean records with the fields of the model, without validation. See [Record Formats][record-formats].
 
         **Returns**: A ['RiskProfilesPage'][riskprofilespage-model] object.
         """
@@ -125,7 +127,9 @@ class RiskProfilesV1:
         response = self._parent.session.get(
             "/v1/user-risk-profiles", params=data.dict()
         )
-        return RiskProfilesPage.parse_response(response)
+        return RiskProfilesPage.parse_response(
+            response, record_format=record_format, records="user_risk_profiles"
+        )
 
     def iter_all(
         self,
@@ -141,13 +145,14 @@ class RiskProfilesV1:
         active: bool = None,
         deleted: bool = None,
         support_user: bool = None,
+        record_format: str = "model",
     ) -> Iterator[RiskProfile]:
         """
         Iterate over all risk profiles.
 
         Accepts the same parameters as `.get_page()` except `page_num`.
 
-        **Returns**: A generator yielding individual [`RiskProfile`][riskprofile-model] objects.
+        **Returns**: A generator yielding individual [`RiskProfile`][riskprofile-model] objects, or records in the given `record_format`.
         """
         warn(
             "Risk Profiles are deprecated. Replaced by Actors.",
@@ -170,6 +175,7 @@ class RiskProfilesV1:
                 active=active,
                 deleted=deleted,
                 support_user=support_user,
+                record_format=record_format,
             )
             yield from page.user_risk_profiles
             if len(page.user_risk_profiles) < page_size:
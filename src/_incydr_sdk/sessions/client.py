@@ -1,9 +1,14 @@
 import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Union
 
+from boltons.cacheutils import LRU
+
 from _incydr_sdk.enums import SortDirection
 from _incydr_sdk.enums.sessions import ContentInspectionStatuses
 from _incydr_sdk.enums.sessions import SessionStates
@@ -29,8 +34,11 @@ class SessionsV1:
         >>> client.items.v1.change_state("<session_id>", SessionStates.CLOSED)
     """
 
+    events_cache_size = 1024
+
     def __init__(self, parent):
         self._parent = parent
+        self._events_cache = LRU(max_size=self.events_cache_size)
 
     def get_page(
         self,
@@ -49,6 +57,7 @@ class SessionsV1:
         page_num: int = 0,
         page_size: int = 50,
         content_inspection_status: Optional[ContentInspectionStatuses] = None,
+        record_format: str = "model",
     ):
         """
         Get a page of items.
@@ -72,6 +81,7 @@ class SessionsV1:
         * **page_num**: `int` - Page number for results, starting at 0.
         * **page_size**: `int` - Max number of results to return per page, between 1 and 50 inclusive. Defaults to 50.
         * **content_inspection_status**: `List[[ContentInspectionStatuses][items-content-inspection-statuses]] | None` - The content inspection status(es) to limit the search to.
+        * **record_format**: `str` - The format to return records in: `"model"` (default) to validate them into models, `"dict"` for the `dict`s returned by the API, or `"compact"` for memory-lean records with the fields of the model, without validation. See [Record Formats][record-formats].
 
         **Returns**: A [`SessionsPage`][sessionspage-model] object.
         """
@@ -109,7 +119,9 @@ class SessionsV1:
             content_inspection_status=content_inspection_status,
         )
         response = self._parent.session.get("/v1/sessions", params=data.dict())
-        return SessionsPage.parse_response(response)
+        return SessionsPage.parse_response(
+            response, record_format=record_format, records="items"
+        )
 
     def iter_all(
         self,
@@ -127,13 +139,14 @@ class SessionsV1:
         watchlist_ids: List[str] = None,
         page_size: int = 50,
         content_inspection_status: Optional[ContentInspectionStatuses] = None,
+        record_format: str = "model",
     ):
         """
         Iterate over all items.
 
         Accepts the same parameters as `.get_page()` excepting `page_num`.
 
-        **Returns**: A generator yielding individual [`Session`][session-model] objects.
+        **Returns**: A generator yielding individual [`Session`][session-model] objects, or records in the given `record_format`.
         """
         for page_num in itertools.count(0):
             page = self.get_page(
@@ -152,6 +165,7 @@ class SessionsV1:
                 page_num=page_num,
                 page_size=page_size,
                 content_inspection_status=content_inspection_status,
+                record_format=record_format,
             )
             yield from page.items
             if len(page.items) < page_size:
@@ -185,6 +199,47 @@ class SessionsV1:
         response = self._parent.session.get(f"/v1/sessions/{session_id}/events")
         return SessionEvents.parse_response(response).query_result
 
+    def iter_with_events(self, sessions: Iterable[Session], max_workers: int = 8):
+        """
+        Iterate over sessions along with the events associated with each of them, fetching the events of up to
+        `max_workers` sessions at once.
+
+        Event pages are cached by session ID and end time in a least-recently-used cache of the client's
+        `events_cache_size` (default 1024) most recent sessions, so sessions seen again without new activity aren't
+        fetched again, even when their state or notes have changed.
+
+        Usage example:
+
+            >>> for session, events in client.sessions.v1.iter_with_events(client.sessions.v1.iter_all()):
+            >>>     print(session.session_id, len(events.file_events))
+
+        **Parameters**:
+
+        * **sessions**: `Iterable[Session]` (required) - The sessions to fetch events for, such as the generator
+            returned by `.iter_all()`. Consumed lazily, as events are fetched.
+        * **max_workers**: `int` - The maximum number of sessions to fetch events for at once. Defaults to 8.
+
+        **Returns**: A generator yielding `(Session, FileEventsPage)` tuples, in the order of `sessions`.
+        """
+
+        def get_events(session):
+            key = (session.session_id, session.end_time)
+            page = self._events_cache.get(key)
+            if page is None:
+                page = self.get_session_events(session.session_id)
+                self._events_cache[key] = page
+            return session, page
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # keep a bounded window of fetches in flight so results stream in order
+            pending = deque()
+            for session in sessions:
+                pending.append(executor.submit(get_events, session))
+                if len(pending) >= max_workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
     def update_state_by_id(
         self, session_ids: Union[str, List[str]], new_state: SessionStates
     ):
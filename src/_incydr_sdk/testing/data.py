@@ -0,0 +1,429 @@
+"""
+Deterministic synthetic tenant data in the shapes returned by the Incydr API, served by the API simulator.
+"""
+import random
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from functools import cached_property
+from typing import List
+
+_FIRST_NAMES = ["alex", "blake", "casey", "drew", "emery", "finley", "gray", "harper"]
+_LAST_NAMES = ["adams", "baker", "chen", "diaz", "evans", "fischer", "garcia", "hill"]
+_DEPARTMENTS = ["engineering", "finance", "legal", "marketing", "sales", "support"]
+
+# (category, mime type, extensions)
+_FILE_TYPES = [
+    ("Document", "application/pdf", ["pdf"]),
+    ("Document", "application/msword", ["doc", "docx"]),
+    ("Spreadsheet", "text/csv", ["csv", "xlsx"]),
+    ("Presentation", "application/vnd.ms-powerpoint", ["ppt", "pptx"]),
+    ("Image", "image/jpeg", ["jpg", "png"]),
+    ("Archive", "application/zip", ["zip", "7z"]),
+    ("SourceCode", "text/x-python", ["py", "java", "go"]),
+]
+
+# (action, source category, destination category, destination name, domain)
+_ACTIVITIES = [
+    ("file-created", "Device", None, None, None),
+    ("file-modified", "Device", None, None, None),
+    ("file-deleted", "Device", None, None, None),
+    ("application-read", "Device", "Cloud Storage", "Dropbox", "dropbox.com"),
+    ("application-read", "Device", "Web Browser", "Gmail", "mail.google.com"),
+    ("removable-media-created", "Device", "Removable Media", "SanDisk", None),
+    ("file-uploaded", "Device", "Cloud Storage", "Google Drive", "drive.google.com"),
+    ("file-emailed", "Email", "Email", "Outlook", "outlook.office.com"),
+]
+
+_INDICATORS = [
+    ("First use of destination", 3),
+    ("File mismatch", 9),
+    ("Remote", 0),
+    ("Off hours", 2),
+    ("Source code", 6),
+    ("Zip", 4),
+]
+
+_SEVERITIES = [
+    (0, "NO_RISK"),
+    (4, "LOW"),
+    (9, "MODERATE"),
+    (13, "HIGH"),
+    (17, "CRITICAL"),
+]
+
+_AUDIT_EVENT_TYPES = [
+    "audit_log::logged_in/1",
+    "audit_log::search_issued/1",
+    "audit_log::file_event_search/1",
+    "audit_log::alert_viewed/1",
+    "audit_log::case_updated/1",
+    "audit_log::watchlist_updated/1",
+]
+
+_WATCHLIST_TYPES = [
+    "DEPARTING_EMPLOYEE",
+    "HIGH_IMPACT_EMPLOYEE",
+    "FLIGHT_RISK",
+    "NEW_EMPLOYEE",
+    "CONTRACT_EMPLOYEE",
+    "ELEVATED_ACCESS_PRIVILEGES",
+    "PERFORMANCE_CONCERNS",
+    "POISONED_WELL",
+    "SUSPICIOUS_SYSTEM_ACTIVITY",
+    "CUSTOM",
+]
+
+TENANT_ID = "simulated-tenant"
+
+
+class SyntheticTenant:
+    """
+    A tenant of synthetic users, actors, agents, watchlists, file events, sessions and audit log events.
+
+    Every record is generated from `seed`, so two tenants created with the same arguments hold exactly the same data,
+    and records are only generated the first time each kind is used. File events are spread evenly over the `days`
+    before `end`, and returned in order of their timestamps.
+
+    **Parameters**:
+
+    * **seed**: `int` - The seed the data is generated from. Defaults to 0.
+    * **users**: `int` - The number of users, each with an actor and an agent. Defaults to 100.
+    * **file_events**: `int` - The number of file events. Defaults to 10,000.
+    * **sessions**: `int` - The number of sessions. Defaults to 1,000.
+    * **audit_events**: `int` - The number of audit log events. Defaults to 1,000.
+    * **watchlists**: `int` - The number of watchlists. Defaults to 10.
+    * **days**: `int` - The number of days the file events, sessions and audit log events span. Defaults to 30.
+    * **end**: `datetime` - The end of the time span of the data. Defaults to the start of the current hour, so that
+        `WITHIN_THE_LAST` queries find recent events. Pass a fixed time for data that doesn't depend on when it's
+        generated.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        users: int = 100,
+        file_events: int = 10_000,
+        sessions: int = 1_000,
+        audit_events: int = 1_000,
+        watchlists: int = 10,
+        days: int = 30,
+        end: datetime = None,
+    ):
+        if users < 1:
+            raise ValueError("A tenant needs at least one user.")
+        self.seed = seed
+        self.user_count = users
+        self.file_event_count = file_events
+        self.session_count = sessions
+        self.audit_event_count = audit_events
+        self.watchlist_count = watchlists
+        if end is None:
+            end = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        self.end = end if end.tzinfo else end.replace(tzinfo=timezone.utc)
+        self.start = self.end - timedelta(days=days)
+
+    def _random(self, kind: str) -> random.Random:
+        return random.Random(f"{self.seed}:{kind}")
+
+    def _id(self, rng: random.Random) -> str:
+        value = f"{rng.getrandbits(128):032x}"
+        return f"{value[:8]}-{value[8:12]}-{value[12:16]}-{value[16:20]}-{value[20:]}"
+
+    def _timestamps(self, rng: random.Random, count: int) -> List[datetime]:
+        """`count` ascending timestamps spread evenly between `start` and `end`."""
+        span = (self.end - self.start) / max(count, 1)
+        return [self.start + span * (i + rng.random()) for i in range(count)]
+
+    @cached_property
+    def users(self) -> List[dict]:
+        """Users, in the shape returned by `/v1/users`."""
+        rng = self._random("users")
+        users = []
+        for i in range(self.user_count):
+            first, last = rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES)
+            created = self.start - timedelta(days=rng.randint(30, 1000))
+            users.append(
+                {
+                    "legacyUserId": str(100000 + i),
+                    "userId": self._id(rng),
+                    "username": f"{first}.{last}.{i}@example.com",
+                    "firstName": first.title(),
+                    "lastName": last.title(),
+                    "legacyOrgId": "1",
+                    "orgId": "org-1",
+                    "orgGuid": "org-guid-1",
+                    "orgName": "Simulated Org",
+                    "notes": None,
+                    "active": rng.random() > 0.05,
+                    "blocked": rng.random() < 0.02,
+                    "creationDate": _iso(created),
+                    "modificationDate": _iso(created + timedelta(days=1)),
+                }
+            )
+        return users
+
+    @cached_property
+    def actors(self) -> List[dict]:
+        """An actor for each user, in the shape returned by `/v1/actors/actor/search`."""
+        rng = self._random("actors")
+        actors = []
+        for user in self.users:
+            actors.append(
+                {
+                    "active": user["active"],
+                    "actorId": self._id(rng),
+                    "alternateNames": [],
+                    "country": "usa",
+                    "department": rng.choice(_DEPARTMENTS),
+                    "division": None,
+                    "employeeType": rng.choice(["full-time", "contractor"]),
+                    "endDate": None,
+                    "firstName": user["firstName"],
+                    "inScope": True,
+                    "lastName": user["lastName"],
+                    "locality": None,
+                    "managerActorId": None,
+                    "name": user["username"],
+                    "notes": None,
+                    "parentActorId": None,
+                    "region": None,
+                    "startDate": None,
+                    "title": None,
+                }
+            )
+        return actors
+
+    @cached_property
+    def agents(self) -> List[dict]:
+        """An agent for each user, in the shape returned by `/v1/agents`."""
+        rng = self._random("agents")
+        agents = []
+        for i, user in enumerate(self.users):
+            hostname = f"HOST-{i:05}"
+            connected = self.end - timedelta(minutes=rng.randint(1, 60 * 24 * 14))
+            healthy = rng.random() > 0.1
+            agents.append(
+                {
+                    "agentId": self._id(rng),
+                    "name": hostname,
+                    "userId": user["userId"],
+                    "osHostname": hostname,
+                    "osName": rng.choice(["Win", "Mac", "Linux"]),
+                    "machineId": str(rng.getrandbits(40)),
+                    "serialNumber": f"SN{rng.getrandbits(32):08X}",
+                    "active": user["active"],
+                    "agentType": "COMBINED",
+                    "agentHealthIssueTypes": [] if healthy else ["NOT_CONNECTING"],
+                    "agentHealthModificationDate": _iso(connected),
+                    "appVersion": "1.0",
+                    "productVersion": "2.0",
+                    "lastConnected": _iso(connected),
+                    "externalReference": None,
+                    "creationDate": user["creationDate"],
+                    "modificationDate": _iso(connected),
+                }
+            )
+        return agents
+
+    @cached_property
+    def watchlists(self) -> List[dict]:
+        """Watchlists, in the shape returned by `/v2/watchlists`."""
+        rng = self._random("watchlists")
+        watchlists = []
+        for i in range(self.watchlist_count):
+            list_type = _WATCHLIST_TYPES[i % len(_WATCHLIST_TYPES)]
+            custom = list_type == "CUSTOM"
+            watchlists.append(
+                {
+                    "description": f"Custom watchlist {i}" if custom else None,
+                    "listType": list_type,
+                    "stats": {
+                        "includedActorsCount": rng.randint(0, self.user_count),
+                        "excludedActorsCount": rng.randint(0, 5),
+                        "includedDepartmentsCount": rng.randint(0, 3),
+                        "excludedDepartmentsCount": 0,
+                        "includedDirectoryGroupsCount": rng.randint(0, 3),
+                        "excludedDirectoryGroupsCount": 0,
+                    },
+                    "tenantId": TENANT_ID,
+                    "title": f"watchlist {i}" if custom else None,
+                    "watchlistId": self._id(rng),
+                }
+            )
+        return watchlists
+
+    @cached_property
+    def file_events(self) -> List[dict]:
+        """File events, in order of their timestamps, in the shape returned by `/v2/file-events`."""
+        rng = self._random("file-events")
+        users, agents = self.users, self.agents
+        events = []
+        for i, timestamp in enumerate(self._timestamps(rng, self.file_event_count)):
+            index = rng.randrange(len(users))
+            user, agent = users[index], agents[index]
+            category, mime_type, extensions = rng.choice(_FILE_TYPES)
+            action, source, destination, destination_name, domain = rng.choice(
+                _ACTIVITIES
+            )
+            indicators = rng.sample(_INDICATORS, rng.randint(0, 3))
+            score = sum(weight for _, weight in indicators)
+            severity = next(s for floor, s in reversed(_SEVERITIES) if score >= floor)
+            name = f"file-{rng.getrandbits(24):06x}.{rng.choice(extensions)}"
+            events.append(
+                {
+                    "@timestamp": _iso(timestamp),
+                    "event": {
+                        "id": f"0_{self._id(rng)}_{i}",
+                        "inserted": _iso(timestamp + timedelta(minutes=2)),
+                        "action": action,
+                        "observer": "Endpoint",
+                        "shareType": [],
+                        "ingested": _iso(timestamp + timedelta(minutes=1)),
+                        "relatedEvents": [],
+                    },
+                    "user": {
+                        "email": user["username"],
+                        "id": user["userId"],
+                        "deviceUid": agent["agentId"],
+                    },
+                    "file": {
+                        "name": name,
+                        "directory": f"C:/Users/{user['firstName']}/Documents/",
+                        "category": category,
+                        "mimeTypeByBytes": mime_type,
+                        "categoryByBytes": category,
+                        "mimeTypeByExtension": mime_type,
+                        "categoryByExtension": category,
+                        "sizeInBytes": rng.randint(100, 50_000_000),
+                        "owner": user["username"],
+                        "created": _iso(timestamp - timedelta(days=1)),
+                        "modified": _iso(timestamp),
+                        "hash": {
+                            "md5": f"{rng.getrandbits(128):032x}",
+                            "sha256": f"{rng.getrandbits(256):064x}",
+                            "md5Error": None,
+                            "sha256Error": None,
+                        },
+                        "id": None,
+                        "url": None,
+                        "directoryId": [],
+                        "cloudDriveId": None,
+                        "classifications": [],
+                    },
+                    "source": {
+                        "category": source,
+                        "name": agent["osHostname"],
+                        "domain": None,
+                        "ip": f"10.0.{index // 256}.{index % 256}",
+                        "privateIp": [],
+                        "operatingSystem": agent["osName"],
+                        "domains": [],
+                        "tabs": [],
+                    },
+                    "destination": {
+                        "category": destination,
+                        "name": destination_name,
+                        "domains": [domain] if domain else [],
+                        "tabs": [],
+                    },
+                    "process": {"executable": None, "owner": user["username"]},
+                    "risk": {
+                        "score": score,
+                        "severity": severity,
+                        "indicators": [{"name": n, "weight": w} for n, w in indicators],
+                        "trusted": False,
+                        "trustReason": None,
+                    },
+                }
+            )
+        return events
+
+    @cached_property
+    def sessions(self) -> List[dict]:
+        """Sessions, in order of their start times, in the shape returned by `/v1/sessions`."""
+        rng = self._random("sessions")
+        actors = self.actors
+        sessions = []
+        for timestamp in self._timestamps(rng, self.session_count):
+            actor = rng.choice(actors)
+            begin = int(timestamp.timestamp() * 1000)
+            end = begin + rng.randint(60_000, 3_600_000)
+            score, severity = rng.choice(_SEVERITIES[1:])
+            state = rng.choice(["OPEN", "OPEN", "IN_PROGRESS", "CLOSED"])
+            counts = [rng.randint(0, 20) for _ in range(5)]
+            sessions.append(
+                {
+                    "actorId": actor["actorId"],
+                    "actorName": actor["name"],
+                    "type": "STANDARD",
+                    "beginTime": begin,
+                    "contentInspectionResults": None,
+                    "contextSummary": None,
+                    "criticalEvents": counts[0],
+                    "endTime": end,
+                    "exfiltrationSummary": None,
+                    "firstObserved": begin,
+                    "highEvents": counts[1],
+                    "lastUpdated": end,
+                    "lowEvents": counts[2],
+                    "moderateEvents": counts[3],
+                    "noRiskEvents": counts[4],
+                    "notes": [],
+                    "riskIndicators": [
+                        {
+                            "eventCount": rng.randint(1, 20),
+                            "id": None,
+                            "name": n,
+                            "weight": w,
+                        }
+                        for n, w in rng.sample(_INDICATORS, 2)
+                    ],
+                    "scores": [
+                        {
+                            "score": score,
+                            "severity": _SEVERITIES.index((score, severity)),
+                            "sourceTimestamp": end,
+                        }
+                    ],
+                    "sessionId": self._id(rng),
+                    "states": [
+                        {
+                            "sourceTimestamp": end,
+                            "state": state,
+                            "stateV2": state,
+                            "userId": None,
+                        }
+                    ],
+                    "tenantId": TENANT_ID,
+                    "triggeredAlerts": [],
+                    "userId": None,
+                }
+            )
+        return sessions
+
+    @cached_property
+    def audit_events(self) -> List[dict]:
+        """Audit log events, newest first, in the shape returned by `/v1/audit/search-audit-log`."""
+        rng = self._random("audit-events")
+        users = self.users
+        events = []
+        for timestamp in self._timestamps(rng, self.audit_event_count):
+            user = rng.choice(users)
+            events.append(
+                {
+                    "type$": rng.choice(_AUDIT_EVENT_TYPES),
+                    "actorId": user["userId"],
+                    "actorName": user["username"],
+                    "actorAgent": "incydr-simulator",
+                    "actorIpAddress": f"192.0.2.{rng.randint(1, 254)}",
+                    "timestamp": _iso(timestamp),
+                    "actorType": "USER",
+                }
+            )
+        events.reverse()
+        return events
+
+
+def _iso(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03}Z"
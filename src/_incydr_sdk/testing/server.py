@@ -0,0 +1,575 @@
+"""
+A local HTTP server that simulates the Incydr API, serving a `SyntheticTenant`'s data with configurable latency and
+failures, for load and integration testing without a tenant.
+"""
+import base64
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from urllib.parse import parse_qs
+from urllib.parse import unquote
+from urllib.parse import urlsplit
+
+from boltons.cacheutils import LRU
+from pydantic import ValidationError
+
+from _incydr_sdk.core.client import Client
+from _incydr_sdk.core.codec import get_codec
+from _incydr_sdk.core.history import url_template
+from _incydr_sdk.queries.file_events import EventQuery
+from _incydr_sdk.queries.file_events import GroupingEventQuery
+from _incydr_sdk.queries.local import compile_query
+from _incydr_sdk.queries.local import values_getter
+from _incydr_sdk.testing.data import SyntheticTenant
+from _incydr_sdk.testing.data import TENANT_ID
+
+# an unsigned token with the only claim the SDK reads
+_TOKEN_PREFIX = ".".join(
+    base64.urlsafe_b64encode(json.dumps(part).encode()).decode().rstrip("=")
+    for part in ({"alg": "none", "typ": "JWT"}, {"tenantUid": TENANT_ID})
+)
+
+
+class Faults:
+    """
+    The latency and failures a simulator adds to its responses. Failures are drawn from a random generator seeded
+    with `seed`, so the same sequence of requests fails the same way on every run. Authentication requests
+    (`/v1/oauth`) are delayed but never fail.
+
+    **Parameters**:
+
+    * **latency**: `float` - Seconds to wait before responding to each request. Defaults to 0.
+    * **jitter**: `float` - Up to this many more seconds, chosen at random, to wait before responding. Defaults to 0.
+    * **throttle_rate**: `float` - The fraction of requests, between 0 and 1, to respond to with `429 Too Many
+        Requests`. Defaults to 0.
+    * **retry_after**: `int` - The `Retry-After` header, in seconds, of throttled responses. Defaults to 1.
+    * **requests_per_second**: `float` - A rate limit, across all connections, above which requests are throttled,
+        with a `Retry-After` of the time until the next request is allowed. Defaults to no limit.
+    * **error_rate**: `float` - The fraction of requests, between 0 and 1, to respond to with a server error.
+        Defaults to 0.
+    * **error_statuses**: `Sequence[int]` - The status codes of server errors, chosen at random. Defaults to
+        `(500, 502, 503)`.
+    * **seed**: `int` - The seed failures are drawn with. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        requests_per_second: float = None,
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = (500, 502, 503),
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.requests_per_second = requests_per_second
+        self.error_rate = error_rate
+        self.error_statuses = list(error_statuses)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = requests_per_second
+        self._refilled = time.monotonic()
+
+    def delay(self) -> float:
+        """The seconds to wait before the next response."""
+        if not self.jitter:
+            return self.latency
+        with self._lock:
+            return self.latency + self._random.uniform(0, self.jitter)
+
+    def failure(self) -> Optional[Tuple[int, dict]]:
+        """The status code and headers of the next response, if it should fail, or `None`."""
+        with self._lock:
+            if self.requests_per_second:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.requests_per_second,
+                    self._tokens + (now - self._refilled) * self.requests_per_second,
+                )
+                self._refilled = now
+                if self._tokens < 1:
+                    wait = (1 - self._tokens) / self.requests_per_second
+                    return 429, {"Retry-After": str(math.ceil(wait))}
+                self._tokens -= 1
+            if self.throttle_rate and self._random.random() < self.throttle_rate:
+                return 429, {"Retry-After": str(self.retry_after)}
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self._random.choice(self.error_statuses), {}
+        return None
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class IncydrSimulator:
+    """
+    A local HTTP server that simulates the Incydr API, for load testing integrations and the SDK's concurrent features
+    against realistic volumes of data without a tenant.
+
+    The simulator serves a `SyntheticTenant`'s data from these endpoints, with the
+    request parameters and response shapes of the API:
+
+    * `POST /v1/oauth`, which accepts any client ID and secret.
+    * `POST /v2/file-events`, filtered and sorted by the query, and paged by `pgToken` (each `nextPgToken` is the ID
+        of the last event on the page) or by `pgNum` when `pgToken` is `null`.
+    * `POST /v2/file-events/grouping`.
+    * `POST /v1/audit/search-audit-log` and `POST /v1/audit/search-results-count`.
+    * `GET /v1/sessions` and `GET /v1/sessions/{id}`.
+    * `GET /v1/actors/actor/search`, and actors by ID and by name.
+    * `GET /v1/users` and `GET /v1/users/{id}`.
+    * `GET /v1/agents` and `GET /v1/agents/{id}`.
+    * `GET /v2/watchlists` and `GET /v2/watchlists/{id}`.
+
+    Every other request is answered with `404 Not Found`. Requests are handled in a thread each, and the number of
+    responses by endpoint and status code is kept in `request_counts`.
+
+    Usage example:
+
+        >>> from incydr.testing import Faults, IncydrSimulator, SyntheticTenant
+        >>> tenant = SyntheticTenant(seed=42, file_events=100_000)
+        >>> with IncydrSimulator(tenant, Faults(latency=0.05, throttle_rate=0.01)) as simulator:
+        ...     client = simulator.client()
+        ...     events = list(client.file_events.v2.iter_all(EventQuery("P30D"), page_size=10_000))
+
+    **Parameters**:
+
+    * **tenant**: `SyntheticTenant` - The data to serve. Defaults to a `SyntheticTenant` with its default sizes.
+    * **faults**: `Faults` - The latency and failures to add to responses. Defaults to none.
+    * **host**: `str` - The address to listen on. Defaults to `127.0.0.1`.
+    * **port**: `int` - The port to listen on. Defaults to any free port.
+    * **token_lifetime**: `int` - The seconds until access tokens expire. Defaults to 900.
+    """
+
+    def __init__(
+        self,
+        tenant: SyntheticTenant = None,
+        faults: Faults = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        token_lifetime: int = 900,
+    ):
+        self.tenant = tenant or SyntheticTenant()
+        self.faults = faults or Faults()
+        self.token_lifetime = token_lifetime
+        self.request_counts = Counter()
+        self._codec = get_codec()
+        self._lock = threading.Lock()
+        self._tokens = {}
+        self._queries = LRU(max_size=32)
+        self._encoded = None
+        self._audit_timestamps = None
+        self._server = ThreadingHTTPServer((host, port), _handler(self))
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """The base URL of the simulator, to pass to `Client(url=...)`."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Start serving requests in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                args=(0.05,),
+                name="incydr-simulator",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving requests and close the listening socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def client(self, **settings) -> Client:
+        """
+        Returns a `Client` connected to the simulator. Keyword arguments are passed to `Client`, for any other
+        settings.
+        """
+        settings.setdefault("api_client_id", "simulator")
+        settings.setdefault("api_client_secret", "simulator")
+        return Client(url=self.url, **settings)
+
+    def handle(
+        self, method: str, target: str, headers, body: bytes
+    ) -> Tuple[int, dict, bytes]:
+        """Returns the status code, headers and body of the response to a request."""
+        status, response_headers, content = self._route(method, target, headers, body)
+        with self._lock:
+            self.request_counts[(method, url_template(target), status)] += 1
+        return status, response_headers, content
+
+    def _route(self, method, target, headers, body) -> Tuple[int, dict, bytes]:
+        parts = urlsplit(target)
+        path = parts.path.rstrip("/")
+        delay = self.faults.delay()
+        if delay:
+            time.sleep(delay)
+        try:
+            if path == "/v1/oauth":
+                return self._respond(200, self._authenticate(method, headers))
+            self._authorize(headers)
+            failure = self.faults.failure()
+            if failure:
+                status, failure_headers = failure
+                return status, failure_headers, b'{"error": "Simulated failure"}'
+            for route_method, pattern, name in _ROUTES:
+                match = pattern.fullmatch(path)
+                if match and route_method == method:
+                    params = parse_qs(parts.query)
+                    data = self._codec.loads(body) if body else {}
+                    args = [unquote(arg) for arg in match.groups()]
+                    return self._respond(
+                        200, getattr(self, name)(*args, params=params, data=data)
+                    )
+            raise _HTTPError(404, f"No such endpoint: {method} {path}")
+        except _HTTPError as err:
+            return self._respond(err.status, {"error": str(err)})
+
+    def _respond(self, status, content) -> Tuple[int, dict, bytes]:
+        if not isinstance(content, bytes):
+            content = self._codec.dumps_bytes(content)
+        return status, {"Content-Type": "application/json"}, content
+
+    def _authenticate(self, method, headers) -> dict:
+        auth = headers.get("Authorization") or ""
+        if method != "POST" or not auth.startswith("Basic "):
+            raise _HTTPError(401, "Client credentials are required.")
+        with self._lock:
+            token = f"{_TOKEN_PREFIX}.{len(self._tokens)}"
+            self._tokens[token] = time.monotonic() + self.token_lifetime
+        return {
+            "token_type": "bearer",
+            "expires_in": self.token_lifetime,
+            "access_token": token,
+        }
+
+    def _authorize(self, headers):
+        scheme, _, token = (headers.get("Authorization") or "").partition(" ")
+        expires = self._tokens.get(token)
+        if scheme != "Bearer" or expires is None:
+            raise _HTTPError(401, "A valid access token is required.")
+        if expires < time.monotonic():
+            raise _HTTPError(401, "The access token has expired.")
+
+    def _query(self, query_class, data):
+        try:
+            return query_class.model_validate(data)
+        except (ValidationError, ValueError) as err:
+            raise _HTTPError(400, str(err))
+
+    def _matching_events(self, query, sort_key: str = None, sort_dir: str = "asc"):
+        """The indices of the tenant's events that match the query, in order, and the rank of each event ID."""
+        key = self._codec.dumps_bytes(
+            [query.group_clause, query.dict()["groups"], sort_key, sort_dir]
+        )
+        cached = self._queries.get(key)
+        if cached is not None:
+            return cached
+        events = self.tenant.file_events
+        try:
+            predicate = compile_query(query)
+        except ValueError as err:
+            raise _HTTPError(400, str(err))
+        matches = [i for i, event in enumerate(events) if predicate(event)]
+        if sort_key:
+            get_values = values_getter(sort_key)
+
+            def sort_value(index):
+                values = get_values(events[index])
+                return (0, values[0]) if values else (1, "")
+
+            matches.sort(key=sort_value, reverse=sort_dir.lower() == "desc")
+        ranks = {events[i]["event"]["id"]: rank for rank, i in enumerate(matches)}
+        self._queries[key] = cached = (matches, ranks)
+        return cached
+
+    def _encoded_events(self):
+        with self._lock:
+            if self._encoded is None:
+                self._encoded = [
+                    self._codec.dumps_bytes(event) for event in self.tenant.file_events
+                ]
+        return self._encoded
+
+    def _search_file_events(self, params, data) -> bytes:
+        query = self._query(EventQuery, data)
+        matches, ranks = self._matching_events(query, query.sort_key, query.sort_dir)
+        if query.page_token is None:
+            start = (query.page_num - 1) * query.page_size
+        elif query.page_token == "":
+            start = 0
+        elif query.page_token in ranks:
+            start = ranks[query.page_token] + 1
+        else:
+            raise _HTTPError(400, f"Invalid page token: {query.page_token}")
+        end = start + query.page_size
+        page = matches[start:end]
+        next_token = None
+        if query.page_token is not None and page and end < len(matches):
+            next_token = self.tenant.file_events[page[-1]]["event"]["id"]
+        encoded = self._encoded_events()
+        return b"".join(
+            [
+                b'{"fileEvents":[',
+                b",".join(encoded[i] for i in page),
+                b'],"nextPgToken":',
+                self._codec.dumps_bytes(next_token),
+                b',"totalCount":',
+                str(len(matches)).encode(),
+                b',"problems":null}',
+            ]
+        )
+
+    def _search_groups(self, params, data) -> dict:
+        query = self._query(GroupingEventQuery, data)
+        if not query.grouping_term:
+            raise _HTTPError(400, "A groupingTerm is required.")
+        matches, _ = self._matching_events(query)
+        events = self.tenant.file_events
+        get_values = values_getter(query.grouping_term)
+        counts = Counter()
+        for i in matches:
+            counts.update(str(value) for value in set(get_values(events[i])))
+        return {
+            "groupingTerm": query.grouping_term,
+            "groups": [
+                {"value": value, "docCount": count}
+                for value, count in counts.most_common(query.size)
+            ],
+            "problems": None,
+        }
+
+    def _audit_events(self, data) -> list:
+        with self._lock:
+            if self._audit_timestamps is None:
+                self._audit_timestamps = [
+                    _parse_timestamp(event["timestamp"])
+                    for event in self.tenant.audit_events
+                ]
+            timestamps = self._audit_timestamps
+        date_range = data.get("dateRange") or {}
+        start, end = date_range.get("startTime"), date_range.get("endTime")
+        filters = [
+            (key, set(data[name]))
+            for name, key in (
+                ("actorIds", "actorId"),
+                ("actorNames", "actorName"),
+                ("eventTypes", "type$"),
+            )
+            if data.get(name)
+        ]
+        return [
+            event
+            for event, ts in zip(self.tenant.audit_events, timestamps)
+            if (start is None or ts >= start)
+            and (end is None or ts <= end)
+            and all(event[key] in values for key, values in filters)
+        ]
+
+    def _search_audit_log(self, params, data) -> dict:
+        events = self._audit_events(data)
+        page_size = data.get("pageSize") or 100
+        start = (data.get("page") or 0) * page_size
+        end = start + page_size
+        page = events[start:end]
+        return {
+            "events": page,
+            "paginationRangeStartIndex": start,
+            "paginationRangeEndIndex": start + len(page),
+            "totalResultCount": len(events),
+        }
+
+    def _count_audit_log(self, params, data) -> dict:
+        return {"totalResultCount": len(self._audit_events(data))}
+
+    def _list_sessions(self, params, data) -> dict:
+        actor_id = _param(params, "actor_id")
+        on_or_after = _param(params, "on_or_after", int)
+        before = _param(params, "before", int)
+        states = set(params.get("state", []))
+        sessions = [
+            s
+            for s in self.tenant.sessions
+            if (actor_id is None or s["actorId"] == actor_id)
+            and (on_or_after is None or s["beginTime"] >= on_or_after)
+            and (before is None or s["beginTime"] < before)
+            and (not states or s["states"][-1]["state"] in states)
+        ]
+        if (_param(params, "sort_direction") or "").lower() == "desc":
+            sessions.reverse()
+        page = _page(sessions, params, "page_number", "page_size", first=0)
+        return {"items": page, "totalCount": len(sessions)}
+
+    def _get_session(self, session_id, params, data) -> dict:
+        return _find(self.tenant.sessions, "sessionId", session_id, "Session")
+
+    def _list_users(self, params, data) -> dict:
+        active = _param(params, "active", _bool)
+        blocked = _param(params, "blocked", _bool)
+        username = _param(params, "username")
+        users = [
+            u
+            for u in self.tenant.users
+            if (active is None or u["active"] == active)
+            and (blocked is None or u["blocked"] == blocked)
+            and (username is None or u["username"] == username)
+        ]
+        return {"users": _page(users, params), "totalCount": len(users)}
+
+    def _get_user(self, user_id, params, data) -> dict:
+        return _find(self.tenant.users, "userId", user_id, "User")
+
+    def _search_actors(self, params, data) -> dict:
+        active = _param(params, "active", _bool)
+        starts = (_param(params, "nameStartsWith") or "").lower()
+        ends = (_param(params, "nameEndsWith") or "").lower()
+        actors = [
+            a
+            for a in self.tenant.actors
+            if (active is None or a["active"] == active)
+            and a["name"].lower().startswith(starts)
+            and a["name"].lower().endswith(ends)
+        ]
+        return {"actors": _page(actors, params)}
+
+    def _get_actor(self, actor_id, params, data) -> dict:
+        return _find(self.tenant.actors, "actorId", actor_id, "Actor")
+
+    def _get_actor_by_name(self, name, params, data) -> dict:
+        return _find(self.tenant.actors, "name", name, "Actor")
+
+    def _list_agents(self, params, data) -> dict:
+        active = _param(params, "active", _bool)
+        user_id = _param(params, "userId")
+        agents = [
+            a
+            for a in self.tenant.agents
+            if (active is None or a["active"] == active)
+            and (user_id is None or a["userId"] == user_id)
+        ]
+        return {
+            "agents": _page(agents, params),
+            "totalCount": len(agents),
+            "pageSize": _param(params, "pageSize", int) or 100,
+            "page": _param(params, "page", int) or 1,
+        }
+
+    def _get_agent(self, agent_id, params, data) -> dict:
+        return _find(self.tenant.agents, "agentId", agent_id, "Agent")
+
+    def _list_watchlists(self, params, data) -> dict:
+        watchlists = self.tenant.watchlists
+        return {"watchlists": _page(watchlists, params), "totalCount": len(watchlists)}
+
+    def _get_watchlist(self, watchlist_id, params, data) -> dict:
+        return _find(self.tenant.watchlists, "watchlistId", watchlist_id, "Watchlist")
+
+
+# (method, path pattern, IncydrSimulator method)
+_ROUTES = [
+    (method, re.compile(pattern), name)
+    for method, pattern, name in [
+        ("POST", "/v2/file-events", "_search_file_events"),
+        ("POST", "/v2/file-events/grouping", "_search_groups"),
+        ("POST", "/v1/audit/search-audit-log", "_search_audit_log"),
+        ("POST", "/v1/audit/search-results-count", "_count_audit_log"),
+        ("GET", "/v1/sessions", "_list_sessions"),
+        ("GET", "/v1/sessions/([^/]+)", "_get_session"),
+        ("GET", "/v1/actors/actor/search(?:/parent)?", "_search_actors"),
+        ("GET", "/v1/actors/actor/id/([^/]+)(?:/parent)?", "_get_actor"),
+        ("GET", "/v1/actors/actor/name/([^/]+)(?:/parent)?", "_get_actor_by_name"),
+        ("GET", "/v1/users", "_list_users"),
+        ("GET", "/v1/users/([^/]+)", "_get_user"),
+        ("GET", "/v1/agents", "_list_agents"),
+        ("GET", "/v1/agents/([^/]+)", "_get_agent"),
+        ("GET", "/v2/watchlists", "_list_watchlists"),
+        ("GET", "/v2/watchlists/([^/]+)", "_get_watchlist"),
+    ]
+]
+
+
+def _handler(simulator: IncydrSimulator):
+    class Handler(BaseHTTPRequestHandler):
+        # keep connections open between requests, like the API
+        protocol_version = "HTTP/1.1"
+
+        def _handle(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            status, headers, content = simulator.handle(
+                self.command, self.path, self.headers, body
+            )
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def _bool(value: str) -> bool:
+    return value.lower() == "true"
+
+
+def _param(params: dict, name: str, convert=str):
+    values = params.get(name)
+    return convert(values[0]) if values else None
+
+
+def _page(records: list, params: dict, page="page", page_size="pageSize", first=1):
+    size = _param(params, page_size, int) or 100
+    start = ((_param(params, page, int) or first) - first) * size
+    end = start + size
+    return records[start:end]
+
+
+def _find(records: list, key: str, value: str, kind: str) -> dict:
+    for record in records:
+        if record[key] == value:
+            return record
+    raise _HTTPError(404, f"{kind} not found: {value}")
+
+
+def _parse_timestamp(value: str) -> float:
+    """Seconds since the epoch, to the millisecond, of an ISO timestamp."""
+    ms = round(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp() * 1000)
+    return ms / 1000
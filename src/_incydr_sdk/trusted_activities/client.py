@@ -59,6 +59,7 @@ class TrustedActivitiesV2:
         activity_type: ActivityType = None,
         sort_key: SortKeys = None,
         sort_direction: SortDirection = None,
+        record_format: str = "model",
     ) -> TrustedActivitiesPage:
         """
         Get a page of trusted activities.
@@ -71,6 +72,7 @@ class TrustedActivitiesV2:
         * **activity_type**: `ActivityType` - The type of the trusted activity.
         * **sort_key**: `SortKeys` - The key by which to sort the returned list.
         * **sort_dir**: `SortDirection` - The order in which to sort the returned list.
+        * **record_format**: `str` - The format to return records in: `"model"` (default) to validate them into models, `"dict"` for the `dict`s returned by the API, or `"compact"` for memory-lean records with the fields of the model, without validation. See [Record Formats][record-formats].
 
         **Returns**: A [`TrustedActivitiesPage`][trustedactivitiespage-model] object.
         """
@@ -86,7 +88,9 @@ class TrustedActivitiesV2:
         response = self._parent.session.get(
             "/v2/trusted-activities", params=data.dict()
         )
-        return TrustedActivitiesPage.parse_response(response)
+        return TrustedActivitiesPage.parse_response(
+            response, record_format=record_format, records="trusted_activities"
+        )
 
     def iter_all(
         self,
@@ -94,13 +98,14 @@ class TrustedActivitiesV2:
         activity_type: ActivityType = None,
         sort_key: SortKeys = None,
         sort_direction: SortDirection = None,
+        record_format: str = "model",
     ) -> Iterator[TrustedActivity]:
         """
         Iterate over all trusted activities.
 
         Accepts the same parameters as `.get_page()` except `page_num`.
 
-        **Returns**: A generator yielding individual [`TrustedActivity`][trustedactivity-model] objects.
+        **Returns**: A generator yielding individual [`TrustedActivity`][trustedactivity-model] objects, or records in the given `record_format`.
         """
 
         page_size = page_size or self._parent.settings.page_size
@@ -111,6 +116,7 @@ class TrustedActivitiesV2:
                 activity_type=activity_type,
                 sort_key=sort_key,
                 sort_direction=sort_direction,
+                record_format=record_format,
             )
             yield from page.trusted_activities
             if len(page.trusted_activities) < page_size:
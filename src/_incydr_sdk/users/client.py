@@ -44,7 +44,6 @@ class UsersV1:
 
     def __init__(self, parent):
         self._parent = parent
-        self._available_roles = {}
 
     def get_user(self, user: str) -> User:
         """
@@ -75,6 +74,7 @@ class UsersV1:
         username: str = None,
         page_num: int = 1,
         page_size: int = None,
+        record_format: str = "model",
     ) -> UsersPage:
         """
         Get a page of users.
@@ -88,6 +88,7 @@ class UsersV1:
         * **username**: `str` - The username of a user to search for.
         * **page_num**: `int` - Page number for results. Defaulting to 1.
         * **page_size**: `int` - Max number of results to return per page. Defaulting to client's `page_size` setting.
+        * **record_format**: `str` - The format to return records in: `"model"` (default) to validate them into models, `"dict"` for the `dict`s returned by the API, or `"compact"` for memory-lean records with the fields of the model, without validation. See [Record Formats][record-formats].
 
         **Returns**: A [`UsersPage`][userspage-model] object.
         """
@@ -100,7 +101,9 @@ class UsersV1:
             pageSize=page_size,
         )
         response = self._parent.session.get("/v1/users", params=data.dict())
-        return UsersPage.parse_response(response)
+        return UsersPage.parse_response(
+            response, record_format=record_format, records="users"
+        )
 
     def get_devices(
         self,
@@ -195,13 +198,14 @@ class UsersV1:
         blocked: bool = None,
         username: str = None,
         page_size: int = None,
+        record_format: str = "model",
     ) -> Iterator[User]:
         """
         Iterate over all users.
 
         Accepts the same parameters as `.get_page()` excepting `page_num`.
 
-        **Returns**: A generator yielding individual [`User`][user-model] objects.
+        **Returns**: A generator yielding individual [`User`][user-model] objects, or records in the given `record_format`.
         """
         page_size = page_size or self._parent.settings.page_size
         for page_num in count(1):
@@ -211,6 +215,7 @@ class UsersV1:
                 username=username,
                 page_num=page_num,
                 page_size=page_size,
+                record_format=record_format,
             )
             yield from page.users
             if len(page.users) < page_size:
@@ -364,11 +369,13 @@ class UsersV1:
 
         Returns the role ID unchanged if it doesn't match any names of available roles.
         """
-        if not self._available_roles:
-            self._lookup_roles()
-        for name, id_ in self._available_roles.items():
-            if (role_name == name) or (role_name == id_):
-                return id_
+        for refresh in (False, True):
+            if refresh:
+                # if not found, the cached roles may be out of date
+                self._parent.reference_cache.invalidate("roles")
+            for name, id_ in self._lookup_roles().items():
+                if (role_name == name) or (role_name == id_):
+                    return id_
         raise RoleNotFoundError(role_name)
 
     def _update_role_ids_for_user(self, roles, user_id, add=True):
@@ -384,9 +391,6 @@ class UsersV1:
 
         role_ids = [i.role_id for i in self.list_user_roles(user_id)]
 
-        if not self._available_roles:
-            self._lookup_roles()
-
         if not isinstance(roles, List):
             roles = [roles]
 
@@ -410,11 +414,12 @@ class UsersV1:
         return role_ids
 
     def _lookup_roles(self):
-        """Map role names to role ID."""
-        self._available_roles = {}
-        available_roles = self.list_roles()
-        for r in available_roles:
-            self._available_roles[r.role_name] = r.role_id
+        """Map role names to role ID, from the reference data cache."""
+        roles = parse_obj_as(
+            List[Role],
+            self._parent.reference_cache.get_json("roles", "/v1/users/roles"),
+        )
+        return {r.role_name: r.role_id for r in roles}
 
 
 class RoleProcessingError(IncydrException):
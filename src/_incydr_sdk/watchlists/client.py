@@ -1,8 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
 from itertools import count
+from typing import Any
+from typing import Callable
+from typing import Iterable
 from typing import Iterator
 from typing import List
+from typing import Sequence
 from typing import Union
 
+import requests
+from boltons.iterutils import chunked
+
 from _incydr_sdk.enums.watchlists import WatchlistType
 from _incydr_sdk.exceptions import WatchlistNotFoundError
 from _incydr_sdk.watchlists.clientv1 import WatchlistsV1
@@ -22,6 +30,7 @@ from _incydr_sdk.watchlists.models.responses import IncludedDirectoryGroupsList
 from _incydr_sdk.watchlists.models.responses import WatchlistActor
 from _incydr_sdk.watchlists.models.responses import WatchlistMembersListV2
 from _incydr_sdk.watchlists.models.responses import WatchlistsPageV2
+from _incydr_sdk.watchlists.models.responses import WatchlistSyncResult
 from _incydr_sdk.watchlists.models.responses import WatchlistV2
 
 
@@ -57,11 +66,14 @@ class WatchlistsV2:
 
     def __init__(self, parent):
         self._parent = parent
-        self._watchlist_type_id_map = {}
         self._uri = "/v2/watchlists"
 
     def get_page(
-        self, page_num: int = 1, page_size: int = None, actor_id: str = None
+        self,
+        page_num: int = 1,
+        page_size: int = None,
+        actor_id: str = None,
+        record_format: str = "model",
     ) -> WatchlistsPageV2:
         """
         Get a page of watchlists.
@@ -73,6 +85,7 @@ class WatchlistsV2:
         * **page_num**: `int` - Page number for results, starting at 1.
         * **page_size**: `int` - Max number of results to return for a page.
         * **actor_id**: `str` - Matches watchlists where the actor is a member.
+        * **record_format**: `str` - The format to return records in: `"model"` (default) to validate them into models, `"dict"` for the `dict`s returned by the API, or `"compact"` for memory-lean records with the fields of the model, without validation. See [Record Formats][record-formats].
 
         **Returns**: A [`WatchlistsPage`][watchlistspage-model] object.
         """
@@ -81,22 +94,30 @@ class WatchlistsV2:
             page=page_num, pageSize=page_size, actorId=actor_id
         )
         response = self._parent.session.get(self._uri, params=data.dict())
-        return WatchlistsPageV2.parse_response(response)
+        return WatchlistsPageV2.parse_response(
+            response, record_format=record_format, records="watchlists"
+        )
 
     def iter_all(
-        self, page_size: int = None, actor_id: str = None
+        self,
+        page_size: int = None,
+        actor_id: str = None,
+        record_format: str = "model",
     ) -> Iterator[WatchlistV2]:
         """
         Iterate over all watchlists.
 
         Accepts the same parameters as `.get_page()` excepting `page_num`.
 
-        **Returns**: A generator yielding individual [`Watchlist`][watchlist-model] objects.
+        **Returns**: A generator yielding individual [`Watchlist`][watchlist-model] objects, or records in the given `record_format`.
         """
         page_size = page_size or self._parent.settings.page_size
         for page_num in count(1):
             page = self.get_page(
-                page_num=page_num, page_size=page_size, actor_id=actor_id
+                page_num=page_num,
+                page_size=page_size,
+                actor_id=actor_id,
+                record_format=record_format,
             )
             yield from page.watchlists
             if len(page.watchlists) < page_size:
@@ -137,9 +158,8 @@ class WatchlistsV2:
             description=description, title=title, watchlistType=watchlist_type
         )
         response = self._parent.session.post(url=self._uri, json=data.dict())
-        watchlist = WatchlistV2.parse_response(response)
-        self._watchlist_type_id_map[watchlist_type] = watchlist.watchlist_id
-        return watchlist
+        self._parent.reference_cache.invalidate("watchlists")
+        return WatchlistV2.parse_response(response)
 
     def delete(self, watchlist_id: str):
         """
@@ -151,7 +171,9 @@ class WatchlistsV2:
 
         **Returns**: A `requests.Response` indicating success.
         """
-        return self._parent.session.delete(f"{self._uri}/{watchlist_id}")
+        response = self._parent.session.delete(f"{self._uri}/{watchlist_id}")
+        self._parent.reference_cache.invalidate("watchlists")
+        return response
 
     def update(
         self, watchlist_id: str, title: str = None, description: str = None
@@ -177,6 +199,7 @@ class WatchlistsV2:
         response = self._parent.session.patch(
             f"{self._uri}/{watchlist_id}", params=query, json=data.dict()
         )
+        self._parent.reference_cache.invalidate("watchlists")
         return WatchlistV2.parse_response(response)
 
     def get_member(self, watchlist_id: str, actor_id: str) -> WatchlistActor:
@@ -337,6 +360,115 @@ class WatchlistsV2:
             if len(page.included_actors) < page_size:
                 break
 
+    def sync(
+        self,
+        watchlist_id: str,
+        included_actor_ids: Iterable[str] = None,
+        excluded_actor_ids: Iterable[str] = None,
+        max_workers: int = 4,
+        dry_run: bool = False,
+    ) -> WatchlistSyncResult:
+        """
+        Make a watchlist's individually included and/or excluded actors match the given lists of actor IDs.
+
+        The current members are compared with the desired ones and only the difference is applied: actors missing from
+        the watchlist are added and actors no longer in the desired list are removed, in batches of 100 actors sent
+        `max_workers` at a time. If a batch fails because an actor isn't found, it is split up until the actors that
+        can't be processed are found, and the rest of the batch is still applied.
+
+        Members included through departments or directory groups are not affected.
+
+        **Parameters**:
+
+        * **watchlist_id**: `str` (required) - Watchlist ID.
+        * **included_actor_ids**: `Iterable[str]` - The actor IDs that should be included on the watchlist. Included
+            actors are left unchanged if `None`.
+        * **excluded_actor_ids**: `Iterable[str]` - The actor IDs that should be excluded from the watchlist.
+            Excluded actors are left unchanged if `None`.
+        * **max_workers**: `int` - Max number of batches to send at once. Defaults to 4.
+        * **dry_run**: `bool` - Calculate the changes without applying them. Defaults to False.
+
+        **Returns**: A [`WatchlistSyncResult`][watchlistsyncresult-model] object.
+        """
+        result = WatchlistSyncResult(dryRun=dry_run)
+        changes = []
+        if included_actor_ids is not None:
+            current = {a.actor_id for a in self.iter_all_included_actors(watchlist_id)}
+            desired = set(included_actor_ids)
+            result.included_added = sorted(desired - current)
+            result.included_removed = sorted(current - desired)
+            changes += [
+                (self.add_included_actors, result.included_added),
+                (self.remove_included_actors, result.included_removed),
+            ]
+        if excluded_actor_ids is not None:
+            current = {a.actor_id for a in self.iter_all_excluded_actors(watchlist_id)}
+            desired = set(excluded_actor_ids)
+            result.excluded_added = sorted(desired - current)
+            result.excluded_removed = sorted(current - desired)
+            changes += [
+                (self.add_excluded_actors, result.excluded_added),
+                (self.remove_excluded_actors, result.excluded_removed),
+            ]
+        if dry_run:
+            return result
+
+        for update, actor_ids in changes:
+            result.failed += self.update_actors_in_batches(
+                update, watchlist_id, actor_ids, max_workers=max_workers
+            )
+        return result
+
+    def update_actors_in_batches(
+        self,
+        update: Callable[[str, List[str]], Any],
+        watchlist_id: str,
+        actor_ids: Sequence[str],
+        max_workers: int = 4,
+    ) -> List[str]:
+        """
+        Include, exclude or remove any number of actors, in batches of 100 actors sent `max_workers` at a time. A batch
+        rejected because an actor wasn't found is split in half and retried until the unknown actors are isolated, so
+        the rest of the batch is still applied.
+
+        Usage example:
+
+            >>> client.watchlists.v2.update_actors_in_batches(
+            ...     client.watchlists.v2.add_included_actors, watchlist_id, actor_ids
+            ... )
+
+        **Parameters**:
+
+        * **update**: `Callable` (required) - The method to apply to each batch: `.add_included_actors`,
+            `.remove_included_actors`, `.add_excluded_actors` or `.remove_excluded_actors`.
+        * **watchlist_id**: `str` (required) - Watchlist ID.
+        * **actor_ids**: `Sequence[str]` (required) - The actor IDs to update.
+        * **max_workers**: `int` - Max number of batches to send at once. Defaults to 4.
+
+        **Returns**: A list of the actor IDs that could not be processed.
+        """
+
+        def apply(batch):
+            try:
+                update(watchlist_id, batch)
+                return []
+            except requests.HTTPError as err:
+                if "Actor not found" not in err.response.text:
+                    raise
+                if len(batch) == 1:
+                    self._parent.settings.logger.error(
+                        f"Problem processing actorId={batch[0]} for watchlist={watchlist_id}: {err.response.text}"
+                    )
+                    return batch
+                middle = len(batch) // 2
+                return apply(batch[:middle]) + apply(batch[middle:])
+
+        failed = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for batch_failed in executor.map(apply, chunked(actor_ids, 100)):
+                failed += batch_failed
+        return failed
+
     def add_excluded_actors(self, watchlist_id: str, actor_ids: Union[str, List[str]]):
         """
         Exclude individual actors from a watchlist.
@@ -643,21 +775,31 @@ class WatchlistsV2:
         **Returns**: A watchlist ID (`str`).
         """
 
-        def _lookup_ids(self):
-            """Map watchlist types to IDs, if they exist."""
-            self._watchlist_type_id_map = {}
-            watchlists = self.get_page(page_size=100).watchlists
-            for item in watchlists:
-                if item.list_type == "CUSTOM":
-                    # store title for custom lists instead of list_type
-                    self._watchlist_type_id_map[item.title] = item.watchlist_id
-                self._watchlist_type_id_map[item.list_type] = item.watchlist_id
-
-        watchlist_id = self._watchlist_type_id_map.get(name)
+        watchlist_id = self._watchlist_ids().get(name)
         if not watchlist_id:
-            # if not found, reset ID cache
-            _lookup_ids(self)
-            watchlist_id = self._watchlist_type_id_map.get(name)
+            # if not found, the cached watchlists may be out of date
+            self._parent.reference_cache.invalidate("watchlists")
+            watchlist_id = self._watchlist_ids().get(name)
             if not watchlist_id:
                 raise WatchlistNotFoundError(name)
         return watchlist_id
+
+    def _watchlist_ids(self):
+        """Map watchlist types (and titles, for custom lists) to IDs, from the reference data cache."""
+        watchlist_ids = {}
+        page_size = 100
+        for page_num in count(1):
+            data = ListWatchlistsRequestV2(page=page_num, pageSize=page_size)
+            page = WatchlistsPageV2.parse_obj(
+                self._parent.reference_cache.get_json(
+                    "watchlists", self._uri, params=data.dict()
+                )
+            )
+            for item in page.watchlists:
+                if item.list_type == "CUSTOM":
+                    # store title for custom lists instead of list_type
+                    watchlist_ids[item.title] = item.watchlist_id
+                watchlist_ids[item.list_type] = item.watchlist_id
+            if len(page.watchlists) < page_size:
+                break
+        return watchlist_ids
@@ -461,3 +461,25 @@ class WatchlistsPageV2(ResponseModel):
     watchlists: Optional[List[WatchlistV2]] = Field(
         None, description="The list of watchlists."
     )
+
+
+class WatchlistSyncResult(ResponseModel):
+    """
+    A model representing the changes made to a watchlist's members by `WatchlistsV2.sync()`.
+
+    **Fields**:
+
+    * **included_added**: `List[str]` - Actor IDs included on the watchlist.
+    * **included_removed**: `List[str]` - Actor IDs no longer included on the watchlist.
+    * **excluded_added**: `List[str]` - Actor IDs excluded from the watchlist.
+    * **excluded_removed**: `List[str]` - Actor IDs no longer excluded from the watchlist.
+    * **failed**: `List[str]` - Actor IDs that could not be added or removed because the actor was not found.
+    * **dry_run**: `bool` - Whether the changes were only calculated, and not applied.
+    """
+
+    included_added: List[str] = Field([], alias="includedAdded")
+    included_removed: List[str] = Field([], alias="includedRemoved")
+    excluded_added: List[str] = Field([], alias="excludedAdded")
+    excluded_removed: List[str] = Field([], alias="excludedRemoved")
+    failed: List[str] = Field([])
+    dry_run: bool = Field(False, alias="dryRun")
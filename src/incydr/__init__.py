@@ -1,11 +1,14 @@
 # SPDX-FileCopyrightText: 2022-present Code42 Software <integrations@code42.com>
 #
 # SPDX-License-Identifier: MIT
+from . import aggregations
 from . import enums
 from . import models
 from _incydr_sdk import exceptions
 from _incydr_sdk.__version__ import __version__
 from _incydr_sdk.core.client import Client
+from _incydr_sdk.event_store.store import EventStore
+from _incydr_sdk.mirror.store import LocalMirror
 from _incydr_sdk.queries.alerts import AlertQuery
 from _incydr_sdk.queries.file_events import EventQuery
 from _incydr_sdk.queries.file_events import GroupingEventQuery
@@ -16,6 +19,9 @@ __all__ = [
     "AlertQuery",
     "EventQuery",
     "GroupingEventQuery",
+    "EventStore",
+    "LocalMirror",
+    "aggregations",
     "models",
     "exceptions",
 ]
@@ -0,0 +1,23 @@
+from _incydr_sdk.aggregations.operators import Aggregation
+from _incydr_sdk.aggregations.operators import Count
+from _incydr_sdk.aggregations.operators import CountMinSketch
+from _incydr_sdk.aggregations.operators import DistinctCount
+from _incydr_sdk.aggregations.operators import Operator
+from _incydr_sdk.aggregations.operators import TimeHistogram
+from _incydr_sdk.aggregations.operators import TopK
+
+__all__ = [
+    "Aggregation",
+    "Operator",
+    "Count",
+    "CountMinSketch",
+    "DistinctCount",
+    "TimeHistogram",
+    "TopK",
+]
+
+
+__locals = locals()
+for __name in __all__:
+    if not __name.startswith("__"):
+        setattr(__locals[__name], "__module__", "incydr.aggregations")  # noqa
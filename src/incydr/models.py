@@ -12,6 +12,7 @@ from _incydr_sdk.alerts.models.response import AlertQueryPage
 from _incydr_sdk.audit_log.models import AuditEventsPage
 from _incydr_sdk.cases.models import Case
 from _incydr_sdk.cases.models import CaseFileEvents
+from _incydr_sdk.cases.models import CaseFileEventsUpdate
 from _incydr_sdk.cases.models import CasesPage
 from _incydr_sdk.customer.models import Customer
 from _incydr_sdk.departments.models import DepartmentsPage
@@ -22,8 +23,12 @@ from _incydr_sdk.directory_groups.models import DirectoryGroupsPage
 from _incydr_sdk.file_events.models.event import FileEventV2
 from _incydr_sdk.file_events.models.event import User
 from _incydr_sdk.file_events.models.response import FileEventGroup
+from _incydr_sdk.file_events.models.response import FileEventGroupPartition
 from _incydr_sdk.file_events.models.response import FileEventsPage
 from _incydr_sdk.file_events.models.response import GroupedFileEventResponse
+from _incydr_sdk.file_events.models.response import (
+    PartitionedGroupedFileEventResponse,
+)
 from _incydr_sdk.file_events.models.response import SavedSearch
 from _incydr_sdk.risk_indicator_categories.models import RiskIndicator
 from _incydr_sdk.risk_indicator_categories.models import (
@@ -55,6 +60,7 @@ from _incydr_sdk.watchlists.models.responses import WatchlistMembersList
 from _incydr_sdk.watchlists.models.responses import WatchlistMembersListV2
 from _incydr_sdk.watchlists.models.responses import WatchlistsPage
 from _incydr_sdk.watchlists.models.responses import WatchlistsPageV2
+from _incydr_sdk.watchlists.models.responses import WatchlistSyncResult
 from _incydr_sdk.watchlists.models.responses import WatchlistUser
 from _incydr_sdk.watchlists.models.responses import WatchlistV2
 
@@ -70,6 +76,7 @@ __all__ = [
     "AlertQueryPage",
     "Case",
     "CaseFileEvents",
+    "CaseFileEventsUpdate",
     "CasesPage",
     "Customer",
     "Device",
@@ -79,6 +86,8 @@ __all__ = [
     "FileEventV2",
     "GroupedFileEventResponse",
     "FileEventGroup",
+    "PartitionedGroupedFileEventResponse",
+    "FileEventGroupPartition",
     "User",
     "UsersPage",
     "UserRole",
@@ -106,6 +115,7 @@ __all__ = [
     "IncludedUsersList",
     "WatchlistActor",
     "WatchlistUser",
+    "WatchlistSyncResult",
     "IncludedDepartmentsList",
     "IncludedDepartment",
     "IncludedDirectoryGroupsList",
@@ -0,0 +1,15 @@
+from _incydr_sdk.testing.data import SyntheticTenant
+from _incydr_sdk.testing.server import Faults
+from _incydr_sdk.testing.server import IncydrSimulator
+
+__all__ = [
+    "IncydrSimulator",
+    "Faults",
+    "SyntheticTenant",
+]
+
+
+__locals = locals()
+for __name in __all__:
+    if not __name.startswith("__"):
+        setattr(__locals[__name], "__module__", "incydr.testing")  # noqa
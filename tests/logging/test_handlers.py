@@ -1,16 +1,21 @@
 import logging
 import ssl
+import threading
+import time
 from socket import IPPROTO_TCP
 from socket import IPPROTO_UDP
 from socket import SOCK_DGRAM
 from socket import SOCK_STREAM
 from socket import socket
 from socket import SocketKind
+from unittest.mock import MagicMock
 
 import pytest
 
 from _incydr_cli.logger.enums import ServerProtocol
+from _incydr_cli.logger.enums import SyslogFraming
 from _incydr_cli.logger.handlers import NoPrioritySysLogHandler
+from _incydr_cli.logger.handlers import QueuedSysLogHandler
 from _incydr_cli.logger.handlers import SyslogServerNetworkConnectionError
 
 _TEST_HOST = "example.com"
@@ -251,3 +256,128 @@ class TestNoPrioritySysLogHandler:
         handler.connect_socket()
         handler.close()
         assert global_close.call_count == 1
+
+    @tls_and_tcp_test
+    def test_emit_when_octet_counting_prefixes_message_with_length(self, protocol):
+        handler = NoPrioritySysLogHandler(
+            _TEST_HOST,
+            _TEST_PORT,
+            protocol,
+            None,
+            framing=SyslogFraming.OCTET_COUNTING,
+        )
+        handler.socket = mock_socket = MagicMock()
+        handler.setFormatter(logging.Formatter(fmt="%(message)s"))
+        handler.emit(_record("test"))
+        mock_socket.sendall.assert_called_once_with(b"4 test")
+
+
+@pytest.fixture
+def queued_socket(mocker):
+    sock = mocker.MagicMock(spec=ssl.SSLSocket)
+    mocker.patch.object(QueuedSysLogHandler, "_create_socket", return_value=sock)
+    return sock
+
+
+def _queued_handler(protocol=ServerProtocol.TCP, **kwargs):
+    kwargs.setdefault("reconnect_backoff", 0)
+    handler = QueuedSysLogHandler(_TEST_HOST, _TEST_PORT, protocol, None, **kwargs)
+    handler.setFormatter(logging.Formatter(fmt="%(message)s"))
+    return handler
+
+
+def _record(msg):
+    return logging.LogRecord("test", logging.INFO, "", 0, msg, None, None)
+
+
+class TestQueuedSysLogHandler:
+    def test_flush_sends_queued_records_in_a_single_write(self, queued_socket):
+        handler = _queued_handler()
+        for i in range(3):
+            handler._queue.put(f"event-{i}".encode())
+        handler.flush()
+        queued_socket.sendall.assert_called_once_with(b"event-0\nevent-1\nevent-2\n")
+        assert handler.stats["delivered"] == 3
+        handler.close()
+
+    def test_emit_when_octet_counting_frames_each_record(self, queued_socket):
+        handler = _queued_handler(framing=SyslogFraming.OCTET_COUNTING)
+        handler.emit(_record("abc"))
+        handler.emit(_record("defgh"))
+        handler.flush()
+        sent = b"".join(c.args[0] for c in queued_socket.sendall.call_args_list)
+        assert sent == b"3 abc5 defgh"
+        handler.close()
+
+    def test_emit_when_udp_sends_one_datagram_per_record(self, queued_socket):
+        handler = _queued_handler(protocol=ServerProtocol.UDP)
+        handler.emit(_record("abc"))
+        handler.emit(_record("def"))
+        handler.flush()
+        assert [c.args for c in queued_socket.sendto.call_args_list] == [
+            (b"abc\n", (_TEST_HOST, _TEST_PORT)),
+            (b"def\n", (_TEST_HOST, _TEST_PORT)),
+        ]
+        handler.close()
+
+    def test_flush_when_send_fails_reconnects_and_resends_batch(self, queued_socket):
+        queued_socket.sendall.side_effect = [ConnectionResetError(), None]
+        handler = _queued_handler()
+        handler.emit(_record("abc"))
+        handler.flush()
+        assert queued_socket.sendall.call_count == 2
+        assert handler.stats["delivered"] == 1
+        assert handler.stats["reconnects"] == 1
+        assert handler.stats["dropped"] == 0
+        handler.close()
+
+    def test_emit_when_reconnect_attempts_exhausted_drops_and_raises(
+        self, queued_socket
+    ):
+        queued_socket.sendall.side_effect = ConnectionResetError()
+        handler = _queued_handler(max_reconnect_attempts=2)
+        handler.emit(_record("abc"))
+        handler.flush()
+        assert queued_socket.sendall.call_count == 3
+        assert handler.stats["dropped"] == 1
+        with pytest.raises(SyslogServerNetworkConnectionError):
+            handler.emit(_record("def"))
+        handler.close()
+
+    def test_emit_when_queue_full_and_spill_file_spills_then_forwards(
+        self, queued_socket, tmp_path
+    ):
+        release = threading.Event()
+        queued_socket.sendall.side_effect = lambda data: release.wait()
+        spill_file = tmp_path / "spill"
+        handler = _queued_handler(queue_size=1, spill_file=spill_file)
+        handler.emit(_record("first"))
+        # wait for the sender to take the first record and block sending it
+        while handler._queue.qsize():
+            time.sleep(0.01)
+        handler.emit(_record("second"))
+        handler.emit(_record("third"))
+        assert handler.stats["spilled"] == 1
+        release.set()
+        handler.flush()
+        sent = b"".join(c.args[0] for c in queued_socket.sendall.call_args_list)
+        assert sent == b"first\nsecond\nthird\n"
+        assert handler.stats["delivered"] == 3
+        assert not spill_file.exists()
+        handler.close()
+
+    def test_flush_forwards_records_left_in_spill_file(self, queued_socket, tmp_path):
+        spill_file = tmp_path / "spill"
+        spill_file.write_bytes(b"3 abc3 def2 g")
+        handler = _queued_handler(spill_file=spill_file)
+        handler.flush()
+        queued_socket.sendall.assert_called_once_with(b"abc\ndef\n")
+        assert not spill_file.exists()
+        handler.close()
+
+    def test_close_stops_sender_thread(self, queued_socket):
+        handler = _queued_handler()
+        handler.emit(_record("abc"))
+        handler.close()
+        assert not handler._sender.is_alive()
+        queued_socket.sendall.assert_called_once_with(b"abc\n")
@@ -1,11 +1,10 @@
-import logging
-
 import pytest
 
-from _incydr_cli.logger import _init_logger
-from _incydr_cli.logger import get_logger_for_server
+from _incydr_cli.logger import create_server_handler
 from _incydr_cli.logger.enums import ServerProtocol
+from _incydr_cli.logger.enums import SyslogFraming
 from _incydr_cli.logger.handlers import NoPrioritySysLogHandler
+from _incydr_cli.logger.handlers import QueuedSysLogHandler
 
 
 @pytest.fixture(autouse=True)
@@ -13,71 +12,53 @@ def init_socket_mock(mocker):
     return mocker.patch("_incydr_cli.logger.NoPrioritySysLogHandler.connect_socket")
 
 
-@pytest.fixture(autouse=True)
-def fresh_syslog_handler(init_socket_mock):
-    # Set handlers to empty list so it gets initialized each test
-    get_logger_for_server(
-        ServerProtocol.TCP,
-        "example.com",
-        None,
-        None,
-    ).handlers = []
-    init_socket_mock.call_count = 0
-
-
-def test_init_logger_does_as_expected():
-    logger = logging.getLogger("TEST_INCYDR_CLI")
-    handler = logging.Handler()
-    _init_logger(logger, handler)
-    assert handler in logger.handlers
-    assert isinstance(handler.formatter, logging.Formatter)
-
-
-def test_get_logger_for_server_has_info_level():
-    logger = get_logger_for_server(ServerProtocol.TCP, "example.com", None, None)
-    assert logger.level == logging.INFO
-
+def test_create_server_handler_uses_no_priority_syslog_handler():
+    handler = create_server_handler(ServerProtocol.TCP, "example.com", None, None)
+    assert type(handler) == NoPrioritySysLogHandler
 
-def test_get_logger_for_server_when_called_twice_only_has_one_handler():
-    get_logger_for_server(ServerProtocol.TCP, "example.com", None, None)
-    logger = get_logger_for_server(ServerProtocol.TCP, "example.com", None, None)
-    assert len(logger.handlers) == 1
 
-
-def test_get_logger_for_server_uses_no_priority_syslog_handler():
-    logger = get_logger_for_server(ServerProtocol.TCP, "example.com", None, None)
-    assert type(logger.handlers[0]) == NoPrioritySysLogHandler
-
-
-def test_get_logger_for_server_constructs_handler_with_expected_args(
-    mocker, monkeypatch
-):
+def test_create_server_handler_constructs_handler_with_expected_args(mocker):
     no_priority_syslog_handler = mocker.patch(
         "_incydr_cli.logger.handlers.NoPrioritySysLogHandler.__init__"
     )
     no_priority_syslog_handler.return_value = None
-    get_logger_for_server(ServerProtocol.TCP, "example.com", None, "cert")
+    create_server_handler(ServerProtocol.TCP, "example.com", None, "cert")
     no_priority_syslog_handler.assert_called_once_with(
-        "example.com", 601, ServerProtocol.TCP.value, "cert"
+        "example.com",
+        601,
+        ServerProtocol.TCP.value,
+        "cert",
+        framing=SyslogFraming.NEWLINE.value,
     )
 
 
-def test_get_logger_for_server_when_hostname_includes_port_constructs_handler_with_expected_args(
+def test_create_server_handler_when_hostname_includes_port_constructs_handler_with_expected_args(
     mocker,
 ):
     no_priority_syslog_handler = mocker.patch(
         "_incydr_cli.logger.handlers.NoPrioritySysLogHandler.__init__"
     )
     no_priority_syslog_handler.return_value = None
-    get_logger_for_server(ServerProtocol.TCP, "example.com", 999, None)
+    create_server_handler(ServerProtocol.TCP, "example.com", 999, None)
     no_priority_syslog_handler.assert_called_once_with(
         "example.com",
         999,
         ServerProtocol.TCP.value,
         None,
+        framing=SyslogFraming.NEWLINE.value,
     )
 
 
-def test_get_logger_for_server_inits_socket(init_socket_mock):
-    get_logger_for_server(ServerProtocol.TCP, "example.com", None, None)
+def test_create_server_handler_inits_socket(init_socket_mock):
+    create_server_handler(ServerProtocol.TCP, "example.com", None, None)
     assert init_socket_mock.call_count == 1
+
+
+def test_create_server_handler_when_queue_size_uses_queued_syslog_handler(mocker):
+    mocker.patch("_incydr_cli.logger.handlers.QueuedSysLogHandler.connect_socket")
+    handler = create_server_handler(
+        ServerProtocol.TCP, "example.com", None, None, queue_size=10
+    )
+    assert type(handler) == QueuedSysLogHandler
+    assert handler._queue.maxsize == 10
+    handler.close()
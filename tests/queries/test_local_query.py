@@ -0,0 +1,117 @@
+import json
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+
+from _incydr_sdk.queries.local import compile_query
+from _incydr_sdk.queries.local import filter_events
+from _incydr_sdk.queries.local import read_events
+from incydr import EventQuery
+from tests.test_file_events import TEST_EVENT_1
+from tests.test_file_events import TEST_EVENT_2
+
+NOW = datetime(2022, 7, 15, tzinfo=timezone.utc)
+
+
+def event_ids(query, events=(TEST_EVENT_1, TEST_EVENT_2)):
+    return [e["event"]["id"] for e in filter_events(query, events, now=NOW)]
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        (EventQuery(), ["2-event-id-100", "1-event-id-100"]),
+        (EventQuery().equals("file.category", "Archive"), ["1-event-id-100"]),
+        (
+            EventQuery().equals("file.category", ["Archive", "Spreadsheet"]),
+            ["2-event-id-100", "1-event-id-100"],
+        ),
+        (EventQuery().not_equals("file.category", "Archive"), ["2-event-id-100"]),
+        (EventQuery().equals("file.category", "archive"), ["1-event-id-100"]),
+        (
+            EventQuery().is_any("file.category", ["ARCHIVE", "spreadSheet"]),
+            ["2-event-id-100", "1-event-id-100"],
+        ),
+        (
+            EventQuery().equals("risk.trusted", "false"),
+            ["2-event-id-100", "1-event-id-100"],
+        ),
+        (EventQuery().equals("risk.trusted", "True"), []),
+        (EventQuery().not_equals("risk.trusted", "FALSE"), []),
+        (EventQuery().is_any("risk.indicators.name", ["Zip"]), ["1-event-id-100"]),
+        (
+            EventQuery().is_none("risk.indicators.name", ["Zip", "Other"]),
+            ["2-event-id-100"],
+        ),
+        (EventQuery().greater_than("risk.score", 15), ["2-event-id-100"]),
+        (EventQuery().less_than("risk.score", 15), ["1-event-id-100"]),
+        (EventQuery().exists("file.name"), ["2-event-id-100", "1-event-id-100"]),
+        (EventQuery().does_not_exist("file.name"), []),
+        (EventQuery().on("@timestamp", "2022-05-31"), ["1-event-id-100"]),
+        (EventQuery(start_date="P2D"), ["2-event-id-100"]),
+        (
+            EventQuery(start_date="2022-05-01", end_date="2022-06-01"),
+            ["1-event-id-100"],
+        ),
+    ],
+)
+def test_filter_events_evaluates_operators(query, expected):
+    assert event_ids(query) == expected
+
+
+def test_filter_events_evaluates_nested_subgroups():
+    query = (
+        EventQuery()
+        .greater_than("risk.score", 1)
+        .subquery(
+            EventQuery()
+            .matches_any()
+            .equals("file.name", "cat.jpg")
+            .subquery(EventQuery().equals("user.email", "partner@code42.com"))
+        )
+    )
+    assert event_ids(query) == ["2-event-id-100", "1-event-id-100"]
+
+    query = EventQuery().subquery(
+        EventQuery().equals("file.name", "cat.jpg").equals("file.category", "Archive")
+    )
+    assert event_ids(query) == []
+
+
+def test_filter_events_when_matches_any_returns_events_matching_any_group():
+    query = (
+        EventQuery()
+        .matches_any()
+        .equals("file.category", "Archive")
+        .equals("file.name", "cat.jpg")
+    )
+    assert event_ids(query) == ["2-event-id-100", "1-event-id-100"]
+
+
+def test_compile_query_matches_booleans_as_true_or_false():
+    assert compile_query(EventQuery().equals("risk.trusted", "false"))(
+        {"risk": {"trusted": False}}
+    )
+    assert compile_query(EventQuery().equals("risk.trusted", "true"))(
+        {"risk.trusted": True}
+    )
+    assert not compile_query(EventQuery().equals("risk.trusted", "true"))(
+        {"risk": {"trusted": False}}
+    )
+
+
+def test_compile_query_matches_flattened_events():
+    matches = compile_query(EventQuery().equals("file.category", "Archive"))
+    assert matches({"file.category": "Archive"})
+    assert not matches({"file.category": "Document"})
+
+
+def test_read_events_reads_json_lines_and_json_arrays(tmp_path):
+    lines = tmp_path / "events.jsonl"
+    lines.write_text(f"{json.dumps(TEST_EVENT_1)}\n\n{json.dumps(TEST_EVENT_2)}\n")
+    array = tmp_path / "events.json"
+    array.write_text(json.dumps([TEST_EVENT_1, TEST_EVENT_2]))
+
+    assert list(read_events(lines)) == [TEST_EVENT_1, TEST_EVENT_2]
+    assert list(read_events(array)) == [TEST_EVENT_1, TEST_EVENT_2]
@@ -0,0 +1,48 @@
+from _incydr_sdk.queries.multiplex import plan_batches
+from incydr import EventQuery
+
+
+def test_plan_batches_merges_queries_differing_in_term_values():
+    queries = [
+        EventQuery("P1D").equals("user.email", f"user{i}@example.com") for i in range(5)
+    ]
+    batches = plan_batches(queries, "user.email", batch_size=2)
+
+    assert [b.query_indexes for b in batches] == [[0, 1], [2, 3], [4]]
+    merged = batches[0].query.dict()["groups"][1]["filters"][0]
+    assert merged["operator"] == "IS_ANY"
+    assert merged["value"] == ["user0@example.com", "user1@example.com"]
+    # the shared date range filter is kept
+    assert batches[0].query.dict()["groups"][0] == queries[0].dict()["groups"][0]
+    # the original queries are left unchanged
+    assert queries[0].dict()["groups"][1]["filters"][0]["operator"] == "IS"
+
+
+def test_plan_batches_keeps_incompatible_queries_separate():
+    queries = [
+        EventQuery("P1D").equals("user.email", "a@example.com"),
+        EventQuery("P2D").equals("user.email", "b@example.com"),
+        EventQuery("P1D").not_equals("user.email", "c@example.com"),
+        EventQuery("P1D").equals("user.email", ["d@example.com", "a@example.com"]),
+    ]
+    batches = plan_batches(queries, "user.email")
+
+    assert sorted(b.query_indexes for b in batches) == [[0, 3], [1], [2]]
+    unmerged = next(b for b in batches if b.query_indexes == [2])
+    assert unmerged.term is None
+    # unmerged queries are copied, so that paging them leaves the original unchanged
+    assert unmerged.query is not queries[2]
+    assert unmerged.query.dict() == queries[2].dict()
+
+
+def test_query_batch_routes_events_to_matching_queries():
+    queries = [
+        EventQuery().equals("user.email", "a@example.com"),
+        EventQuery().equals("user.email", ["A@example.com", "b@example.com"]),
+        EventQuery().equals("user.email", "c@example.com"),
+    ]
+    (batch,) = plan_batches(queries, "user.email")
+
+    assert batch.route({"user": {"email": "a@example.com"}}) == [0, 1]
+    assert batch.route({"user": {"email": "B@EXAMPLE.COM"}}) == [1]
+    assert batch.route({"user": {"email": "d@example.com"}}) == []
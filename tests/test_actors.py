@@ -316,6 +316,23 @@ def test_iter_all_with_default_params_returns_expected_data(
     assert total_count == 2
 
 
+def test_iter_all_with_record_format_skips_validation(httpserver_auth: HTTPServer):
+    httpserver_auth.expect_request(
+        "/v1/actors/actor/search",
+        method="GET",
+        query_string=urlencode({"pageSize": 2, "page": 1}),
+    ).respond_with_json({"actors": [CHILD_ACTOR]})
+
+    client = Client()
+    dicts = list(client.actors.v1.iter_all(page_size=2, record_format="dict"))
+    records = list(client.actors.v1.iter_all(page_size=2, record_format="compact"))
+
+    assert dicts == [CHILD_ACTOR]
+    assert records[0].actor_id == CHILD_ACTOR["actorId"]
+    assert records[0].name == CHILD_ACTOR["name"]
+    assert records[0]._fields == tuple(Actor.model_fields)
+
+
 def test_iter_all_when_custom_params_returns_expected_data(
     httpserver_auth: HTTPServer,
 ):
@@ -0,0 +1,103 @@
+import pickle
+from datetime import timedelta
+
+import pytest
+
+from _incydr_sdk.file_events.models.event import FileEventV2
+from incydr.aggregations import Aggregation
+from incydr.aggregations import Count
+from incydr.aggregations import CountMinSketch
+from incydr.aggregations import DistinctCount
+from incydr.aggregations import TimeHistogram
+from incydr.aggregations import TopK
+from tests.test_file_events import TEST_EVENT_1
+from tests.test_file_events import TEST_EVENT_2
+
+
+def make_events(n):
+    for i in range(n):
+        yield {
+            "@timestamp": f"2024-01-0{1 + i % 3}T0{i % 10}:00:00.000Z",
+            "user": {"email": f"user{i % 7}@example.com" if i % 2 else "a@example.com"},
+            "file": {"hash": {"sha256": f"hash-{i % 500}"}},
+        }
+
+
+def test_aggregation_computes_each_operator():
+    aggregation = Aggregation(
+        events=Count(),
+        users=TopK("user.email", k=2),
+        hashes=DistinctCount("file.hash.sha256"),
+        per_day=TimeHistogram(),
+    )
+    passed = list(aggregation.tap(make_events(3000)))
+    result = aggregation.result()
+
+    assert len(passed) == 3000
+    assert result["events"] == 3000
+    assert result["users"][0] == {"value": "a@example.com", "count": 1500, "error": 0}
+    assert len(result["users"]) == 2
+    assert abs(result["hashes"] - 500) <= 10
+    assert result["per_day"] == {
+        "2024-01-01T00:00:00Z": 1000,
+        "2024-01-02T00:00:00Z": 1000,
+        "2024-01-03T00:00:00Z": 1000,
+    }
+
+
+def test_aggregation_merge_of_partitions_matches_single_aggregation():
+    def new_aggregation():
+        return Aggregation(
+            users=TopK("user.email", k=3, capacity=4),
+            hashes=DistinctCount("file.hash.sha256"),
+            sketch=CountMinSketch("user.email"),
+            hours=TimeHistogram(interval=timedelta(hours=12)),
+        )
+
+    events = list(make_events(2000))
+    whole = new_aggregation().consume(events)
+    first = new_aggregation().consume(events[:700])
+    second = new_aggregation().consume(events[700:])
+    # partial aggregations can be returned from other processes
+    merged = first.merge(pickle.loads(pickle.dumps(second)))
+
+    assert merged.result()["hashes"] == whole.result()["hashes"]
+    assert merged.result()["hours"] == whole.result()["hours"]
+    assert merged.result()["users"][0]["value"] == "a@example.com"
+    assert merged.operators["sketch"].estimate("a@example.com") >= 1000
+
+
+def test_top_k_when_capacity_exceeded_tracks_heavy_hitters_with_error_bound():
+    top = TopK("value", k=1, capacity=3)
+    values = ["heavy", "a", "heavy", "b", "heavy", "c", "d", "heavy", "e", "heavy"]
+    for value in values:
+        top.add({"value": value})
+    (result,) = top.result()
+    assert result["value"] == "heavy"
+    assert result["count"] - result["error"] <= 5 <= result["count"]
+
+
+def test_count_min_sketch_never_underestimates():
+    sketch = CountMinSketch("value", width=16, depth=3)
+    for i in range(500):
+        sketch.add({"value": i % 50})
+    assert sketch.result() == 500
+    assert all(sketch.estimate(i) >= 10 for i in range(50))
+
+
+def test_operators_aggregate_models_by_alias_and_multi_valued_terms():
+    aggregation = Aggregation(
+        indicators=TopK("risk.indicators.name", k=1),
+        destinations=Count("destination.category"),
+    )
+    aggregation.consume(FileEventV2.parse_obj(e) for e in (TEST_EVENT_1, TEST_EVENT_2))
+    result = aggregation.result()
+    assert result["indicators"][0]["count"] == 2
+    assert result["destinations"] == 2
+
+
+def test_merge_when_configuration_differs_raises_value_error():
+    with pytest.raises(ValueError):
+        DistinctCount("a", precision=10).merge(DistinctCount("a", precision=12))
+    with pytest.raises(ValueError):
+        Aggregation(a=Count()).merge(Aggregation(b=Count()))
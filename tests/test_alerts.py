@@ -4,6 +4,8 @@ from unittest import mock
 
 import pytest
 from pytest_httpserver import HTTPServer
+from requests import HTTPError
+from werkzeug import Response
 
 from _incydr_cli.cmds.options.output_options import TableFormat
 from _incydr_cli.cursor import CursorStore
@@ -926,3 +928,59 @@ def test_cli_bulk_update_state_when_404_retries_individual_alert_ids(
     )
     assert result.exit_code == 0
     httpserver_auth.check()
+
+
+@pytest.fixture
+def mock_query_details_with_failure(httpserver_auth: HTTPServer):
+    """Responds to each chunk of ids with their details, after failing the first request for the second chunk."""
+    requests = []
+
+    def handler(request):
+        ids = request.json["alertIds"]
+        requests.append(ids)
+        if ids[0] == "101" and requests.count(ids) == 1:
+            return Response("unavailable", status=503)
+        alerts = [
+            json.loads(
+                AlertDetails(
+                    id=i,
+                    tenantId="1234",
+                    type="alert",
+                    createdAt=datetime.now(),
+                    state="OPEN",
+                ).json()
+            )
+            for i in ids
+        ]
+        return Response(json.dumps({"alerts": alerts}))
+
+    httpserver_auth.expect_request(
+        "/v1/alerts/query-details", method="POST"
+    ).respond_with_handler(handler)
+    return requests
+
+
+def test_get_details_when_max_workers_returns_details_in_order_and_retries_chunks(
+    mock_query_details_with_failure,
+):
+    alert_ids = [str(i) for i in range(1, 251)]
+    client = Client()
+    client.alerts.v1.retry_backoff = 0
+    response = client.alerts.v1.get_details(alert_ids, max_workers=3, max_retries=1)
+    assert [alert.id for alert in response] == alert_ids
+    assert len(mock_query_details_with_failure) == 4
+
+
+def test_iter_details_yields_details_for_each_chunk(mock_query_details_with_failure):
+    alert_ids = [str(i) for i in range(1, 251)]
+    client = Client()
+    client.alerts.v1.retry_backoff = 0
+    alerts = list(client.alerts.v1.iter_details(iter(alert_ids), max_workers=2))
+    assert sorted(alert.id for alert in alerts) == sorted(alert_ids)
+    assert all(isinstance(alert, AlertDetails) for alert in alerts)
+
+
+def test_get_details_when_retries_exhausted_raises(mock_query_details_with_failure):
+    client = Client()
+    with pytest.raises(HTTPError):
+        client.alerts.v1.get_details([str(i) for i in range(1, 201)], max_workers=2)
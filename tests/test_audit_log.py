@@ -1,14 +1,21 @@
+import csv
 import datetime
+import json
+import os
+import signal
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest import mock
 
 import pytest
 from pytest_httpserver import HTTPServer
+from werkzeug import Response
 
 from _incydr_cli.cmds.audit_log import _hash_event
 from _incydr_cli.cmds.options.output_options import TableFormat
 from _incydr_cli.cursor import CursorStore
 from _incydr_cli.main import incydr
+from _incydr_sdk.audit_log.export import partition_date_range
 from _incydr_sdk.audit_log.models import AuditEventsPage
 from _incydr_sdk.queries.utils import parse_ts_to_posix_ts
 from incydr import Client
@@ -371,3 +378,296 @@ def test_cli_download_makes_expected_call(
     result = runner.invoke(incydr, ["audit-log", "download", "--path", str(tmp_path)])
     httpserver_auth.check()
     assert result.exit_code == 0
+
+
+def test_cli_search_with_follow_polls_from_last_timestamp_and_dedupes_events(
+    httpserver_auth: HTTPServer, runner
+):
+    new_event = dict(TEST_AL_ENTRY_1, timestamp="2022-10-03T13:20:00.000Z")
+    responses = [[TEST_AL_ENTRY_1], [TEST_AL_ENTRY_1, new_event], []]
+    requests = []
+
+    def handler(request):
+        requests.append(request.json)
+        if len(requests) == len(responses):
+            # stop following once all pages have been served
+            os.kill(os.getpid(), signal.SIGINT)
+        return Response(json.dumps({"events": responses[len(requests) - 1]}))
+
+    httpserver_auth.expect_request(
+        "/v1/audit/search-audit-log", method="POST"
+    ).respond_with_handler(handler)
+
+    result = runner.invoke(
+        incydr,
+        [
+            "audit-log",
+            "search",
+            "--follow",
+            "--poll-interval",
+            "0",
+            "-f",
+            "json_lines",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert [r["dateRange"]["startTime"] for r in requests] == [
+        None,
+        parse_ts_to_posix_ts(TEST_AL_ENTRY_1["timestamp"]),
+        parse_ts_to_posix_ts(new_event["timestamp"]),
+    ]
+    printed = [json.loads(line) for line in result.output.splitlines() if "{" in line]
+    assert printed == [TEST_AL_ENTRY_1, new_event]
+
+
+def _audit_log_handler(events, requests, descending=True):
+    """Serves `events` like the audit log search endpoint: filtered by date range and ordered by timestamp."""
+
+    def handler(request):
+        requests.append(request.json)
+        date_range = request.json["dateRange"]
+        page = [
+            e
+            for e in events
+            if (
+                date_range["startTime"] is None
+                or parse_ts_to_posix_ts(e["timestamp"]) >= date_range["startTime"]
+            )
+            and (
+                date_range["endTime"] is None
+                or parse_ts_to_posix_ts(e["timestamp"]) <= date_range["endTime"]
+            )
+        ]
+        page.sort(key=lambda e: e["timestamp"], reverse=descending)
+        start = request.json["page"] * request.json["pageSize"]
+        end = start + request.json["pageSize"]
+        return Response(json.dumps({"events": page[start:end]}))
+
+    return handler
+
+
+# three events share a timestamp, more than fit on one page
+TIME_SLIDING_EVENTS = [
+    dict(TEST_AL_ENTRY_1, resourceId=str(i), timestamp=ts)
+    for i, ts in enumerate(
+        [
+            "2022-10-03T13:14:46.001Z",
+            "2022-10-03T13:14:46.002Z",
+            "2022-10-03T13:14:46.002Z",
+            "2022-10-03T13:14:46.002Z",
+            "2022-10-03T13:14:46.003Z",
+            "2022-10-03T13:14:46.004Z",
+            "2022-10-03T13:14:46.004Z",
+        ]
+    )
+]
+
+
+@pytest.mark.parametrize(
+    "descending, expected_pages",
+    [
+        (
+            True,
+            [(0, None), (1, None), (0, ".002"), (1, ".002"), (0, ".001")],
+        ),
+        (
+            False,
+            [
+                (0, None),
+                (0, ".002"),
+                (1, ".002"),
+                (0, ".003"),
+                (0, ".004"),
+                (1, ".004"),
+            ],
+        ),
+    ],
+)
+def test_iter_all_when_paginate_by_time_returns_each_event_once(
+    httpserver_auth: HTTPServer, descending, expected_pages
+):
+    requests = []
+    httpserver_auth.expect_request(
+        "/v1/audit/search-audit-log", method="POST"
+    ).respond_with_handler(
+        _audit_log_handler(TIME_SLIDING_EVENTS, requests, descending=descending)
+    )
+
+    client = Client()
+    events = list(client.audit_log.v1.iter_all(page_size=2, paginate_by_time=True))
+
+    expected = sorted(
+        TIME_SLIDING_EVENTS, key=lambda e: e["timestamp"], reverse=descending
+    )
+    assert sorted(e["resourceId"] for e in events) == [
+        e["resourceId"] for e in TIME_SLIDING_EVENTS
+    ]
+    assert [e["timestamp"] for e in events] == [e["timestamp"] for e in expected]
+    # the date range moves with each page, only stepping past a page when one timestamp fills it
+    bound = "endTime" if descending else "startTime"
+    assert [(r["page"], r["dateRange"][bound]) for r in requests] == [
+        (page, parse_ts_to_posix_ts(f"2022-10-03T13:14:46{ms}Z") if ms else None)
+        for page, ms in expected_pages
+    ]
+
+
+def test_cli_search_when_paginate_by_time_returns_each_event_once(
+    httpserver_auth: HTTPServer, runner
+):
+    requests = []
+    httpserver_auth.expect_request(
+        "/v1/audit/search-audit-log", method="POST"
+    ).respond_with_handler(_audit_log_handler(TIME_SLIDING_EVENTS, requests))
+
+    result = runner.invoke(
+        incydr,
+        [
+            "audit-log",
+            "search",
+            "--paginate-by-time",
+            "--page-size",
+            "2",
+            "-f",
+            "json_lines",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    printed = [json.loads(line) for line in result.output.splitlines()]
+    assert sorted(e["resourceId"] for e in printed) == [
+        e["resourceId"] for e in TIME_SLIDING_EVENTS
+    ]
+    assert all(r["pageSize"] == 2 for r in requests)
+
+
+EXPORT_EVENTS = [
+    {"timestamp": ts, "type": "audit_log::logged_in/1", "actorName": f"user{i}"}
+    for i, ts in enumerate(
+        [
+            "2022-10-01T00:00:00.000Z",
+            "2022-10-01T06:00:00.000Z",
+            "2022-10-02T00:00:00.000Z",
+            "2022-10-02T12:00:00.000Z",
+            "2022-10-02T18:00:00.000Z",
+            "2022-10-03T00:00:00.000Z",
+            "2022-10-04T00:00:00.000Z",
+        ]
+    )
+]
+
+
+@pytest.fixture
+def mock_partitioned_export(httpserver_auth: HTTPServer):
+    """Serves `EXPORT_EVENTS` from the count, export and download endpoints, filtered by each request's date range."""
+
+    def in_range(date_range):
+        return [
+            e
+            for e in EXPORT_EVENTS
+            if date_range["startTime"]
+            <= parse_ts_to_posix_ts(e["timestamp"])
+            <= date_range["endTime"]
+        ]
+
+    def count_handler(request):
+        return Response(
+            json.dumps({"totalResultCount": len(in_range(request.json["dateRange"]))})
+        )
+
+    def export_handler(request):
+        return Response(json.dumps({"downloadToken": json.dumps(request.json)}))
+
+    def download_handler(request):
+        date_range = json.loads(request.args["downloadToken"])["dateRange"]
+        rows = ["timestamp,type,actorName"] + [
+            f"{e['timestamp']},{e['type']},{e['actorName']}"
+            # exports are newest first
+            for e in reversed(in_range(date_range))
+        ]
+        return Response("\n".join(rows) + "\n", content_type="text/csv")
+
+    httpserver_auth.expect_request(
+        "/v1/audit/search-results-count", method="POST"
+    ).respond_with_handler(count_handler)
+    httpserver_auth.expect_request(
+        "/v1/audit/export", method="POST"
+    ).respond_with_handler(export_handler)
+    httpserver_auth.expect_request(
+        "/v1/audit/redeem-download-token"
+    ).respond_with_handler(download_handler)
+
+
+def test_export_events_merges_partitions_into_time_ordered_files(
+    mock_partitioned_export, tmp_path
+):
+    client = Client()
+    targets = client.audit_log.v1.export_events(
+        tmp_path,
+        start_time="2022-10-01",
+        end_time="2022-10-05",
+        formats=["csv", "jsonl"],
+        partition_size=2,
+    )
+    assert [t.name for t in targets] == [
+        "AuditLog_Export_20221001T000000Z-20221005T000000Z.csv",
+        "AuditLog_Export_20221001T000000Z-20221005T000000Z.jsonl",
+    ]
+    with open(targets[0], newline="") as f:
+        assert list(csv.DictReader(f)) == EXPORT_EVENTS
+    with open(targets[1]) as f:
+        assert [json.loads(line) for line in f] == EXPORT_EVENTS
+    # only the merged files are left behind
+    assert sorted(tmp_path.iterdir()) == sorted(targets)
+
+
+def test_export_events_when_unknown_format_raises_value_error(
+    httpserver_auth: HTTPServer, tmp_path
+):
+    client = Client()
+    with pytest.raises(ValueError):
+        client.audit_log.v1.export_events(tmp_path, "2022-10-01", formats="xlsx")
+
+
+def test_partition_date_range_splits_ranges_until_under_max_events():
+    timestamps = [parse_ts_to_posix_ts(e["timestamp"]) for e in EXPORT_EVENTS]
+
+    def count_events(start, end):
+        return len([t for t in timestamps if start.timestamp() <= t <= end.timestamp()])
+
+    start = datetime.datetime(2022, 10, 1, tzinfo=datetime.timezone.utc)
+    end = datetime.datetime(2022, 10, 5, tzinfo=datetime.timezone.utc)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        partitions = partition_date_range(count_events, start, end, 2, executor)
+
+    assert all(count_events(s, e) <= 2 for s, e in partitions)
+    assert partitions[0][0] == start
+    assert all(a[1] <= b[0] for a, b in zip(partitions, partitions[1:]))
+    covered = {
+        t
+        for t in timestamps
+        for s, e in partitions
+        if s.timestamp() <= t <= e.timestamp()
+    }
+    assert covered == set(timestamps)
+
+
+def test_cli_export_makes_expected_calls(runner, mock_partitioned_export, tmp_path):
+    result = runner.invoke(
+        incydr,
+        [
+            "audit-log",
+            "export",
+            "--start",
+            "2022-10-01",
+            "--end",
+            "2022-10-05",
+            "--path",
+            str(tmp_path),
+            "-f",
+            "jsonl",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    target = tmp_path / "AuditLog_Export_20221001T000000Z-20221005T000000Z.jsonl"
+    assert "Audit log events exported to" in result.output
+    with open(target) as f:
+        assert [json.loads(line) for line in f] == EXPORT_EVENTS
@@ -1,16 +1,19 @@
 import datetime
 import json
+import re
 from copy import copy
 from urllib.parse import urlencode
 
 import pytest
 from pydantic import ValidationError
 from pytest_httpserver import HTTPServer
+from werkzeug import Response
 
 from _incydr_cli.main import incydr
 from _incydr_sdk.cases.models import Case
 from _incydr_sdk.cases.models import CaseDetail
 from _incydr_sdk.cases.models import CaseFileEvents
+from _incydr_sdk.cases.models import CaseFileEventsUpdate
 from _incydr_sdk.cases.models import CasesPage
 from _incydr_sdk.cases.models import FileEvent
 from _incydr_sdk.file_events.models.event import FileEventV2
@@ -885,8 +888,15 @@ def test_cli_list_file_events_makes_expected_call(runner, httpserver_auth: HTTPS
     assert result.exit_code == 0
 
 
+@pytest.fixture
+def mock_no_case_file_events(httpserver_auth: HTTPServer):
+    httpserver_auth.expect_request(
+        f"/v1/cases/{TEST_CASE_NUMBER}/fileevent", method="GET"
+    ).respond_with_json({"events": [], "totalCount": 0})
+
+
 def test_cli_file_events_add_when_event_ids_list_makes_expected_call(
-    runner, httpserver_auth: HTTPServer, tmp_path
+    runner, httpserver_auth: HTTPServer, mock_no_case_file_events, tmp_path
 ):
     event_ids = ["event-1", "event-2", "event-3"]
 
@@ -903,7 +913,7 @@ def test_cli_file_events_add_when_event_ids_list_makes_expected_call(
 
 
 def test_cli_file_events_add_when_csv_makes_expected_call(
-    runner, httpserver_auth: HTTPServer, tmp_path
+    runner, httpserver_auth: HTTPServer, mock_no_case_file_events, tmp_path
 ):
     event_ids = ["event-1", "event-2", "event-3"]
     p = tmp_path / "event_ids.csv"
@@ -923,7 +933,7 @@ def test_cli_file_events_add_when_csv_makes_expected_call(
 
 
 def test_cli_file_events_add_when_jsonlines_makes_expected_call(
-    runner, httpserver_auth: HTTPServer, tmp_path
+    runner, httpserver_auth: HTTPServer, mock_no_case_file_events, tmp_path
 ):
     event_ids = ["event-1", "event-2", "event-3"]
     p = tmp_path / "event_ids.json"
@@ -955,11 +965,11 @@ def test_cli_file_events_add_when_jsonlines_makes_expected_call(
 def test_cli_file_events_remove_when_event_ids_makes_expected_call(
     runner, httpserver_auth: HTTPServer
 ):
-    httpserver_auth.expect_ordered_request(
+    httpserver_auth.expect_request(
         f"/v1/cases/{TEST_CASE_NUMBER}/fileevent/event-1",
         method="DELETE",
     ).respond_with_data()
-    httpserver_auth.expect_ordered_request(
+    httpserver_auth.expect_request(
         f"/v1/cases/{TEST_CASE_NUMBER}/fileevent/event-2",
         method="DELETE",
     ).respond_with_data()
@@ -976,11 +986,11 @@ def test_cli_file_events_remove_when_csv_makes_expected_call(
     p = tmp_path / "event_ids.csv"
     p.write_text("event_id\nevent-1\nevent-2")
 
-    httpserver_auth.expect_ordered_request(
+    httpserver_auth.expect_request(
         f"/v1/cases/{TEST_CASE_NUMBER}/fileevent/event-1",
         method="DELETE",
     ).respond_with_data()
-    httpserver_auth.expect_ordered_request(
+    httpserver_auth.expect_request(
         f"/v1/cases/{TEST_CASE_NUMBER}/fileevent/event-2",
         method="DELETE",
     ).respond_with_data()
@@ -1008,15 +1018,15 @@ def test_cli_file_events_remove_when_jsonlines_makes_expected_call(
         """{"event_id": "event-1"}\n{"eventId": "event-2"}\n{"event": {"id": "event-3"}}"""
     )
 
-    httpserver_auth.expect_ordered_request(
+    httpserver_auth.expect_request(
         f"/v1/cases/{TEST_CASE_NUMBER}/fileevent/event-1",
         method="DELETE",
     ).respond_with_data()
-    httpserver_auth.expect_ordered_request(
+    httpserver_auth.expect_request(
         f"/v1/cases/{TEST_CASE_NUMBER}/fileevent/event-2",
         method="DELETE",
     ).respond_with_data()
-    httpserver_auth.expect_ordered_request(
+    httpserver_auth.expect_request(
         f"/v1/cases/{TEST_CASE_NUMBER}/fileevent/event-3",
         method="DELETE",
     ).respond_with_data()
@@ -1034,3 +1044,86 @@ def test_cli_file_events_remove_when_jsonlines_makes_expected_call(
     )
     httpserver_auth.check()
     assert result.exit_code == 0
+
+
+@pytest.fixture
+def mock_attach_file_events(httpserver_auth: HTTPServer):
+    """Records attached event IDs, rejecting batches that contain 'bad-*' event IDs."""
+    attached = []
+
+    def handler(request):
+        events = request.json["events"]
+        if any(e.startswith("bad") for e in events):
+            return Response("Invalid event", status=400)
+        attached.append(events)
+        return Response()
+
+    existing = {"events": [TEST_FILE_EVENT], "totalCount": 1}
+    httpserver_auth.expect_request(
+        f"/v1/cases/{TEST_CASE_NUMBER}/fileevent", method="GET"
+    ).respond_with_json(existing)
+    httpserver_auth.expect_request(
+        f"/v1/cases/{TEST_CASE_NUMBER}/fileevent", method="POST"
+    ).respond_with_handler(handler)
+    return attached
+
+
+def test_attach_file_events_skips_existing_and_batches(mock_attach_file_events):
+    event_ids = [TEST_EVENT_ID] + [f"event-{i}" for i in range(250)]
+    client = Client()
+    result = client.cases.v1.attach_file_events(TEST_CASE_NUMBER, iter(event_ids))
+
+    assert isinstance(result, CaseFileEventsUpdate)
+    assert result.updated == event_ids[1:]
+    assert result.skipped == [TEST_EVENT_ID]
+    assert [len(batch) for batch in mock_attach_file_events] == [100, 100, 50]
+
+
+def test_attach_file_events_when_batch_rejected_reports_failed_events(
+    mock_attach_file_events,
+):
+    event_ids = [f"event-{i}" for i in range(6)] + ["bad-1"]
+    client = Client()
+    result = client.cases.v1.attach_file_events(
+        TEST_CASE_NUMBER, event_ids, skip_existing=False
+    )
+
+    assert result.updated == event_ids[:-1]
+    assert result.failed == {"bad-1": "400: Invalid event"}
+
+
+def test_detach_file_events_reports_result_for_each_event(httpserver_auth: HTTPServer):
+    def handler(request):
+        event_id = request.path.rsplit("/", 1)[-1]
+        if event_id == "missing":
+            return Response(status=404)
+        if event_id == "error":
+            return Response("Server error", status=500)
+        return Response()
+
+    httpserver_auth.expect_request(
+        re.compile(f"/v1/cases/{TEST_CASE_NUMBER}/fileevent/.+"), method="DELETE"
+    ).respond_with_handler(handler)
+
+    event_ids = [f"event-{i}" for i in range(20)] + ["missing", "error", "event-1"]
+    client = Client()
+    result = client.cases.v1.detach_file_events(
+        TEST_CASE_NUMBER, event_ids, max_workers=4
+    )
+
+    assert result.updated == [f"event-{i}" for i in range(20)]
+    assert sorted(result.skipped) == ["event-1", "missing"]
+    assert result.failed == {"error": "500: Server error"}
+    assert len(httpserver_auth.log) == 23
+
+
+def test_cli_file_events_add_prints_failed_events(mock_attach_file_events, runner):
+    result = runner.invoke(
+        incydr,
+        ["cases", "file-events", "add", TEST_CASE_NUMBER, f"{TEST_EVENT_ID},e-1,bad-1"],
+    )
+    assert result.exit_code == 0
+    assert mock_attach_file_events == [["e-1"]]
+    assert "1 events added to case 42" in result.output
+    assert "1 events were already attached to case 42" in result.output
+    assert "Error adding event: bad-1 (400: Invalid event)" in result.output
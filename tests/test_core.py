@@ -1,4 +1,6 @@
 from io import StringIO
+from typing import List
+from typing import Optional
 
 import pytest
 from pydantic import Field
@@ -6,9 +8,16 @@ from pytest_httpserver import HTTPServer
 
 from .conftest import TEST_HOST
 from .conftest import TEST_TOKEN
+from _incydr_cli.file_readers import detect_encoding
 from _incydr_sdk.core.auth import RefreshTokenAuth
+from _incydr_sdk.core.codec import get_codec
+from _incydr_sdk.core.codec import JSONCodec
+from _incydr_sdk.core.history import ResponseRecord
+from _incydr_sdk.core.history import url_template
+from _incydr_sdk.core.models import compact_record_type
 from _incydr_sdk.core.models import CSVModel
 from _incydr_sdk.core.models import Model
+from _incydr_sdk.core.models import ResponseModel
 from _incydr_sdk.core.settings import IncydrSettings
 from _incydr_sdk.exceptions import AuthMissingError
 from incydr import Client
@@ -123,6 +132,50 @@ def test_json_lines_model_parsing():
     assert "Input should be a valid integer" in str(err.value)
 
 
+def test_csv_model_parsing_with_on_error_reports_invalid_rows_and_continues():
+    class Test(CSVModel):
+        required_field: str = Field(csv_aliases=["required_field", "RF"])
+
+    # more rows than are validated at once, so that later chunks are parsed after an invalid one
+    rows = [f"{i},x" for i in range(2500)]
+    rows[1200] = ",x"
+    csv_file = StringIO("RF,other\n" + "\n".join(rows) + "\n")
+    errors = []
+
+    parsed = list(Test.parse_csv(csv_file, on_error=lambda *args: errors.append(args)))
+
+    assert len(parsed) == 2499
+    assert parsed[-1].required_field == "2499"
+    assert errors[0][0] == 1201
+    assert errors[0][1].startswith("Missing data on CSV row 1201:")
+
+
+def test_json_lines_model_parsing_with_on_error_reports_invalid_lines_and_continues():
+    class Test(Model):
+        field_1: str
+
+    json_lines = StringIO(
+        """{"field_1": "a"}\nnot json\n\n{"field_1": 1}\n{"field_1": "b"}\n"""
+    )
+    errors = []
+
+    parsed = list(
+        Test.parse_json_lines(json_lines, on_error=lambda *args: errors.append(args))
+    )
+
+    assert [p.field_1 for p in parsed] == ["a", "b"]
+    assert [line for line, _ in errors] == [2, 4]
+    assert errors[0][1].startswith("Unable to parse line 2.")
+    assert errors[1][1].startswith("Error parsing object on line 4:")
+
+
+def test_detect_encoding_reads_only_sample(tmp_path):
+    path = tmp_path / "users.csv"
+    path.write_bytes(b"username\n" + b"a@example.com\n" * 10000 + "é\n".encode())
+
+    assert detect_encoding(str(path), sample_size=1024) == "utf-8"
+
+
 def test_user_agent(httpserver_auth: HTTPServer):
     c = Client()
     assert c._session.headers["User-Agent"].startswith("incydrSDK")
@@ -243,3 +296,141 @@ def test_client_prefers_refresh_token_auth_when_both_auth_methods_provided(
 
     c = Client()
     assert isinstance(c._session.auth, RefreshTokenAuth)
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_json_codec_round_trips_documents(name):
+    if name != "json":
+        pytest.importorskip(name)
+    codec = get_codec(name)
+    doc = {"fileEvents": [{"event": {"id": "1"}, "risk": {"score": 5}}], "ok": True}
+    assert codec.loads(codec.dumps_bytes(doc)) == doc
+    assert codec.loads(codec.dumps(doc)) == doc
+
+
+def test_get_codec_when_auto_prefers_installed_fast_codec():
+    codec = get_codec("auto")
+    try:
+        import orjson  # noqa: F401
+
+        assert codec.name == "orjson"
+    except ImportError:
+        assert codec.name in ("msgspec", "json")
+
+
+def test_settings_with_unknown_json_codec_raises_value_error():
+    with pytest.raises(ValueError):
+        IncydrSettings(url=TEST_HOST, json_codec="yaml")
+
+
+def test_client_encodes_request_bodies_with_json_codec(httpserver_auth: HTTPServer):
+    class RecordingCodec(JSONCodec):
+        encoded = []
+
+        def dumps_bytes(self, obj):
+            self.encoded.append(obj)
+            return super().dumps_bytes(obj)
+
+    httpserver_auth.expect_request(
+        "/v1/test", method="POST", json={"a": [1, 2]}
+    ).respond_with_json({"ok": True})
+    client = Client(json_codec="json")
+    client.session.codec = RecordingCodec()
+    response = client.session.post("/v1/test", json={"a": [1, 2]})
+
+    assert response.request.headers["Content-Type"] == "application/json"
+    assert RecordingCodec.encoded == [{"a": [1, 2]}]
+    assert client.json_codec.loads(response.content) == {"ok": True}
+
+
+class Item(Model):
+    item_id: str = Field(alias="itemId")
+    score: Optional[int] = None
+
+
+class ItemsPage(ResponseModel):
+    items: Optional[List[Item]] = None
+    total_count: int = Field(alias="totalCount")
+
+
+class MockResponse:
+    content = b'{"items": [{"itemId": "1", "score": "not validated"}], "totalCount": 1}'
+
+
+@pytest.mark.parametrize(
+    "record_format, expected",
+    [
+        ("dict", {"itemId": "1", "score": "not validated"}),
+        ("compact", ("1", "not validated")),
+    ],
+)
+def test_parse_response_with_record_format_skips_validating_records(
+    record_format, expected
+):
+    page = ItemsPage.parse_response(
+        MockResponse(), record_format=record_format, records="items"
+    )
+    assert page.items == [expected]
+    assert page.total_count == 1
+
+
+def test_compact_record_type_has_model_fields():
+    record_type = compact_record_type(Item)
+    assert record_type is compact_record_type(Item)
+    assert record_type._fields == ("item_id", "score")
+    assert record_type("1")._asdict() == {"item_id": "1", "score": None}
+
+
+def test_parse_response_with_unknown_record_format_raises_value_error():
+    with pytest.raises(ValueError):
+        ItemsPage.parse_response(MockResponse(), record_format="rows", records="items")
+
+
+def test_request_history_records_response_metadata(httpserver_auth: HTTPServer):
+    httpserver_auth.expect_request(
+        "/v1/cases/42/fileevent", method="POST"
+    ).respond_with_data("x" * 1000)
+    client = Client()
+    client.session.post("/v1/cases/42/fileevent", json={"a": 1}, params={"q": 1})
+
+    record = client.request_history[0]
+    assert isinstance(record, ResponseRecord)
+    assert record.method == "POST"
+    assert record.url == f"{TEST_HOST}/v1/cases/42/fileevent?q=1"
+    assert record.url_template == "/v1/cases/{id}/fileevent"
+    assert record.status_code == 200
+    assert record.ok
+    assert record.request_size == len(client.json_codec.dumps_bytes({"a": 1}))
+    assert record.response_size == 1000
+    assert record.preview == "x" * ResponseRecord.preview_size
+    # the token response's body isn't previewed
+    assert client.request_history[1].url_template == "/v1/oauth"
+    assert client.request_history[1].preview == ""
+
+
+def test_request_history_with_response_history_bodies_keeps_responses(
+    httpserver_auth: HTTPServer,
+):
+    httpserver_auth.expect_request("/v1/test").respond_with_json({"ok": True})
+    client = Client(response_history_bodies=True)
+    client.session.get("/v1/test")
+    assert client.request_history[0].json() == {"ok": True}
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://h/v2/file-events?x=1", "/v2/file-events"),
+        ("https://h/v1/actors/actor/id/1234", "/v1/actors/actor/id/{id}"),
+        (
+            "https://h/v1/watchlists/3a6b1c5e-0b4c-4f8e-9a1e-2c3d4e5f6a7b/members",
+            "/v1/watchlists/{id}/members",
+        ),
+        (
+            "https://h/v1/actors/actor/name/engineer@example.com",
+            "/v1/actors/actor/name/{id}",
+        ),
+    ],
+)
+def test_url_template_replaces_ids(url, expected):
+    assert url_template(url) == expected
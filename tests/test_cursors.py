@@ -5,6 +5,7 @@ import pytest
 
 from _incydr_cli import get_user_project_path
 from _incydr_cli.cursor import CursorStore
+from _incydr_cli.cursor import MemoryCursorStore
 
 CURSOR_NAME = "testcursor"
 EVENT_KEY = "events"
@@ -212,3 +213,29 @@ class TestBaseCursorStore:
         mock_open_events.return_value.write.assert_called_once_with(
             '["hash1", "hash2"]'
         )
+
+
+def test_memory_cursor_store_when_no_store_keeps_checkpoints_in_memory():
+    cursor = MemoryCursorStore()
+    assert cursor.get(CURSOR_NAME) is None
+    assert cursor.get_items(CURSOR_NAME) == []
+    cursor.replace(CURSOR_NAME, 123)
+    cursor.replace_items(CURSOR_NAME, ["a", "b"])
+    assert cursor.get(CURSOR_NAME) == "123"
+    assert cursor.get_items(CURSOR_NAME) == ["a", "b"]
+
+
+def test_memory_cursor_store_reads_from_and_writes_through_to_store(mocker):
+    store = mocker.MagicMock(spec=CursorStore)
+    store.get.return_value = "100"
+    store.get_items.return_value = ["a"]
+    cursor = MemoryCursorStore(store)
+    assert cursor.get(CURSOR_NAME) == "100"
+    assert cursor.get_items(CURSOR_NAME) == ["a"]
+    cursor.replace(CURSOR_NAME, 200)
+    cursor.replace_items(CURSOR_NAME, ["b"])
+    assert cursor.get(CURSOR_NAME) == "200"
+    assert cursor.get_items(CURSOR_NAME) == ["b"]
+    store.replace.assert_called_once_with(CURSOR_NAME, 200)
+    store.replace_items.assert_called_once_with(CURSOR_NAME, ["b"])
+    store.get.assert_called_once_with(CURSOR_NAME)
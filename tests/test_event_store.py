@@ -0,0 +1,273 @@
+import gzip
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Response
+
+from _incydr_cli.cmds.options.output_options import TableFormat
+from _incydr_cli.main import incydr
+from _incydr_sdk.event_store.reader import SegmentReader
+from _incydr_sdk.event_store.store import BloomFilter
+from incydr import Client
+from incydr import EventQuery
+from incydr import EventStore
+from tests.test_file_events import TEST_EVENT_1
+from tests.test_file_events import TEST_EVENT_2
+
+
+def make_events(n, day=1):
+    for i in range(n):
+        yield {
+            "@timestamp": f"2024-01-{day:02}T{i % 24:02}:00:00.000Z",
+            "event": {"id": f"event-{day}-{i}", "action": "file-created"},
+            "user": {"email": f"user{i % 5}@example.com"},
+            "file": {"hash": {"sha256": f"hash-{i}"}},
+        }
+
+
+@pytest.mark.parametrize("compression", ["gzip", None])
+def test_append_stores_events_by_day_and_skips_stored_ids(tmp_path, compression):
+    with EventStore(tmp_path, compression=compression) as store:
+        assert store.append(make_events(10, day=1)) == 10
+        assert store.append(list(make_events(10, day=2)) + [TEST_EVENT_1]) == 11
+        # appending the same events again stores nothing
+        assert store.append(make_events(10, day=1)) == 0
+
+        segments = store.segments()
+        assert [s.partition for s in segments] == [
+            "2022-07-14",
+            "2024-01-01",
+            "2024-01-02",
+        ]
+        assert [s.events for s in segments] == [1, 10, 10]
+        assert segments[1].start == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert segments[1].end == datetime(2024, 1, 1, 9, tzinfo=timezone.utc)
+        assert len(list(store.search(EventQuery("P100000D")))) == 21
+
+        assert store.get("event-2-3")["user"]["email"] == "user3@example.com"
+        assert store.get(TEST_EVENT_1["event"]["id"]) == TEST_EVENT_1
+        assert store.get("missing") is None
+        assert "event-1-0" in store
+
+
+def test_append_splits_partitions_into_segments_of_segment_events(tmp_path):
+    with EventStore(tmp_path, segment_events=4) as store:
+        assert store.append(make_events(10)) == 10
+        assert [s.events for s in store.segments()] == [4, 4, 2]
+
+
+def test_search_skips_segments_outside_time_range_or_without_term_values(tmp_path):
+    with EventStore(tmp_path) as store:
+        store.append(make_events(10, day=1))
+        store.append(make_events(10, day=2))
+        store.append(make_events(10, day=3))
+
+        by_time = EventQuery(
+            start_date="2024-01-02T00:00:00Z", end_date="2024-01-02T23:59:59Z"
+        )
+        assert [s.partition for s in store.segments(by_time)] == ["2024-01-02"]
+        assert len(list(store.search(by_time))) == 10
+
+        by_hash = EventQuery(start_date="2024-01-01T00:00:00Z").equals(
+            "file.hash.sha256", "hash-3"
+        )
+        # every day has hash-3, but none of them have hash-30
+        assert len(store.segments(by_hash)) == 3
+        assert [e["event"]["id"] for e in store.search(by_hash)] == [
+            "event-1-3",
+            "event-2-3",
+            "event-3-3",
+        ]
+        missing = EventQuery(start_date="2024-01-01T00:00:00Z").equals(
+            "file.hash.sha256", "hash-30"
+        )
+        assert store.segments(missing) == []
+
+        # segments can't be ruled out by a filter in only one branch of an OR
+        either = EventQuery(start_date="2024-01-01T00:00:00Z")
+        either.group_clause = "OR"
+        either = either.equals("file.hash.sha256", "hash-30")
+        assert len(store.segments(either)) == 3
+
+
+def test_search_prunes_segments_with_values_matched_like_filters(tmp_path):
+    events = list(make_events(10))
+    for i, event in enumerate(events):
+        event["risk"] = {"trusted": i % 2 == 0}
+    with EventStore(
+        tmp_path, segment_events=2, bloom_terms=["risk.trusted", "user.email"]
+    ) as store:
+        store.append(events)
+
+        assert len(list(store.search(EventQuery().equals("risk.trusted", "true")))) == 5
+        assert (
+            len(list(store.search(EventQuery().equals("risk.trusted", "FALSE")))) == 5
+        )
+        query = EventQuery().equals("user.email", "USER1@example.com")
+        assert [e["event"]["id"] for e in store.search(query)] == [
+            "event-1-1",
+            "event-1-6",
+        ]
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter.for_capacity(1000)
+    for i in range(1000):
+        bloom.add(f"value-{i}")
+
+    assert all(f"value-{i}" in bloom for i in range(1000))
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_sync_with_checkpoint_resumes_after_last_stored_event(
+    httpserver_auth: HTTPServer, tmp_path
+):
+    page_tokens = []
+    events = [TEST_EVENT_1]
+
+    def handler(request):
+        page_tokens.append(json.loads(request.data)["pgToken"])
+        page = {"fileEvents": events, "nextPgToken": None, "totalCount": 1}
+        return Response(json.dumps(page), content_type="application/json")
+
+    httpserver_auth.expect_request(
+        "/v2/file-events", method="POST"
+    ).respond_with_handler(handler)
+
+    client = Client()
+    with EventStore(tmp_path) as store:
+        assert store.sync(client, EventQuery("P1D"), checkpoint="test") == 1
+        events = [TEST_EVENT_2]
+        assert store.sync(client, EventQuery("P1D"), checkpoint="test") == 1
+        assert store.get(TEST_EVENT_2["event"]["id"]) == TEST_EVENT_2
+
+    assert page_tokens == ["", TEST_EVENT_1["event"]["id"]]
+
+
+def test_cli_search_with_store_stores_events_to_filter_later(
+    httpserver_auth: HTTPServer, runner, tmp_path
+):
+    page = {"fileEvents": [TEST_EVENT_1, TEST_EVENT_2], "nextPgToken": None}
+    httpserver_auth.expect_request("/v2/file-events", method="POST").respond_with_json(
+        page
+    )
+    store_dir = str(tmp_path / "store")
+
+    result = runner.invoke(
+        incydr,
+        [
+            "file-events",
+            "search",
+            "--start",
+            "P10D",
+            "--store",
+            store_dir,
+            "-f",
+            TableFormat.json_lines,
+        ],
+    )
+    assert result.exit_code == 0, result.output
+
+    result = runner.invoke(
+        incydr,
+        [
+            "file-events",
+            "filter",
+            store_dir,
+            "--file-category",
+            "Archive",
+            "-f",
+            TableFormat.json_lines,
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line) for line in result.output.splitlines()] == [TEST_EVENT_2]
+
+
+def test_cli_filter_when_directory_not_event_store_raises_error(runner, tmp_path):
+    result = runner.invoke(incydr, ["file-events", "filter", str(tmp_path)])
+    assert result.exit_code == 2
+    assert "is not an event store" in result.output
+
+
+def test_segment_reader_returns_views_of_each_line(tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.write_bytes(b'{"a": 1}\n\n  \n{"a": 2}\r\n{"a": 3}')
+
+    with SegmentReader(path) as reader:
+        lines = list(reader.iter_raw())
+        assert all(isinstance(line, memoryview) for line in lines)
+        assert [bytes(line) for line in lines] == [
+            b'{"a": 1}',
+            b'{"a": 2}\r',
+            b'{"a": 3}',
+        ]
+        assert list(reader.iter_events()) == [{"a": 1}, {"a": 2}, {"a": 3}]
+        assert bytes(reader.line_at(reader.offsets[3])) == b'{"a": 2}\r'
+        assert len(reader) == 5
+        assert bytes(reader[4]) == b'{"a": 3}'
+        kept = reader[0]
+
+    # views still referenced when the reader is closed stay valid
+    assert bytes(kept) == b'{"a": 1}'
+
+
+def test_segment_reader_split_ranges_can_be_read_in_parallel(tmp_path):
+    path = tmp_path / "events.jsonl.gz"
+    with gzip.open(path, "wb") as f:
+        for event in make_events(1000):
+            f.write(json.dumps(event).encode() + b"\n")
+
+    with SegmentReader(path) as reader:
+        ranges = reader.split(4)
+        expected = list(reader.iter_events())
+
+    assert len(ranges) == 4
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+
+    def read_range(bounds):
+        with SegmentReader(path) as reader:
+            return list(reader.iter_events(*bounds))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parts = list(executor.map(read_range, ranges))
+
+    assert [e for part in parts for e in part] == expected == list(make_events(1000))
+
+
+def test_search_raw_yields_stored_json_of_matching_events(tmp_path):
+    with EventStore(tmp_path, compression=None) as store:
+        store.append([TEST_EVENT_1, TEST_EVENT_2])
+        query = EventQuery(start_date="2022-01-01T00:00:00Z").equals(
+            "file.category", "Archive"
+        )
+        lines = [bytes(line) for line in store.search_raw(query)]
+        unfiltered = [bytes(line) for line in store.search_raw(EventQuery())]
+
+    assert [json.loads(line) for line in lines] == [TEST_EVENT_2]
+    assert len(unfiltered) == 2
+
+
+def test_cli_filter_with_output_forwards_stored_json(runner, tmp_path):
+    events_file = tmp_path / "events.jsonl"
+    lines = [json.dumps(e, separators=(",", ":")) for e in (TEST_EVENT_1, TEST_EVENT_2)]
+    events_file.write_text("\n".join(lines) + "\n")
+
+    result = runner.invoke(
+        incydr,
+        [
+            "file-events",
+            "filter",
+            str(events_file),
+            "--output",
+            f"file:{tmp_path / 'forwarded.jsonl'}",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "forwarded-000001.jsonl").read_text() == events_file.read_text()
@@ -1,22 +1,29 @@
 import json
+import os
+import signal
 from datetime import datetime
 from datetime import timezone
+from operator import attrgetter
 from typing import List
 from unittest import mock
 
 import pytest
 from pydantic import ValidationError
 from pytest_httpserver import HTTPServer
+from werkzeug import Response
 
 from _incydr_cli.cmds.options.output_options import TableFormat
 from _incydr_cli.cursor import CursorStore
 from _incydr_cli.main import incydr
 from _incydr_sdk.core.client import Client
+from _incydr_sdk.core.codec import get_codec
 from _incydr_sdk.file_events.models.event import FileEventV2
 from _incydr_sdk.file_events.models.response import FileEventsPage
 from _incydr_sdk.file_events.models.response import SavedSearch
 from _incydr_sdk.file_events.models.response import SearchFilter
 from _incydr_sdk.file_events.models.response import SearchFilterGroup
+from _incydr_sdk.file_events.parsing import has_file_events
+from _incydr_sdk.file_events.parsing import next_page_token
 from _incydr_sdk.queries.file_events import EventQuery
 from _incydr_sdk.queries.file_events import GroupingEventQuery
 
@@ -1507,3 +1514,400 @@ def test_cli_search_groups_makes_expected_api_call(
     )
     httpserver_auth.check()
     assert result.exit_code == 0
+
+
+def test_cli_search_with_follow_resumes_from_last_event_id(
+    httpserver_auth: HTTPServer, runner
+):
+    responses = [[TEST_EVENT_1], [TEST_EVENT_2], []]
+    requests = []
+
+    def handler(request):
+        requests.append(request.json)
+        if len(requests) == len(responses):
+            # stop following once all pages have been served
+            os.kill(os.getpid(), signal.SIGINT)
+        page = responses[len(requests) - 1]
+        return Response(
+            json.dumps(
+                {
+                    "fileEvents": page,
+                    "nextPgToken": None,
+                    "problems": None,
+                    "totalCount": len(page),
+                }
+            )
+        )
+
+    httpserver_auth.expect_request(
+        "/v2/file-events", method="POST"
+    ).respond_with_handler(handler)
+
+    result = runner.invoke(
+        incydr,
+        [
+            "file-events",
+            "search",
+            "--start",
+            "2022-06-01",
+            "--follow",
+            "--poll-interval",
+            "0",
+            "-f",
+            TableFormat.json_lines,
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert [r["pgToken"] for r in requests] == [
+        "",
+        TEST_EVENT_1["event"]["id"],
+        TEST_EVENT_2["event"]["id"],
+    ]
+    printed = [json.loads(line) for line in result.output.splitlines() if "{" in line]
+    assert printed == [TEST_EVENT_1, TEST_EVENT_2]
+
+
+def test_cli_search_with_follow_and_table_format_raises_usage_error(runner):
+    result = runner.invoke(
+        incydr,
+        ["file-events", "search", "--start", "P1D", "--follow", "-f", "table"],
+    )
+    assert result.exit_code == 2
+    assert "--follow can't be used with 'table' format" in result.output
+
+
+def test_cli_search_json_lines_output_does_not_depend_on_json_codec(
+    httpserver_auth: HTTPServer, runner, monkeypatch
+):
+    pytest.importorskip("orjson")
+    monkeypatch.setenv("INCYDR_JSON_CODEC", "orjson")
+    httpserver_auth.expect_request("/v2/file-events", method="POST").respond_with_json(
+        {"fileEvents": [TEST_EVENT_1], "nextPgToken": None, "totalCount": 1}
+    )
+    result = runner.invoke(
+        incydr,
+        ["file-events", "search", "--start", "P1D", "-f", TableFormat.json_lines],
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == [json.dumps(TEST_EVENT_1)]
+
+
+def test_cli_filter_filters_events_file_without_searching(runner, tmp_path):
+    events_file = tmp_path / "events.jsonl"
+    events_file.write_text(
+        "\n".join(json.dumps(e) for e in (TEST_EVENT_1, TEST_EVENT_2))
+    )
+    result = runner.invoke(
+        incydr,
+        [
+            "file-events",
+            "filter",
+            str(events_file),
+            "--file-category",
+            "Archive",
+            "-f",
+            TableFormat.json_lines,
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line) for line in result.output.splitlines()] == [TEST_EVENT_2]
+
+    result = runner.invoke(
+        incydr,
+        ["file-events", "filter", str(events_file), "-f", TableFormat.csv],
+    )
+    assert result.exit_code == 0, result.output
+
+
+def test_search_many_merges_queries_and_routes_events(httpserver_auth: HTTPServer):
+    emails = {
+        TEST_EVENT_1["user"]["email"]: TEST_EVENT_1,
+        TEST_EVENT_2["user"]["email"]: TEST_EVENT_2,
+    }
+    requests = []
+
+    def handler(request):
+        query = json.loads(request.data)
+        requests.append(query)
+        values = query["groups"][1]["filters"][0]["value"]
+        events = [emails[v] for v in values if v in emails]
+        page = {"fileEvents": events, "nextPgToken": None, "totalCount": len(events)}
+        return Response(json.dumps(page), content_type="application/json")
+
+    httpserver_auth.expect_request(
+        "/v2/file-events", method="POST"
+    ).respond_with_handler(handler)
+
+    addresses = [TEST_EVENT_2["user"]["email"], "nobody@example.com"]
+    addresses += [TEST_EVENT_1["user"]["email"]]
+    queries = [EventQuery("P1D").equals("user.email", a) for a in addresses]
+    results = Client().file_events.v2.search_many(queries, "user.email", batch_size=2)
+
+    assert len(requests) == 2
+    assert [[e.event.id for e in events] for events in results] == [
+        [TEST_EVENT_2["event"]["id"]],
+        [],
+        [TEST_EVENT_1["event"]["id"]],
+    ]
+
+
+@pytest.mark.parametrize("parse_workers", [None, 2])
+def test_iter_all_yields_events_from_every_page_in_order(
+    httpserver_auth: HTTPServer, parse_workers
+):
+    pages = {
+        "": {"fileEvents": [TEST_EVENT_1], "nextPgToken": "page-2"},
+        "page-2": {"fileEvents": [TEST_EVENT_2], "nextPgToken": "page-3"},
+        "page-3": {"fileEvents": [TEST_EVENT_1], "nextPgToken": None},
+    }
+
+    def handler(request):
+        page = pages[json.loads(request.data)["pgToken"]]
+        return Response(json.dumps(page), content_type="application/json")
+
+    httpserver_auth.expect_request(
+        "/v2/file-events", method="POST"
+    ).respond_with_handler(handler)
+
+    client = Client()
+    query = EventQuery("P1D")
+    events = list(client.file_events.v2.iter_all(query, parse_workers=parse_workers))
+    ids = list(
+        client.file_events.v2.iter_all(
+            query, parse_workers=parse_workers, transform=attrgetter("event.id")
+        )
+    )
+
+    expected = [
+        TEST_EVENT_1["event"]["id"],
+        TEST_EVENT_2["event"]["id"],
+        TEST_EVENT_1["event"]["id"],
+    ]
+    assert [e.event.id for e in events] == expected
+    assert all(isinstance(e, FileEventV2) for e in events)
+    assert ids == expected
+    assert query.page_token == ""
+
+    raw = client.file_events.v2.iter_all(
+        query, parse_workers=parse_workers, record_format="dict"
+    )
+    assert [e["event"]["id"] for e in raw] == expected
+
+
+@pytest.mark.parametrize("parse_workers", [None, 2])
+def test_iter_all_when_page_empty_stops_despite_next_page_token(
+    httpserver_auth: HTTPServer, parse_workers
+):
+    pages = {
+        "": {"fileEvents": [TEST_EVENT_1], "nextPgToken": "page-2"},
+        "page-2": {"fileEvents": [], "nextPgToken": "page-3"},
+        "page-3": {"fileEvents": [TEST_EVENT_2], "nextPgToken": None},
+    }
+
+    def handler(request):
+        page = pages[json.loads(request.data)["pgToken"]]
+        return Response(json.dumps(page), content_type="application/json")
+
+    httpserver_auth.expect_request(
+        "/v2/file-events", method="POST"
+    ).respond_with_handler(handler)
+
+    client = Client()
+    events = client.file_events.v2.iter_all(
+        EventQuery("P1D"), parse_workers=parse_workers
+    )
+    assert [e.event.id for e in events] == [TEST_EVENT_1["event"]["id"]]
+
+
+def test_has_file_events_reads_raw_pages():
+    codec = get_codec("json")
+    event = dict(TEST_EVENT_1, file={"name": '"fileEvents": []'})
+    assert has_file_events(json.dumps({"fileEvents": [event]}).encode(), codec)
+    assert not has_file_events(b'{"fileEvents": [ ], "nextPgToken": "x"}', codec)
+    assert not has_file_events(b'{"fileEvents": null}', codec)
+
+
+def test_next_page_token_ignores_token_key_inside_strings():
+    event = dict(TEST_EVENT_1, file={"name": '"nextPgToken": "wrong"'})
+    content = json.dumps({"fileEvents": [event], "nextPgToken": "right"}).encode()
+    assert next_page_token(content, get_codec("json")) == "right"
+    content = json.dumps({"fileEvents": [], "nextPgToken": None}).encode()
+    assert next_page_token(content, get_codec("json")) is None
+
+
+@pytest.fixture
+def mock_partitioned_grouping(httpserver_auth: HTTPServer):
+    """Groups a fixed set of (timestamp, category, email) events, honoring date range and is_any filters."""
+    events = [
+        (datetime(2024, 1, 1, 1, tzinfo=timezone.utc), "Document", "a@example.com"),
+        (datetime(2024, 1, 1, 5, tzinfo=timezone.utc), "Document", "b@example.com"),
+        (datetime(2024, 1, 1, 9, tzinfo=timezone.utc), "Image", "a@example.com"),
+        (datetime(2024, 1, 1, 13, tzinfo=timezone.utc), "Image", "c@example.com"),
+        (datetime(2024, 1, 1, 17, tzinfo=timezone.utc), "Archive", "d@example.com"),
+        (datetime(2024, 1, 1, 21, tzinfo=timezone.utc), "Archive", "a@example.com"),
+    ]
+    requests = []
+
+    def handler(request):
+        query = json.loads(request.data)
+        requests.append(query)
+        matched = events
+        for group in query["groups"]:
+            for f in group["filters"]:
+                if f["operator"] == "ON_OR_AFTER":
+                    start = datetime.fromisoformat(f["value"].replace("Z", "+00:00"))
+                    matched = [e for e in matched if e[0] >= start]
+                elif f["operator"] == "ON_OR_BEFORE":
+                    end = datetime.fromisoformat(f["value"].replace("Z", "+00:00"))
+                    matched = [e for e in matched if e[0] <= end]
+                elif f["operator"] == "IS_ANY":
+                    matched = [e for e in matched if e[1] in f["value"]]
+        counts = {}
+        for e in matched:
+            counts[e[2]] = counts.get(e[2], 0) + 1
+        groups = [{"value": k, "docCount": v} for k, v in counts.items()]
+        groups = groups[: query["size"]]
+        return Response(json.dumps({"groups": groups}), content_type="application/json")
+
+    httpserver_auth.expect_request(
+        "/v2/file-events/grouping", method="POST"
+    ).respond_with_handler(handler)
+    return requests
+
+
+def test_search_groups_partitioned_splits_truncated_windows_and_merges_counts(
+    mock_partitioned_grouping,
+):
+    client = Client()
+    client.file_events.v2.max_groups = 2
+    query = GroupingEventQuery().group_by("user.email")
+    response = client.file_events.v2.search_groups_partitioned(
+        query,
+        start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        end_date=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        windows=2,
+    )
+
+    assert [(g.value, g.doc_count) for g in response.groups] == [
+        ("a@example.com", 3),
+        ("b@example.com", 1),
+        ("c@example.com", 1),
+        ("d@example.com", 1),
+    ]
+    assert response.total_groups == 4
+    assert sum(p.doc_count for p in response.partitions) == 6
+    assert not any(p.truncated for p in response.partitions)
+    # both windows returned 2 (the maximum) groups, so each was split
+    assert len(mock_partitioned_grouping) > 2
+    assert all(q["size"] == 2 for q in mock_partitioned_grouping)
+
+
+def test_search_groups_partitioned_by_values_returns_top_k(mock_partitioned_grouping):
+    client = Client()
+    query = GroupingEventQuery().group_by("user.email")
+    response = client.file_events.v2.search_groups_partitioned(
+        query,
+        partition_term="file.category",
+        partition_values=[["Document", "Image"], ["Archive"]],
+        top_k=1,
+    )
+
+    assert [(g.value, g.doc_count) for g in response.groups] == [("a@example.com", 3)]
+    assert response.total_groups == 4
+    assert [p.values for p in response.partitions] in (
+        [["Document", "Image"], ["Archive"]],
+        [["Archive"], ["Document", "Image"]],
+    )
+    assert len(mock_partitioned_grouping) == 2
+
+
+def test_cli_search_groups_with_windows_merges_partitions(
+    runner, mock_partitioned_grouping
+):
+    result = runner.invoke(
+        incydr,
+        [
+            "file-events",
+            "search-groups",
+            "--group-by",
+            "user.email",
+            "--start",
+            "2024-01-01 00:00:00",
+            "--end",
+            "2024-01-02 00:00:00",
+            "--windows",
+            "4",
+            "--top",
+            "2",
+            "-f",
+            TableFormat.json_lines,
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    groups = [json.loads(line) for line in result.output.splitlines()]
+    assert groups[0] == {"value": "a@example.com", "docCount": 3}
+    assert len(groups) == 2
+    assert len(mock_partitioned_grouping) == 4
+
+
+def test_cli_search_groups_with_windows_and_no_start_raises_usage_error(runner):
+    result = runner.invoke(
+        incydr,
+        [
+            "file-events",
+            "search-groups",
+            "--group-by",
+            "user.email",
+            "--advanced-query",
+            TEST_GROUPING_QUERY.json(),
+            "--windows",
+            "2",
+        ],
+    )
+    assert result.exit_code == 2
+    assert "--windows requires the --start option" in result.output
+
+
+def test_cli_search_with_aggregate_outputs_aggregates(
+    httpserver_auth: HTTPServer, runner
+):
+    page = {
+        "fileEvents": [TEST_EVENT_1, TEST_EVENT_2],
+        "nextPgToken": None,
+        "totalCount": 2,
+    }
+    httpserver_auth.expect_request("/v2/file-events", method="POST").respond_with_json(
+        page
+    )
+    result = runner.invoke(
+        incydr,
+        [
+            "file-events",
+            "search",
+            "--start",
+            "P1D",
+            "--aggregate",
+            "count",
+            "--aggregate",
+            "top:file.category:1",
+            "--aggregate",
+            "distinct:user.email",
+            "-f",
+            TableFormat.json_lines,
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == {
+        "count": 2,
+        "top:file.category:1": [{"value": "Spreadsheet", "count": 1, "error": 0}],
+        "distinct:user.email": 2,
+    }
+
+
+def test_cli_search_with_invalid_aggregate_raises_usage_error(runner):
+    result = runner.invoke(
+        incydr,
+        ["file-events", "search", "--start", "P1D", "--aggregate", "median:risk.score"],
+    )
+    assert result.exit_code == 2
+    assert "is not a valid aggregation" in result.output
@@ -0,0 +1,118 @@
+import json
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Response
+
+from _incydr_cli.main import incydr
+from _incydr_sdk.actors.models import Actor
+from _incydr_sdk.agents.models import Agent
+from incydr import Client
+from incydr import LocalMirror
+from tests.test_actors import CHILD_ACTOR
+from tests.test_actors import PARENT_ACTOR
+from tests.test_agents import TEST_AGENT_1
+from tests.test_devices import TEST_DEVICE_1
+from tests.test_users import TEST_USER_1
+
+
+@pytest.fixture
+def mock_inventory(httpserver_auth: HTTPServer):
+    """Serves a single page of each entity type, recording the query args of each agents request."""
+    inventory = {
+        "actors": [CHILD_ACTOR, PARENT_ACTOR],
+        "users": [TEST_USER_1],
+        "agents": [TEST_AGENT_1],
+        "devices": [TEST_DEVICE_1],
+    }
+    agent_requests = []
+
+    def respond(entity):
+        def handler(request):
+            if entity == "agents":
+                agent_requests.append(request.args.to_dict())
+            data = {entity: inventory[entity], "totalCount": len(inventory[entity])}
+            if entity == "agents":
+                data.update(pageSize=500, page=1)
+            return Response(json.dumps(data), content_type="application/json")
+
+        return handler
+
+    for entity, uri in [
+        ("actors", "/v1/actors/actor/search"),
+        ("users", "/v1/users"),
+        ("agents", "/v1/agents"),
+        ("devices", "/v1/devices"),
+    ]:
+        httpserver_auth.expect_request(uri, method="GET").respond_with_handler(
+            respond(entity)
+        )
+    inventory["agent_requests"] = agent_requests
+    return inventory
+
+
+def test_sync_stores_each_entity_type(mock_inventory):
+    with LocalMirror(Client()) as mirror:
+        written = mirror.sync()
+        assert written == {"actors": 2, "users": 1, "agents": 1, "devices": 1}
+
+        actor = mirror.get("actors", CHILD_ACTOR["actorId"])
+        assert isinstance(actor, Actor)
+        assert actor.name == CHILD_ACTOR["name"]
+        assert [
+            a.actor_id for a in mirror.find("actors", email="PARENT@email.com")
+        ] == [PARENT_ACTOR["actorId"]]
+        agents = mirror.find("agents", user_id="user-1")
+        assert [type(a) for a in agents] == [Agent]
+        assert mirror.get("devices", "device-1").name == TEST_DEVICE_1["name"]
+        assert len(list(mirror.iter_all("actors"))) == 2
+        assert mirror.last_synced("users") is not None
+
+
+def test_sync_removes_entities_no_longer_returned(mock_inventory):
+    with LocalMirror(Client()) as mirror:
+        mirror.sync(["actors"])
+        mock_inventory["actors"] = [PARENT_ACTOR]
+        mirror.sync(["actors"])
+        assert mirror.get("actors", CHILD_ACTOR["actorId"]) is None
+        assert mirror.get("actors", PARENT_ACTOR["actorId"]) is not None
+
+
+def test_sync_refreshes_agents_incrementally_after_full_sync(mock_inventory):
+    with LocalMirror(Client()) as mirror:
+        mirror.sync(["agents"])
+        mirror.sync(["agents"])
+        mirror.sync(["agents"], full=True)
+
+    requests = mock_inventory["agent_requests"]
+    assert "connectedInLastDays" not in requests[0]
+    assert requests[1]["connectedInLastDays"] == "1"
+    assert requests[2]["agentHealthModifiedInLastDays"] == "1"
+    assert "connectedInLastDays" not in requests[3]
+
+
+def test_sync_persists_mirror_to_path(mock_inventory, tmp_path):
+    path = tmp_path / "mirror.db"
+    with LocalMirror(Client(), path) as mirror:
+        mirror.sync(["users"])
+    with LocalMirror(Client(skip_auth=True), path) as mirror:
+        assert mirror.find("users", name="USERNAME-1")[0].user_id == "user-1"
+
+
+def test_find_when_unknown_entity_raises_value_error(httpserver_auth):
+    with LocalMirror(Client()) as mirror:
+        with pytest.raises(ValueError):
+            mirror.find("widgets", name="x")
+
+
+def test_cli_sync_writes_mirror(mock_inventory, runner, tmp_path):
+    path = tmp_path / "mirror.db"
+    result = runner.invoke(
+        incydr, ["sync", "--path", str(path), "--entity", "actors", "--entity", "users"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "Synced 2 actors." in result.output
+    assert "Synced 1 users." in result.output
+    with LocalMirror(Client(skip_auth=True), path) as mirror:
+        assert mirror.last_synced("agents") is None
+        assert len(mirror.find("actors")) == 2
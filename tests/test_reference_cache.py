@@ -0,0 +1,136 @@
+import json
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Response
+
+from _incydr_sdk.core.cache import ReferenceDataCache
+from _incydr_sdk.exceptions import WatchlistNotFoundError
+from incydr import Client
+from tests.test_watchlists import TEST_WATCHLIST_1
+from tests.test_watchlists import TEST_WATCHLIST_2
+from tests.test_watchlists import TEST_WATCHLIST_ID
+
+TEST_ROLE = {
+    "roleId": "desktop-user",
+    "roleName": "Desktop User",
+    "creationDate": "2021-04-09T23:13:06.641000Z",
+    "modificationDate": "2022-09-08T14:05:05.418000Z",
+    "permissions": [],
+}
+
+
+@pytest.fixture
+def watchlist_requests(httpserver_auth: HTTPServer):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        data = {"watchlists": [TEST_WATCHLIST_1, TEST_WATCHLIST_2], "totalCount": 2}
+        return Response(
+            json.dumps(data), headers={"ETag": '"v1"'}, content_type="application/json"
+        )
+
+    httpserver_auth.expect_request("/v2/watchlists", method="GET").respond_with_handler(
+        handler
+    )
+    return requests
+
+
+def test_get_id_by_name_uses_cached_watchlists(watchlist_requests):
+    client = Client()
+    assert (
+        client.watchlists.v2.get_id_by_name("DEPARTING_EMPLOYEE") == TEST_WATCHLIST_ID
+    )
+    assert client.watchlists.v2.get_id_by_name("test") == "1-watchlist-43"
+    assert len(watchlist_requests) == 1
+
+
+def test_get_id_by_name_when_not_cached_refreshes_watchlists(watchlist_requests):
+    client = Client()
+    client.watchlists.v2.get_id_by_name("DEPARTING_EMPLOYEE")
+    with pytest.raises(WatchlistNotFoundError):
+        client.watchlists.v2.get_id_by_name("missing")
+    assert len(watchlist_requests) == 2
+
+
+def test_create_watchlist_invalidates_cached_watchlists(
+    httpserver_auth: HTTPServer, watchlist_requests
+):
+    httpserver_auth.expect_request("/v2/watchlists", method="POST").respond_with_json(
+        TEST_WATCHLIST_1
+    )
+    client = Client()
+    client.watchlists.v2.get_id_by_name("DEPARTING_EMPLOYEE")
+    client.watchlists.v2.create("DEPARTING_EMPLOYEE")
+    client.watchlists.v2.get_id_by_name("DEPARTING_EMPLOYEE")
+    assert len(watchlist_requests) == 2
+
+
+def test_reference_cache_when_expired_revalidates_with_etag(
+    httpserver_auth: HTTPServer,
+):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return Response(status=304)
+        return Response(json.dumps([TEST_ROLE]), headers={"ETag": '"v1"'})
+
+    httpserver_auth.expect_request("/v1/users/roles").respond_with_handler(handler)
+    now = [0]
+    client = Client()
+    cache = ReferenceDataCache(client.session, clock=lambda: now[0])
+
+    assert cache.get_json("roles", "/v1/users/roles") == [TEST_ROLE]
+    now[0] = cache.ttls["roles"] + 1
+    assert cache.get_json("roles", "/v1/users/roles") == [TEST_ROLE]
+    assert cache.get_json("roles", "/v1/users/roles") == [TEST_ROLE]
+    assert [r.headers.get("If-None-Match") for r in requests] == [None, '"v1"']
+
+
+def test_reference_cache_dir_shares_entries_between_clients(
+    httpserver_auth: HTTPServer, tmp_path
+):
+    httpserver_auth.expect_request("/v1/users/roles").respond_with_json([TEST_ROLE])
+    client = Client(reference_cache_dir=tmp_path)
+    assert client.users.v1._get_id_by_name("Desktop User") == "desktop-user"
+
+    httpserver_auth.clear()
+    client = Client(reference_cache_dir=tmp_path, skip_auth=True)
+    assert client.users.v1._get_id_by_name("Desktop User") == "desktop-user"
+
+
+def test_list_methods_do_not_use_reference_cache(httpserver_auth: HTTPServer):
+    httpserver_auth.expect_request("/v1/users/roles").respond_with_json([TEST_ROLE])
+    httpserver_auth.expect_request("/v1/departments").respond_with_json(
+        {"departments": ["Engineering"], "totalCount": 1}
+    )
+    client = Client()
+    for _ in range(2):
+        assert client.users.v1.list_roles()[0].role_id == "desktop-user"
+        assert client.departments.v1.get_page().departments == ["Engineering"]
+    assert len(httpserver_auth.log) == 5
+
+
+def test_reference_cache_ttl_zero_disables_caching(watchlist_requests):
+    client = Client(reference_cache_ttl=0)
+    client.watchlists.v2.get_id_by_name("DEPARTING_EMPLOYEE")
+    client.watchlists.v2.get_id_by_name("DEPARTING_EMPLOYEE")
+    assert len(watchlist_requests) == 2
+
+
+def test_reference_cache_invalidate_removes_stored_entries(
+    httpserver_auth: HTTPServer, tmp_path
+):
+    httpserver_auth.expect_request("/v1/users/roles").respond_with_json([TEST_ROLE])
+    client = Client()
+    cache = ReferenceDataCache(client.session, path=tmp_path)
+    cache.get_json("roles", "/v1/users/roles")
+    assert (tmp_path / "roles.json").exists()
+
+    cache.invalidate()
+    assert not (tmp_path / "roles.json").exists()
+    assert cache.get_json("roles", "/v1/users/roles") == [TEST_ROLE]
+    assert len(httpserver_auth.log) == 3
@@ -1,4 +1,5 @@
 import json
+import re
 from datetime import datetime
 from datetime import timezone
 from unittest import mock
@@ -6,6 +7,7 @@ from urllib.parse import urlencode
 
 import pytest
 from pytest_httpserver import HTTPServer
+from werkzeug import Response
 
 from _incydr_cli.cursor import CursorStore
 from _incydr_cli.main import incydr
@@ -815,3 +817,125 @@ def test_cli_bulk_update_state_when_state_option_and_note_column_makes_expected_
     result = runner.invoke(incydr, cmd)
     httpserver_auth.check()
     assert result.exit_code == 0
+
+
+def test_iter_with_events_yields_sessions_with_events_in_order_and_caches_pages(
+    httpserver_auth: HTTPServer,
+):
+    requests = []
+
+    def handler(request):
+        session_id = request.path.split("/")[-2]
+        requests.append(session_id)
+        event = dict(TEST_EVENT_1, event=dict(TEST_EVENT_1["event"], id=session_id))
+        return Response(
+            json.dumps({"queryResult": {"fileEvents": [event], "totalCount": 1}})
+        )
+
+    httpserver_auth.expect_request(
+        re.compile("/v1/sessions/.+/events"), method="GET"
+    ).respond_with_handler(handler)
+
+    sessions = [
+        Session.parse_obj(dict(TEST_SESSION, sessionId=session_id, endTime=end_time))
+        for session_id, end_time in [
+            ("s0", 1),
+            ("s1", 1),
+            ("s2", 1),
+            # seen again without new activity
+            ("s0", 1),
+            # seen again with new activity
+            ("s1", 2),
+        ]
+    ]
+    client = Client()
+    results = list(client.sessions.v1.iter_with_events(sessions, max_workers=2))
+
+    assert [session for session, _ in results] == sessions
+    assert [events.file_events[0].event.id for _, events in results] == [
+        "s0",
+        "s1",
+        "s2",
+        "s0",
+        "s1",
+    ]
+    assert sorted(requests) == ["s0", "s1", "s1", "s2"]
+
+
+def test_cli_search_with_events_outputs_sessions_with_events(
+    httpserver_auth: HTTPServer, runner, mock_get_events
+):
+    query = {"has_alerts": "true", "page_number": 0, "page_size": 50}
+    httpserver_auth.expect_request(
+        "/v1/sessions", method="GET", query_string=urlencode(query, doseq=True)
+    ).respond_with_json({"items": [TEST_SESSION], "totalCount": 1})
+
+    result = runner.invoke(
+        incydr, ["sessions", "search", "--with-events", "-f", "json-lines"]
+    )
+    assert result.exit_code == 0, result.output
+    record = json.loads(result.output)
+    assert record["session"]["sessionId"] == TEST_SESSION_ID
+    assert [e["event"]["id"] for e in record["events"]] == [
+        TEST_EVENT_1["event"]["id"],
+        TEST_EVENT_2["event"]["id"],
+    ]
+
+
+def test_cli_search_with_events_and_table_format_raises_usage_error(runner):
+    result = runner.invoke(
+        incydr, ["sessions", "search", "--with-events", "-f", "table"]
+    )
+    assert result.exit_code == 2
+    assert "--with-events can only be used with JSON formats" in result.output
+
+
+def test_cli_search_with_events_and_checkpoint_only_stores_sessions_output(
+    httpserver_auth: HTTPServer, runner, mocker
+):
+    sessions = [
+        dict(TEST_SESSION, sessionId=session_id, endTime=end_time)
+        for session_id, end_time in [("s0", 1), ("s1", 2), ("s2", 3)]
+    ]
+    query = {"has_alerts": "true", "page_number": 0, "page_size": 50}
+    httpserver_auth.expect_request(
+        "/v1/sessions", method="GET", query_string=urlencode(query, doseq=True)
+    ).respond_with_json({"items": sessions, "totalCount": len(sessions)})
+
+    def handler(request):
+        if request.path.split("/")[-2] == "s1":
+            return Response(status=500)
+        return Response(
+            json.dumps({"queryResult": {"fileEvents": [], "totalCount": 0}})
+        )
+
+    httpserver_auth.expect_request(
+        re.compile("/v1/sessions/.+/events"), method="GET"
+    ).respond_with_handler(handler)
+
+    mock_cursor = mocker.MagicMock(spec=CursorStore)
+    mock_cursor.get.return_value = None
+    mock_cursor.get_items.return_value = []
+    with mock.patch(
+        "_incydr_cli.cmds.sessions._get_cursor_store", return_value=mock_cursor
+    ):
+        result = runner.invoke(
+            incydr,
+            [
+                "sessions",
+                "search",
+                "--with-events",
+                "-f",
+                "json-lines",
+                "--checkpoint",
+                "test-chkpt",
+            ],
+        )
+
+    assert result.exit_code != 0
+    records = [
+        json.loads(line) for line in result.output.splitlines() if line.startswith("{")
+    ]
+    assert [record["session"]["sessionId"] for record in records] == ["s0"]
+    mock_cursor.replace.assert_called_once_with("test-chkpt", 1)
+    mock_cursor.replace_items.assert_called_once_with("test-chkpt", ["s0"])
@@ -0,0 +1,189 @@
+import gzip
+import json
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Response
+
+from _incydr_cli.main import incydr
+from _incydr_cli.sinks import create_output_sink
+from _incydr_cli.sinks import FanOutSink
+from _incydr_cli.sinks import FileSink
+from _incydr_cli.sinks import HttpEventCollectorSink
+from _incydr_cli.sinks import OutputSinkError
+from _incydr_cli.sinks import SyslogSink
+from tests.conftest import TEST_HOST
+
+TEST_EVENTS = [json.dumps({"id": i, "name": f"event-{i}"}) for i in range(5)]
+
+
+@pytest.fixture
+def hec_requests(httpserver: HTTPServer):
+    received = []
+
+    def handler(request):
+        received.append(request)
+        return Response(json.dumps({"text": "Success", "code": 0}))
+
+    httpserver.expect_request(
+        "/services/collector/event", method="POST"
+    ).respond_with_handler(handler)
+    return received
+
+
+def _hec_events(request):
+    assert request.headers["Content-Encoding"] == "gzip"
+    payload = gzip.decompress(request.data).decode()
+    decoder = json.JSONDecoder()
+    events, i = [], 0
+    while i < len(payload):
+        obj, i = decoder.raw_decode(payload, i)
+        events.append(obj["event"])
+    return events
+
+
+def test_file_sink_writes_json_lines(tmp_path):
+    with FileSink(tmp_path / "events.jsonl") as sink:
+        for event in TEST_EVENTS:
+            sink.send(event)
+    lines = (tmp_path / "events-000001.jsonl").read_text().splitlines()
+    assert lines == TEST_EVENTS
+    assert sink.stats == {"delivered": 5, "dropped": 0}
+
+
+def test_file_sink_when_gz_suffix_writes_gzip(tmp_path):
+    with FileSink(tmp_path / "events.jsonl.gz") as sink:
+        for event in TEST_EVENTS:
+            sink.send(event)
+    with gzip.open(tmp_path / "events-000001.jsonl.gz", "rt") as f:
+        assert f.read().splitlines() == TEST_EVENTS
+
+
+def test_file_sink_rotates_when_max_bytes_reached(tmp_path):
+    sink = FileSink(tmp_path / "events.jsonl", max_bytes=1, batch_size=2)
+    for event in TEST_EVENTS:
+        sink.send(event)
+        sink.flush()
+    sink.close()
+    files = sorted(tmp_path.glob("events-*.jsonl"))
+    assert [f.name for f in files] == [f"events-00000{i}.jsonl" for i in range(1, 6)]
+    assert [f.read_text().strip() for f in files] == TEST_EVENTS
+
+
+def test_file_sink_numbers_files_after_existing_files(tmp_path):
+    (tmp_path / "events-000007.jsonl").write_text("existing\n")
+    with FileSink(tmp_path / "events.jsonl") as sink:
+        sink.send(TEST_EVENTS[0])
+    assert (tmp_path / "events-000007.jsonl").read_text() == "existing\n"
+    assert (tmp_path / "events-000008.jsonl").read_text() == TEST_EVENTS[0] + "\n"
+
+
+def test_hec_sink_sends_gzipped_batches_with_token(hec_requests):
+    with HttpEventCollectorSink(TEST_HOST, "hec-token", batch_size=2) as sink:
+        for event in TEST_EVENTS:
+            sink.send(event)
+    assert all(r.headers["Authorization"] == "Splunk hec-token" for r in hec_requests)
+    received = [e for r in hec_requests for e in _hec_events(r)]
+    assert received == [json.loads(e) for e in TEST_EVENTS]
+    assert all(len(_hec_events(r)) <= 2 for r in hec_requests)
+    assert sink.stats == {"delivered": 5, "dropped": 0}
+
+
+def test_hec_sink_when_request_fails_drops_events_and_raises_on_next_send(
+    httpserver: HTTPServer,
+):
+    httpserver.expect_request("/services/collector/event").respond_with_data(
+        "bad request", status=400
+    )
+    sink = HttpEventCollectorSink(TEST_HOST, "hec-token")
+    sink.send(TEST_EVENTS[0])
+    sink.flush()
+    assert sink.stats == {"delivered": 0, "dropped": 1}
+    with pytest.raises(OutputSinkError):
+        sink.send(TEST_EVENTS[1])
+    sink.close()
+
+
+def test_create_output_sink_when_multiple_outputs_returns_fan_out(tmp_path, mocker):
+    mocker.patch("_incydr_cli.sinks.create_server_handler")
+    sink = create_output_sink(
+        [
+            f"file:{tmp_path / 'events.jsonl'}",
+            "https://hec.example.com",
+            "TCP:syslog:514",
+        ],
+        hec_token="token",
+    )
+    assert isinstance(sink, FanOutSink)
+    assert [type(s) for s in sink.sinks] == [
+        FileSink,
+        HttpEventCollectorSink,
+        SyslogSink,
+    ]
+    sink.close()
+
+
+def test_create_output_sink_when_multiple_syslog_outputs_spills_to_a_file_each(
+    tmp_path, mocker
+):
+    create_handler = mocker.patch("_incydr_cli.sinks.create_server_handler")
+    spill_file = str(tmp_path / "spill")
+    sink = create_output_sink(
+        ["TCP:syslog-a:514", "syslog-b"], queue_size=10, spill_file=spill_file
+    )
+    assert [c.kwargs["spill_file"] for c in create_handler.call_args_list] == [
+        f"{spill_file}.TCP_syslog-a_514",
+        f"{spill_file}.syslog-b",
+    ]
+    sink.close()
+
+    create_output_sink(
+        ["syslog-a", f"file:{tmp_path / 'events.jsonl'}"],
+        queue_size=10,
+        spill_file=spill_file,
+    ).close()
+    assert create_handler.call_args.kwargs["spill_file"] == spill_file
+
+
+def test_create_output_sink_when_hec_without_token_raises_bad_option_usage():
+    with pytest.raises(Exception) as err:
+        create_output_sink(["https://hec.example.com"])
+    assert "'hec-token' is required" in str(err.value)
+
+
+def test_fan_out_sink_sends_each_event_to_every_sink(tmp_path):
+    with FanOutSink(
+        [FileSink(tmp_path / "a.jsonl"), FileSink(tmp_path / "b.jsonl")]
+    ) as sink:
+        for event in TEST_EVENTS:
+            sink.send(event)
+    assert (tmp_path / "a-000001.jsonl").read_text().splitlines() == TEST_EVENTS
+    assert (tmp_path / "b-000001.jsonl").read_text().splitlines() == TEST_EVENTS
+
+
+def test_cli_search_when_multiple_outputs_sends_events_to_each(
+    httpserver_auth: HTTPServer, hec_requests, runner, tmp_path
+):
+    event = {"type$": "audit_log::logged_in/1", "timestamp": "2022-10-03T13:14:46.962Z"}
+    httpserver_auth.expect_request(
+        "/v1/audit/search-audit-log", method="POST"
+    ).respond_with_json({"events": [event]})
+
+    result = runner.invoke(
+        incydr,
+        [
+            "audit-log",
+            "search",
+            "--output",
+            f"file:{tmp_path / 'audit.jsonl.gz'}",
+            "--output",
+            TEST_HOST,
+            "--hec-token",
+            "token",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    with gzip.open(tmp_path / "audit-000001.jsonl.gz", "rt") as f:
+        assert [json.loads(line) for line in f] == [event]
+    assert [e for r in hec_requests for e in _hec_events(r)] == [event]
+    assert "Forwarded 1 events to" in result.output
@@ -0,0 +1,177 @@
+import math
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+import requests
+from requests import HTTPError
+
+from _incydr_sdk.queries.local import compile_query
+from incydr import EventQuery
+from incydr import GroupingEventQuery
+from incydr.testing import Faults
+from incydr.testing import IncydrSimulator
+from incydr.testing import SyntheticTenant
+
+END = datetime(2024, 1, 31, tzinfo=timezone.utc)
+
+
+def make_tenant(seed=0):
+    return SyntheticTenant(
+        seed=seed,
+        users=20,
+        file_events=1000,
+        sessions=120,
+        audit_events=150,
+        watchlists=3,
+        end=END,
+    )
+
+
+@pytest.fixture
+def simulator():
+    with IncydrSimulator(make_tenant()) as simulator:
+        yield simulator
+
+
+def test_synthetic_tenant_is_deterministic_for_a_seed():
+    tenant = make_tenant(seed=1)
+    assert tenant.file_events == make_tenant(seed=1).file_events
+    assert tenant.sessions == make_tenant(seed=1).sessions
+    assert tenant.file_events != make_tenant(seed=2).file_events
+
+    timestamps = [e["@timestamp"] for e in tenant.file_events]
+    assert timestamps == sorted(timestamps)
+    assert timestamps[0] >= "2024-01-01T00:00:00.000Z"
+    assert timestamps[-1] < "2024-01-31T00:00:00.000Z"
+    assert len({e["event"]["id"] for e in tenant.file_events}) == 1000
+
+
+def test_simulator_pages_file_events_by_page_token(simulator):
+    client = simulator.client()
+    query = EventQuery(start_date="2024-01-01T00:00:00Z").equals(
+        "file.category", ["Document", "Archive"]
+    )
+    query.page_size = 50
+    predicate = compile_query(query)
+    expected = sorted(
+        e["event"]["id"] for e in simulator.tenant.file_events if predicate(e)
+    )
+
+    events = list(client.file_events.v2.iter_all(query))
+
+    assert [e.event.id for e in events] == expected
+    pages = simulator.request_counts[("POST", "/v2/file-events", 200)]
+    assert pages == math.ceil(len(expected) / 50)
+
+
+def test_simulator_pages_file_events_by_page_number_without_page_token(simulator):
+    client = simulator.client()
+    query = EventQuery(start_date="2024-01-01T00:00:00Z")
+    query.page_token = None
+    query.page_num = 3
+    query.page_size = 100
+    query.sort_key = "@timestamp"
+    query.sort_dir = "desc"
+
+    page = client.file_events.v2.search(query)
+
+    assert page.total_count == 1000
+    assert page.next_pg_token is None
+    assert [e.event.id for e in page.file_events] == [
+        e["event"]["id"] for e in simulator.tenant.file_events[::-1][200:300]
+    ]
+
+
+def test_simulator_counts_groups_of_matching_events(simulator):
+    client = simulator.client()
+    query = GroupingEventQuery(start_date="2024-01-01T00:00:00Z").group_by(
+        "file.category"
+    )
+
+    response = client.file_events.v2.search_groups(query)
+
+    counts = {g.value: g.doc_count for g in response.groups}
+    assert sum(counts.values()) == 1000
+    assert counts["Archive"] == sum(
+        e["file"]["category"] == "Archive" for e in simulator.tenant.file_events
+    )
+
+
+def test_simulator_serves_paged_endpoints(simulator):
+    client = simulator.client()
+    tenant = simulator.tenant
+
+    assert len(list(client.users.v1.iter_all(page_size=7))) == 20
+    assert len(list(client.actors.v1.iter_all(page_size=7))) == 20
+    assert len(list(client.agents.v1.iter_all(page_size=7))) == 20
+    assert len(list(client.watchlists.v2.iter_all(page_size=2))) == 3
+    assert len(list(client.sessions.v1.iter_all(has_alerts=None))) == 120
+    assert list(client.audit_log.v1.iter_all(page_size=40)) == tenant.audit_events
+    by_time = client.audit_log.v1.iter_all(page_size=40, paginate_by_time=True)
+    assert list(by_time) == tenant.audit_events
+    assert client.audit_log.v1.get_event_count() == 150
+
+    user = tenant.users[3]
+    assert client.users.v1.get_user(user["userId"]).username == user["username"]
+    actor = client.actors.v1.get_actor_by_name(tenant.actors[3]["name"])
+    assert actor.actor_id == tenant.actors[3]["actorId"]
+    session = client.sessions.v1.get_session_details(tenant.sessions[5]["sessionId"])
+    assert session.actor_id == tenant.sessions[5]["actorId"]
+
+
+def test_simulator_requires_access_token(simulator):
+    response = requests.get(f"{simulator.url}/v1/users")
+    assert response.status_code == 401
+
+    response = requests.post(f"{simulator.url}/v1/oauth", auth=("id", "secret"))
+    token = response.json()["access_token"]
+    response = requests.get(
+        f"{simulator.url}/v1/missing", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 404
+
+
+def test_simulator_throttles_requests_with_retry_after():
+    faults = Faults(throttle_rate=1, retry_after=7)
+    with IncydrSimulator(make_tenant(), faults) as simulator:
+        client = simulator.client()
+        with pytest.raises(HTTPError) as err:
+            client.users.v1.get_page()
+
+    assert err.value.response.status_code == 429
+    assert err.value.response.headers["Retry-After"] == "7"
+
+
+def test_simulator_limits_requests_per_second():
+    with IncydrSimulator(make_tenant(), Faults(requests_per_second=1)) as simulator:
+        client = simulator.client()
+        client.users.v1.get_page()
+        with pytest.raises(HTTPError) as err:
+            client.users.v1.get_page()
+
+    assert err.value.response.status_code == 429
+    assert err.value.response.headers["Retry-After"] == "1"
+
+
+def test_simulator_file_event_searches_retry_throttled_requests():
+    faults = Faults(throttle_rate=0.2, retry_after=0, seed=13)
+    with IncydrSimulator(make_tenant(), faults) as simulator:
+        client = simulator.client()
+        query = EventQuery(start_date="2024-01-01T00:00:00Z")
+        query.page_size = 50
+        events = list(client.file_events.v2.iter_all(query, record_format="dict"))
+
+    assert len(events) == 1000
+    assert simulator.request_counts[("POST", "/v2/file-events", 429)] > 0
+    assert simulator.request_counts[("POST", "/v2/file-events", 200)] == 20
+
+
+def test_simulator_injects_server_errors():
+    faults = Faults(error_rate=1, error_statuses=[502])
+    with IncydrSimulator(make_tenant(), faults) as simulator:
+        client = simulator.client()
+        with pytest.raises(HTTPError) as err:
+            client.agents.v1.get_page()
+
+    assert err.value.response.status_code == 502
@@ -1090,6 +1090,29 @@ def test_cli_bulk_activate_and_deactivate_when_csv_makes_expected_call(
     assert result.exit_code == 0
 
 
+def test_cli_bulk_activate_when_invalid_rows_reports_them_and_continues(
+    httpserver_auth: HTTPServer, runner, tmp_path
+):
+    httpserver_auth.expect_request(
+        "/v1/users/test-user-id/activate", method="POST"
+    ).respond_with_data()
+    httpserver_auth.expect_request(
+        "/v1/users/test-user-id-1/activate", method="POST"
+    ).respond_with_data()
+
+    p = tmp_path / "users.jsonl"
+    p.write_text(
+        '{"userId": "test-user-id"}\n{"userId": \n{"userId": "test-user-id-1"}\n'
+    )
+    result = runner.invoke(
+        incydr, ["users", "bulk-activate", str(p), "-f", "json-lines"]
+    )
+    httpserver_auth.check()
+    assert result.exit_code == 0
+    assert len(httpserver_auth.log) == 3
+    assert "Unable to parse line 2" in result.output
+
+
 @pytest.mark.parametrize(
     "command,uri", [("bulk-activate", "activate"), ("bulk-deactivate", "deactivate")]
 )
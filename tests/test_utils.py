@@ -1,4 +1,5 @@
 import datetime
+from io import StringIO
 from typing import List
 from typing import Optional
 from typing import Union
@@ -6,7 +7,13 @@ from typing import Union
 import pytest
 from pydantic import BaseModel
 from pydantic import Field
+from rich.console import Console
 
+from _incydr_cli import render
+from _incydr_cli.cmds.utils import AdaptivePollInterval
+from _incydr_cli.cmds.utils import follow
+from _incydr_cli.render import TABLE_WINDOW_SIZE
+from _incydr_sdk.core.models import ResponseModel
 from _incydr_sdk.queries.utils import parse_str_to_dt
 from _incydr_sdk.utils import _get_model_type
 from _incydr_sdk.utils import _is_single
@@ -263,3 +270,87 @@ def test_is_single(type, expected):
 )
 def test_get_model_type(type, expected):
     assert _get_model_type(type) == expected
+
+
+def test_adaptive_poll_interval_shortens_when_busy_and_backs_off_when_idle():
+    interval = AdaptivePollInterval(minimum=5, maximum=30)
+    assert [interval.update(n) for n in (0, 0, 0, 0, 10, 10, 10)] == [
+        10,
+        20,
+        30,
+        30,
+        15,
+        7.5,
+        5,
+    ]
+
+
+def test_follow_yields_results_of_each_poll_until_stopped():
+    polls = [[1, 2], [], [3]]
+    sleeps = []
+    results = follow(
+        lambda: polls.pop(0),
+        AdaptivePollInterval(minimum=0, maximum=0),
+        should_stop=lambda: not polls,
+        sleep=sleeps.append,
+    )
+    assert list(results) == [1, 2, 3]
+    assert sleeps == []
+
+
+class TableTestModel(ResponseModel):
+    name: str
+    number: int
+
+
+@pytest.mark.parametrize("count", [TABLE_WINDOW_SIZE * 2, TABLE_WINDOW_SIZE * 2 + 10])
+def test_table_when_results_exceed_window_streams_one_continuous_table(capsys, count):
+    retrieved = []
+
+    def models():
+        for i in range(count):
+            retrieved.append(i)
+            # values after the first window are wider than the columns sized from it
+            name = "a" if i < TABLE_WINDOW_SIZE else "b" * 6
+            yield TableTestModel(name=name, number=i % 10)
+
+    render.table(TableTestModel, models(), title="Results")
+    lines = capsys.readouterr().out.splitlines()
+
+    assert len(retrieved) == count
+    assert lines[0].strip() == "Results"
+    assert sum("name" in line for line in lines) == 1
+    # windows are joined without closing and reopening the table
+    assert sum(line.startswith(("┏", "┌", "└")) for line in lines) == 2
+    assert lines[-1].startswith("└")
+    assert "│ a    │ 0      │" in lines
+    # wider values are folded into the measured column width
+    assert "│ bbbb │ 0      │" in lines
+    assert "│ bb   │        │" in lines
+    assert len({len(line) for line in lines[1:]}) == 1
+
+
+def test_table_when_no_pager_variable_set_streams_to_less(mocker, monkeypatch):
+    monkeypatch.delenv("MANPAGER", raising=False)
+    monkeypatch.delenv("PAGER", raising=False)
+    monkeypatch.setenv("TERM", "xterm")
+    mocker.patch.object(
+        Console, "is_terminal", new_callable=mocker.PropertyMock, return_value=True
+    )
+    mocker.patch("_incydr_cli.render.shutil.which", return_value="/usr/bin/less")
+    popen = mocker.patch("_incydr_cli.render.subprocess.Popen")
+    popen.return_value.stdin = StringIO()
+    models = [TableTestModel(name="a", number=i) for i in range(TABLE_WINDOW_SIZE + 1)]
+
+    render.table(TableTestModel, models)
+
+    assert popen.call_args.args[0] == "less"
+
+
+def test_table_when_results_fit_in_window_measures_all_rows(capsys):
+    models = [TableTestModel(name="a" * i, number=i) for i in range(1, 11)]
+
+    render.table(TableTestModel, models)
+    out = capsys.readouterr().out
+
+    assert "│ " + "a" * 10 + " │ 10     │" in out
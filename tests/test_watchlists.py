@@ -1,10 +1,12 @@
 import datetime
 import json
+import re
 from urllib.parse import urlencode
 
 import pydantic
 import pytest
 from pytest_httpserver import HTTPServer
+from werkzeug import Response
 
 from _incydr_cli.main import incydr
 from _incydr_sdk.core.client import Client
@@ -1592,3 +1594,97 @@ def test_cli_update_users_batches_by_100(httpserver_auth: HTTPServer, runner, ac
     )
     httpserver_auth.check()
     assert result.exit_code == 0
+
+
+@pytest.fixture
+def mock_sync_included_actors(httpserver_auth: HTTPServer):
+    """Records included actor updates, rejecting batches that contain 'unknown-*' actor IDs."""
+    updates = []
+
+    def handler(request):
+        actor_ids = request.json["actorIds"]
+        if any(i.startswith("unknown") for i in actor_ids):
+            return Response("Actor not found", status=400)
+        updates.append((request.path.rsplit("/", 1)[-1], actor_ids))
+        return Response()
+
+    data = {"includedActors": [TEST_ACTOR_1, TEST_ACTOR_2], "totalCount": 2}
+    httpserver_auth.expect_request(
+        f"/v2/watchlists/{TEST_WATCHLIST_ID}/included-actors", method="GET"
+    ).respond_with_json(data)
+    httpserver_auth.expect_request(
+        re.compile(f"/v2/watchlists/{TEST_WATCHLIST_ID}/included-actors/(add|delete)"),
+        method="POST",
+    ).respond_with_handler(handler)
+    return updates
+
+
+def test_sync_applies_only_the_difference_in_batches(mock_sync_included_actors):
+    desired = [TEST_ID] + [f"actor-{i:03d}" for i in range(150)]
+    client = Client()
+    result = client.watchlists.v2.sync(TEST_WATCHLIST_ID, included_actor_ids=desired)
+
+    assert result.included_added == desired[1:]
+    assert result.included_removed == ["user-43"]
+    assert result.failed == []
+    assert sorted(mock_sync_included_actors) == [
+        ("add", desired[1:101]),
+        ("add", desired[101:]),
+        ("delete", ["user-43"]),
+    ]
+
+
+def test_sync_when_actor_not_found_isolates_unknown_actors(mock_sync_included_actors):
+    desired = [TEST_ID, "user-43", "unknown-1"] + [f"actor-{i}" for i in range(9)]
+    client = Client()
+    result = client.watchlists.v2.sync(TEST_WATCHLIST_ID, included_actor_ids=desired)
+
+    assert result.failed == ["unknown-1"]
+    added = [i for action, ids in mock_sync_included_actors for i in ids]
+    assert sorted(added) == [f"actor-{i}" for i in range(9)]
+
+
+def test_cli_add_when_actor_not_found_isolates_unknown_actors(
+    mock_sync_included_actors, runner
+):
+    actors = ["actor-1", "unknown-1", "actor-2"]
+    result = runner.invoke(
+        incydr, ["watchlists", "add", TEST_WATCHLIST_ID, "--actors", ",".join(actors)]
+    )
+    assert result.exit_code == 0, result.output
+    added = [i for action, ids in mock_sync_included_actors for i in ids]
+    assert sorted(added) == ["actor-1", "actor-2"]
+    assert "Successfully included 2 actors" in result.output
+    assert "unknown-1" in result.output
+
+
+def test_sync_when_dry_run_makes_no_changes(mock_sync_included_actors):
+    client = Client()
+    result = client.watchlists.v2.sync(
+        TEST_WATCHLIST_ID, included_actor_ids=["actor-1"], dry_run=True
+    )
+    assert result.included_added == ["actor-1"]
+    assert result.included_removed == sorted([TEST_ID, "user-43"])
+    assert mock_sync_included_actors == []
+
+
+def test_cli_sync_applies_difference(mock_sync_included_actors, runner, tmp_path):
+    actors_file = tmp_path / "actors.csv"
+    actors_file.write_text(f"user\n{TEST_ID}\nactor-1\n")
+    result = runner.invoke(
+        incydr,
+        ["watchlists", "sync", TEST_WATCHLIST_ID, "--actors", f"@{actors_file}"],
+    )
+    assert result.exit_code == 0, result.output
+    assert sorted(mock_sync_included_actors) == [
+        ("add", ["actor-1"]),
+        ("delete", ["user-43"]),
+    ]
+    assert "Successfully included 1 actors" in result.output
+    assert "Successfully removed included 1 actors" in result.output
+
+
+def test_cli_sync_without_actor_options_raises_usage_error(runner):
+    result = runner.invoke(incydr, ["watchlists", "sync", TEST_WATCHLIST_ID])
+    assert result.exit_code == 2
+    assert "At least one of '--actors' or '--excluded-actors'" in result.output